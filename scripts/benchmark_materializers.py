@@ -0,0 +1,621 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Benchmark the save and load throughput of materializers.
+
+Every materializer is benchmarked for every data size in two fresh
+processes, one which saves the data and one which loads it again. For each
+phase, the throughput, the peak RSS of the process and the number of calls to
+the artifact store filesystem are reported.
+
+The benchmarks write to the artifact store of the active stack. To benchmark
+against a local S3 stand-in, start a moto server and activate a stack with an
+S3 artifact store pointing to it:
+
+```
+pip install "moto[server]"
+zenml integration install s3
+moto_server -p 5000 &
+AWS_ACCESS_KEY_ID=test AWS_SECRET_ACCESS_KEY=test \
+    aws --endpoint-url http://127.0.0.1:5000 s3 mb s3://benchmarks
+zenml artifact-store register local_s3 --flavor=s3 --path=s3://benchmarks \
+    --key=test --secret=test \
+    --client_kwargs='{"endpoint_url": "http://127.0.0.1:5000"}'
+zenml stack register local_s3 -o default -a local_s3 --set
+```
+
+Results can be written to a JSON file with `--output` and compared to the
+results of a previous run with `--baseline`, in which case the script fails
+if the throughput of any benchmark dropped or its peak RSS grew by more than
+the given tolerance.
+"""
+import json
+import multiprocessing
+import os
+import resource
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+from uuid import uuid4
+
+import click
+from rich.console import Console
+from rich.table import Table
+
+MB = 1024 * 1024
+DEFAULT_SIZES = "1MB,64MB,512MB"
+DEFAULT_TOLERANCE = 0.2
+BENCHMARKS_DIR = "materializer_benchmarks"
+
+# Filesystem methods that are counted as artifact store calls
+FILESYSTEM_METHODS = (
+    "open",
+    "copyfile",
+    "exists",
+    "glob",
+    "isdir",
+    "listdir",
+    "makedirs",
+    "mkdir",
+    "remove",
+    "rename",
+    "rmtree",
+    "stat",
+    "size",
+    "walk",
+)
+
+
+def _numpy_array(size: int) -> Any:
+    """Creates a float array.
+
+    Args:
+        size: The size of the array in bytes.
+
+    Returns:
+        The array.
+    """
+    import numpy as np
+
+    return np.random.default_rng(0).random(size // 8)
+
+
+def _pandas_dataframe(size: int) -> Any:
+    """Creates a dataframe with float columns.
+
+    Args:
+        size: The size of the dataframe in bytes.
+
+    Returns:
+        The dataframe.
+    """
+    import pandas as pd
+
+    columns = 10
+    rows = max(1, size // (8 * columns))
+    data = _numpy_array(8 * columns * rows).reshape(rows, columns)
+    return pd.DataFrame(data, columns=[f"column_{i}" for i in range(columns)])
+
+
+def _float_list(size: int) -> Any:
+    """Creates a list of floats.
+
+    Args:
+        size: The size of the JSON representation of the list in bytes.
+
+    Returns:
+        The list.
+    """
+    # Floats take up roughly 20 bytes in their JSON representation
+    return _numpy_array(size * 8 // 20).tolist()
+
+
+def _array_list(size: int) -> Any:
+    """Creates a list of float arrays.
+
+    Args:
+        size: The total size of the arrays in bytes.
+
+    Returns:
+        The list.
+    """
+    import numpy as np
+
+    return list(np.array_split(_numpy_array(size), 16))
+
+
+def _bytes(size: int) -> Any:
+    """Creates a byte array.
+
+    Args:
+        size: The size of the byte array.
+
+    Returns:
+        The byte array.
+    """
+    import numpy as np
+
+    return bytearray(np.random.default_rng(0).bytes(size))
+
+
+def _pytorch_module(size: int) -> Any:
+    """Creates a PyTorch module with linear layers.
+
+    Args:
+        size: The size of the module parameters in bytes.
+
+    Returns:
+        The module.
+    """
+    import torch
+
+    torch.manual_seed(0)
+    layers = 8
+    features = max(1, int((size / 4 / layers) ** 0.5))
+    return torch.nn.Sequential(
+        *(torch.nn.Linear(features, features) for _ in range(layers))
+    )
+
+
+def _sklearn_estimator(size: int) -> Any:
+    """Creates a fitted scikit-learn estimator.
+
+    Args:
+        size: The size of the fitted estimator attributes in bytes.
+
+    Returns:
+        The estimator.
+    """
+    from sklearn.preprocessing import StandardScaler
+
+    # The scaler stores three float arrays with one entry per feature
+    features = max(1, size // 24)
+    return StandardScaler().fit(_numpy_array(16 * features).reshape(2, -1))
+
+
+def _huggingface_dataset(size: int) -> Any:
+    """Creates a HuggingFace dataset with a float column.
+
+    Args:
+        size: The size of the dataset in bytes.
+
+    Returns:
+        The dataset.
+    """
+    from datasets import Dataset
+
+    return Dataset.from_dict({"value": _numpy_array(size)})
+
+
+class BenchmarkCase(NamedTuple):
+    """A materializer and the data with which it is benchmarked."""
+
+    name: str
+    materializer: str
+    data_type: str
+    data_factory: Callable[[int], Any]
+
+
+BENCHMARK_CASES = [
+    BenchmarkCase(
+        name="numpy",
+        materializer="zenml.materializers.numpy_materializer.NumpyMaterializer",
+        data_type="numpy.ndarray",
+        data_factory=_numpy_array,
+    ),
+    BenchmarkCase(
+        name="pandas",
+        materializer="zenml.materializers.pandas_materializer.PandasMaterializer",
+        data_type="pandas.DataFrame",
+        data_factory=_pandas_dataframe,
+    ),
+    BenchmarkCase(
+        name="built_in_container_json",
+        materializer="zenml.materializers.built_in_materializer.BuiltInContainerMaterializer",
+        data_type="builtins.list",
+        data_factory=_float_list,
+    ),
+    BenchmarkCase(
+        name="built_in_container_elements",
+        materializer="zenml.materializers.built_in_materializer.BuiltInContainerMaterializer",
+        data_type="builtins.list",
+        data_factory=_array_list,
+    ),
+    BenchmarkCase(
+        name="cloudpickle",
+        materializer="zenml.materializers.cloudpickle_materializer.CloudpickleMaterializer",
+        data_type="builtins.bytearray",
+        data_factory=_bytes,
+    ),
+    BenchmarkCase(
+        name="pytorch_module",
+        materializer="zenml.integrations.pytorch.materializers.PyTorchModuleMaterializer",
+        data_type="torch.nn.Module",
+        data_factory=_pytorch_module,
+    ),
+    BenchmarkCase(
+        name="pytorch_tensor",
+        materializer="zenml.integrations.pytorch.materializers.PyTorchTensorMaterializer",
+        data_type="torch.nn.Module",
+        data_factory=_pytorch_module,
+    ),
+    BenchmarkCase(
+        name="sklearn",
+        materializer="zenml.integrations.sklearn.materializers.SklearnMaterializer",
+        data_type="sklearn.preprocessing.StandardScaler",
+        data_factory=_sklearn_estimator,
+    ),
+    BenchmarkCase(
+        name="huggingface_datasets",
+        materializer="zenml.integrations.huggingface.materializers.HFDatasetMaterializer",
+        data_type="datasets.Dataset",
+        data_factory=_huggingface_dataset,
+    ),
+]
+
+
+def _get_peak_rss() -> int:
+    """Gets the peak resident set size of the current process.
+
+    Returns:
+        The peak RSS in bytes.
+    """
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak_rss if sys.platform == "darwin" else peak_rss * 1024
+
+
+@contextmanager
+def _count_filesystem_calls(path: str) -> Iterator["Counter[str]"]:
+    """Counts the calls to the filesystem responsible for a path.
+
+    Args:
+        path: The path for which to count the filesystem calls.
+
+    Yields:
+        The number of calls per filesystem method.
+    """
+    from zenml.io.filesystem_registry import default_filesystem_registry
+
+    filesystem = default_filesystem_registry.get_filesystem_for_path(path)
+    counts: "Counter[str]" = Counter()
+    originals = {}
+
+    def _counted(name: str, method: Callable[..., Any]) -> Any:
+        def _wrapper(*args: Any, **kwargs: Any) -> Any:
+            counts[name] += 1
+            return method(*args, **kwargs)
+
+        return staticmethod(_wrapper)
+
+    for name in FILESYSTEM_METHODS:
+        originals[name] = filesystem.__dict__.get(name)
+        setattr(filesystem, name, _counted(name, getattr(filesystem, name)))
+    try:
+        yield counts
+    finally:
+        for name, original in originals.items():
+            if original is None:
+                delattr(filesystem, name)
+            else:
+                setattr(filesystem, name, original)
+
+
+def _load_case(name: str) -> BenchmarkCase:
+    """Gets a benchmark case by name.
+
+    Args:
+        name: The name of the benchmark case.
+
+    Returns:
+        The benchmark case.
+    """
+    return next(case for case in BENCHMARK_CASES if case.name == name)
+
+
+def _run_phase(
+    case_name: str, size: int, uri: str, phase: str
+) -> Dict[str, Any]:
+    """Saves or loads the data of a benchmark case.
+
+    This runs in a fresh process for each phase, so that the peak RSS only
+    covers a single save or load.
+
+    Args:
+        case_name: The name of the benchmark case.
+        size: The size of the benchmark data in bytes.
+        uri: The URI of the artifact.
+        phase: Either `save` or `load`.
+
+    Returns:
+        The duration, peak RSS and filesystem calls of the phase.
+    """
+    from zenml.client import Client
+    from zenml.io import fileio
+    from zenml.utils import source_utils
+
+    # Registers the filesystem of the artifact store
+    Client().active_stack.artifact_store
+
+    case = _load_case(case_name)
+    materializer = source_utils.load(case.materializer)(uri)
+    if phase == "save":
+        data = case.data_factory(size)
+        fileio.makedirs(uri)
+    else:
+        data_type = source_utils.load(case.data_type)
+
+    rss_before = _get_peak_rss()
+    with _count_filesystem_calls(uri) as calls:
+        start = time.perf_counter()
+        if phase == "save":
+            materializer.save(data)
+        else:
+            materializer.load(data_type)
+        duration = time.perf_counter() - start
+
+    return {
+        "seconds": duration,
+        "peak_rss": _get_peak_rss(),
+        "rss_increase": _get_peak_rss() - rss_before,
+        "calls": sum(calls.values()),
+    }
+
+
+def _run_case(case: BenchmarkCase, size: int, root: str) -> Dict[str, Any]:
+    """Benchmarks a single materializer and data size.
+
+    Args:
+        case: The benchmark case.
+        size: The size of the benchmark data in bytes.
+        root: The directory in which to store the artifacts.
+
+    Returns:
+        The benchmark results.
+    """
+    uri = os.path.join(root, f"{case.name}_{size}")
+    result: Dict[str, Any] = {"name": case.name, "size": size}
+    context = multiprocessing.get_context("spawn")
+    for phase in ("save", "load"):
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+            phase_result = pool.submit(
+                _run_phase, case.name, size, uri, phase
+            ).result()
+        phase_result["mb_per_second"] = size / MB / phase_result["seconds"]
+        result[phase] = phase_result
+    return result
+
+
+def _is_available(case: BenchmarkCase) -> bool:
+    """Checks whether the materializer and data type of a case can be imported.
+
+    Args:
+        case: The benchmark case.
+
+    Returns:
+        Whether the case can be benchmarked in the current environment.
+    """
+    from zenml.utils import source_utils
+
+    try:
+        source_utils.load(case.materializer)
+        source_utils.load(case.data_type)
+    except ImportError:
+        return False
+    return True
+
+
+def _parse_size(value: str) -> int:
+    """Parses a data size like `64MB`.
+
+    Args:
+        value: The data size.
+
+    Returns:
+        The data size in bytes.
+
+    Raises:
+        click.BadParameter: If the data size is invalid.
+    """
+    units = {"GB": 1024 * MB, "MB": MB, "KB": 1024, "B": 1}
+    value = value.strip().upper()
+    for unit, factor in units.items():
+        if value.endswith(unit):
+            try:
+                return int(float(value[: -len(unit)]) * factor)
+            except ValueError:
+                break
+    raise click.BadParameter(f"Invalid data size `{value}`.")
+
+
+def _compare(
+    results: List[Dict[str, Any]],
+    baseline: List[Dict[str, Any]],
+    tolerance: float,
+) -> List[str]:
+    """Compares benchmark results to a baseline.
+
+    Args:
+        results: The benchmark results.
+        baseline: The baseline results.
+        tolerance: The relative change which is considered a regression.
+
+    Returns:
+        Descriptions of all regressions.
+    """
+    baseline_results = {(r["name"], r["size"]): r for r in baseline}
+    regressions = []
+    for result in results:
+        previous = baseline_results.get((result["name"], result["size"]))
+        if not previous:
+            continue
+        for phase in ("save", "load"):
+            label = f"{result['name']} {phase} ({result['size'] / MB:g}MB)"
+            current, old = result[phase], previous[phase]
+            if current["mb_per_second"] < old["mb_per_second"] * (
+                1 - tolerance
+            ):
+                regressions.append(
+                    f"{label}: throughput dropped from "
+                    f"{old['mb_per_second']:.1f}MB/s to "
+                    f"{current['mb_per_second']:.1f}MB/s."
+                )
+            if current["peak_rss"] > old["peak_rss"] * (1 + tolerance):
+                regressions.append(
+                    f"{label}: peak RSS grew from "
+                    f"{old['peak_rss'] / MB:.0f}MB to "
+                    f"{current['peak_rss'] / MB:.0f}MB."
+                )
+    return regressions
+
+
+def _print_results(results: List[Dict[str, Any]]) -> None:
+    """Prints the benchmark results as a table.
+
+    Args:
+        results: The benchmark results.
+    """
+    table = Table(title="Materializer benchmarks")
+    for column in ("Materializer", "Size (MB)"):
+        table.add_column(column)
+    for phase in ("Save", "Load"):
+        table.add_column(f"{phase} MB/s", justify="right")
+        table.add_column(f"{phase} peak RSS (MB)", justify="right")
+        table.add_column(f"{phase} store calls", justify="right")
+
+    for result in results:
+        row = [result["name"], f"{result['size'] / MB:g}"]
+        for phase in ("save", "load"):
+            row += [
+                f"{result[phase]['mb_per_second']:.1f}",
+                f"{result[phase]['peak_rss'] / MB:.0f}",
+                str(result[phase]["calls"]),
+            ]
+        table.add_row(*row)
+    Console().print(table)
+
+
+@click.command()
+@click.option(
+    "--materializer",
+    "-m",
+    "names",
+    multiple=True,
+    type=click.Choice([case.name for case in BENCHMARK_CASES]),
+    help="Materializer to benchmark. Defaults to all available ones.",
+)
+@click.option(
+    "--sizes",
+    default=DEFAULT_SIZES,
+    show_default=True,
+    help="Comma-separated data sizes to benchmark.",
+)
+@click.option(
+    "--output",
+    type=click.Path(dir_okay=False),
+    help="JSON file to write the results to.",
+)
+@click.option(
+    "--baseline",
+    type=click.Path(exists=True, dir_okay=False),
+    help="JSON results of a previous run to compare against.",
+)
+@click.option(
+    "--tolerance",
+    default=DEFAULT_TOLERANCE,
+    show_default=True,
+    help="Relative throughput drop or peak RSS growth considered a "
+    "regression.",
+)
+def benchmark(
+    names: Tuple[str, ...],
+    sizes: str,
+    output: Optional[str],
+    baseline: Optional[str],
+    tolerance: float,
+) -> None:
+    """Benchmark the save and load throughput of materializers.
+
+    Args:
+        names: Materializers to benchmark.
+        sizes: Comma-separated data sizes to benchmark.
+        output: JSON file to write the results to.
+        baseline: JSON results of a previous run to compare against.
+        tolerance: Relative change which is considered a regression.
+
+    Raises:
+        ClickException: If any benchmark failed or regressed compared to the
+            baseline.
+    """
+    from zenml.client import Client
+    from zenml.io import fileio
+
+    cases = [
+        case for case in BENCHMARK_CASES if not names or case.name in names
+    ]
+    for case in cases:
+        if not _is_available(case):
+            click.echo(
+                f"Skipping `{case.name}` as its integration is not installed."
+            )
+    cases = [case for case in cases if _is_available(case)]
+    data_sizes = [_parse_size(size) for size in sizes.split(",")]
+
+    root = os.path.join(
+        Client().active_stack.artifact_store.path,
+        BENCHMARKS_DIR,
+        str(uuid4()),
+    )
+    results = []
+    failures = []
+    try:
+        for case in cases:
+            for size in data_sizes:
+                click.echo(f"Benchmarking `{case.name}` with {size / MB:g}MB.")
+                try:
+                    results.append(_run_case(case, size=size, root=root))
+                except Exception as e:
+                    failures.append(f"{case.name} ({size / MB:g}MB): {e}")
+    finally:
+        if fileio.exists(root):
+            fileio.rmtree(root)
+
+    _print_results(results)
+    if output:
+        with open(output, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if baseline:
+        with open(baseline) as f:
+            failures += _compare(results, json.load(f), tolerance=tolerance)
+    if failures:
+        raise click.ClickException(
+            "Materializer benchmarks failed or regressed:\n"
+            + "\n".join(failures)
+        )
+
+
+if __name__ == "__main__":
+    benchmark()
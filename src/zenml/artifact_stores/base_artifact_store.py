@@ -12,6 +12,7 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 """The base interface to extend the ZenML artifact store."""
+import os
 import textwrap
 from abc import abstractmethod
 from typing import (
@@ -31,6 +32,7 @@ from typing import (
 
 from pydantic import root_validator
 
+from zenml.artifact_stores.local_artifact_cache import LocalArtifactCache
 from zenml.enums import StackComponentType
 from zenml.exceptions import ArtifactStoreInterfaceError
 from zenml.io import fileio
@@ -42,6 +44,8 @@ logger = get_logger(__name__)
 
 PathType = Union[bytes, str]
 
+LOCAL_ARTIFACT_CACHE_DIRECTORY_NAME = "artifact_cache"
+
 
 def _sanitize_potential_path(potential_path: Any) -> Any:
     """Sanitizes the input if it is a path.
@@ -107,9 +111,20 @@ def _sanitize_paths(_func: Callable[..., Any]) -> Callable[..., Any]:
 
 
 class BaseArtifactStoreConfig(StackComponentConfig):
-    """Config class for `BaseArtifactStore`."""
+    """Config class for `BaseArtifactStore`.
+
+    Attributes:
+        path: The root path of the artifact store.
+        local_cache_size_mb: Maximum size in MB of the local cache in which
+            artifacts of a remote artifact store are kept after they were
+            loaded. Set to 0 to disable the cache.
+        local_cache_path: Local directory for the artifact cache. Defaults to
+            a directory inside the global ZenML config directory.
+    """
 
     path: str
+    local_cache_size_mb: int = 0
+    local_cache_path: Optional[str] = None
 
     SUPPORTED_SCHEMES: ClassVar[Set[str]]
 
@@ -168,6 +183,8 @@ class BaseArtifactStoreConfig(StackComponentConfig):
 class BaseArtifactStore(StackComponent):
     """Base class for all ZenML artifact stores."""
 
+    _local_cache: Optional[LocalArtifactCache]
+
     @property
     def config(self) -> BaseArtifactStoreConfig:
         """Returns the `BaseArtifactStoreConfig` config.
@@ -186,6 +203,31 @@ class BaseArtifactStore(StackComponent):
         """
         return self.config.path
 
+    @property
+    def local_cache(self) -> Optional[LocalArtifactCache]:
+        """The local read-through cache for artifacts of this store.
+
+        Returns:
+            The local artifact cache or `None` if the cache is disabled or
+            the artifact store is local.
+        """
+        if self.config.local_cache_size_mb <= 0 or not io_utils.is_remote(
+            self.path
+        ):
+            return None
+
+        if not self._local_cache:
+            root = self.config.local_cache_path or os.path.join(
+                io_utils.get_global_config_directory(),
+                LOCAL_ARTIFACT_CACHE_DIRECTORY_NAME,
+                str(self.id),
+            )
+            self._local_cache = LocalArtifactCache(
+                root=root,
+                max_size=self.config.local_cache_size_mb * 1024 * 1024,
+            )
+        return self._local_cache
+
     # --- User interface ---
     @abstractmethod
     def open(self, name: PathType, mode: str = "r") -> Any:
@@ -355,6 +397,7 @@ class BaseArtifactStore(StackComponent):
             **kwargs: The keyword arguments to pass to the Pydantic object.
         """
         super(BaseArtifactStore, self).__init__(*args, **kwargs)
+        self._local_cache = None
         self._register()
 
     def _register(self) -> None:
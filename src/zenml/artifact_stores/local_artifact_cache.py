@@ -0,0 +1,353 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Local read-through cache for artifacts of remote artifact stores."""
+
+import os
+import shutil
+import tempfile
+import threading
+import weakref
+from collections import Counter
+from typing import Any, List, Optional, Tuple
+
+from zenml.io import fileio
+from zenml.logger import get_logger
+from zenml.utils import io_utils
+
+logger = get_logger(__name__)
+
+TEMPORARY_ENTRY_PREFIX = ".tmp-"
+# Directory in which processes mark the cache entries they are using
+PINS_DIRECTORY = ".pins"
+
+# Number of pins of each cache entry path in this process. These are shared
+# by all cache instances, as several instances can use the same directory.
+_pins: "Counter[str]" = Counter()
+_lock = threading.Lock()
+
+
+class LocalArtifactCache:
+    """Size-bounded on-disk cache for artifact directories.
+
+    Each cache entry is a local copy of an artifact directory, stored under a
+    key which identifies the artifact content (e.g. its content hash or ID).
+    Artifacts are immutable once published, so entries never need to be
+    invalidated. Whenever the cache grows beyond its maximum size, the least
+    recently used entries are evicted.
+
+    Entries returned by `acquire` are pinned until they are released, so
+    that they remain readable while the caller uses them. Pinned entries are
+    never evicted, neither by this process nor by other processes sharing the
+    cache directory, which see the pins as marker files.
+    """
+
+    def __init__(self, root: str, max_size: int) -> None:
+        """Initializes the cache.
+
+        Args:
+            root: Local directory in which the cache entries are stored.
+            max_size: Maximum size of all cache entries in bytes.
+        """
+        self.root = root
+        self.max_size = max_size
+
+    def get_entry_path(self, key: str) -> str:
+        """Gets the local path of a cache entry.
+
+        Args:
+            key: The key of the cache entry.
+
+        Returns:
+            The local path of the cache entry.
+        """
+        return os.path.join(self.root, key)
+
+    def acquire(
+        self, key: str, uri: str, keep_oversized: bool = False
+    ) -> Optional[str]:
+        """Gets a pinned local copy of an artifact directory.
+
+        If the cache does not contain an entry for the key yet, the artifact
+        directory is downloaded into the cache first. The entry is not
+        evicted until it is released by calling `release` with the same key.
+
+        Args:
+            key: The key identifying the artifact content.
+            uri: The URI of the artifact directory in the artifact store.
+            keep_oversized: Whether to cache artifacts which are larger than
+                the cache anyway. These are evicted as soon as they are
+                released.
+
+        Returns:
+            The local path of the cached artifact directory or `None` if the
+            artifact can't be cached, in which case nothing needs to be
+            released.
+        """
+        entry_path = self.get_entry_path(key)
+        with _lock:
+            # Pin before checking for the entry, so that other processes
+            # can't evict it in between
+            self._pin(key)
+            if os.path.isdir(entry_path):
+                # Mark the entry as recently used
+                os.utime(entry_path)
+                return entry_path
+
+        try:
+            if not fileio.isdir(uri):
+                self.release(key)
+                return None
+            local_path = self._download(
+                key=key, uri=uri, keep_oversized=keep_oversized
+            )
+        except BaseException:
+            self.release(key)
+            raise
+
+        if local_path is None:
+            self.release(key)
+        return local_path
+
+    def release(self, key: str) -> None:
+        """Releases a cache entry pinned by `acquire`.
+
+        Once an entry isn't pinned anymore, it can be evicted if the cache is
+        larger than its maximum size.
+
+        Args:
+            key: The key of the cache entry.
+        """
+        with _lock:
+            entry_path = self.get_entry_path(key)
+            _pins[entry_path] -= 1
+            if _pins[entry_path] > 0:
+                return
+            del _pins[entry_path]
+            try:
+                os.remove(self._get_pin_path(key))
+            except OSError:
+                pass
+            self._evict()
+
+    def release_when_collected(self, key: str, obj: Any) -> None:
+        """Releases a cache entry once an object is garbage collected.
+
+        This keeps entries pinned while objects which lazily read from them,
+        e.g. memory-mapped arrays, are still in use. Entries are released
+        immediately for objects which can't be tracked.
+
+        Args:
+            key: The key of the cache entry.
+            obj: The object which was loaded from the cache entry.
+        """
+        try:
+            weakref.finalize(obj, self.release, key)
+        except TypeError:
+            # The object doesn't support weak references
+            self.release(key)
+
+    def _download(
+        self, key: str, uri: str, keep_oversized: bool
+    ) -> Optional[str]:
+        """Downloads an artifact directory into the cache.
+
+        Args:
+            key: The key identifying the artifact content.
+            uri: The URI of the artifact directory in the artifact store.
+            keep_oversized: Whether to keep artifacts which are larger than
+                the cache.
+
+        Returns:
+            The local path of the cached artifact directory or `None` if the
+            artifact is larger than the cache and should not be kept.
+        """
+        entry_path = self.get_entry_path(key)
+        io_utils.create_dir_recursive_if_not_exists(self.root)
+        download_path = tempfile.mkdtemp(
+            prefix=TEMPORARY_ENTRY_PREFIX, dir=self.root
+        )
+        try:
+            io_utils.copy_dir(uri, download_path)
+            if (
+                not keep_oversized
+                and _get_local_size(download_path) > self.max_size
+            ):
+                logger.debug(
+                    "Not caching artifact `%s` as it is larger than the "
+                    "cache.",
+                    uri,
+                )
+                return None
+
+            with _lock:
+                try:
+                    os.rename(download_path, entry_path)
+                except OSError:
+                    # Another process cached the same artifact in the meantime
+                    if not os.path.isdir(entry_path):
+                        raise
+                os.utime(entry_path)
+                self._evict()
+        finally:
+            shutil.rmtree(download_path, ignore_errors=True)
+
+        return entry_path if os.path.isdir(entry_path) else None
+
+    def _get_pin_path(self, key: str) -> str:
+        """Gets the path of the marker file pinning an entry for this process.
+
+        Args:
+            key: The key of the cache entry.
+
+        Returns:
+            The path of the marker file.
+        """
+        return os.path.join(self.root, PINS_DIRECTORY, key, str(os.getpid()))
+
+    def _pin(self, key: str) -> None:
+        """Pins a cache entry.
+
+        Must be called while holding the lock.
+
+        Args:
+            key: The key of the cache entry.
+        """
+        entry_path = self.get_entry_path(key)
+        if _pins[entry_path] == 0:
+            pin_path = self._get_pin_path(key)
+            os.makedirs(os.path.dirname(pin_path), exist_ok=True)
+            with open(pin_path, "w"):
+                pass
+        _pins[entry_path] += 1
+
+    def _is_pinned(self, key: str) -> bool:
+        """Checks whether a cache entry is pinned by any process.
+
+        Marker files of processes which no longer exist are removed.
+
+        Must be called while holding the lock.
+
+        Args:
+            key: The key of the cache entry.
+
+        Returns:
+            Whether the cache entry is pinned.
+        """
+        if _pins[self.get_entry_path(key)] > 0:
+            return True
+
+        pins_dir = os.path.join(self.root, PINS_DIRECTORY, key)
+        try:
+            pids = os.listdir(pins_dir)
+        except OSError:
+            return False
+
+        pinned = False
+        for pid in pids:
+            if process_exists(int(pid)):
+                pinned = True
+            else:
+                try:
+                    os.remove(os.path.join(pins_dir, pid))
+                except OSError:
+                    pass
+        return pinned
+
+    def _evict(self) -> None:
+        """Evicts the least recently used entries until the cache fits.
+
+        Pinned entries are never evicted but count towards the size of the
+        cache. Must be called while holding the lock.
+        """
+        if not os.path.isdir(self.root):
+            return
+
+        entries: List[Tuple[float, int, str]] = []
+        total_size = 0
+        for name in os.listdir(self.root):
+            if name.startswith((TEMPORARY_ENTRY_PREFIX, PINS_DIRECTORY)):
+                continue
+            path = os.path.join(self.root, name)
+            try:
+                size = _get_local_size(path)
+                entries.append((os.path.getmtime(path), size, name))
+            except OSError:
+                # Evicted by another process
+                continue
+            total_size += size
+
+        for _, size, key in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            if self._is_pinned(key):
+                continue
+
+            # Move the entry out of place before deleting it, so that new pins
+            # never refer to a partially deleted entry. Another process might
+            # have pinned the entry right before it was moved, in which case
+            # it is moved back.
+            path = self.get_entry_path(key)
+            evicted_dir = tempfile.mkdtemp(
+                prefix=TEMPORARY_ENTRY_PREFIX, dir=self.root
+            )
+            evicted_path = os.path.join(evicted_dir, key)
+            try:
+                os.rename(path, evicted_path)
+                if self._is_pinned(key):
+                    os.rename(evicted_path, path)
+                    continue
+            except OSError:
+                # Evicted or cached again by another process
+                continue
+            finally:
+                shutil.rmtree(evicted_dir, ignore_errors=True)
+            total_size -= size
+
+
+def _get_local_size(path: str) -> int:
+    """Gets the size of a local directory.
+
+    Args:
+        path: The path of the directory.
+
+    Returns:
+        The size of all files inside the directory in bytes.
+    """
+    return sum(
+        os.path.getsize(os.path.join(root, file))
+        for root, _, files in os.walk(path)
+        for file in files
+    )
+
+
+def process_exists(pid: int) -> bool:
+    """Checks whether a process exists.
+
+    Args:
+        pid: The ID of the process.
+
+    Returns:
+        Whether the process exists. Always `True` on Windows, where this can't
+        be checked without additional dependencies.
+    """
+    if pid == os.getpid() or os.name == "nt":
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        # The process exists but belongs to another user
+        return True
+    return True
@@ -0,0 +1,148 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Asyncio interface of the ZenML client."""
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from types import TracebackType
+from typing import Any, Awaitable, Callable, Optional, Type, TypeVar
+
+from zenml.client import Client
+
+T = TypeVar("T")
+
+DEFAULT_MAX_CONCURRENCY = 10
+# Prefixes of the client methods which are exposed as coroutines
+ASYNC_METHOD_PREFIXES = ("get_", "list_")
+
+
+class AsyncClient:
+    """Asyncio interface for concurrent read operations of the ZenML client.
+
+    All `get_*` and `list_*` methods of the `Client` are available as
+    coroutines which return the same models. The calls are sent to the ZenML
+    store from a pool of threads, so at most `max_concurrency` of them are in
+    progress at the same time:
+
+    ```python
+    async with AsyncClient(max_concurrency=20) as client:
+        runs = await asyncio.gather(
+            *(client.get_pipeline_run(run_id) for run_id in run_ids)
+        )
+    ```
+
+    For a `RestZenStore`, the concurrency should not exceed the size of its
+    connection pool (`http_pool_size`), as additional requests would
+    otherwise open connections which are not kept alive.
+    """
+
+    def __init__(
+        self,
+        client: Optional[Client] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> None:
+        """Initializes the async client.
+
+        Args:
+            client: The client to use. Defaults to the global client.
+            max_concurrency: The maximum number of concurrent calls to the
+                ZenML store.
+
+        Raises:
+            ValueError: If the maximum concurrency is not positive.
+        """
+        if max_concurrency < 1:
+            raise ValueError(
+                "The maximum concurrency of the async client needs to be "
+                f"positive, got {max_concurrency}."
+            )
+        self._client = client or Client()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="zenml-client"
+        )
+
+    async def run(
+        self, func: Callable[..., T], *args: Any, **kwargs: Any
+    ) -> T:
+        """Runs a blocking function in one of the threads of the client.
+
+        This can be used to run other client methods, e.g. to delete
+        entities, concurrently.
+
+        Args:
+            func: The function to run.
+            *args: Positional arguments for the function.
+            **kwargs: Keyword arguments for the function.
+
+        Returns:
+            The return value of the function.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(func, *args, **kwargs)
+        )
+
+    def __getattr__(self, name: str) -> Callable[..., Awaitable[Any]]:
+        """Gets a client method as coroutine function.
+
+        Args:
+            name: The name of the client method.
+
+        Returns:
+            A coroutine function which calls the client method.
+
+        Raises:
+            AttributeError: If the client has no such read method.
+        """
+        if not name.startswith(ASYNC_METHOD_PREFIXES):
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'."
+            )
+        method = getattr(self._client, name)
+        if not callable(method):
+            raise AttributeError(f"Client attribute `{name}` is no method.")
+
+        @functools.wraps(method)
+        async def _call(*args: Any, **kwargs: Any) -> Any:
+            return await self.run(method, *args, **kwargs)
+
+        return _call
+
+    def close(self) -> None:
+        """Waits for all running calls and stops the threads of the client."""
+        self._executor.shutdown(wait=True)
+
+    async def __aenter__(self) -> "AsyncClient":
+        """Enters the async context.
+
+        Returns:
+            The async client.
+        """
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Exits the async context and stops the threads of the client.
+
+        Args:
+            exc_type: The type of the raised exception.
+            exc_value: The raised exception.
+            traceback: The traceback of the raised exception.
+        """
+        self.close()
@@ -40,6 +40,7 @@ from pydantic import SecretStr
 from zenml.config.global_config import GlobalConfiguration
 from zenml.config.source import Source
 from zenml.constants import (
+    CLIENT_CACHE_TTL,
     ENV_ZENML_ACTIVE_STACK_ID,
     ENV_ZENML_ACTIVE_WORKSPACE_ID,
     ENV_ZENML_ENABLE_REPO_INIT_WARNINGS,
@@ -142,6 +143,7 @@ from zenml.models.schedule_model import (
 )
 from zenml.utils import io_utils, source_utils
 from zenml.utils.analytics_utils import AnalyticsEvent, event_handler, track
+from zenml.utils.entity_cache import EntityCache
 from zenml.utils.filesync_model import FileSyncModel
 from zenml.utils.pagination_utils import depaginate
 
@@ -153,6 +155,7 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 AnyResponseModel = TypeVar("AnyResponseModel", bound=BaseResponseModel)
+T = TypeVar("T")
 
 
 class ClientConfiguration(FileSyncModel):
@@ -267,9 +270,14 @@ class Client(metaclass=ClientMetaClass):
 
     The ZenML client manages configuration options for ZenML stacks as well
     as their components.
+
+    The active user, workspace and stack model as well as the flavors of the
+    stack components are cached for `ZENML_CLIENT_CACHE_TTL` seconds by all client
+    instances of the process. The cache is invalidated whenever one of these
+    entities is updated or deleted through the client.
     """
 
-    _active_user: Optional[UserResponseModel] = None
+    _entity_cache = EntityCache(ttl=CLIENT_CACHE_TTL)
 
     def __init__(
         self,
@@ -327,6 +335,7 @@ class Client(metaclass=ClientMetaClass):
                 value.
         """
         cls._global_client = client
+        cls.invalidate_cache()
 
     def _set_active_root(self, root: Optional[Path] = None) -> None:
         """Set the supplied path as the repository root.
@@ -418,6 +427,28 @@ class Client(metaclass=ClientMetaClass):
 
         return ClientConfiguration(config_file=config_path)
 
+    def _get_cached(self, key: Tuple[Any, ...], load: Callable[[], T]) -> T:
+        """Gets an entity from the process-level entity cache.
+
+        Args:
+            key: The key of the entity.
+            load: Function which fetches the entity if it's not cached.
+
+        Returns:
+            The entity.
+        """
+        return self._entity_cache.get(key, load)
+
+    @classmethod
+    def invalidate_cache(cls) -> None:
+        """Invalidates the cached users, workspaces, stacks and flavors.
+
+        This only needs to be called after modifying these entities without
+        using the client, e.g. through the store directly. The cache is also
+        invalidated whenever the global store is configured.
+        """
+        cls._entity_cache.invalidate()
+
     @staticmethod
     def initialize(
         root: Optional[Path] = None,
@@ -641,9 +672,10 @@ class Client(metaclass=ClientMetaClass):
         Returns:
             The active user.
         """
-        if self._active_user is None:
-            self._active_user = self.zen_store.get_user(include_private=True)
-        return self._active_user
+        return self._get_cached(
+            ("active_user",),
+            lambda: self.zen_store.get_user(include_private=True),
+        )
 
     def create_user(
         self,
@@ -705,6 +737,8 @@ class Client(metaclass=ClientMetaClass):
         sort_by: str = "created",
         page: int = PAGINATION_STARTING_PAGE,
         size: int = PAGE_SIZE_DEFAULT,
+        cursor: Optional[str] = None,
+        count: bool = True,
         logical_operator: LogicalOperators = LogicalOperators.AND,
         id: Optional[Union[UUID, str]] = None,
         created: Optional[Union[datetime, str]] = None,
@@ -721,6 +755,9 @@ class Client(metaclass=ClientMetaClass):
             sort_by: The column to sort by
             page: The page of items
             size: The maximum size of all pages
+            cursor: The `next_cursor` of a previous page to continue
+                after.
+            count: Whether to count the total number of items and pages.
             logical_operator: Which logical operator to use [and, or]
             id: Use the id of stacks to filter by.
             created: Use to filter by time of creation
@@ -739,6 +776,8 @@ class Client(metaclass=ClientMetaClass):
                 sort_by=sort_by,
                 page=page,
                 size=size,
+                cursor=cursor,
+                count=count,
                 logical_operator=logical_operator,
                 id=id,
                 created=created,
@@ -759,6 +798,7 @@ class Client(metaclass=ClientMetaClass):
         """
         user = self.get_user(name_id_or_prefix, allow_name_prefix_match=False)
         self.zen_store.delete_user(user_name_or_id=user.name)
+        self.invalidate_cache()
 
     def update_user(
         self,
@@ -798,9 +838,11 @@ class Client(metaclass=ClientMetaClass):
         if updated_hub_token is not None:
             user_update.hub_token = updated_hub_token
 
-        return self.zen_store.update_user(
+        updated_user = self.zen_store.update_user(
             user_id=user.id, user_update=user_update
         )
+        self.invalidate_cache()
+        return updated_user
 
     # ---- #
     # TEAM #
@@ -832,6 +874,8 @@ class Client(metaclass=ClientMetaClass):
         sort_by: str = "created",
         page: int = PAGINATION_STARTING_PAGE,
         size: int = PAGE_SIZE_DEFAULT,
+        cursor: Optional[str] = None,
+        count: bool = True,
         logical_operator: LogicalOperators = LogicalOperators.AND,
         id: Optional[Union[UUID, str]] = None,
         created: Optional[Union[datetime, str]] = None,
@@ -844,6 +888,9 @@ class Client(metaclass=ClientMetaClass):
             sort_by: The column to sort by
             page: The page of items
             size: The maximum size of all pages
+            cursor: The `next_cursor` of a previous page to continue
+                after.
+            count: Whether to count the total number of items and pages.
             logical_operator: Which logical operator to use [and, or]
             id: Use the id of teams to filter by.
             created: Use to filter by time of creation
@@ -858,6 +905,8 @@ class Client(metaclass=ClientMetaClass):
                 sort_by=sort_by,
                 page=page,
                 size=size,
+                cursor=cursor,
+                count=count,
                 logical_operator=logical_operator,
                 id=id,
                 created=created,
@@ -991,6 +1040,8 @@ class Client(metaclass=ClientMetaClass):
         sort_by: str = "created",
         page: int = PAGINATION_STARTING_PAGE,
         size: int = PAGE_SIZE_DEFAULT,
+        cursor: Optional[str] = None,
+        count: bool = True,
         logical_operator: LogicalOperators = LogicalOperators.AND,
         id: Optional[Union[UUID, str]] = None,
         created: Optional[Union[datetime, str]] = None,
@@ -1003,6 +1054,9 @@ class Client(metaclass=ClientMetaClass):
             sort_by: The column to sort by
             page: The page of items
             size: The maximum size of all pages
+            cursor: The `next_cursor` of a previous page to continue
+                after.
+            count: Whether to count the total number of items and pages.
             logical_operator: The logical operator to use between column filters
             id: Use the id of roles to filter by.
             created: Use to filter by time of creation
@@ -1017,6 +1071,8 @@ class Client(metaclass=ClientMetaClass):
                 sort_by=sort_by,
                 page=page,
                 size=size,
+                cursor=cursor,
+                count=count,
                 logical_operator=logical_operator,
                 id=id,
                 created=created,
@@ -1189,6 +1245,8 @@ class Client(metaclass=ClientMetaClass):
         sort_by: str = "created",
         page: int = PAGINATION_STARTING_PAGE,
         size: int = PAGE_SIZE_DEFAULT,
+        cursor: Optional[str] = None,
+        count: bool = True,
         logical_operator: LogicalOperators = LogicalOperators.AND,
         id: Optional[Union[UUID, str]] = None,
         created: Optional[Union[datetime, str]] = None,
@@ -1203,6 +1261,9 @@ class Client(metaclass=ClientMetaClass):
             sort_by: The column to sort by
             page: The page of items
             size: The maximum size of all pages
+            cursor: The `next_cursor` of a previous page to continue
+                after.
+            count: Whether to count the total number of items and pages.
             logical_operator: Which logical operator to use [and, or]
             id: Use the id of the user role assignment to filter by.
             created: Use to filter by time of creation
@@ -1219,6 +1280,8 @@ class Client(metaclass=ClientMetaClass):
                 sort_by=sort_by,
                 page=page,
                 size=size,
+                cursor=cursor,
+                count=count,
                 logical_operator=logical_operator,
                 id=id,
                 created=created,
@@ -1295,6 +1358,8 @@ class Client(metaclass=ClientMetaClass):
         sort_by: str = "created",
         page: int = PAGINATION_STARTING_PAGE,
         size: int = PAGE_SIZE_DEFAULT,
+        cursor: Optional[str] = None,
+        count: bool = True,
         logical_operator: LogicalOperators = LogicalOperators.AND,
         id: Optional[Union[UUID, str]] = None,
         created: Optional[Union[datetime, str]] = None,
@@ -1309,6 +1374,9 @@ class Client(metaclass=ClientMetaClass):
             sort_by: The column to sort by
             page: The page of items
             size: The maximum size of all pages
+            cursor: The `next_cursor` of a previous page to continue
+                after.
+            count: Whether to count the total number of items and pages.
             logical_operator: Which logical operator to use [and, or]
             id: Use the id of the team role assignment to filter by.
             created: Use to filter by time of creation
@@ -1325,6 +1393,8 @@ class Client(metaclass=ClientMetaClass):
                 sort_by=sort_by,
                 page=page,
                 size=size,
+                cursor=cursor,
+                count=count,
                 logical_operator=logical_operator,
                 id=id,
                 created=created,
@@ -1354,7 +1424,10 @@ class Client(metaclass=ClientMetaClass):
         """
         if ENV_ZENML_ACTIVE_WORKSPACE_ID in os.environ:
             workspace_id = os.environ[ENV_ZENML_ACTIVE_WORKSPACE_ID]
-            return self.get_workspace(workspace_id)
+            return self._get_cached(
+                ("workspace", workspace_id),
+                lambda: self.get_workspace(workspace_id),
+            )
 
         workspace: Optional["WorkspaceResponseModel"] = None
         if self._config:
@@ -1411,6 +1484,8 @@ class Client(metaclass=ClientMetaClass):
         sort_by: str = "created",
         page: int = PAGINATION_STARTING_PAGE,
         size: int = PAGE_SIZE_DEFAULT,
+        cursor: Optional[str] = None,
+        count: bool = True,
         logical_operator: LogicalOperators = LogicalOperators.AND,
         id: Optional[Union[UUID, str]] = None,
         created: Optional[Union[datetime, str]] = None,
@@ -1423,6 +1498,9 @@ class Client(metaclass=ClientMetaClass):
             sort_by: The column to sort by
             page: The page of items
             size: The maximum size of all pages
+            cursor: The `next_cursor` of a previous page to continue
+                after.
+            count: Whether to count the total number of items and pages.
             logical_operator: Which logical operator to use [and, or]
             id: Use the id of teams to filter by.
             created: Use to filter by time of creation
@@ -1437,6 +1515,8 @@ class Client(metaclass=ClientMetaClass):
                 sort_by=sort_by,
                 page=page,
                 size=size,
+                cursor=cursor,
+                count=count,
                 logical_operator=logical_operator,
                 id=id,
                 created=created,
@@ -1485,10 +1565,12 @@ class Client(metaclass=ClientMetaClass):
         )
         if new_description:
             workspace_update.description = new_description
-        return self.zen_store.update_workspace(
+        updated_workspace = self.zen_store.update_workspace(
             workspace_id=workspace.id,
             workspace_update=workspace_update,
         )
+        self.invalidate_cache()
+        return updated_workspace
 
     def delete_workspace(self, name_id_or_prefix: str) -> None:
         """Delete a workspace.
@@ -1510,6 +1592,7 @@ class Client(metaclass=ClientMetaClass):
                 "active first."
             )
         self.zen_store.delete_workspace(workspace_name_or_id=workspace.id)
+        self.invalidate_cache()
 
     # ------ #
     # STACKS #
@@ -1531,13 +1614,15 @@ class Client(metaclass=ClientMetaClass):
 
         if ENV_ZENML_ACTIVE_STACK_ID in os.environ:
             stack_id = os.environ[ENV_ZENML_ACTIVE_STACK_ID]
-            return self.get_stack(stack_id)
+            return self._get_cached_stack(stack_id)
 
         if self._config:
-            stack = self.get_stack(self._config.active_stack_id)
+            stack = self._get_cached_stack(self._config.active_stack_id)
 
         if not stack:
-            stack = self.get_stack(GlobalConfiguration().get_active_stack_id())
+            stack = self._get_cached_stack(
+                GlobalConfiguration().get_active_stack_id()
+            )
 
         if not stack:
             raise RuntimeError(
@@ -1551,6 +1636,10 @@ class Client(metaclass=ClientMetaClass):
     def active_stack(self) -> "Stack":
         """The active stack for this client.
 
+        A new stack instance is created on every access, as stack components
+        keep state of the pipeline runs they are used for. Only the stack
+        model and the flavors of its components are cached.
+
         Returns:
             The active stack for this client.
         """
@@ -1558,6 +1647,21 @@ class Client(metaclass=ClientMetaClass):
 
         return Stack.from_model(self.active_stack_model)
 
+    def _get_cached_stack(
+        self, stack_id: Optional[Union[UUID, str]]
+    ) -> "StackResponseModel":
+        """Gets a stack model from the process-level entity cache.
+
+        Args:
+            stack_id: The ID of the stack.
+
+        Returns:
+            The stack model.
+        """
+        return self._get_cached(
+            ("stack", str(stack_id)), lambda: self.get_stack(stack_id)
+        )
+
     def get_stack(
         self,
         name_id_or_prefix: Optional[Union[UUID, str]] = None,
@@ -1746,10 +1850,12 @@ class Client(metaclass=ClientMetaClass):
 
             update_model.components = components_dict
 
-        return self.zen_store.update_stack(
+        updated_stack = self.zen_store.update_stack(
             stack_id=stack.id,
             stack_update=update_model,
         )
+        self.invalidate_cache()
+        return updated_stack
 
     def delete_stack(
         self, name_id_or_prefix: Union[str, UUID], recursive: bool = False
@@ -1818,6 +1924,7 @@ class Client(metaclass=ClientMetaClass):
             return
 
         self.zen_store.delete_stack(stack_id=stack.id)
+        self.invalidate_cache()
         logger.info("Deregistered stack with name '%s'.", stack.name)
 
     def list_stacks(
@@ -1825,6 +1932,8 @@ class Client(metaclass=ClientMetaClass):
         sort_by: str = "created",
         page: int = PAGINATION_STARTING_PAGE,
         size: int = PAGE_SIZE_DEFAULT,
+        cursor: Optional[str] = None,
+        count: bool = True,
         logical_operator: LogicalOperators = LogicalOperators.AND,
         id: Optional[Union[UUID, str]] = None,
         created: Optional[datetime] = None,
@@ -1842,6 +1951,9 @@ class Client(metaclass=ClientMetaClass):
             sort_by: The column to sort by
             page: The page of items
             size: The maximum size of all pages
+            cursor: The `next_cursor` of a previous page to continue
+                after.
+            count: Whether to count the total number of items and pages.
             logical_operator: Which logical operator to use [and, or]
             id: Use the id of stacks to filter by.
             created: Use to filter by time of creation
@@ -1859,6 +1971,8 @@ class Client(metaclass=ClientMetaClass):
         stack_filter_model = StackFilterModel(
             page=page,
             size=size,
+            cursor=cursor,
+            count=count,
             sort_by=sort_by,
             logical_operator=logical_operator,
             workspace_id=workspace_id,
@@ -2045,6 +2159,8 @@ class Client(metaclass=ClientMetaClass):
         sort_by: str = "created",
         page: int = PAGINATION_STARTING_PAGE,
         size: int = PAGE_SIZE_DEFAULT,
+        cursor: Optional[str] = None,
+        count: bool = True,
         logical_operator: LogicalOperators = LogicalOperators.AND,
         id: Optional[Union[UUID, str]] = None,
         created: Optional[datetime] = None,
@@ -2063,6 +2179,9 @@ class Client(metaclass=ClientMetaClass):
             sort_by: The column to sort by
             page: The page of items
             size: The maximum size of all pages
+            cursor: The `next_cursor` of a previous page to continue
+                after.
+            count: Whether to count the total number of items and pages.
             logical_operator: Which logical operator to use [and, or]
             id: Use the id of component to filter by.
             created: Use to component by time of creation
@@ -2081,6 +2200,8 @@ class Client(metaclass=ClientMetaClass):
         component_filter_model = ComponentFilterModel(
             page=page,
             size=size,
+            cursor=cursor,
+            count=count,
             sort_by=sort_by,
             logical_operator=logical_operator,
             workspace_id=workspace_id or self.active_workspace.id,
@@ -2207,7 +2328,7 @@ class Client(metaclass=ClientMetaClass):
                 is_shared=shared_status,
                 type=component_type,
             )
-            if existing_components.total > 0:
+            if existing_components.total:
                 raise EntityExistsError(
                     f"There are already existing "
                     f"{'shared' if shared_status else 'unshared'} components "
@@ -2267,10 +2388,12 @@ class Client(metaclass=ClientMetaClass):
             update_model.connector_resource_id = connector_resource_id
 
         # Send the updated component to the ZenStore
-        return self.zen_store.update_stack_component(
+        updated_component = self.zen_store.update_stack_component(
             component_id=component.id,
             component_update=update_model,
         )
+        self.invalidate_cache()
+        return updated_component
 
     def delete_stack_component(
         self,
@@ -2290,6 +2413,7 @@ class Client(metaclass=ClientMetaClass):
         )
 
         self.zen_store.delete_stack_component(component_id=component.id)
+        self.invalidate_cache()
         logger.info(
             "Deregistered stack component (type: %s) with name '%s'.",
             component.type,
@@ -2610,7 +2734,11 @@ class Client(metaclass=ClientMetaClass):
             workspace=self.active_workspace.id,
         )
 
-        return self.zen_store.create_flavor(flavor=create_flavor_request)
+        created_flavor = self.zen_store.create_flavor(
+            flavor=create_flavor_request
+        )
+        self.invalidate_cache()
+        return created_flavor
 
     def get_flavor(
         self,
@@ -2645,6 +2773,7 @@ class Client(metaclass=ClientMetaClass):
             name_id_or_prefix, allow_name_prefix_match=False
         )
         self.zen_store.delete_flavor(flavor_id=flavor.id)
+        self.invalidate_cache()
 
         logger.info(f"Deleted flavor '{flavor.name}' of type '{flavor.type}'.")
 
@@ -2653,6 +2782,8 @@ class Client(metaclass=ClientMetaClass):
         sort_by: str = "created",
         page: int = PAGINATION_STARTING_PAGE,
         size: int = PAGE_SIZE_DEFAULT,
+        cursor: Optional[str] = None,
+        count: bool = True,
         logical_operator: LogicalOperators = LogicalOperators.AND,
         id: Optional[Union[UUID, str]] = None,
         created: Optional[datetime] = None,
@@ -2668,6 +2799,9 @@ class Client(metaclass=ClientMetaClass):
             sort_by: The column to sort by
             page: The page of items
             size: The maximum size of all pages
+            cursor: The `next_cursor` of a previous page to continue
+                after.
+            count: Whether to count the total number of items and pages.
             logical_operator: Which logical operator to use [and, or]
             id: Use the id of flavors to filter by.
             created: Use to flavors by time of creation
@@ -2683,6 +2817,8 @@ class Client(metaclass=ClientMetaClass):
         flavor_filter_model = FlavorFilterModel(
             page=page,
             size=size,
+            cursor=cursor,
+            count=count,
             sort_by=sort_by,
             logical_operator=logical_operator,
             user_id=user_id,
@@ -2734,10 +2870,10 @@ class Client(metaclass=ClientMetaClass):
             f"Fetching the flavor of type {component_type} with name {name}."
         )
 
-        flavors = self.list_flavors(
-            type=component_type,
-            name=name,
-        ).items
+        flavors = self._get_cached(
+            ("flavors", component_type, name),
+            lambda: self.list_flavors(type=component_type, name=name).items,
+        )
 
         if flavors:
             if len(flavors) > 1:
@@ -2762,6 +2898,8 @@ class Client(metaclass=ClientMetaClass):
         sort_by: str = "created",
         page: int = PAGINATION_STARTING_PAGE,
         size: int = PAGE_SIZE_DEFAULT,
+        cursor: Optional[str] = None,
+        count: bool = True,
         logical_operator: LogicalOperators = LogicalOperators.AND,
         id: Optional[Union[UUID, str]] = None,
         created: Optional[Union[datetime, str]] = None,
@@ -2779,6 +2917,9 @@ class Client(metaclass=ClientMetaClass):
             sort_by: The column to sort by
             page: The page of items
             size: The maximum size of all pages
+            cursor: The `next_cursor` of a previous page to continue
+                after.
+            count: Whether to count the total number of items and pages.
             logical_operator: Which logical operator to use [and, or]
             id: Use the id of pipeline to filter by.
             created: Use to filter by time of creation
@@ -2797,6 +2938,8 @@ class Client(metaclass=ClientMetaClass):
             sort_by=sort_by,
             page=page,
             size=size,
+            cursor=cursor,
+            count=count,
             logical_operator=logical_operator,
             id=id,
             created=created,
@@ -2912,6 +3055,8 @@ class Client(metaclass=ClientMetaClass):
         sort_by: str = "created",
         page: int = PAGINATION_STARTING_PAGE,
         size: int = PAGE_SIZE_DEFAULT,
+        cursor: Optional[str] = None,
+        count: bool = True,
         logical_operator: LogicalOperators = LogicalOperators.AND,
         id: Optional[Union[UUID, str]] = None,
         created: Optional[Union[datetime, str]] = None,
@@ -2932,6 +3077,9 @@ class Client(metaclass=ClientMetaClass):
             sort_by: The column to sort by
             page: The page of items
             size: The maximum size of all pages
+            cursor: The `next_cursor` of a previous page to continue
+                after.
+            count: Whether to count the total number of items and pages.
             logical_operator: Which logical operator to use [and, or]
             id: Use the id of build to filter by.
             created: Use to filter by time of creation
@@ -2953,6 +3101,8 @@ class Client(metaclass=ClientMetaClass):
             sort_by=sort_by,
             page=page,
             size=size,
+            cursor=cursor,
+            count=count,
             logical_operator=logical_operator,
             id=id,
             created=created,
@@ -3034,6 +3184,8 @@ class Client(metaclass=ClientMetaClass):
         sort_by: str = "created",
         page: int = PAGINATION_STARTING_PAGE,
         size: int = PAGE_SIZE_DEFAULT,
+        cursor: Optional[str] = None,
+        count: bool = True,
         logical_operator: LogicalOperators = LogicalOperators.AND,
         id: Optional[Union[UUID, str]] = None,
         created: Optional[Union[datetime, str]] = None,
@@ -3050,6 +3202,9 @@ class Client(metaclass=ClientMetaClass):
             sort_by: The column to sort by
             page: The page of items
             size: The maximum size of all pages
+            cursor: The `next_cursor` of a previous page to continue
+                after.
+            count: Whether to count the total number of items and pages.
             logical_operator: Which logical operator to use [and, or]
             id: Use the id of build to filter by.
             created: Use to filter by time of creation
@@ -3067,6 +3222,8 @@ class Client(metaclass=ClientMetaClass):
             sort_by=sort_by,
             page=page,
             size=size,
+            cursor=cursor,
+            count=count,
             logical_operator=logical_operator,
             id=id,
             created=created,
@@ -3146,6 +3303,8 @@ class Client(metaclass=ClientMetaClass):
         sort_by: str = "created",
         page: int = PAGINATION_STARTING_PAGE,
         size: int = PAGE_SIZE_DEFAULT,
+        cursor: Optional[str] = None,
+        count: bool = True,
         logical_operator: LogicalOperators = LogicalOperators.AND,
         id: Optional[Union[UUID, str]] = None,
         created: Optional[Union[datetime, str]] = None,
@@ -3168,6 +3327,9 @@ class Client(metaclass=ClientMetaClass):
             sort_by: The column to sort by
             page: The page of items
             size: The maximum size of all pages
+            cursor: The `next_cursor` of a previous page to continue
+                after.
+            count: Whether to count the total number of items and pages.
             logical_operator: Which logical operator to use [and, or]
             id: Use the id of stacks to filter by.
             created: Use to filter by time of creation
@@ -3191,6 +3353,8 @@ class Client(metaclass=ClientMetaClass):
             sort_by=sort_by,
             page=page,
             size=size,
+            cursor=cursor,
+            count=count,
             logical_operator=logical_operator,
             id=id,
             created=created,
@@ -3259,6 +3423,8 @@ class Client(metaclass=ClientMetaClass):
         sort_by: str = "created",
         page: int = PAGINATION_STARTING_PAGE,
         size: int = PAGE_SIZE_DEFAULT,
+        cursor: Optional[str] = None,
+        count: bool = True,
         logical_operator: LogicalOperators = LogicalOperators.AND,
         id: Optional[Union[UUID, str]] = None,
         created: Optional[Union[datetime, str]] = None,
@@ -3285,6 +3451,9 @@ class Client(metaclass=ClientMetaClass):
             sort_by: The column to sort by
             page: The page of items
             size: The maximum size of all pages
+            cursor: The `next_cursor` of a previous page to continue
+                after.
+            count: Whether to count the total number of items and pages.
             logical_operator: Which logical operator to use [and, or]
             id: The id of the runs to filter by.
             created: Use to filter by time of creation
@@ -3312,6 +3481,8 @@ class Client(metaclass=ClientMetaClass):
             sort_by=sort_by,
             page=page,
             size=size,
+            cursor=cursor,
+            count=count,
             logical_operator=logical_operator,
             id=id,
             created=created,
@@ -3379,6 +3550,8 @@ class Client(metaclass=ClientMetaClass):
         sort_by: str = "created",
         page: int = PAGINATION_STARTING_PAGE,
         size: int = PAGE_SIZE_DEFAULT,
+        cursor: Optional[str] = None,
+        count: bool = True,
         logical_operator: LogicalOperators = LogicalOperators.AND,
         id: Optional[Union[UUID, str]] = None,
         created: Optional[Union[datetime, str]] = None,
@@ -3402,6 +3575,9 @@ class Client(metaclass=ClientMetaClass):
             sort_by: The column to sort by
             page: The page of items
             size: The maximum size of all pages
+            cursor: The `next_cursor` of a previous page to continue
+                after.
+            count: Whether to count the total number of items and pages.
             logical_operator: Which logical operator to use [and, or]
             id: Use the id of runs to filter by.
             created: Use to filter by time of creation
@@ -3426,6 +3602,8 @@ class Client(metaclass=ClientMetaClass):
             sort_by=sort_by,
             page=page,
             size=size,
+            cursor=cursor,
+            count=count,
             logical_operator=logical_operator,
             id=id,
             entrypoint_name=entrypoint_name,
@@ -3468,6 +3646,8 @@ class Client(metaclass=ClientMetaClass):
         sort_by: str = "created",
         page: int = PAGINATION_STARTING_PAGE,
         size: int = PAGE_SIZE_DEFAULT,
+        cursor: Optional[str] = None,
+        count: bool = True,
         logical_operator: LogicalOperators = LogicalOperators.AND,
         id: Optional[Union[UUID, str]] = None,
         created: Optional[Union[datetime, str]] = None,
@@ -3488,6 +3668,9 @@ class Client(metaclass=ClientMetaClass):
             sort_by: The column to sort by
             page: The page of items
             size: The maximum size of all pages
+            cursor: The `next_cursor` of a previous page to continue
+                after.
+            count: Whether to count the total number of items and pages.
             logical_operator: Which logical operator to use [and, or]
             id: Use the id of runs to filter by.
             created: Use to filter by time of creation
@@ -3509,6 +3692,8 @@ class Client(metaclass=ClientMetaClass):
             sort_by=sort_by,
             page=page,
             size=size,
+            cursor=cursor,
+            count=count,
             logical_operator=logical_operator,
             id=id,
             created=created,
@@ -3660,8 +3845,6 @@ class Client(metaclass=ClientMetaClass):
             ValueError: If not exactly one of either `pipeline_run_id`,
                 `step_run_id`, or `artifact_id` is provided.
         """
-        from zenml.metadata.metadata_types import get_metadata_type
-
         if not (pipeline_run_id or step_run_id or artifact_id):
             raise ValueError(
                 "Cannot create run metadata without linking it to any entity. "
@@ -3679,7 +3862,87 @@ class Client(metaclass=ClientMetaClass):
                 "`step_run_id` or only an `artifact_id`."
             )
 
-        created_metadata: Dict[str, RunMetadataResponseModel] = {}
+        created_metadata = self.zen_store.create_run_metadata_batch(
+            self._get_run_metadata_requests(
+                metadata=metadata,
+                pipeline_run_id=pipeline_run_id,
+                step_run_id=step_run_id,
+                artifact_id=artifact_id,
+                stack_component_id=stack_component_id,
+            )
+        )
+        return {
+            metadata_model.key: metadata_model
+            for metadata_model in created_metadata
+        }
+
+    def create_run_metadata_for_artifacts(
+        self,
+        metadata: Dict[UUID, Dict[str, "MetadataType"]],
+        stack_component_id: Optional[UUID] = None,
+    ) -> Dict[UUID, Dict[str, RunMetadataResponseModel]]:
+        """Create run metadata for multiple artifacts in a single request.
+
+        Args:
+            metadata: The metadata to create, mapping artifact IDs to
+                dictionaries of key-value pairs.
+            stack_component_id: The ID of the stack component that produced
+                the metadata.
+
+        Returns:
+            The created metadata, mapping artifact IDs to string to model
+            dictionaries.
+        """
+        run_metadata_requests: List[RunMetadataRequestModel] = []
+        for artifact_id, artifact_metadata in metadata.items():
+            run_metadata_requests += self._get_run_metadata_requests(
+                metadata=artifact_metadata,
+                artifact_id=artifact_id,
+                stack_component_id=stack_component_id,
+            )
+
+        created_metadata: Dict[UUID, Dict[str, RunMetadataResponseModel]] = {
+            artifact_id: {} for artifact_id in metadata
+        }
+        for metadata_model in self.zen_store.create_run_metadata_batch(
+            run_metadata_requests
+        ):
+            if metadata_model.artifact_id in created_metadata:
+                created_metadata[metadata_model.artifact_id][
+                    metadata_model.key
+                ] = metadata_model
+        return created_metadata
+
+    def _get_run_metadata_requests(
+        self,
+        metadata: Dict[str, "MetadataType"],
+        pipeline_run_id: Optional[UUID] = None,
+        step_run_id: Optional[UUID] = None,
+        artifact_id: Optional[UUID] = None,
+        stack_component_id: Optional[UUID] = None,
+    ) -> List[RunMetadataRequestModel]:
+        """Creates the requests to store run metadata.
+
+        Metadata values which are too large or not of a supported type are
+        skipped.
+
+        Args:
+            metadata: The metadata as a dictionary of key-value pairs.
+            pipeline_run_id: The ID of the pipeline run during which the
+                metadata was produced.
+            step_run_id: The ID of the step run during which the metadata was
+                produced.
+            artifact_id: The ID of the artifact for which the metadata was
+                produced.
+            stack_component_id: The ID of the stack component that produced
+                the metadata.
+
+        Returns:
+            The run metadata requests.
+        """
+        from zenml.metadata.metadata_types import get_metadata_type
+
+        run_metadata_requests: List[RunMetadataRequestModel] = []
         for key, value in metadata.items():
             # Skip metadata that is too large to be stored in the database.
             if len(json.dumps(value)) > TEXT_FIELD_MAX_LENGTH:
@@ -3699,26 +3962,28 @@ class Client(metaclass=ClientMetaClass):
                 )
                 continue
 
-            run_metadata = RunMetadataRequestModel(
-                workspace=self.active_workspace.id,
-                user=self.active_user.id,
-                pipeline_run_id=pipeline_run_id,
-                step_run_id=step_run_id,
-                artifact_id=artifact_id,
-                stack_component_id=stack_component_id,
-                key=key,
-                value=value,
-                type=metadata_type,
+            run_metadata_requests.append(
+                RunMetadataRequestModel(
+                    workspace=self.active_workspace.id,
+                    user=self.active_user.id,
+                    pipeline_run_id=pipeline_run_id,
+                    step_run_id=step_run_id,
+                    artifact_id=artifact_id,
+                    stack_component_id=stack_component_id,
+                    key=key,
+                    value=value,
+                    type=metadata_type,
+                )
             )
-            metadata_model = self.zen_store.create_run_metadata(run_metadata)
-            created_metadata[key] = metadata_model
-        return created_metadata
+        return run_metadata_requests
 
     def list_run_metadata(
         self,
         sort_by: str = "created",
         page: int = PAGINATION_STARTING_PAGE,
         size: int = PAGE_SIZE_DEFAULT,
+        cursor: Optional[str] = None,
+        count: bool = True,
         logical_operator: LogicalOperators = LogicalOperators.AND,
         id: Optional[Union[UUID, str]] = None,
         created: Optional[Union[datetime, str]] = None,
@@ -3739,6 +4004,9 @@ class Client(metaclass=ClientMetaClass):
             sort_by: The field to sort the results by.
             page: The page number to return.
             size: The number of results to return per page.
+            cursor: The `next_cursor` of a previous page to continue
+                after.
+            count: Whether to count the total number of items and pages.
             logical_operator: The logical operator to use for filtering.
             id: The ID of the metadata.
             created: The creation time of the metadata.
@@ -3761,6 +4029,8 @@ class Client(metaclass=ClientMetaClass):
             sort_by=sort_by,
             page=page,
             size=size,
+            cursor=cursor,
+            count=count,
             logical_operator=logical_operator,
             id=id,
             created=created,
@@ -3994,6 +4264,8 @@ class Client(metaclass=ClientMetaClass):
         sort_by: str = "created",
         page: int = PAGINATION_STARTING_PAGE,
         size: int = PAGE_SIZE_DEFAULT,
+        cursor: Optional[str] = None,
+        count: bool = True,
         logical_operator: LogicalOperators = LogicalOperators.AND,
         id: Optional[Union[UUID, str]] = None,
         created: Optional[datetime] = None,
@@ -4012,6 +4284,9 @@ class Client(metaclass=ClientMetaClass):
             sort_by: The column to sort by
             page: The page of items
             size: The maximum size of all pages
+            cursor: The `next_cursor` of a previous page to continue
+                after.
+            count: Whether to count the total number of items and pages.
             logical_operator: Which logical operator to use [and, or]
             id: Use the id of secrets to filter by.
             created: Use to secrets by time of creation
@@ -4031,6 +4306,8 @@ class Client(metaclass=ClientMetaClass):
         secret_filter_model = SecretFilterModel(
             page=page,
             size=size,
+            cursor=cursor,
+            count=count,
             sort_by=sort_by,
             logical_operator=logical_operator,
             user_id=user_id,
@@ -4220,6 +4497,8 @@ class Client(metaclass=ClientMetaClass):
         sort_by: str = "created",
         page: int = PAGINATION_STARTING_PAGE,
         size: int = PAGE_SIZE_DEFAULT,
+        cursor: Optional[str] = None,
+        count: bool = True,
         logical_operator: LogicalOperators = LogicalOperators.AND,
         id: Optional[Union[UUID, str]] = None,
         created: Optional[Union[datetime, str]] = None,
@@ -4234,6 +4513,9 @@ class Client(metaclass=ClientMetaClass):
             sort_by: The column to sort by.
             page: The page of items.
             size: The maximum size of all pages.
+            cursor: The `next_cursor` of a previous page to continue
+                after.
+            count: Whether to count the total number of items and pages.
             logical_operator: Which logical operator to use [and, or].
             id: Use the id of the code repository to filter by.
             created: Use to filter by time of creation.
@@ -4249,6 +4531,8 @@ class Client(metaclass=ClientMetaClass):
             sort_by=sort_by,
             page=page,
             size=size,
+            cursor=cursor,
+            count=count,
             logical_operator=logical_operator,
             id=id,
             created=created,
@@ -4394,6 +4678,8 @@ class Client(metaclass=ClientMetaClass):
         sort_by: str = "created",
         page: int = PAGINATION_STARTING_PAGE,
         size: int = PAGE_SIZE_DEFAULT,
+        cursor: Optional[str] = None,
+        count: bool = True,
         logical_operator: LogicalOperators = LogicalOperators.AND,
         id: Optional[Union[UUID, str]] = None,
         created: Optional[datetime] = None,
@@ -4415,6 +4701,9 @@ class Client(metaclass=ClientMetaClass):
             sort_by: The column to sort by
             page: The page of items
             size: The maximum size of all pages
+            cursor: The `next_cursor` of a previous page to continue
+                after.
+            count: Whether to count the total number of items and pages.
             logical_operator: Which logical operator to use [and, or]
             id: The id of the service connector to filter by.
             created: Filter service connectors by time of creation
@@ -4439,6 +4728,8 @@ class Client(metaclass=ClientMetaClass):
         connector_filter_model = ServiceConnectorFilterModel(
             page=page,
             size=size,
+            cursor=cursor,
+            count=count,
             sort_by=sort_by,
             logical_operator=logical_operator,
             workspace_id=workspace_id or self.active_workspace.id,
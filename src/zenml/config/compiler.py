@@ -166,6 +166,7 @@ class Compiler:
             enable_cache=config.enable_cache,
             enable_artifact_metadata=config.enable_artifact_metadata,
             enable_artifact_visualization=config.enable_artifact_visualization,
+            enable_content_addressed_caching=config.enable_content_addressed_caching,
             settings=config.settings,
             extra=config.extra,
         )
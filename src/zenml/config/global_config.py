@@ -68,6 +68,17 @@ def generate_jwt_secret_key() -> str:
     return token_hex(32)
 
 
+def _invalidate_client_cache() -> None:
+    """Invalidates the entities cached by the client.
+
+    The cached entities belong to the previously configured store, so they
+    must not be used anymore once the store changes.
+    """
+    from zenml.client import Client
+
+    Client.invalidate_cache()
+
+
 class GlobalConfigMetaClass(ModelMetaclass):
     """Global configuration metaclass.
 
@@ -215,6 +226,7 @@ class GlobalConfiguration(BaseModel, metaclass=GlobalConfigMetaClass):
         cls._global_config = config
         if config:
             config._write_config()
+        _invalidate_client_cache()
 
     @validator("version")
     def _validate_version(cls, v: Optional[str]) -> Optional[str]:
@@ -401,6 +413,7 @@ class GlobalConfiguration(BaseModel, metaclass=GlobalConfigMetaClass):
         logger.debug(f"Configuring the global store to {store.config}")
         self.store = store.config
         self._zen_store = store
+        _invalidate_client_cache()
 
         if not skip_default_registrations:
             store._initialize_database()
@@ -32,6 +32,7 @@ class PipelineRunConfiguration(
     enable_cache: Optional[bool] = None
     enable_artifact_metadata: Optional[bool] = None
     enable_artifact_visualization: Optional[bool] = None
+    enable_content_addressed_caching: Optional[bool] = None
     schedule: Optional[Schedule] = None
     build: Union[PipelineBuildBaseModel, UUID, None] = None
     steps: Dict[str, StepConfigurationUpdate] = {}
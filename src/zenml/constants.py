@@ -95,6 +95,17 @@ ENV_ZENML_SKIP_IMAGE_BUILDER_DEFAULT = "ZENML_SKIP_IMAGE_BUILDER_DEFAULT"
 ENV_ZENML_REQUIRES_CODE_DOWNLOAD = "ZENML_REQUIRES_CODE_DOWNLOAD"
 ENV_ZENML_SERVER = "ZENML_SERVER"
 ENV_ZENML_HUB_URL = "ZENML_HUB_URL"
+ENV_ZENML_OUTPUT_ARTIFACT_THREADS = "ZENML_OUTPUT_ARTIFACT_THREADS"
+ENV_ZENML_FILE_COPY_THREADS = "ZENML_FILE_COPY_THREADS"
+ENV_ZENML_NUMPY_MEMORY_MAP = "ZENML_NUMPY_MEMORY_MAP"
+ENV_ZENML_PANDAS_PARQUET_COMPRESSION = "ZENML_PANDAS_PARQUET_COMPRESSION"
+ENV_ZENML_PANDAS_PARQUET_ROW_GROUP_SIZE = "ZENML_PANDAS_PARQUET_ROW_GROUP_SIZE"
+ENV_ZENML_PANDAS_STATISTICS_SAMPLE_SIZE = "ZENML_PANDAS_STATISTICS_SAMPLE_SIZE"
+ENV_ZENML_CLIENT_CACHE_TTL = "ZENML_CLIENT_CACHE_TTL"
+ENV_ZENML_SERVER_AUTH_CACHE_TTL = "ZENML_SERVER_AUTH_CACHE_TTL"
+ENV_ZENML_SERVER_RESPONSE_CACHE_SIZE = "ZENML_SERVER_RESPONSE_CACHE_SIZE"
+ENV_ZENML_SERVER_RESPONSE_CACHE_TTL = "ZENML_SERVER_RESPONSE_CACHE_TTL"
+ENV_ZENML_CLIENT_RESPONSE_CACHE_SIZE = "ZENML_CLIENT_RESPONSE_CACHE_SIZE"
 
 
 # Logging variables
@@ -197,6 +208,8 @@ PIPELINE_CONFIGURATION = "/pipeline-configuration"
 STEP_CONFIGURATION = "/step-configuration"
 GRAPH = "/graph"
 STEPS = "/steps"
+OUTPUTS = "/outputs"
+CACHE = "/cache"
 ARTIFACTS = "/artifacts"
 COMPONENT_TYPES = "/component-types"
 REPOSITORIES = "/repositories"
@@ -207,6 +220,7 @@ INFO = "/info"
 VERSION_1 = "/v1"
 STATUS = "/status"
 GET_OR_CREATE = "/get-or-create"
+BATCH = "/batch"
 SECRETS = "/secrets"
 VISUALIZE = "/visualize"
 CODE_REPOSITORIES = "/code_repositories"
@@ -239,6 +253,44 @@ PAGE_SIZE_MAXIMUM: int = handle_int_env_var(
 )
 FILTERING_DATETIME_FORMAT: str = "%Y-%m-%d %H:%M:%S"
 
+# Maximum number of threads used to save the output artifacts of a step
+OUTPUT_ARTIFACT_THREADS: int = handle_int_env_var(
+    ENV_ZENML_OUTPUT_ARTIFACT_THREADS, default=4
+)
+
+# Maximum number of threads used to copy the files of a directory
+FILE_COPY_THREADS: int = handle_int_env_var(
+    ENV_ZENML_FILE_COPY_THREADS, default=8
+)
+# Size of the blocks in which files are copied between filesystems
+FILE_COPY_BLOCK_SIZE = 8 * 1024 * 1024
+
+# Number of seconds for which the client caches stacks, components, flavors
+# and workspaces fetched from the ZenML store
+CLIENT_CACHE_TTL: int = handle_int_env_var(
+    ENV_ZENML_CLIENT_CACHE_TTL, default=30
+)
+# Number of seconds for which the server caches the authentication context
+# of an access token
+SERVER_AUTH_CACHE_TTL: int = handle_int_env_var(
+    ENV_ZENML_SERVER_AUTH_CACHE_TTL, default=15
+)
+# Maximum number of serialized responses of immutable resources which the
+# server keeps in memory
+SERVER_RESPONSE_CACHE_SIZE: int = handle_int_env_var(
+    ENV_ZENML_SERVER_RESPONSE_CACHE_SIZE, default=1024
+)
+# Number of seconds for which the server keeps serialized responses, so that
+# changes made through other replicas of the server are picked up
+SERVER_RESPONSE_CACHE_TTL: int = handle_int_env_var(
+    ENV_ZENML_SERVER_RESPONSE_CACHE_TTL, default=60
+)
+# Maximum number of responses which the REST store keeps to send conditional
+# requests for them
+CLIENT_RESPONSE_CACHE_SIZE: int = handle_int_env_var(
+    ENV_ZENML_CLIENT_RESPONSE_CACHE_SIZE, default=256
+)
+
 # Metadata constants
 METADATA_ORCHESTRATOR_URL = "orchestrator_url"
 METADATA_EXPERIMENT_TRACKER_URL = "experiment_tracker_url"
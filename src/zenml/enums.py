@@ -244,3 +244,11 @@ class EnvironmentType(StrEnum):
     NOTEBOOK = "notebook"
     PAPERSPACE = "paperspace"
     WSL = "wsl"
+
+
+class LocalExecutionMode(StrEnum):
+    """Enum for the ways the local orchestrator can execute steps."""
+
+    SEQUENTIAL = "sequential"
+    THREAD = "thread"
+    PROCESS = "process"
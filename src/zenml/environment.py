@@ -15,6 +15,7 @@
 
 import os
 import platform
+from contextvars import ContextVar
 from importlib.util import find_spec
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, Type, cast
@@ -32,6 +33,13 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+# Environment components registered in the current context. The dictionary is
+# replaced instead of modified so that contexts copied to run code in other
+# threads don't see components registered after they were copied.
+_context_components: ContextVar[
+    Dict[str, "BaseEnvironmentComponent"]
+] = ContextVar("environment_components", default={})
+
 
 def get_run_environment_dict() -> Dict[str, str]:
     """Returns a dictionary of the current run environment.
@@ -125,6 +133,21 @@ class Environment(metaclass=SingletonMetaClass):
         """
         self._components: Dict[str, "BaseEnvironmentComponent"] = {}
 
+    @property
+    def _thread_local_components(
+        self,
+    ) -> Dict[str, "BaseEnvironmentComponent"]:
+        """Environment components registered in the current context.
+
+        Threads don't inherit these components unless the code they run is
+        started in a copy of the context which registered them, e.g. using
+        `contextvars.copy_context().run`.
+
+        Returns:
+            The thread-local environment components.
+        """
+        return _context_components.get()
+
     @property
     def step_is_running(self) -> bool:
         """Returns if a step is currently running.
@@ -348,6 +371,21 @@ class Environment(metaclass=SingletonMetaClass):
             The newly registered environment component, or the environment
             component that was already registered under the given name.
         """
+        if component.THREAD_LOCAL:
+            local_components = self._thread_local_components
+            if component.NAME in local_components:
+                logger.warning(
+                    f"Ignoring attempt to overwrite an existing Environment "
+                    f"component registered under the name {component.NAME}."
+                )
+                return local_components[component.NAME]
+
+            _context_components.set(
+                {**local_components, component.NAME: component}
+            )
+            logger.debug(f"Registered environment component {component.NAME}")
+            return component
+
         if component.NAME not in self._components:
             self._components[component.NAME] = component
             logger.debug(f"Registered environment component {component.NAME}")
@@ -367,17 +405,31 @@ class Environment(metaclass=SingletonMetaClass):
         Args:
             component: a BaseEnvironmentComponent instance.
         """
-        if self._components.get(component.NAME) is component:
+        if component.THREAD_LOCAL:
+            local_components = self._thread_local_components
+            if local_components.get(component.NAME) is component:
+                _context_components.set(
+                    {
+                        name: local_component
+                        for name, local_component in local_components.items()
+                        if name != component.NAME
+                    }
+                )
+                logger.debug(
+                    f"Deregistered environment component {component.NAME}"
+                )
+                return
+        elif self._components.get(component.NAME) is component:
             del self._components[component.NAME]
             logger.debug(
                 f"Deregistered environment component {component.NAME}"
             )
+            return
 
-        else:
-            logger.warning(
-                f"Ignoring attempt to deregister an inexistent Environment "
-                f"component with the name {component.NAME}."
-            )
+        logger.warning(
+            f"Ignoring attempt to deregister an inexistent Environment "
+            f"component with the name {component.NAME}."
+        )
 
     def get_component(self, name: str) -> Optional["BaseEnvironmentComponent"]:
         """Get the environment component with a known name.
@@ -389,7 +441,9 @@ class Environment(metaclass=SingletonMetaClass):
             The environment component that is registered under the given name,
             or None if no such component is registered.
         """
-        return self._components.get(name)
+        return self._thread_local_components.get(
+            name, self._components.get(name)
+        )
 
     def get_components(
         self,
@@ -399,7 +453,7 @@ class Environment(metaclass=SingletonMetaClass):
         Returns:
             A dictionary containing all registered environment components.
         """
-        return self._components.copy()
+        return {**self._components, **self._thread_local_components}
 
     def has_component(self, name: str) -> bool:
         """Check if the environment component with a known name is available.
@@ -411,7 +465,9 @@ class Environment(metaclass=SingletonMetaClass):
             `True` if an environment component with the given name is
             currently registered for the given name, `False` otherwise.
         """
-        return name in self._components
+        return (
+            name in self._thread_local_components or name in self._components
+        )
 
     def __getitem__(self, name: str) -> "BaseEnvironmentComponent":
         """Get the environment component with the given name.
@@ -427,8 +483,9 @@ class Environment(metaclass=SingletonMetaClass):
             KeyError: if no environment component is registered for the given
                 name.
         """
-        if name in self._components:
-            return self._components[name]
+        component = self.get_component(name)
+        if component is not None:
+            return component
         else:
             raise KeyError(
                 f"No environment component with name {name} is currently "
@@ -559,9 +616,15 @@ class BaseEnvironmentComponent(metaclass=EnvironmentComponentMeta):
         NAME: a unique name for this component. This name will be used to
             register this component in the global Environment and to
             subsequently retrieve it by calling `Environment().get_component`.
+        THREAD_LOCAL: whether this component is scoped to the thread that
+            activated it. Multiple instances of a thread-local component can
+            be active at the same time in different threads. Threads started
+            while the component is active only see it if they run in a copy
+            of the activating context.
     """
 
     NAME: str = _BASE_ENVIRONMENT_COMPONENT_NAME
+    THREAD_LOCAL: bool = False
 
     def __init__(self) -> None:
         """Initialize an environment component."""
@@ -13,25 +13,56 @@
 #  permissions and limitations under the License.
 """Implementation of the Huggingface datasets materializer."""
 
+import atexit
+import functools
+import hashlib
 import os
+import shutil
+import threading
+import weakref
 from collections import defaultdict
-from tempfile import TemporaryDirectory, mkdtemp
-from typing import TYPE_CHECKING, Any, ClassVar, Dict, Tuple, Type, Union
+from tempfile import TemporaryDirectory
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    List,
+    Tuple,
+    Type,
+    Union,
+)
+from uuid import uuid4
 
+import pyarrow as pa  # type: ignore
+import pyarrow.compute as pc  # type: ignore
 from datasets import Dataset, load_from_disk
 from datasets.dataset_dict import DatasetDict
 
+from zenml.artifact_stores.local_artifact_cache import (
+    LocalArtifactCache,
+    process_exists,
+)
+from zenml.constants import handle_int_env_var
 from zenml.enums import ArtifactType
-from zenml.io import fileio
+from zenml.logger import get_logger
 from zenml.materializers.base_materializer import BaseMaterializer
-from zenml.materializers.pandas_materializer import PandasMaterializer
+from zenml.metadata.metadata_types import DType
 from zenml.utils import io_utils
 
 if TYPE_CHECKING:
     from zenml.metadata.metadata_types import MetadataType
 
+logger = get_logger(__name__)
+
 DEFAULT_DATASET_DIR = "hf_datasets"
 
+ENV_ZENML_HF_DATASETS_CACHE_SIZE_MB = "ZENML_HF_DATASETS_CACHE_SIZE_MB"
+DEFAULT_CACHE_SIZE_MB = 10 * 1024
+CACHE_DIR = "huggingface_datasets_cache"
+LINKS_DIR = "huggingface_datasets_links"
+
 
 class HFDatasetMaterializer(BaseMaterializer):
     """Materializer to read data to and from huggingface datasets."""
@@ -46,41 +77,73 @@ class HFDatasetMaterializer(BaseMaterializer):
     ) -> Union[Dataset, DatasetDict]:
         """Reads Dataset.
 
+        The Arrow files of the dataset are memory-mapped instead of being read
+        into memory. Datasets stored in a local artifact store are loaded in
+        place. Datasets stored in a remote artifact store are downloaded into
+        a local cache first, which is reused by later loads of the same
+        artifact and limited to `ZENML_HF_DATASETS_CACHE_SIZE_MB` megabytes.
+        Cached datasets are kept until the loaded dataset is garbage
+        collected, datasets larger than the cache are evicted afterwards.
+
+        The dataset is loaded through a directory of links to its files, so
+        that cache files written by e.g. `Dataset.map` end up in that
+        directory instead of the artifact directory. This directory is deleted
+        once the loaded dataset is garbage collected.
+
         Args:
             data_type: The type of the dataset to read.
 
         Returns:
             The dataset read from the specified dir.
         """
-        temp_dir = mkdtemp()
-        io_utils.copy_dir(
-            os.path.join(self.uri, DEFAULT_DATASET_DIR),
-            temp_dir,
+        dataset_dir = os.path.join(self.uri, DEFAULT_DATASET_DIR)
+        if not io_utils.is_remote(dataset_dir):
+            return _load_linked_dataset(dataset_dir)
+
+        # Artifacts are immutable, so their URI identifies their content
+        cache_key = hashlib.sha256(dataset_dir.encode()).hexdigest()
+        cache = _get_cache()
+        local_dir = cache.acquire(
+            key=cache_key, uri=dataset_dir, keep_oversized=True
         )
-        return load_from_disk(temp_dir)
+        if not local_dir:
+            raise FileNotFoundError(f"No dataset found at `{dataset_dir}`.")
+
+        try:
+            dataset = _load_linked_dataset(local_dir)
+        except BaseException:
+            cache.release(cache_key)
+            raise
+        _call_when_collected(dataset, cache.release, cache_key)
+        return dataset
 
     def save(self, ds: Union[Dataset, DatasetDict]) -> None:
         """Writes a Dataset to the specified dir.
 
+        Datasets are written to a local artifact store directly and through a
+        temporary directory for remote artifact stores.
+
         Args:
             ds: The Dataset to write.
         """
-        temp_dir = TemporaryDirectory()
-        path = os.path.join(temp_dir.name, DEFAULT_DATASET_DIR)
-        try:
+        dataset_dir = os.path.join(self.uri, DEFAULT_DATASET_DIR)
+        if not io_utils.is_remote(dataset_dir):
+            ds.save_to_disk(dataset_dir)
+            return
+
+        with TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, DEFAULT_DATASET_DIR)
             ds.save_to_disk(path)
-            io_utils.copy_dir(
-                path,
-                os.path.join(self.uri, DEFAULT_DATASET_DIR),
-            )
-        finally:
-            fileio.rmtree(temp_dir.name)
+            io_utils.copy_dir(path, dataset_dir)
 
     def extract_metadata(
         self, ds: Union[Dataset, DatasetDict]
     ) -> Dict[str, "MetadataType"]:
         """Extract metadata from the given `Dataset` object.
 
+        The statistics are computed on the Arrow data of the dataset, without
+        converting it to a pandas dataframe.
+
         Args:
             ds: The `Dataset` object to extract metadata from.
 
@@ -90,16 +153,188 @@ class HFDatasetMaterializer(BaseMaterializer):
         Raises:
             ValueError: If the given object is not a `Dataset` or `DatasetDict`.
         """
-        pandas_materializer = PandasMaterializer(self.uri)
         if isinstance(ds, Dataset):
-            return pandas_materializer.extract_metadata(ds.to_pandas())
+            return _extract_table_metadata(ds.with_format("arrow")[:])
         elif isinstance(ds, DatasetDict):
             metadata: Dict[str, Dict[str, "MetadataType"]] = defaultdict(dict)
             for dataset_name, dataset in ds.items():
-                dataset_metadata = pandas_materializer.extract_metadata(
-                    dataset.to_pandas()
+                dataset_metadata = _extract_table_metadata(
+                    dataset.with_format("arrow")[:]
                 )
                 for key, value in dataset_metadata.items():
                     metadata[key][dataset_name] = value
             return dict(metadata)
         raise ValueError(f"Unsupported type {type(ds)}")
+
+
+def _get_cache() -> LocalArtifactCache:
+    """Gets the local cache for datasets stored in remote artifact stores.
+
+    Returns:
+        The local dataset cache.
+    """
+    max_size_mb = handle_int_env_var(
+        ENV_ZENML_HF_DATASETS_CACHE_SIZE_MB, default=DEFAULT_CACHE_SIZE_MB
+    )
+    return _get_cache_instance(
+        root=os.path.join(io_utils.get_global_config_directory(), CACHE_DIR),
+        max_size=max_size_mb * 1024 * 1024,
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _get_cache_instance(root: str, max_size: int) -> LocalArtifactCache:
+    """Gets the local dataset cache for a directory.
+
+    The cache is shared by all loads in this process, so that it can
+    serialize downloads and evictions.
+
+    Args:
+        root: The directory of the cache.
+        max_size: Maximum size of the cache in bytes.
+
+    Returns:
+        The local dataset cache.
+    """
+    return LocalArtifactCache(root=root, max_size=max_size)
+
+
+def _load_linked_dataset(
+    dataset_dir: str,
+) -> Union[Dataset, DatasetDict]:
+    """Loads a local dataset through a directory of links.
+
+    Huggingface writes cache files next to the Arrow files of a dataset. The
+    files of the dataset are therefore linked into a separate directory, so
+    that the dataset directory itself is never modified.
+
+    Args:
+        dataset_dir: The local directory of the dataset.
+
+    Returns:
+        The loaded dataset.
+    """
+    links_dir = os.path.join(_get_links_root(), uuid4().hex)
+    for root, _, files in os.walk(dataset_dir):
+        link_dir = os.path.join(links_dir, os.path.relpath(root, dataset_dir))
+        os.makedirs(link_dir, exist_ok=True)
+        for file in files:
+            src = os.path.abspath(os.path.join(root, file))
+            dst = os.path.join(link_dir, file)
+            try:
+                os.symlink(src, dst)
+            except OSError:
+                # Creating symlinks requires additional privileges on Windows
+                shutil.copy2(src, dst)
+
+    try:
+        dataset = load_from_disk(links_dir)
+    except BaseException:
+        shutil.rmtree(links_dir, ignore_errors=True)
+        raise
+    _call_when_collected(dataset, shutil.rmtree, links_dir, True)
+    return dataset
+
+
+def _call_when_collected(
+    dataset: Union[Dataset, DatasetDict],
+    callback: Callable[..., Any],
+    *args: Any,
+) -> None:
+    """Calls a function once a loaded dataset is garbage collected.
+
+    The splits of a dataset dictionary are often used on their own, so the
+    function is only called once the dictionary and all its splits are
+    garbage collected.
+
+    Args:
+        dataset: The loaded dataset.
+        callback: The function to call.
+        *args: Positional arguments to pass to the function.
+    """
+    objects: List[Any] = [dataset]
+    if isinstance(dataset, DatasetDict):
+        objects += dataset.values()
+
+    remaining = [len(objects)]
+    lock = threading.Lock()
+
+    def _on_collected() -> None:
+        with lock:
+            remaining[0] -= 1
+            if remaining[0] > 0:
+                return
+        callback(*args)
+
+    for obj in objects:
+        weakref.finalize(obj, _on_collected)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_links_root() -> str:
+    """Gets the directory in which this process links loaded datasets.
+
+    All processes share a parent directory, in which each process uses a
+    directory named after its process ID. The directory of this process is
+    deleted when it exits, and directories left behind by processes which
+    no longer exist are deleted the first time this is called.
+
+    Returns:
+        The directory for the dataset links of this process.
+    """
+    parent = os.path.join(io_utils.get_global_config_directory(), LINKS_DIR)
+    if os.path.isdir(parent):
+        for name in os.listdir(parent):
+            if name.isdigit() and not process_exists(int(name)):
+                shutil.rmtree(os.path.join(parent, name), ignore_errors=True)
+
+    root = os.path.join(parent, str(os.getpid()))
+    os.makedirs(root, exist_ok=True)
+    atexit.register(shutil.rmtree, root, True)
+    return root
+
+
+def _extract_table_metadata(table: pa.Table) -> Dict[str, "MetadataType"]:
+    """Extracts the same metadata as the `PandasMaterializer` from a table.
+
+    Args:
+        table: The Arrow table.
+
+    Returns:
+        The shape and column types of the table as well as the mean, standard
+        deviation, minimum and maximum of all numeric columns.
+    """
+
+    def _to_float(scalar: pa.Scalar) -> float:
+        value = scalar.as_py()
+        return float("nan") if value is None else float(value)
+
+    metadata: Dict[str, "MetadataType"] = {
+        "shape": (table.num_rows, table.num_columns),
+        "dtype": {
+            field.name: DType(field.type.to_pandas_dtype())
+            for field in table.schema
+        },
+    }
+    statistics: Dict[str, Dict[str, float]] = {
+        "mean": {},
+        "std": {},
+        "min": {},
+        "max": {},
+    }
+    for field, column in zip(table.schema, table.columns):
+        if pa.types.is_boolean(field.type):
+            column = column.cast(pa.int8())
+        elif not (
+            pa.types.is_integer(field.type) or pa.types.is_floating(field.type)
+        ):
+            continue
+
+        min_max = pc.min_max(column)
+        statistics["mean"][field.name] = _to_float(pc.mean(column))
+        statistics["std"][field.name] = _to_float(pc.stddev(column, ddof=1))
+        statistics["min"][field.name] = _to_float(min_max["min"])
+        statistics["max"][field.name] = _to_float(min_max["max"])
+
+    metadata.update(statistics)
+    return metadata
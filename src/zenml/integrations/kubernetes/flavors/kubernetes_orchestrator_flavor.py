@@ -15,6 +15,8 @@
 
 from typing import TYPE_CHECKING, Optional, Type
 
+from pydantic import PositiveInt
+
 from zenml.config.base_settings import BaseSettings
 from zenml.constants import KUBERNETES_CLUSTER_RESOURCE_TYPE
 from zenml.integrations.kubernetes import KUBERNETES_ORCHESTRATOR_FLAVOR
@@ -40,12 +42,19 @@ class KubernetesOrchestratorSettings(BaseSettings):
             orchestrator pod. If not provided, a new service account with "edit"
             permissions will be created.
         pod_settings: Pod settings to apply.
+        max_parallelism: Maximum number of step pods that run at the same
+            time. If not set, all steps that are ready will run at once.
+        fail_fast: If `True`, no new step pods will be started once a step
+            failed. Otherwise, all steps that don't depend on the failed step
+            will still be run.
     """
 
     synchronous: bool = False
     timeout: int = 0
     service_account_name: Optional[str] = None
     pod_settings: Optional[KubernetesPodSettings] = None
+    max_parallelism: Optional[PositiveInt] = None
+    fail_fast: bool = False
 
 
 class KubernetesOrchestratorConfig(  # type: ignore[misc] # https://github.com/pydantic/pydantic/issues/4173
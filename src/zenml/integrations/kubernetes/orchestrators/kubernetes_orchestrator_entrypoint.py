@@ -15,6 +15,7 @@
 
 import argparse
 import socket
+from typing import cast
 
 from kubernetes import client as k8s_client
 
@@ -34,7 +35,7 @@ from zenml.integrations.kubernetes.orchestrators.manifest_utils import (
     build_pod_manifest,
 )
 from zenml.logger import get_logger
-from zenml.orchestrators.dag_runner import ThreadedDagRunner
+from zenml.orchestrators.dag_runner import NodeStatus, ThreadedDagRunner
 from zenml.orchestrators.utils import get_config_environment_vars
 
 logger = get_logger(__name__)
@@ -54,7 +55,11 @@ def parse_args() -> argparse.Namespace:
 
 
 def main() -> None:
-    """Entrypoint of the k8s master/orchestrator pod."""
+    """Entrypoint of the k8s master/orchestrator pod.
+
+    Raises:
+        RuntimeError: If any of the steps failed.
+    """
     # Log to the container's stdout so it can be streamed by the client.
     logger.info("Kubernetes orchestrator pod started.")
 
@@ -137,7 +142,28 @@ def main() -> None:
         )
         logger.info(f"Pod of step `{step_name}` completed.")
 
-    ThreadedDagRunner(dag=pipeline_dag, run_fn=run_step_on_kubernetes).run()
+    orchestrator_settings = cast(
+        KubernetesOrchestratorSettings,
+        orchestrator.get_settings(deployment_config),
+    )
+    dag_runner = ThreadedDagRunner(
+        dag=pipeline_dag,
+        run_fn=run_step_on_kubernetes,
+        max_parallelism=orchestrator_settings.max_parallelism,
+        fail_fast=orchestrator_settings.fail_fast,
+    )
+    dag_runner.run()
+
+    failed_steps = [
+        step_name
+        for step_name, node_status in dag_runner.node_states.items()
+        if node_status == NodeStatus.FAILED
+    ]
+    if failed_steps:
+        raise RuntimeError(
+            f"Orchestration pod failed because the following steps failed: "
+            f"{failed_steps}."
+        )
 
     logger.info("Orchestration pod completed.")
 
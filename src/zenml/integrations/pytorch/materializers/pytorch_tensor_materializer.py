@@ -0,0 +1,291 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Implementation of a tensor-native materializer for PyTorch objects."""
+
+import mmap
+import os
+import pickle
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    ClassVar,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
+
+import cloudpickle
+import torch
+from torch.nn import Module, Parameter
+
+from zenml.enums import ArtifactType
+from zenml.integrations.pytorch.utils import count_module_params
+from zenml.io import fileio
+from zenml.materializers.base_materializer import BaseMaterializer
+from zenml.utils import io_utils, yaml_utils
+
+if TYPE_CHECKING:
+    from zenml.metadata.metadata_types import MetadataType
+
+OBJECT_FILENAME = "object.pkl"
+INDEX_FILENAME = "tensors.json"
+DATA_FILENAME = "tensors.bin"
+
+# Offsets of the tensors in the data file are aligned to this number of bytes
+# so that memory-mapped tensors are suitably aligned for all dtypes.
+TENSOR_ALIGNMENT = 64
+TENSOR_PERSISTENT_ID = "tensor"
+
+
+class PyTorchTensorMaterializer(BaseMaterializer):
+    """Materializer to read/write PyTorch objects in a tensor-native format.
+
+    Instead of pickling the tensor data together with the object like
+    `torch.save`, the raw data of all tensors is written to a single flat
+    file next to a JSON index of their dtypes, shapes and offsets. Only the
+    object structure (e.g. the module classes and their attributes) is still
+    pickled. Tensors shared between multiple places of the object (e.g. tied
+    weights) are stored once and remain shared after loading.
+
+    When loading from a local artifact store, the data file is memory-mapped
+    copy-on-write, so tensor data is only read from disk when it is accessed.
+    Tensors are always loaded on the CPU and views of the same storage are
+    loaded as independent tensors.
+
+    The object structure is unpickled without restricting which classes and
+    functions it may reference, exactly like `torch.load` with
+    `weights_only=False`. Loading an artifact can therefore execute arbitrary
+    code, so only load artifacts written by trusted pipelines.
+
+    This materializer is not registered by default. Select it for individual
+    step outputs instead:
+
+    ```python
+    @step(output_materializers=PyTorchTensorMaterializer)
+    def train() -> torch.nn.Module:
+        ...
+    ```
+    """
+
+    SKIP_REGISTRATION: ClassVar[bool] = True
+    ASSOCIATED_TYPES: ClassVar[Tuple[Type[Any], ...]] = (
+        Module,
+        torch.Tensor,
+        dict,
+    )
+    ASSOCIATED_ARTIFACT_TYPE: ClassVar[ArtifactType] = ArtifactType.MODEL
+
+    def load(self, data_type: Type[Any]) -> Any:
+        """Reads a PyTorch object and its tensors.
+
+        Only load artifacts from trusted sources, as unpickling the object
+        structure can execute arbitrary code.
+
+        Args:
+            data_type: The type of the object to read.
+
+        Returns:
+            The loaded object.
+        """
+        index = yaml_utils.read_json(os.path.join(self.uri, INDEX_FILENAME))
+        buffer = _read_buffer(os.path.join(self.uri, DATA_FILENAME))
+        tensors = [_load_tensor(buffer, entry) for entry in index]
+
+        with fileio.open(os.path.join(self.uri, OBJECT_FILENAME), "rb") as f:
+            return _TensorUnpickler(f, tensors=tensors).load()
+
+    def save(self, obj: Any) -> None:
+        """Writes a PyTorch object and its tensors.
+
+        Args:
+            obj: The object to write.
+        """
+        tensors: List[torch.Tensor] = []
+        with fileio.open(os.path.join(self.uri, OBJECT_FILENAME), "wb") as f:
+            _TensorPickler(f, tensors=tensors).dump(obj)
+
+        index: List[Dict[str, Any]] = []
+        offset = 0
+        with fileio.open(os.path.join(self.uri, DATA_FILENAME), "wb") as f:
+            for tensor in tensors:
+                padding = -offset % TENSOR_ALIGNMENT
+                f.write(b"\0" * padding)
+                offset += padding
+
+                data = tensor.detach().cpu().contiguous().reshape(-1)
+                f.write(data.view(torch.uint8).numpy().data)
+                nbytes = data.numel() * data.element_size()
+                index.append(
+                    {
+                        "dtype": str(tensor.dtype).replace("torch.", ""),
+                        "shape": list(tensor.shape),
+                        "offset": offset,
+                        "nbytes": nbytes,
+                        "parameter": isinstance(tensor, Parameter),
+                        "requires_grad": tensor.requires_grad,
+                    }
+                )
+                offset += nbytes
+
+        yaml_utils.write_json(os.path.join(self.uri, INDEX_FILENAME), index)
+
+    def extract_metadata(self, obj: Any) -> Dict[str, "MetadataType"]:
+        """Extract metadata from the given PyTorch object.
+
+        Args:
+            obj: The object to extract metadata from.
+
+        Returns:
+            The extracted metadata as a dictionary.
+        """
+        if isinstance(obj, Module):
+            return {**count_module_params(obj)}
+        return {}
+
+
+class _TensorPickler(cloudpickle.CloudPickler):  # type: ignore[misc]
+    """Pickler that stores references to tensors instead of their data."""
+
+    def __init__(self, file: IO[bytes], tensors: List[torch.Tensor]) -> None:
+        """Initializes the pickler.
+
+        Args:
+            file: The file to write the pickled object to.
+            tensors: List to which the tensors of the object are appended.
+        """
+        super().__init__(file)
+        self._tensors = tensors
+        self._tensor_indices: Dict[int, int] = {}
+
+    def persistent_id(self, obj: Any) -> Optional[Tuple[str, int]]:
+        """Replaces dense tensors with a reference into the tensor list.
+
+        Args:
+            obj: The object to pickle.
+
+        Returns:
+            The reference to the tensor or `None` if the object should be
+            pickled regularly.
+        """
+        if type(obj) not in (torch.Tensor, Parameter):
+            return None
+        if (
+            obj.layout != torch.strided
+            or obj.is_quantized
+            or obj.device.type == "meta"
+        ):
+            return None
+
+        if id(obj) not in self._tensor_indices:
+            self._tensor_indices[id(obj)] = len(self._tensors)
+            self._tensors.append(obj)
+        return TENSOR_PERSISTENT_ID, self._tensor_indices[id(obj)]
+
+
+class _TensorUnpickler(pickle.Unpickler):
+    """Unpickler that resolves tensor references of the `_TensorPickler`.
+
+    Classes and functions referenced by the pickled object are not restricted,
+    as the `_TensorPickler` pickles arbitrary objects including classes
+    defined by value. The pickled object must therefore be trusted.
+    """
+
+    def __init__(self, file: IO[bytes], tensors: List[torch.Tensor]) -> None:
+        """Initializes the unpickler.
+
+        Args:
+            file: The file to read the pickled object from.
+            tensors: The tensors referenced by the pickled object.
+        """
+        super().__init__(file)
+        self._tensors = tensors
+
+    def persistent_load(self, pid: Any) -> torch.Tensor:
+        """Resolves a tensor reference.
+
+        Args:
+            pid: The tensor reference.
+
+        Returns:
+            The referenced tensor.
+
+        Raises:
+            pickle.UnpicklingError: If the reference is invalid.
+        """
+        if (
+            not isinstance(pid, tuple)
+            or len(pid) != 2
+            or pid[0] != TENSOR_PERSISTENT_ID
+        ):
+            raise pickle.UnpicklingError(
+                f"Unsupported persistent ID: {pid!r}."
+            )
+        return self._tensors[pid[1]]
+
+
+def _read_buffer(path: str) -> Union[mmap.mmap, bytearray]:
+    """Reads the tensor data file.
+
+    Args:
+        path: Path of the tensor data file.
+
+    Returns:
+        A copy-on-write memory map of the file for local artifact stores,
+        the file content otherwise.
+    """
+    if not io_utils.is_remote(path) and os.path.getsize(path) > 0:
+        with open(path, "rb") as f:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+
+    with fileio.open(path, "rb") as f:
+        return bytearray(f.read())
+
+
+def _load_tensor(
+    buffer: Union[mmap.mmap, bytearray], entry: Dict[str, Any]
+) -> torch.Tensor:
+    """Loads a tensor from the tensor data file.
+
+    The tensor shares its memory with the buffer, which is kept alive as long
+    as the tensor is in use.
+
+    Args:
+        buffer: The content of the tensor data file.
+        entry: The index entry of the tensor.
+
+    Returns:
+        The loaded tensor.
+    """
+    dtype = getattr(torch, entry["dtype"])
+    shape = entry["shape"]
+    if entry["nbytes"] == 0:
+        tensor = torch.empty(shape, dtype=dtype)
+    else:
+        tensor = torch.frombuffer(
+            buffer,
+            dtype=dtype,
+            count=entry["nbytes"]
+            // torch.empty((), dtype=dtype).element_size(),
+            offset=entry["offset"],
+        ).reshape(shape)
+
+    if entry["parameter"]:
+        return Parameter(tensor, requires_grad=entry["requires_grad"])
+    if entry["requires_grad"]:
+        tensor.requires_grad_()
+    return tensor
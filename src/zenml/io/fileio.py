@@ -13,7 +13,21 @@
 #  permissions and limitations under the License.
 """Functionality for reading, writing and managing files."""
 import os
-from typing import Any, Callable, Iterable, List, Optional, Tuple, Type
+import shutil
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+)
+
+from zenml.constants import FILE_COPY_BLOCK_SIZE
 
 # this import required for CI to get local filesystem
 from zenml.io import local_filesystem  # noqa
@@ -23,6 +37,18 @@ from zenml.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Function which gets passed every file the current context opens for
+# writing, see `observe_writes`
+_write_observer: ContextVar[
+    Optional[Callable[["PathType", str, Any], Any]]
+] = ContextVar("write_observer", default=None)
+
+# Function which gets passed every path the current context modifies without
+# opening it, see `observe_writes`
+_change_observer: ContextVar[
+    Optional[Callable[["PathType"], Any]]
+] = ContextVar("change_observer", default=None)
+
 
 def _get_filesystem(path: "PathType") -> Type["BaseFilesystem"]:
     """Returns a filesystem class for a given path from the registry.
@@ -61,12 +87,62 @@ def open(path: "PathType", mode: str = "r") -> Any:  # noqa
     Returns:
         The opened file.
     """
-    return _get_filesystem(path).open(path, mode=mode)
+    file = _get_filesystem(path).open(path, mode=mode)
+    observer = _write_observer.get()
+    if observer and any(char in mode for char in "wax+"):
+        file = observer(path, mode, file)
+    return file
+
+
+def _notify_change(path: "PathType") -> None:
+    """Passes a path which was modified without opening it to the observer.
+
+    Args:
+        path: The modified path.
+    """
+    on_change = _change_observer.get()
+    if on_change:
+        on_change(path)
+
+
+@contextmanager
+def observe_writes(
+    observer: Callable[["PathType", str, Any], Any],
+    on_change: Optional[Callable[["PathType"], Any]] = None,
+) -> Iterator[None]:
+    """Passes all files opened for writing in the current context to a function.
+
+    The function receives the path and mode of every file which is opened
+    for writing through `open` and returns the file object to use instead,
+    e.g. a wrapper which inspects the written data. Files which are copied
+    within a single filesystem, renamed or removed are not opened and are
+    passed to `on_change` instead.
+
+    Args:
+        observer: The function which observes opened files.
+        on_change: The function which observes paths that are copied to,
+            renamed or removed.
+
+    Yields:
+        Nothing.
+    """
+    token = _write_observer.set(observer)
+    change_token = _change_observer.set(on_change)
+    try:
+        yield
+    finally:
+        _change_observer.reset(change_token)
+        _write_observer.reset(token)
 
 
 def copy(src: "PathType", dst: "PathType", overwrite: bool = False) -> None:
     """Copy a file from the source to the destination.
 
+    Files are copied between different filesystems in blocks of
+    `FILE_COPY_BLOCK_SIZE` bytes, so they never need to fit into memory and
+    large files are uploaded in multiple parts by filesystems which support
+    multipart uploads.
+
     Args:
         src: The path of the file to copy.
         dst: The path to copy the source file to.
@@ -80,17 +156,16 @@ def copy(src: "PathType", dst: "PathType", overwrite: bool = False) -> None:
     dst_fs = _get_filesystem(dst)
     if src_fs is dst_fs:
         src_fs.copyfile(src, dst, overwrite=overwrite)
+        _notify_change(dst)
     else:
         if not overwrite and exists(dst):
             raise FileExistsError(
                 f"Destination file '{convert_to_str(dst)}' already exists "
                 f"and `overwrite` is false."
             )
-        with open(src, mode="rb") as f:
-            contents = f.read()
-
-        with open(dst, mode="wb") as f:
-            f.write(contents)
+        with open(src, mode="rb") as src_file:
+            with open(dst, mode="wb") as dst_file:
+                shutil.copyfileobj(src_file, dst_file, FILE_COPY_BLOCK_SIZE)
 
 
 def exists(path: "PathType") -> bool:
@@ -181,6 +256,7 @@ def remove(path: "PathType") -> None:
     if not exists(path):
         raise FileNotFoundError(f"{convert_to_str(path)} does not exist!")
     _get_filesystem(path).remove(path)
+    _notify_change(path)
 
 
 def rename(src: "PathType", dst: "PathType", overwrite: bool = False) -> None:
@@ -201,6 +277,8 @@ def rename(src: "PathType", dst: "PathType", overwrite: bool = False) -> None:
     dst_fs = _get_filesystem(dst)
     if src_fs is dst_fs:
         src_fs.rename(src, dst, overwrite=overwrite)
+        _notify_change(src)
+        _notify_change(dst)
     else:
         raise NotImplementedError(
             f"Renaming from {convert_to_str(src)} to {convert_to_str(dst)} "
@@ -221,6 +299,7 @@ def rmtree(dir_path: str) -> None:
         raise TypeError(f"Path '{dir_path}' is not a directory.")
 
     _get_filesystem(dir_path).rmtree(dir_path)
+    _notify_change(dir_path)
 
 
 def stat(path: "PathType") -> Any:
@@ -31,7 +31,10 @@ from zenml.materializers.structured_string_materializer import (
     StructuredStringMaterializer,
 )
 from zenml.materializers.numpy_materializer import NumpyMaterializer
-from zenml.materializers.pandas_materializer import PandasMaterializer
+from zenml.materializers.pandas_materializer import (
+    LazyDataFrame,
+    PandasMaterializer,
+)
 from zenml.materializers.pydantic_materializer import PydanticMaterializer
 from zenml.materializers.service_materializer import ServiceMaterializer
 from zenml.materializers.unmaterialized_artifact import UnmaterializedArtifact
@@ -41,6 +44,7 @@ __all__ = [
     "BuiltInMaterializer",
     "BytesMaterializer",
     "CloudpickleMaterializer",
+    "LazyDataFrame",
     "StructuredStringMaterializer",
     "NumpyMaterializer",
     "PandasMaterializer",
@@ -13,18 +13,35 @@
 #  permissions and limitations under the License.
 """Metaclass implementation for registering ZenML BaseMaterializer subclasses."""
 
+import hashlib
 import inspect
-from typing import Any, ClassVar, Dict, Tuple, Type, cast
+import os
+import threading
+from contextlib import contextmanager
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Iterator,
+    Optional,
+    Tuple,
+    Type,
+    cast,
+)
 
 from zenml.enums import ArtifactType, VisualizationType
 from zenml.exceptions import MaterializerInterfaceError
 from zenml.io import fileio
+from zenml.io.filesystem import PathType
 from zenml.logger import get_logger
 from zenml.materializers.materializer_registry import materializer_registry
 from zenml.metadata.metadata_types import MetadataType
 
 logger = get_logger(__name__)
 
+CONTENT_HASH_CHUNK_SIZE = 1024 * 1024
+
 
 class BaseMaterializerMeta(type):
     """Metaclass responsible for registering different BaseMaterializer subclasses.
@@ -144,6 +161,42 @@ class BaseMaterializer(metaclass=BaseMaterializerMeta):
         """
         # write `data` into self.uri
 
+    def load_chunks(self, data_type: Type[Any]) -> Iterator[Any]:
+        """Loads the data of an artifact chunk by chunk.
+
+        Steps receive the result of this method for inputs annotated as
+        `Iterator`. Override this method to load artifacts which don't fit
+        into memory. The default implementation loads the complete artifact
+        as a single chunk.
+
+        Args:
+            data_type: What type the chunks should be loaded as.
+
+        Yields:
+            The chunks of the artifact data.
+        """
+        yield self.load(data_type)
+
+    def save_chunks(self, chunks: Iterator[Any]) -> None:
+        """Saves the data of an artifact chunk by chunk.
+
+        This method is called for step outputs which are returned as an
+        iterator (e.g. by a step function that yields its output). Override
+        this method to save artifacts which don't fit into memory. The saved
+        artifact must be loadable by `load` as the concatenation of all chunks.
+
+        Args:
+            chunks: Iterator over the chunks of the artifact data.
+
+        Raises:
+            NotImplementedError: If the materializer does not support saving
+                artifacts in chunks.
+        """
+        raise NotImplementedError(
+            f"{self.__class__.__name__} does not support saving artifacts in "
+            "chunks."
+        )
+
     def save_visualizations(self, data: Any) -> Dict[str, VisualizationType]:
         """Save visualizations of the given data.
 
@@ -198,6 +251,124 @@ class BaseMaterializer(metaclass=BaseMaterializerMeta):
         # Optionally, extract some metadata from `data` for ZenML to store.
         return {}
 
+    @contextmanager
+    def record_file_digests(self) -> Iterator[None]:
+        """Records the digests of files while they are written.
+
+        Files which are opened for writing in binary mode through
+        `fileio.open` while this context is active are hashed as their data is
+        written, so that `compute_content_hash` doesn't have to read them back
+        from the artifact store afterwards. Files which are written in text
+        mode, written multiple times, or copied to, renamed or removed through
+        `fileio` are read back instead.
+
+        Yields:
+            Nothing.
+        """
+        digests: Dict[str, Optional[Tuple[bytes, int]]] = {}
+        lock = threading.Lock()
+        root = self.uri.replace("\\", "/").rstrip("/") + "/"
+
+        def _get_relative_path(path: "PathType") -> Optional[str]:
+            path = fileio.convert_to_str(path).replace("\\", "/")
+            if not path.startswith(root):
+                return None
+            return path[len(root) :]
+
+        def _record(
+            relative_path: str, digest: Optional[Tuple[bytes, int]]
+        ) -> None:
+            with lock:
+                digests[relative_path] = digest
+
+        def _observe(path: "PathType", mode: str, file: Any) -> Any:
+            relative_path = _get_relative_path(path)
+            if relative_path is None:
+                return file
+
+            with lock:
+                written_before = relative_path in digests
+                digests[relative_path] = None
+            if written_before or "b" not in mode or "a" in mode or "+" in mode:
+                return file
+            return _HashingFile(
+                file=file,
+                on_close=lambda digest: _record(relative_path, digest),
+            )
+
+        def _on_change(path: "PathType") -> None:
+            relative_path = _get_relative_path(path)
+            if relative_path is None:
+                return
+
+            with lock:
+                for recorded_path in list(digests):
+                    if recorded_path == relative_path or (
+                        recorded_path.startswith(relative_path + "/")
+                    ):
+                        digests[recorded_path] = None
+                digests[relative_path] = None
+
+        with fileio.observe_writes(_observe, on_change=_on_change):
+            yield
+        self._file_digests = {
+            path: digest for path, digest in digests.items() if digest
+        }
+
+    def compute_content_hash(self) -> Optional[str]:
+        """Compute a digest of the artifact data written by `save`.
+
+        The default implementation combines the SHA-256 digests of all files
+        inside `self.uri`, in sorted order and together with their paths
+        relative to `self.uri`, into a single digest. Files whose digests were
+        recorded while `save` wrote them are not read again, unless their size
+        changed since they were written. Override this
+        method if your materializer can compute a stable digest more cheaply.
+
+        Returns:
+            The hex digest of the artifact content or `None` if no digest could
+            be computed.
+        """
+        if not fileio.exists(self.uri):
+            return None
+
+        recorded_digests: Dict[str, Tuple[bytes, int]] = getattr(
+            self, "_file_digests", {}
+        )
+        hash_ = hashlib.sha256()
+
+        def _update(path: str, relative_path: str) -> None:
+            if fileio.isdir(path):
+                for child in sorted(
+                    fileio.convert_to_str(f) for f in fileio.listdir(path)
+                ):
+                    _update(
+                        os.path.join(path, child),
+                        os.path.join(relative_path, child),
+                    )
+                return
+
+            digest: Optional[bytes] = None
+            recorded = recorded_digests.get(relative_path.replace("\\", "/"))
+            if recorded and fileio.size(path) in (recorded[1], None):
+                digest = recorded[0]
+            if digest is None:
+                file_hash = hashlib.sha256()
+                with fileio.open(path, "rb") as f:
+                    while True:
+                        chunk = f.read(CONTENT_HASH_CHUNK_SIZE)
+                        if not chunk:
+                            break
+                        file_hash.update(chunk)
+                digest = file_hash.digest()
+
+            hash_.update(relative_path.encode())
+            hash_.update(b"\0")
+            hash_.update(digest)
+
+        _update(self.uri, "")
+        return hash_.hexdigest()
+
     # ================
     # Internal Methods
     # ================
@@ -264,3 +435,117 @@ class BaseMaterializer(metaclass=BaseMaterializerMeta):
         if isinstance(storage_size, int):
             return {"storage_size": StorageSize(storage_size)}
         return {}
+
+
+class _HashingFile:
+    """Wrapper of a file opened for writing which hashes the written data."""
+
+    def __init__(
+        self,
+        file: Any,
+        on_close: Callable[[Optional[Tuple[bytes, int]]], None],
+    ) -> None:
+        """Initializes the wrapper.
+
+        Args:
+            file: The file to wrap, opened in binary mode.
+            on_close: Function which receives the digest and size of the file
+                content once the file is closed, or `None` if the content is
+                not known because the file was not written sequentially.
+        """
+        self._file = file
+        self._on_close = on_close
+        self._hash: Optional["hashlib._Hash"] = hashlib.sha256()
+        self._written = 0
+        self._closed = False
+
+    def write(self, data: Any) -> Any:
+        """Writes data to the file and hashes it.
+
+        Args:
+            data: The data to write.
+
+        Returns:
+            The return value of the write call of the wrapped file.
+        """
+        result = self._file.write(data)
+        if self._hash is not None:
+            view = memoryview(data).cast("B")
+            if isinstance(result, int):
+                view = view[:result]
+            self._hash.update(view)
+            self._written += len(view)
+        return result
+
+    def writelines(self, lines: Any) -> None:
+        """Writes multiple lines to the file and hashes them.
+
+        Args:
+            lines: The lines to write.
+        """
+        for line in lines:
+            self.write(line)
+
+    def seek(self, *args: Any) -> Any:
+        """Changes the position in the file.
+
+        Args:
+            *args: Arguments of the seek call of the wrapped file.
+
+        Returns:
+            The new position.
+        """
+        position = self._file.seek(*args)
+        if position != self._written:
+            # Data could be overwritten, the content needs to be read back
+            self._hash = None
+        return position
+
+    def truncate(self, *args: Any) -> Any:
+        """Truncates the file.
+
+        Args:
+            *args: Arguments of the truncate call of the wrapped file.
+
+        Returns:
+            The new size of the file.
+        """
+        self._hash = None
+        return self._file.truncate(*args)
+
+    def close(self) -> None:
+        """Closes the file and reports the digest of its content."""
+        if self._closed:
+            return
+        self._closed = True
+        self._file.close()
+        self._on_close(
+            (self._hash.digest(), self._written) if self._hash else None
+        )
+
+    def __enter__(self) -> "_HashingFile":
+        """Enters the file context.
+
+        Returns:
+            The file.
+        """
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Closes the file.
+
+        Args:
+            *args: The exception arguments.
+        """
+        self.close()
+
+    def __getattr__(self, name: str) -> Any:
+        """Gets an attribute of the wrapped file.
+
+        Args:
+            name: The attribute name.
+
+        Returns:
+            The attribute of the wrapped file.
+        """
+        return getattr(self._file, name)
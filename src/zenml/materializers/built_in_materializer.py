@@ -13,14 +13,23 @@
 #  permissions and limitations under the License.
 """Implementation of ZenML's builtin materializer."""
 
+import json
 import os
+import shutil
+import tarfile
+import tempfile
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from typing import (
     TYPE_CHECKING,
     Any,
     ClassVar,
     Dict,
     Iterable,
+    Iterator,
     List,
+    Set,
     Tuple,
     Type,
     Union,
@@ -40,6 +49,13 @@ logger = get_logger(__name__)
 DEFAULT_FILENAME = "data.json"
 DEFAULT_BYTES_FILENAME = "data.txt"
 DEFAULT_METADATA_FILENAME = "metadata.json"
+DEFAULT_CHUNKED_FILENAME = "data.jsonl"
+DEFAULT_PACKED_FILENAME = "elements.tar"
+DEFAULT_PACKED_METADATA_FILENAME = "elements.json"
+# Maximum number of threads used to load elements stored in subdirectories
+ELEMENT_LOAD_THREADS = 8
+# Number of elements per chunk when loading containers in chunks
+CHUNK_SIZE = 10000
 BASIC_TYPES = (
     bool,
     float,
@@ -182,6 +198,56 @@ def _is_serializable(obj: Any) -> bool:
     return False
 
 
+def _normalize_tar_info(tar_info: tarfile.TarInfo) -> tarfile.TarInfo:
+    """Removes attributes which change between saves from an archive member.
+
+    This keeps the archive content identical for identical elements, which
+    is required for content-addressed caching.
+
+    Args:
+        tar_info: The archive member.
+
+    Returns:
+        The normalized archive member.
+    """
+    tar_info.mtime = 0
+    tar_info.uid = tar_info.gid = 0
+    tar_info.uname = tar_info.gname = ""
+    return tar_info
+
+
+def _load_element(entry: Dict[str, str]) -> Any:
+    """Loads an element of a container stored in its own subdirectory.
+
+    Args:
+        entry: The metadata entry of the element.
+
+    Returns:
+        The loaded element.
+    """
+    type_ = source_utils.load(entry["type"])
+    materializer_class = source_utils.load(entry["materializer"])
+    materializer = materializer_class(uri=entry["path"])
+    return materializer.load(type_)
+
+
+def _cast_chunk(chunk: List[Any], data_type: Type[Any]) -> Any:
+    """Casts a chunk of a container to the requested container type.
+
+    Args:
+        chunk: The chunk elements.
+        data_type: The requested container type.
+
+    Returns:
+        The chunk as the requested container type.
+    """
+    if issubclass(data_type, tuple):
+        return tuple(chunk)
+    if issubclass(data_type, set):
+        return set(chunk)
+    return chunk
+
+
 def find_type_by_str(type_str: str) -> Type[Any]:
     """Get a Python type, given its string representation.
 
@@ -261,12 +327,23 @@ class BuiltInContainerMaterializer(BaseMaterializer):
         super().__init__(uri)
         self.data_path = os.path.join(self.uri, DEFAULT_FILENAME)
         self.metadata_path = os.path.join(self.uri, DEFAULT_METADATA_FILENAME)
+        self.chunked_data_path = os.path.join(
+            self.uri, DEFAULT_CHUNKED_FILENAME
+        )
+        self.packed_data_path = os.path.join(self.uri, DEFAULT_PACKED_FILENAME)
+        self.packed_metadata_path = os.path.join(
+            self.uri, DEFAULT_PACKED_METADATA_FILENAME
+        )
 
     def load(self, data_type: Type[Any]) -> Any:
         """Reads a materialized built-in container object.
 
         If the data was serialized to JSON, deserialize it.
 
+        If the elements were packed into a single archive, download and
+        extract the archive to a temporary directory and load each element
+        with the materializer stored in the packed metadata file.
+
         Otherwise, reconstruct all elements according to the metadata file:
             1. Resolve the data type using `find_type_by_str()`,
             2. Get the materializer via the `default_materializer_registry`,
@@ -282,8 +359,20 @@ class BuiltInContainerMaterializer(BaseMaterializer):
         Raises:
             RuntimeError: If the data was not found.
         """
+        # If the data was saved in chunks, read all of them.
+        if fileio.exists(self.chunked_data_path):
+            outputs = [
+                element
+                for chunk in self.load_chunks(list)
+                for element in chunk
+            ]
+
+        # If the elements were packed into an archive, extract and load them.
+        elif fileio.exists(self.packed_metadata_path):
+            outputs = self._load_packed_elements()
+
         # If the data was not serialized, there must be metadata present.
-        if not fileio.exists(self.data_path) and not fileio.exists(
+        elif not fileio.exists(self.data_path) and not fileio.exists(
             self.metadata_path
         ):
             raise RuntimeError(
@@ -292,7 +381,7 @@ class BuiltInContainerMaterializer(BaseMaterializer):
             )
 
         # If the data was serialized as JSON, deserialize it.
-        if fileio.exists(self.data_path):
+        elif fileio.exists(self.data_path):
             outputs = yaml_utils.read_json(self.data_path)
 
         # Otherwise, use the metadata to reconstruct the data as a list.
@@ -311,17 +400,12 @@ class BuiltInContainerMaterializer(BaseMaterializer):
                     element = materializer.load(type_)
                     outputs.append(element)
 
-            # New format for zenml > 0.37.0
+            # Format for zenml > 0.37.0: Elements are loaded concurrently as
+            # each of them requires several requests to the artifact store.
             elif isinstance(metadata, list):
-                for entry in metadata:
-                    path_ = entry["path"]
-                    type_ = source_utils.load(entry["type"])
-                    materializer_class = source_utils.load(
-                        entry["materializer"]
-                    )
-                    materializer = materializer_class(uri=path_)
-                    element = materializer.load(type_)
-                    outputs.append(element)
+                max_workers = max(1, min(ELEMENT_LOAD_THREADS, len(metadata)))
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    outputs = list(executor.map(_load_element, metadata))
 
             else:
                 raise RuntimeError(f"Unknown metadata format: {metadata}.")
@@ -336,14 +420,71 @@ class BuiltInContainerMaterializer(BaseMaterializer):
             return set(outputs)
         return outputs
 
+    def load_chunks(self, data_type: Type[Any]) -> Iterator[Any]:
+        """Reads a materialized built-in container object in chunks.
+
+        Containers saved in chunks are read in chunks of `CHUNK_SIZE`
+        elements, all other containers are read as a single chunk.
+
+        Args:
+            data_type: The type of the chunks to read.
+
+        Yields:
+            The chunks of the container.
+        """
+        if not fileio.exists(self.chunked_data_path):
+            yield self.load(data_type)
+            return
+
+        chunk: List[Any] = []
+        with fileio.open(self.chunked_data_path, "r") as f:
+            for line in f:
+                chunk.append(json.loads(line))
+                if len(chunk) >= CHUNK_SIZE:
+                    yield _cast_chunk(chunk, data_type)
+                    chunk = []
+        if chunk:
+            yield _cast_chunk(chunk, data_type)
+
+    def save_chunks(self, chunks: Iterator[Any]) -> None:
+        """Materialize a list, tuple or set chunk by chunk.
+
+        The elements of all chunks are written to a JSON lines file, one
+        element per line, so they all need to be JSON-serializable.
+
+        Args:
+            chunks: The chunks of the container.
+
+        Raises:
+            TypeError: If a chunk is not a list, tuple or set, or contains
+                elements which are not JSON-serializable.
+        """
+        with fileio.open(self.chunked_data_path, "w") as f:
+            for chunk in chunks:
+                if not isinstance(chunk, (list, tuple, set)):
+                    raise TypeError(
+                        f"Unable to save chunk of type {type(chunk)}. Only "
+                        "lists, tuples and sets can be saved in chunks."
+                    )
+                for element in chunk:
+                    if not _is_serializable(element):
+                        raise TypeError(
+                            f"Unable to save element of type {type(element)}"
+                            ". Only JSON-serializable elements can be saved "
+                            "in chunks."
+                        )
+                    f.write(json.dumps(element) + "\n")
+
     def save(self, data: Any) -> None:
         """Materialize a built-in container object.
 
         If the object can be serialized to JSON, serialize it.
 
         Otherwise, use the `default_materializer_registry` to find the correct
-        materializer for each element and materialize each element into a
-        subdirectory.
+        materializer for each element, materialize each element into a
+        subdirectory of a local temporary directory and upload all elements as
+        a single archive. The type and materializer of the elements are stored
+        once per distinct type.
 
         Tuples and sets are cast to list before materialization.
 
@@ -368,43 +509,102 @@ class BuiltInContainerMaterializer(BaseMaterializer):
         if isinstance(data, dict):
             data = [list(data.keys()), list(data.values())]
 
-        # non-serializable list: Materialize each element into a subfolder.
-        # Get path, type, and corresponding materializer for each element.
-        metadata: List[Dict[str, str]] = []
-        materializers: List[BaseMaterializer] = []
+        # non-serializable list: Materialize each element into a subfolder of
+        # a local directory and upload all of them as a single archive.
+        types: List[Dict[str, str]] = []
+        type_indices: Dict[Tuple[Type[Any], Type[BaseMaterializer]], int] = {}
+        elements: List[int] = []
         try:
-            for i, element in enumerate(data):
-                element_path = os.path.join(self.uri, str(i))
-                fileio.mkdir(element_path)
-                type_ = type(element)
-                materializer_class = materializer_registry[type_]
-                materializer = materializer_class(uri=element_path)
-                materializers.append(materializer)
-                metadata.append(
-                    {
-                        "path": element_path,
-                        "type": source_utils.resolve(type_).import_path,
-                        "materializer": source_utils.resolve(
-                            materializer_class
-                        ).import_path,
-                    }
-                )
-            # Write metadata as JSON.
-            yaml_utils.write_json(self.metadata_path, metadata)
-            # Materialize each element.
-            for element, materializer in zip(data, materializers):
-                materializer.validate_type_compatibility(type(element))
-                materializer.save(element)
+            with tempfile.TemporaryDirectory() as temp_dir:
+                for i, element in enumerate(data):
+                    type_ = type(element)
+                    materializer_class = materializer_registry[type_]
+                    key = (type_, materializer_class)
+                    if key not in type_indices:
+                        type_indices[key] = len(types)
+                        types.append(
+                            {
+                                "type": source_utils.resolve(
+                                    type_
+                                ).import_path,
+                                "materializer": source_utils.resolve(
+                                    materializer_class
+                                ).import_path,
+                            }
+                        )
+                    elements.append(type_indices[key])
+
+                    element_path = os.path.join(temp_dir, str(i))
+                    os.mkdir(element_path)
+                    materializer = materializer_class(uri=element_path)
+                    materializer.validate_type_compatibility(type_)
+                    materializer.save(element)
+
+                with fileio.open(self.packed_data_path, "wb") as f:
+                    with tarfile.open(fileobj=f, mode="w|") as archive:
+                        for i in range(len(elements)):
+                            archive.add(
+                                os.path.join(temp_dir, str(i)),
+                                arcname=str(i),
+                                filter=_normalize_tar_info,
+                            )
+
+            yaml_utils.write_json(
+                self.packed_metadata_path,
+                {"types": types, "elements": elements},
+            )
         # If an error occurs, delete all created files.
         except Exception as e:
-            # Delete metadata
-            if fileio.exists(self.metadata_path):
-                fileio.remove(self.metadata_path)
-            # Delete all elements that were already saved.
-            for entry in metadata:
-                fileio.rmtree(entry["path"])
+            for path in (self.packed_data_path, self.packed_metadata_path):
+                if fileio.exists(path):
+                    fileio.remove(path)
             raise e
 
+    def _load_packed_elements(self) -> List[Any]:
+        """Loads the elements of a container stored as a single archive.
+
+        Returns:
+            The loaded elements.
+        """
+        metadata = yaml_utils.read_json(self.packed_metadata_path)
+        types = [
+            (
+                source_utils.load(entry["type"]),
+                source_utils.load(entry["materializer"]),
+            )
+            for entry in metadata["types"]
+        ]
+
+        # The elements might lazily read from their files after loading, e.g.
+        # memory-mapped arrays, so the extracted files are only removed once
+        # all loaded elements are garbage collected.
+        temp_dir = tempfile.mkdtemp(prefix="zenml-packed-")
+        try:
+            with fileio.open(self.packed_data_path, "rb") as f:
+                with tarfile.open(fileobj=f, mode="r|") as archive:
+                    # Reject links and paths outside of the target directory
+                    # on Python versions which support extraction filters
+                    extract_kwargs: Dict[str, Any] = (
+                        {"filter": "data"}
+                        if hasattr(tarfile, "data_filter")
+                        else {}
+                    )
+                    archive.extractall(temp_dir, **extract_kwargs)
+
+            outputs = []
+            for i, type_index in enumerate(metadata["elements"]):
+                type_, materializer_class = types[type_index]
+                materializer = materializer_class(
+                    uri=os.path.join(temp_dir, str(i))
+                )
+                outputs.append(materializer.load(type_))
+        except BaseException:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+            raise
+
+        _remove_when_collected(temp_dir, outputs)
+        return outputs
+
     def extract_metadata(self, data: Any) -> Dict[str, "MetadataType"]:
         """Extract metadata from the given built-in container object.
 
@@ -417,3 +617,55 @@ class BuiltInContainerMaterializer(BaseMaterializer):
         if hasattr(data, "__len__"):
             return {"length": len(data)}
         return {}
+
+
+def _remove_when_collected(path: str, objects: Iterable[Any]) -> None:
+    """Removes a directory once all objects loaded from it are collected.
+
+    Built-in containers are searched for the objects they contain, as they
+    don't support weak references themselves. Objects which don't support
+    weak references either, e.g. strings or numbers, don't read from files
+    after loading and are ignored. If there are no objects left to track,
+    the directory is removed immediately.
+
+    Args:
+        path: The directory to remove.
+        objects: The objects loaded from the directory.
+    """
+    tracked: List[Any] = []
+    seen: Set[int] = set()
+    pending = list(objects)
+    while pending:
+        obj = pending.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        if isinstance(obj, dict):
+            pending += obj.keys()
+            pending += obj.values()
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            pending += obj
+        else:
+            tracked.append(obj)
+
+    remaining = [0]
+    lock = threading.Lock()
+
+    def _on_collected() -> None:
+        with lock:
+            remaining[0] -= 1
+            if remaining[0] > 0:
+                return
+        shutil.rmtree(path, ignore_errors=True)
+
+    with lock:
+        for obj in tracked:
+            try:
+                weakref.finalize(obj, _on_collected)
+            except TypeError:
+                # The object doesn't support weak references
+                continue
+            remaining[0] += 1
+        if remaining[0] > 0:
+            return
+    shutil.rmtree(path, ignore_errors=True)
@@ -14,16 +14,30 @@
 """Implementation of the ZenML NumPy materializer."""
 
 import os
+import shutil
+import tempfile
 from collections import Counter
-from typing import TYPE_CHECKING, Any, ClassVar, Dict, Tuple, Type, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ClassVar,
+    Dict,
+    Iterator,
+    Optional,
+    Tuple,
+    Type,
+    cast,
+)
 
 import numpy as np
 
+from zenml.constants import ENV_ZENML_NUMPY_MEMORY_MAP, handle_bool_env_var
 from zenml.enums import ArtifactType, VisualizationType
 from zenml.io import fileio
 from zenml.logger import get_logger
 from zenml.materializers.base_materializer import BaseMaterializer
 from zenml.metadata.metadata_types import DType, MetadataType
+from zenml.utils import io_utils
 
 if TYPE_CHECKING:
     from numpy.typing import NDArray
@@ -33,6 +47,9 @@ logger = get_logger(__name__)
 
 NUMPY_FILENAME = "data.npy"
 
+# Approximate size of the chunks in which arrays are loaded by `load_chunks`
+CHUNK_SIZE = 64 * 1024 * 1024
+
 DATA_FILENAME = "data.parquet"
 SHAPE_FILENAME = "shape.json"
 DATA_VAR = "data_var"
@@ -47,6 +64,13 @@ class NumpyMaterializer(BaseMaterializer):
     def load(self, data_type: Type[Any]) -> "Any":
         """Reads a numpy array from a `.npy` file.
 
+        If the `ZENML_NUMPY_MEMORY_MAP` environment variable is set and the
+        array is stored on the local filesystem (e.g. in a local artifact
+        store or the local cache of a remote artifact store), the array is
+        memory-mapped instead of being read into memory. The returned
+        `np.memmap` is copy-on-write, so modifying it does not change the
+        stored artifact.
+
         Args:
             data_type: The type of the data to read.
 
@@ -60,6 +84,17 @@ class NumpyMaterializer(BaseMaterializer):
         numpy_file = os.path.join(self.uri, NUMPY_FILENAME)
 
         if fileio.exists(numpy_file):
+            if handle_bool_env_var(
+                ENV_ZENML_NUMPY_MEMORY_MAP, default=False
+            ) and not io_utils.is_remote(numpy_file):
+                try:
+                    return cast(Any, np.load)(
+                        numpy_file, mmap_mode="c", allow_pickle=True
+                    )
+                except ValueError:
+                    # Arrays of Python objects can't be memory-mapped
+                    pass
+
             with fileio.open(numpy_file, "rb") as f:
                 # This function is untyped for numpy versions supporting python
                 # 3.7, but typed for numpy versions installed on python 3.8+.
@@ -115,6 +150,98 @@ class NumpyMaterializer(BaseMaterializer):
             # statement
             cast(Any, np.save)(f, arr)
 
+    def load_chunks(self, data_type: Type[Any]) -> Iterator["Any"]:
+        """Reads a numpy array from a `.npy` file in chunks of rows.
+
+        The array is split along its first axis into chunks of roughly
+        `CHUNK_SIZE` bytes. Arrays which can't be read partially (e.g. arrays
+        of Python objects or arrays stored in Fortran order) are read as a
+        single chunk.
+
+        Args:
+            data_type: The type of the data to read.
+
+        Yields:
+            The chunks of the numpy array.
+        """
+        numpy_file = os.path.join(self.uri, NUMPY_FILENAME)
+        header = None
+        if fileio.exists(numpy_file):
+            with fileio.open(numpy_file, "rb") as f:
+                header = _read_array_header(f)
+                if header:
+                    shape, dtype = header
+                    row_size = dtype.itemsize * int(np.prod(shape[1:]))
+                    rows_per_chunk = max(1, CHUNK_SIZE // max(row_size, 1))
+                    for start in range(0, shape[0], rows_per_chunk):
+                        num_rows = min(rows_per_chunk, shape[0] - start)
+                        buffer = _read_exactly(f, num_rows * row_size)
+                        yield np.frombuffer(buffer, dtype=dtype).reshape(
+                            (num_rows,) + shape[1:]
+                        )
+
+        if header is None:
+            yield self.load(data_type)
+
+    def save_chunks(self, chunks: Iterator["NDArray[Any]"]) -> None:
+        """Writes numpy array chunks to a single `.npy` file.
+
+        The chunks are concatenated along their first axis, so they all need
+        to have the same dtype, at least one dimension and the same size in
+        all other dimensions. As the `.npy` header contains the shape of the
+        complete array, the chunks are buffered in a local temporary file
+        before being written to the artifact store.
+
+        Args:
+            chunks: The numpy array chunks to write.
+
+        Raises:
+            ValueError: If the chunks have different dtypes, can't be
+                concatenated or contain Python objects.
+        """
+        num_rows = 0
+        row_shape: Tuple[int, ...] = ()
+        dtype: Optional[Any] = None
+        with tempfile.TemporaryFile() as buffer:
+            for chunk in chunks:
+                if dtype is None:
+                    if chunk.ndim == 0 or chunk.dtype.hasobject:
+                        raise ValueError(
+                            "Only arrays with at least one dimension and "
+                            "without Python objects can be saved in chunks."
+                        )
+                    dtype, row_shape = chunk.dtype, tuple(chunk.shape)[1:]
+                elif chunk.dtype != dtype:
+                    raise ValueError(
+                        f"Unable to concatenate array chunks of dtypes "
+                        f"{dtype} and {chunk.dtype}."
+                    )
+                elif chunk.ndim == 0 or tuple(chunk.shape)[1:] != row_shape:
+                    raise ValueError(
+                        f"Unable to concatenate array chunks of shapes "
+                        f"{(num_rows,) + row_shape} and {chunk.shape}."
+                    )
+                np.ascontiguousarray(chunk).tofile(buffer)
+                num_rows += chunk.shape[0]
+
+            if dtype is None:
+                # No chunks, store an empty array
+                dtype = np.dtype(float)
+
+            buffer.seek(0)
+            with fileio.open(
+                os.path.join(self.uri, NUMPY_FILENAME), "wb"
+            ) as f:
+                np.lib.format.write_array_header_1_0(
+                    f,
+                    {
+                        "descr": np.lib.format.dtype_to_descr(dtype),
+                        "fortran_order": False,
+                        "shape": (num_rows,) + row_shape,
+                    },
+                )
+                shutil.copyfileobj(buffer, f, CHUNK_SIZE)
+
     def save_visualizations(
         self, arr: "NDArray[Any]"
     ) -> Dict[str, VisualizationType]:
@@ -273,3 +400,51 @@ class NumpyMaterializer(BaseMaterializer):
             "most_common_count": most_common_count,
         }
         return text_metadata
+
+
+def _read_array_header(f: Any) -> Optional[Tuple[Tuple[int, ...], Any]]:
+    """Reads the header of a `.npy` file if its data can be read in chunks.
+
+    Args:
+        f: The open `.npy` file.
+
+    Returns:
+        The shape and dtype of the array, or `None` if the array can't be read
+        in chunks.
+    """
+    version = np.lib.format.read_magic(f)
+    if version == (1, 0):
+        header = np.lib.format.read_array_header_1_0(f)
+    elif version == (2, 0):
+        header = np.lib.format.read_array_header_2_0(f)
+    else:
+        return None
+
+    shape, fortran_order, dtype = header
+    if fortran_order or dtype.hasobject or len(shape) == 0:
+        return None
+    return tuple(shape), dtype
+
+
+def _read_exactly(f: Any, size: int) -> bytearray:
+    """Reads an exact number of bytes from a file.
+
+    Args:
+        f: The file to read from.
+        size: The number of bytes to read.
+
+    Returns:
+        A writable buffer containing the bytes.
+
+    Raises:
+        EOFError: If the file ends before enough bytes were read.
+    """
+    buffer = bytearray(size)
+    view = memoryview(buffer)
+    position = 0
+    while position < size:
+        num_bytes = f.readinto(view[position:])
+        if not num_bytes:
+            raise EOFError("Unexpected end of `.npy` file.")
+        position += num_bytes
+    return buffer
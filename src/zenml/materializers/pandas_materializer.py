@@ -14,10 +14,28 @@
 """Materializer for Pandas."""
 
 import os
-from typing import Any, ClassVar, Dict, Tuple, Type, Union
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
 
 import pandas as pd
-
+from pandas.api.types import is_bool_dtype, is_numeric_dtype
+
+from zenml.constants import (
+    ENV_ZENML_PANDAS_PARQUET_COMPRESSION,
+    ENV_ZENML_PANDAS_PARQUET_ROW_GROUP_SIZE,
+    ENV_ZENML_PANDAS_STATISTICS_SAMPLE_SIZE,
+    handle_int_env_var,
+)
 from zenml.enums import ArtifactType, VisualizationType
 from zenml.io import fileio
 from zenml.logger import get_logger
@@ -26,11 +44,161 @@ from zenml.metadata.metadata_types import DType, MetadataType
 
 logger = get_logger(__name__)
 
-PARQUET_FILENAME = "df.parquet.gzip"
-COMPRESSION_TYPE = "gzip"
+PARQUET_FILENAME = "df.parquet"
+DEFAULT_COMPRESSION_TYPE = "zstd"
+DEFAULT_ROW_GROUP_SIZE = 100_000
+
+# Artifacts stored by previous versions of this materializer
+LEGACY_PARQUET_FILENAME = "df.parquet.gzip"
 
 CSV_FILENAME = "df.csv"
 
+# Summary statistics of numeric columns which are stored as metadata
+STATISTICS = ("mean", "std", "min", "max")
+
+
+class LazyDataFrame:
+    """Handle to a stored dataframe which only reads the data on request.
+
+    Steps can annotate an input with this type instead of `pd.DataFrame` to
+    read only the columns or row groups they need. For artifacts stored as
+    parquet, only the requested parts of the file are read from the artifact
+    store. Artifacts stored as `.csv` are always read completely.
+
+    Example:
+    ```python
+    @step
+    def train(features: LazyDataFrame) -> None:
+        df = features.read(columns=["age", "income", "label"])
+    ```
+    """
+
+    def __init__(self, path: str) -> None:
+        """Initializes the handle.
+
+        Args:
+            path: Path of the `.parquet` or `.csv` file storing the dataframe.
+        """
+        self.path = path
+        self.is_parquet = not path.endswith(CSV_FILENAME)
+
+    @property
+    def columns(self) -> List[str]:
+        """The names of the dataframe columns.
+
+        Returns:
+            The column names.
+        """
+        if not self.is_parquet:
+            return [str(column) for column in self._read_csv().columns]
+
+        import pyarrow.parquet as pq  # type: ignore
+
+        with fileio.open(self.path, mode="rb") as f:
+            schema = pq.read_schema(f)
+
+        index_columns = set()
+        if schema.pandas_metadata:
+            index_columns = {
+                column
+                for column in schema.pandas_metadata.get("index_columns", [])
+                if isinstance(column, str)
+            }
+        return [name for name in schema.names if name not in index_columns]
+
+    @property
+    def num_rows(self) -> int:
+        """The number of rows of the dataframe.
+
+        Returns:
+            The number of rows.
+        """
+        if not self.is_parquet:
+            return len(self._read_csv())
+
+        import pyarrow.parquet as pq  # type: ignore
+
+        with fileio.open(self.path, mode="rb") as f:
+            return int(pq.ParquetFile(f).metadata.num_rows)
+
+    @property
+    def num_row_groups(self) -> int:
+        """The number of row groups in which the dataframe is stored.
+
+        Returns:
+            The number of row groups. Dataframes stored as `.csv` consist of a
+            single row group.
+        """
+        if not self.is_parquet:
+            return 1
+
+        import pyarrow.parquet as pq  # type: ignore
+
+        with fileio.open(self.path, mode="rb") as f:
+            return int(pq.ParquetFile(f).num_row_groups)
+
+    def read(
+        self,
+        columns: Optional[Sequence[str]] = None,
+        row_groups: Optional[Sequence[int]] = None,
+    ) -> pd.DataFrame:
+        """Reads (parts of) the dataframe.
+
+        Args:
+            columns: Names of the columns to read. Reads all columns if not
+                given. The index of the dataframe is always read.
+            row_groups: Indices of the row groups to read. Reads all row
+                groups if not given.
+
+        Returns:
+            The dataframe containing the requested columns and row groups.
+        """
+        if not self.is_parquet:
+            df = self._read_csv()
+            return df[list(columns)] if columns is not None else df
+
+        import pyarrow.parquet as pq  # type: ignore
+
+        columns = list(columns) if columns is not None else None
+        with fileio.open(self.path, mode="rb") as f:
+            parquet_file = pq.ParquetFile(f)
+            if row_groups is None:
+                table = parquet_file.read(
+                    columns=columns, use_pandas_metadata=True
+                )
+            else:
+                table = parquet_file.read_row_groups(
+                    list(row_groups), columns=columns, use_pandas_metadata=True
+                )
+        return table.to_pandas()
+
+    def iter_row_groups(
+        self, columns: Optional[Sequence[str]] = None
+    ) -> Iterator[pd.DataFrame]:
+        """Iterates over the row groups of the dataframe.
+
+        Only a single row group is kept in memory at a time, which allows
+        processing dataframes that don't fit into memory.
+
+        Args:
+            columns: Names of the columns to read. Reads all columns if not
+                given.
+
+        Yields:
+            One dataframe per row group.
+        """
+        for row_group in range(self.num_row_groups):
+            yield self.read(columns=columns, row_groups=[row_group])
+
+    def _read_csv(self) -> pd.DataFrame:
+        """Reads the complete dataframe from a `.csv` file.
+
+        Returns:
+            The dataframe.
+        """
+        with fileio.open(self.path, mode="rb") as f:
+            return pd.read_csv(f, index_col=0, parse_dates=True)
+
 
 class PandasMaterializer(BaseMaterializer):
     """Materializer to read data to and from pandas."""
@@ -38,6 +206,7 @@ class PandasMaterializer(BaseMaterializer):
     ASSOCIATED_TYPES: ClassVar[Tuple[Type[Any], ...]] = (
         pd.DataFrame,
         pd.Series,
+        LazyDataFrame,
     )
     ASSOCIATED_ARTIFACT_TYPE: ClassVar[ArtifactType] = ArtifactType.DATA
 
@@ -63,77 +232,180 @@ class PandasMaterializer(BaseMaterializer):
             )
         finally:
             self.parquet_path = os.path.join(self.uri, PARQUET_FILENAME)
+            self.legacy_parquet_path = os.path.join(
+                self.uri, LEGACY_PARQUET_FILENAME
+            )
             self.csv_path = os.path.join(self.uri, CSV_FILENAME)
+            self._statistics: Optional[
+                Tuple[
+                    Any,
+                    Union[pd.DataFrame, pd.Series],
+                    Union[pd.DataFrame, pd.Series],
+                ]
+            ] = None
+
+    def _get_parquet_path(self) -> Optional[str]:
+        """Gets the path of the stored parquet file.
+
+        Raises:
+            ImportError: If the data is stored as parquet file but pyarrow is
+                not installed.
 
-    def load(self, data_type: Type[Any]) -> Union[pd.DataFrame, pd.Series]:
+        Returns:
+            The path of the parquet file or `None` if the data is stored as a
+            `.csv` file.
+        """
+        if fileio.exists(self.parquet_path):
+            parquet_path: Optional[str] = self.parquet_path
+        elif fileio.exists(self.legacy_parquet_path):
+            parquet_path = self.legacy_parquet_path
+        else:
+            return None
+
+        if not self.pyarrow_exists:
+            raise ImportError(
+                "You have an old version of a `PandasMaterializer` "
+                "data artifact stored in the artifact store "
+                "as a `.parquet` file, which requires `pyarrow` "
+                "for reading, You can install `pyarrow` by running "
+                "'`pip install pyarrow fastparquet`'."
+            )
+        return parquet_path
+
+    def load(
+        self, data_type: Type[Any]
+    ) -> Union[pd.DataFrame, pd.Series, LazyDataFrame]:
         """Reads `pd.DataFrame` or `pd.Series` from a `.parquet` or `.csv` file.
 
+        If the requested data type is `LazyDataFrame`, no data is read and a
+        handle to the stored file is returned instead.
+
         Args:
             data_type: The type of the data to read.
 
-        Raises:
-            ImportError: If pyarrow or fastparquet is not installed.
-
         Returns:
-            The pandas dataframe or series.
+            The pandas dataframe or series, or a lazy handle to the dataframe.
         """
-        if fileio.exists(self.parquet_path):
-            if self.pyarrow_exists:
-                with fileio.open(self.parquet_path, mode="rb") as f:
-                    df = pd.read_parquet(f)
-            else:
-                raise ImportError(
-                    "You have an old version of a `PandasMaterializer` "
-                    "data artifact stored in the artifact store "
-                    "as a `.parquet` file, which requires `pyarrow` "
-                    "for reading, You can install `pyarrow` by running "
-                    "'`pip install pyarrow fastparquet`'."
-                )
+        parquet_path = self._get_parquet_path()
+
+        if issubclass(data_type, LazyDataFrame):
+            return LazyDataFrame(path=parquet_path or self.csv_path)
+
+        if parquet_path:
+            with fileio.open(parquet_path, mode="rb") as f:
+                df = pd.read_parquet(f)
         else:
             with fileio.open(self.csv_path, mode="rb") as f:
                 df = pd.read_csv(f, index_col=0, parse_dates=True)
 
-        # validate the type of the data.
-        def is_dataframe_or_series(
-            df: Union[pd.DataFrame, pd.Series]
-        ) -> Union[pd.DataFrame, pd.Series]:
-            """Checks if the data is a `pd.DataFrame` or `pd.Series`.
-
-            Args:
-                df: The data to check.
-
-            Returns:
-                The data if it is a `pd.DataFrame` or `pd.Series`.
-            """
-            if issubclass(data_type, pd.Series):
-                # Taking the first column if its a series as the assumption
-                # is that there will only be one
-                assert len(df.columns) == 1
-                df = df[df.columns[0]]
-                return df
-            else:
-                return df
+        return _to_data_type(df, data_type=data_type)
+
+    def load_chunks(
+        self, data_type: Type[Any]
+    ) -> Iterator[Union[pd.DataFrame, pd.Series]]:
+        """Reads `pd.DataFrame` or `pd.Series` chunks from a stored file.
 
-        return is_dataframe_or_series(df)
+        Parquet files are read one row group at a time, `.csv` files in
+        chunks of `DEFAULT_ROW_GROUP_SIZE` rows.
+
+        Args:
+            data_type: The type of the chunks to read.
 
-    def save(self, df: Union[pd.DataFrame, pd.Series]) -> None:
+        Yields:
+            The pandas dataframe or series chunks.
+        """
+        if issubclass(data_type, LazyDataFrame):
+            data_type = pd.DataFrame
+
+        parquet_path = self._get_parquet_path()
+        if parquet_path:
+            for df in LazyDataFrame(path=parquet_path).iter_row_groups():
+                yield _to_data_type(df, data_type=data_type)
+        else:
+            with fileio.open(self.csv_path, mode="rb") as f:
+                for df in pd.read_csv(
+                    f,
+                    index_col=0,
+                    parse_dates=True,
+                    chunksize=DEFAULT_ROW_GROUP_SIZE,
+                ):
+                    yield _to_data_type(df, data_type=data_type)
+
+    def save(self, df: Union[pd.DataFrame, pd.Series, LazyDataFrame]) -> None:
         """Writes a pandas dataframe or series to the specified filename.
 
+        Parquet files are written with the compression codec configured by
+        the `ZENML_PANDAS_PARQUET_COMPRESSION` environment variable (`zstd` by
+        default) and split into row groups of at most
+        `ZENML_PANDAS_PARQUET_ROW_GROUP_SIZE` rows, which allows reading them
+        partially using a `LazyDataFrame`.
+
         Args:
             df: The pandas dataframe or series to write.
         """
-        if isinstance(df, pd.Series):
-            df = df.to_frame(name="series")
+        df = _to_frame(_to_pandas(df))
 
         if self.pyarrow_exists:
+            compression, row_group_size = _get_parquet_write_options()
             with fileio.open(self.parquet_path, mode="wb") as f:
-                df.to_parquet(f, compression=COMPRESSION_TYPE)
+                df.to_parquet(
+                    f,
+                    engine="pyarrow",
+                    compression=compression,
+                    row_group_size=row_group_size,
+                )
         else:
             with fileio.open(self.csv_path, mode="wb") as f:
                 df.to_csv(f, index=True)
 
+    def save_chunks(
+        self, chunks: Iterator[Union[pd.DataFrame, pd.Series]]
+    ) -> None:
+        """Writes pandas dataframe or series chunks to a single file.
+
+        Only one chunk is kept in memory at a time. All chunks must have the
+        same columns, and their column types must be convertible to the ones
+        of the first chunk.
+
+        Args:
+            chunks: The pandas dataframe or series chunks to write.
+        """
+        if not self.pyarrow_exists:
+            with fileio.open(self.csv_path, mode="wb") as f:
+                for i, chunk in enumerate(chunks):
+                    _to_frame(chunk).to_csv(f, index=True, header=i == 0)
+            return
+
+        import pyarrow as pa  # type: ignore
+        import pyarrow.parquet as pq  # type: ignore
+
+        compression, row_group_size = _get_parquet_write_options()
+        writer = None
+        with fileio.open(self.parquet_path, mode="wb") as f:
+            try:
+                for chunk in chunks:
+                    # The index is always stored as a column, as the metadata
+                    # of a range index would only describe the first chunk
+                    if writer is None:
+                        table = pa.Table.from_pandas(
+                            _to_frame(chunk), preserve_index=True
+                        )
+                        writer = pq.ParquetWriter(
+                            f, table.schema, compression=compression
+                        )
+                    else:
+                        table = pa.Table.from_pandas(
+                            _to_frame(chunk),
+                            schema=writer.schema,
+                            preserve_index=True,
+                        )
+                    writer.write_table(table, row_group_size=row_group_size)
+            finally:
+                if writer is not None:
+                    writer.close()
+
     def save_visualizations(
-        self, df: Union[pd.DataFrame, pd.Series]
+        self, df: Union[pd.DataFrame, pd.Series, LazyDataFrame]
     ) -> Dict[str, VisualizationType]:
         """Save visualizations of the given pandas dataframe or series.
 
@@ -145,11 +417,12 @@ class PandasMaterializer(BaseMaterializer):
         """
         describe_uri = os.path.join(self.uri, "describe.csv")
         with fileio.open(describe_uri, mode="wb") as f:
-            df.describe().to_csv(f)
+            description, _ = self._get_statistics(df)
+            description.to_csv(f)
         return {describe_uri: VisualizationType.CSV}
 
     def extract_metadata(
-        self, df: Union[pd.DataFrame, pd.Series]
+        self, df: Union[pd.DataFrame, pd.Series, LazyDataFrame]
     ) -> Dict[str, "MetadataType"]:
         """Extract metadata from the given pandas dataframe or series.
 
@@ -159,28 +432,163 @@ class PandasMaterializer(BaseMaterializer):
         Returns:
             The extracted metadata as a dictionary.
         """
+        _, statistics = self._get_statistics(df)
+        df = _to_pandas(df)
         pandas_metadata: Dict[str, "MetadataType"] = {"shape": df.shape}
 
         if isinstance(df, pd.Series):
             pandas_metadata["dtype"] = DType(df.dtype.type)
-            pandas_metadata["mean"] = float(df.mean().item())
-            pandas_metadata["std"] = float(df.std().item())
-            pandas_metadata["min"] = float(df.min().item())
-            pandas_metadata["max"] = float(df.max().item())
+            if is_numeric_dtype(df.dtype):
+                for stat_name in STATISTICS:
+                    pandas_metadata[stat_name] = float(statistics[stat_name])
 
         else:
             pandas_metadata["dtype"] = {
                 str(key): DType(value.type) for key, value in df.dtypes.items()
             }
-            for stat_name, stat in {
-                "mean": df.mean,
-                "std": df.std,
-                "min": df.min,
-                "max": df.max,
-            }.items():
+            for stat_name in STATISTICS:
                 pandas_metadata[stat_name] = {
-                    str(key): float(value)
-                    for key, value in stat(numeric_only=True).to_dict().items()
+                    str(column): float(statistics.at[stat_name, column])
+                    for column in statistics.columns
                 }
 
         return pandas_metadata
+
+    def _get_statistics(
+        self, df: Union[pd.DataFrame, pd.Series, LazyDataFrame]
+    ) -> Tuple[Union[pd.DataFrame, pd.Series], Union[pd.DataFrame, pd.Series]]:
+        """Computes the summary statistics of a dataframe or series.
+
+        The statistics are shared by the visualization and the metadata, so
+        they are only computed once per artifact. For data with more rows than
+        the `ZENML_PANDAS_STATISTICS_SAMPLE_SIZE` environment variable, the
+        statistics are approximated on a random sample of rows.
+
+        Args:
+            df: The pandas dataframe or series.
+
+        Returns:
+            The summary statistics as returned by `describe()`, and the
+            statistics of the numeric columns which are stored as metadata.
+        """
+        if self._statistics is None or self._statistics[0] is not df:
+            sample_size = handle_int_env_var(
+                ENV_ZENML_PANDAS_STATISTICS_SAMPLE_SIZE, default=0
+            )
+            description, statistics = _describe(
+                _to_pandas(df), sample_size=sample_size
+            )
+            self._statistics = (df, description, statistics)
+        return self._statistics[1], self._statistics[2]
+
+
+def _describe(
+    df: Union[pd.DataFrame, pd.Series], sample_size: int = 0
+) -> Tuple[Union[pd.DataFrame, pd.Series], Union[pd.DataFrame, pd.Series]]:
+    """Computes the summary statistics of a dataframe or series in one call.
+
+    `describe()` doesn't treat boolean columns as numeric, so the metadata
+    statistics of those columns are aggregated separately instead of changing
+    the summary.
+
+    Args:
+        df: The pandas dataframe or series.
+        sample_size: If positive and the data has more rows, the statistics
+            are approximated on a random sample of this many rows.
+
+    Returns:
+        The summary statistics, and the mean, standard deviation, minimum and
+        maximum of all numeric columns including boolean ones.
+    """
+    if sample_size > 0 and len(df) > sample_size:
+        df = df.sample(n=sample_size, random_state=0)
+
+    if isinstance(df, pd.Series):
+        description = df.describe()
+        if is_bool_dtype(df.dtype):
+            return description, df.astype("uint8").agg(list(STATISTICS))
+        return description, description
+
+    if df.columns.empty:
+        return pd.DataFrame(), pd.DataFrame()
+    description = df.describe()
+    numeric_columns = [
+        column
+        for column in description.columns
+        if is_numeric_dtype(df[column].dtype)
+        and not is_bool_dtype(df[column].dtype)
+    ]
+    statistics = description[numeric_columns].reindex(list(STATISTICS))
+    bool_columns = df.select_dtypes(include="bool").columns
+    if len(bool_columns) > 0:
+        bool_statistics = (
+            df[bool_columns].astype("uint8").agg(list(STATISTICS))
+        )
+        statistics = pd.concat([statistics, bool_statistics], axis=1)
+    return description, statistics
+
+
+def _get_parquet_write_options() -> Tuple[str, int]:
+    """Gets the options for writing parquet files.
+
+    Returns:
+        The compression codec and the maximum number of rows per row group.
+    """
+    compression = os.getenv(
+        ENV_ZENML_PANDAS_PARQUET_COMPRESSION, DEFAULT_COMPRESSION_TYPE
+    )
+    row_group_size = handle_int_env_var(
+        ENV_ZENML_PANDAS_PARQUET_ROW_GROUP_SIZE,
+        default=DEFAULT_ROW_GROUP_SIZE,
+    )
+    return compression, row_group_size
+
+
+def _to_frame(df: Union[pd.DataFrame, pd.Series]) -> pd.DataFrame:
+    """Converts a series to the dataframe in which it is stored.
+
+    Args:
+        df: The pandas dataframe or series.
+
+    Returns:
+        The dataframe.
+    """
+    if isinstance(df, pd.Series):
+        return df.to_frame(name="series")
+    return df
+
+
+def _to_data_type(
+    df: pd.DataFrame, data_type: Type[Any]
+) -> Union[pd.DataFrame, pd.Series]:
+    """Converts a stored dataframe to the requested data type.
+
+    Args:
+        df: The stored dataframe.
+        data_type: The requested data type.
+
+    Returns:
+        The dataframe, or its only column if a series was requested.
+    """
+    if issubclass(data_type, pd.Series):
+        # Taking the first column if its a series as the assumption
+        # is that there will only be one
+        assert len(df.columns) == 1
+        return df[df.columns[0]]
+    return df
+
+
+def _to_pandas(
+    df: Union[pd.DataFrame, pd.Series, LazyDataFrame]
+) -> Union[pd.DataFrame, pd.Series]:
+    """Reads the data of a lazy dataframe handle.
+
+    Args:
+        df: A pandas dataframe or series, or a lazy dataframe handle.
+
+    Returns:
+        The pandas dataframe or series.
+    """
+    if isinstance(df, LazyDataFrame):
+        return df.read()
+    return df
@@ -14,6 +14,7 @@
 """Pydantic models for the various concepts in ZenML."""
 
 from zenml.models.artifact_models import (
+    ArtifactBatchRequestModel,
     ArtifactFilterModel,
     ArtifactRequestModel,
     ArtifactResponseModel,
@@ -68,6 +69,7 @@ from zenml.models.role_models import (
     RoleUpdateModel,
 )
 from zenml.models.run_metadata_models import (
+    RunMetadataBatchRequestModel,
     RunMetadataFilterModel,
     RunMetadataRequestModel,
     RunMetadataResponseModel,
@@ -105,6 +107,7 @@ from zenml.models.service_connector_models import (
 )
 from zenml.models.step_run_models import (
     StepRunFilterModel,
+    StepRunOutputArtifactsModel,
     StepRunRequestModel,
     StepRunResponseModel,
     StepRunUpdateModel,
@@ -249,6 +252,7 @@ ServiceConnectorResponseModel.update_forward_refs(
 )
 
 __all__ = [
+    "ArtifactBatchRequestModel",
     "ArtifactRequestModel",
     "ArtifactResponseModel",
     "ArtifactFilterModel",
@@ -298,6 +302,7 @@ __all__ = [
     "RoleResponseModel",
     "RoleUpdateModel",
     "RoleFilterModel",
+    "RunMetadataBatchRequestModel",
     "RunMetadataFilterModel",
     "RunMetadataRequestModel",
     "RunMetadataResponseModel",
@@ -328,6 +333,7 @@ __all__ = [
     "StepRunResponseModel",
     "StepRunUpdateModel",
     "StepRunFilterModel",
+    "StepRunOutputArtifactsModel",
     "TeamRequestModel",
     "TeamResponseModel",
     "TeamUpdateModel",
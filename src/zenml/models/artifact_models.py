@@ -57,6 +57,11 @@ class ArtifactBaseModel(BaseModel):
     visualizations: Optional[List[VisualizationModel]] = Field(
         default=None, title="Visualizations of the artifact."
     )
+    content_hash: Optional[str] = Field(
+        default=None,
+        title="Digest of the stored artifact content.",
+        max_length=STR_FIELD_MAX_LENGTH,
+    )
 
     _convert_source = convert_source_validator("materializer", "data_type")
 
@@ -132,3 +137,9 @@ class ArtifactFilterModel(WorkspaceScopedFilterModel):
 
 class ArtifactRequestModel(ArtifactBaseModel, WorkspaceScopedRequestModel):
     """Request model for artifacts."""
+
+
+class ArtifactBatchRequestModel(BaseModel):
+    """Request model to create multiple artifacts at once."""
+
+    artifacts: List[ArtifactRequestModel] = []
@@ -267,10 +267,12 @@ class BaseFilterModel(BaseModel):
         "page",
         "size",
         "logical_operator",
+        "cursor",
+        "count",
     ]
 
     # List of fields that are not even mentioned as options in the CLI.
-    CLI_EXCLUDE_FIELDS: ClassVar[List[str]] = []
+    CLI_EXCLUDE_FIELDS: ClassVar[List[str]] = ["cursor", "count"]
 
     sort_by: str = Field(
         default="created", description="Which column to sort by."
@@ -289,6 +291,16 @@ class BaseFilterModel(BaseModel):
         le=PAGE_SIZE_MAXIMUM,
         description="Page size",
     )
+    cursor: Optional[str] = Field(
+        default=None,
+        description="The `next_cursor` of a previous page. If set, the page "
+        "starts right after the last item of that previous page instead of "
+        "at the offset defined by the page number.",
+    )
+    count: bool = Field(
+        default=True,
+        description="Whether to count the total number of items and pages.",
+    )
 
     id: Optional[Union[UUID, str]] = Field(
         default=None, description="Id for this resource"
@@ -40,7 +40,7 @@ fastapi-pagination library: https://github.com/uriyyo/fastapi-pagination
 """
 from __future__ import annotations
 
-from typing import Generic, Sequence, TypeVar
+from typing import Generic, Optional, Sequence, TypeVar
 
 from pydantic import SecretStr
 from pydantic.generics import GenericModel
@@ -53,13 +53,20 @@ B = TypeVar("B", bound=BaseResponseModel)
 
 
 class Page(GenericModel, Generic[B]):
-    """Return Model for List Models to accommodate pagination."""
+    """Return Model for List Models to accommodate pagination.
+
+    The `total` and `total_pages` are `None` if the page was requested without
+    counting the items. The `next_cursor` is set if there are more items after
+    this page and can be passed as `cursor` of a filter model to fetch the next
+    page without an offset.
+    """
 
     index: PositiveInt
     max_size: PositiveInt
-    total_pages: NonNegativeInt
-    total: NonNegativeInt
+    total_pages: Optional[NonNegativeInt]
+    total: Optional[NonNegativeInt]
     items: Sequence[B]
+    next_cursor: Optional[str] = None
 
     __params_type__ = BaseFilterModel
 
@@ -13,7 +13,7 @@
 #  permissions and limitations under the License.
 """Models representing run metadata."""
 
-from typing import Optional, Union
+from typing import List, Optional, Union
 from uuid import UUID
 
 from pydantic import BaseModel, Field
@@ -90,3 +90,9 @@ class RunMetadataRequestModel(
     RunMetadataBaseModel, WorkspaceScopedRequestModel
 ):
     """Request model for run metadata."""
+
+
+class RunMetadataBatchRequestModel(BaseModel):
+    """Request model to create multiple run metadata entries at once."""
+
+    run_metadata: List[RunMetadataRequestModel] = []
@@ -84,6 +84,13 @@ class StepRunResponseModel(StepRunBaseModel, WorkspaceScopedResponseModel):
     )
 
 
+class StepRunOutputArtifactsModel(BaseModel):
+    """Lightweight model of the output artifact IDs of a step run."""
+
+    step_run_id: UUID
+    output_artifact_ids: Dict[str, UUID] = {}
+
+
 # ------ #
 # FILTER #
 # ------ #
@@ -159,6 +159,7 @@ class Pipeline:
         enable_cache: Optional[bool] = None,
         enable_artifact_metadata: Optional[bool] = None,
         enable_artifact_visualization: Optional[bool] = None,
+        enable_content_addressed_caching: Optional[bool] = None,
         settings: Optional[Mapping[str, "SettingsOrDict"]] = None,
         extra: Optional[Dict[str, Any]] = None,
         on_failure: Optional["HookSpecification"] = None,
@@ -174,6 +175,9 @@ class Pipeline:
                 this pipeline.
             enable_artifact_visualization: If artifact visualization should be
                 enabled for this pipeline.
+            enable_content_addressed_caching: If content hashes should be
+                computed for the artifacts of this pipeline and used to
+                generate the cache keys of its steps.
             settings: settings for this pipeline.
             extra: Extra configurations for this pipeline.
             on_failure: Callback function in event of failure of the step. Can
@@ -195,6 +199,7 @@ class Pipeline:
             enable_cache=enable_cache,
             enable_artifact_metadata=enable_artifact_metadata,
             enable_artifact_visualization=enable_artifact_visualization,
+            enable_content_addressed_caching=enable_content_addressed_caching,
             settings=settings,
             extra=extra,
             on_failure=on_failure,
@@ -287,6 +292,7 @@ class Pipeline:
         enable_cache: Optional[bool] = None,
         enable_artifact_metadata: Optional[bool] = None,
         enable_artifact_visualization: Optional[bool] = None,
+        enable_content_addressed_caching: Optional[bool] = None,
         settings: Optional[Mapping[str, "SettingsOrDict"]] = None,
         extra: Optional[Dict[str, Any]] = None,
         on_failure: Optional["HookSpecification"] = None,
@@ -311,6 +317,9 @@ class Pipeline:
                 this pipeline.
             enable_artifact_visualization: If artifact visualization should be
                 enabled for this pipeline.
+            enable_content_addressed_caching: If content hashes should be
+                computed for the artifacts of this pipeline and used to
+                generate the cache keys of its steps.
             settings: settings for this pipeline.
             extra: Extra configurations for this pipeline.
             on_failure: Callback function in event of failure of the step. Can
@@ -345,6 +354,7 @@ class Pipeline:
                 "enable_cache": enable_cache,
                 "enable_artifact_metadata": enable_artifact_metadata,
                 "enable_artifact_visualization": enable_artifact_visualization,
+                "enable_content_addressed_caching": enable_content_addressed_caching,
                 "settings": settings,
                 "extra": extra,
                 "failure_hook_source": failure_hook_source,
@@ -475,6 +485,7 @@ class Pipeline:
         enable_cache: Optional[bool] = None,
         enable_artifact_metadata: Optional[bool] = None,
         enable_artifact_visualization: Optional[bool] = None,
+        enable_content_addressed_caching: Optional[bool] = None,
         schedule: Optional[Schedule] = None,
         build: Union[str, "UUID", "PipelineBuildBaseModel", None] = None,
         settings: Optional[Mapping[str, "SettingsOrDict"]] = None,
@@ -495,6 +506,9 @@ class Pipeline:
                 for this pipeline run.
             enable_artifact_visualization: If artifact visualization should be
                 enabled for this pipeline run.
+            enable_content_addressed_caching: If content hashes should be
+                computed for the artifacts of this pipeline run and used to
+                generate the cache keys of its steps.
             schedule: Optional schedule to use for the run.
             build: Optional build to use for the run.
             settings: Settings for this pipeline run.
@@ -532,6 +546,7 @@ class Pipeline:
                 enable_cache=enable_cache,
                 enable_artifact_metadata=enable_artifact_metadata,
                 enable_artifact_visualization=enable_artifact_visualization,
+                enable_content_addressed_caching=enable_content_addressed_caching,
                 steps=step_configurations,
                 settings=settings,
                 schedule=schedule,
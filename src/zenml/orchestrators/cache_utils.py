@@ -14,10 +14,11 @@
 """Utilities for caching."""
 
 import hashlib
-from typing import TYPE_CHECKING, Dict, Optional
+import json
+import threading
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
 from zenml.client import Client
-from zenml.enums import ExecutionStatus, SorterOps
 from zenml.logger import get_logger
 
 if TYPE_CHECKING:
@@ -25,16 +26,24 @@ if TYPE_CHECKING:
 
     from zenml.artifact_stores import BaseArtifactStore
     from zenml.config.step_configurations import Step
-    from zenml.models.step_run_models import StepRunResponseModel
+    from zenml.models.step_run_models import StepRunOutputArtifactsModel
 
 logger = get_logger(__name__)
 
+_memoized_lookups: Dict[str, Optional["StepRunOutputArtifactsModel"]] = {}
+_memoized_lookups_run_id: Optional["UUID"] = None
+_memoized_lookups_lock = threading.Lock()
+# Incremented whenever a memoized lookup is invalidated, so that lookups which
+# ran concurrently with the invalidation are not memoized
+_memoized_lookups_generation = 0
+
 
 def generate_cache_key(
     step: "Step",
     input_artifact_ids: Dict[str, "UUID"],
     artifact_store: "BaseArtifactStore",
     workspace_id: "UUID",
+    input_artifact_content_hashes: Optional[Dict[str, str]] = None,
 ) -> str:
     """Generates a cache key for a step run.
 
@@ -51,16 +60,31 @@ def generate_cache_key(
     - the source codes of the output materializers of the step.
     - additional custom caching parameters of the step.
 
+    If content hashes of the input artifacts are given, the cache key is
+    content-addressed instead: it is a SHA-256 hash of the same values, but
+    with input artifacts identified by their content hash whenever one is
+    available and parameters serialized deterministically. This way, steps
+    are cached across runs which produced byte-identical inputs.
+
     Args:
         step: The step to generate the cache key for.
         input_artifact_ids: The input artifact IDs for the step.
         artifact_store: The artifact store of the active stack.
         workspace_id: The ID of the active workspace.
+        input_artifact_content_hashes: Optional content hashes of the input
+            artifacts of the step. If given, a content-addressed cache key
+            will be generated.
 
     Returns:
         A cache key.
     """
-    hash_ = hashlib.md5()
+    content_addressed = input_artifact_content_hashes is not None
+    hash_ = hashlib.sha256() if content_addressed else hashlib.md5()
+
+    def _serialize(value: Any) -> str:
+        if content_addressed:
+            return json.dumps(value, sort_keys=True, default=str)
+        return str(value)
 
     # Workspace ID
     hash_.update(workspace_id.bytes)
@@ -78,12 +102,17 @@ def generate_cache_key(
     # Step parameters
     for key, value in sorted(step.config.parameters.items()):
         hash_.update(key.encode())
-        hash_.update(str(value).encode())
+        hash_.update(_serialize(value).encode())
 
     # Input artifacts
     for name, artifact_id in input_artifact_ids.items():
         hash_.update(name.encode())
-        hash_.update(artifact_id.bytes)
+        if input_artifact_content_hashes and (
+            name in input_artifact_content_hashes
+        ):
+            hash_.update(input_artifact_content_hashes[name].encode())
+        else:
+            hash_.update(artifact_id.bytes)
 
     # Output artifacts and materializers
     for name, output in step.config.outputs.items():
@@ -94,33 +123,108 @@ def generate_cache_key(
     # Custom caching parameters
     for key, value in sorted(step.config.caching_parameters.items()):
         hash_.update(key.encode())
-        hash_.update(str(value).encode())
+        hash_.update(_serialize(value).encode())
 
     return hash_.hexdigest()
 
 
-def get_cached_step_run(cache_key: str) -> Optional["StepRunResponseModel"]:
+def get_input_artifact_content_hashes(
+    input_artifact_ids: Dict[str, "UUID"]
+) -> Dict[str, str]:
+    """Get the content hashes of the input artifacts of a step.
+
+    The content hash of each artifact is combined with its data type and
+    materializer, as identical bytes might still be loaded differently.
+    Artifacts which were stored without a content hash are skipped. All
+    input artifacts are fetched in a single request.
+
+    Args:
+        input_artifact_ids: The input artifact IDs of the step.
+
+    Returns:
+        The content hashes of the input artifacts which have one.
+    """
+    artifacts = Client().zen_store.get_artifacts_batch(
+        list(input_artifact_ids.values())
+    )
+    content_hashes = {}
+    for name, artifact_id in input_artifact_ids.items():
+        artifact = artifacts.get(artifact_id)
+        if not artifact or not artifact.content_hash:
+            continue
+
+        hash_ = hashlib.sha256()
+        hash_.update(artifact.content_hash.encode())
+        hash_.update(artifact.data_type.import_path.encode())
+        hash_.update(artifact.materializer.import_path.encode())
+        content_hashes[name] = hash_.hexdigest()
+
+    return content_hashes
+
+
+def get_cached_step_run(
+    cache_key: str, pipeline_run_id: Optional["UUID"] = None
+) -> Optional["StepRunOutputArtifactsModel"]:
     """If a given step can be cached, get the corresponding existing step run.
 
     A step run can be cached if there is an existing step run in the same
     workspace which has the same cache key and was successfully executed.
 
+    If a pipeline run ID is given, the lookup is memoized for that run. This
+    way, steps of the same run with identical cache keys only query the store
+    once. Lookups which didn't find any cached step run are memoized as well
+    and invalidated once a step with the same cache key is published by this
+    process, see `invalidate_cached_step_run_lookup`.
+
     Args:
         cache_key: The cache key of the step.
+        pipeline_run_id: The ID of the pipeline run for which to memoize the
+            lookup.
 
     Returns:
-        The existing step run if the step can be cached, otherwise None.
+        The ID and output artifact IDs of the existing step run if the step
+        can be cached, otherwise None.
     """
+    global _memoized_lookups_run_id
+
+    generation = 0
+    if pipeline_run_id:
+        with _memoized_lookups_lock:
+            if _memoized_lookups_run_id != pipeline_run_id:
+                # Only keep the lookups of the latest pipeline run
+                _memoized_lookups.clear()
+                _memoized_lookups_run_id = pipeline_run_id
+            elif cache_key in _memoized_lookups:
+                return _memoized_lookups[cache_key]
+            generation = _memoized_lookups_generation
+
     client = Client()
+    cached_step_run = client.zen_store.get_cached_run_step_outputs(
+        workspace_id=client.active_workspace.id, cache_key=cache_key
+    )
+
+    if pipeline_run_id:
+        with _memoized_lookups_lock:
+            if (
+                _memoized_lookups_run_id == pipeline_run_id
+                and _memoized_lookups_generation == generation
+            ):
+                _memoized_lookups[cache_key] = cached_step_run
+
+    return cached_step_run
+
+
+def invalidate_cached_step_run_lookup(cache_key: str) -> None:
+    """Invalidates the memoized lookup of a cache key.
+
+    This needs to be called whenever a step run with the cache key succeeds,
+    so that later steps with the same cache key can use its outputs.
+
+    Args:
+        cache_key: The cache key of the step run.
+    """
+    global _memoized_lookups_generation
 
-    cache_candidates = client.list_run_steps(
-        workspace_id=client.active_workspace.id,
-        cache_key=cache_key,
-        status=ExecutionStatus.COMPLETED,
-        sort_by=f"{SorterOps.DESCENDING}:created",
-        size=1,
-    ).items
-
-    if cache_candidates:
-        return cache_candidates[0]
-    return None
+    with _memoized_lookups_lock:
+        _memoized_lookups.pop(cache_key, None)
+        _memoized_lookups_generation += 1
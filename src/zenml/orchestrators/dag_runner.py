@@ -13,10 +13,17 @@
 #  permissions and limitations under the License.
 """DAG (Directed Acyclic Graph) Runners."""
 
-import threading
+import heapq
+import itertools
 from collections import defaultdict
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
 from enum import Enum
-from typing import Any, Callable, Dict, List
+from typing import Any, Callable, Dict, List, Optional
 
 from zenml.logger import get_logger
 
@@ -47,12 +54,55 @@ def reverse_dag(dag: Dict[str, List[str]]) -> Dict[str, List[str]]:
     return reversed_dag
 
 
+def get_critical_path_lengths(dag: Dict[str, List[str]]) -> Dict[str, int]:
+    """Computes the length of the longest path starting at each node of a DAG.
+
+    Args:
+        dag: Adjacency list representation of a DAG.
+
+    Returns:
+        Mapping of each node to the number of nodes on the longest path that
+        starts at this node. Nodes that are part of a cycle are not included.
+    """
+    reversed_dag = reverse_dag(dag)
+    num_pending_downstream_nodes = {
+        node: len(downstream_nodes)
+        for node, downstream_nodes in reversed_dag.items()
+    }
+    critical_path_lengths: Dict[str, int] = {}
+
+    # Traverse the DAG from the leaf nodes towards the root nodes so the
+    # lengths of all downstream nodes are known once we reach a node.
+    nodes_to_process = [
+        node
+        for node, count in num_pending_downstream_nodes.items()
+        if not count
+    ]
+    while nodes_to_process:
+        node = nodes_to_process.pop()
+        critical_path_lengths[node] = 1 + max(
+            (
+                critical_path_lengths[downstream_node]
+                for downstream_node in reversed_dag[node]
+            ),
+            default=0,
+        )
+        for upstream_node in dag.get(node, []):
+            num_pending_downstream_nodes[upstream_node] -= 1
+            if not num_pending_downstream_nodes[upstream_node]:
+                nodes_to_process.append(upstream_node)
+
+    return critical_path_lengths
+
+
 class NodeStatus(Enum):
     """Status of the execution of a node."""
 
     WAITING = "Waiting"
     RUNNING = "Running"
     COMPLETED = "Completed"
+    FAILED = "Failed"
+    SKIPPED = "Skipped"
 
 
 class ThreadedDagRunner:
@@ -62,11 +112,19 @@ class ThreadedDagRunner:
     well as a custom `run_fn` as input, then calls `run_fn(node)` for each
     string node in the DAG.
 
-    Steps that can be executed in parallel will be started in separate threads.
+    Nodes that can be executed in parallel are run in a bounded thread pool.
+    If multiple nodes are ready to run, the ones with the longest chain of
+    downstream nodes are started first. If a node fails, all its downstream
+    nodes are skipped. If the runner is configured to fail fast, no new nodes
+    are started after the first failure and all remaining nodes are skipped.
     """
 
     def __init__(
-        self, dag: Dict[str, List[str]], run_fn: Callable[[str], Any]
+        self,
+        dag: Dict[str, List[str]],
+        run_fn: Callable[[str], Any],
+        max_parallelism: Optional[int] = None,
+        fail_fast: bool = False,
     ) -> None:
         """Define attributes and initialize all nodes in waiting state.
 
@@ -75,13 +133,21 @@ class ThreadedDagRunner:
                 E.g.: [(1->2), (1->3), (2->4), (3->4)] should be represented as
                 `dag={2: [1], 3: [1], 4: [2, 3]}`
             run_fn: A function `run_fn(node)` that runs a single node
+            max_parallelism: Maximum number of nodes that are run at the same
+                time. If not set, all nodes that are ready will run at once.
+            fail_fast: If `True`, no new nodes will be started once a node
+                failed. Otherwise, all nodes that don't depend on the failed
+                node will still be run.
         """
         self.dag = dag
         self.reversed_dag = reverse_dag(dag)
         self.run_fn = run_fn
         self.nodes = dag.keys()
         self.node_states = {node: NodeStatus.WAITING for node in self.nodes}
-        self._lock = threading.Lock()
+        self.max_parallelism = max_parallelism or max(len(self.nodes), 1)
+        self.fail_fast = fail_fast
+        self._critical_path_lengths = get_critical_path_lengths(dag)
+        self._node_counter = itertools.count()
 
     def _can_run(self, node: str) -> bool:
         """Determine whether a node is ready to be run.
@@ -106,82 +172,89 @@ class ThreadedDagRunner:
 
         return True
 
-    def _run_node(self, node: str) -> None:
-        """Run a single node.
-
-        Calls the user-defined run_fn, then calls `self._finish_node`.
+    def _push_ready_node(self, ready_nodes: List[Any], node: str) -> None:
+        """Adds a node to the priority queue of nodes that are ready to run.
 
         Args:
-            node: The node.
+            ready_nodes: The priority queue of ready nodes.
+            node: The node to add.
         """
-        self.run_fn(node)
-        self._finish_node(node)
-
-    def _run_node_in_thread(self, node: str) -> threading.Thread:
-        """Run a single node in a separate thread.
+        priority = self._critical_path_lengths.get(node, 0)
+        # The node counter keeps the order stable for nodes with the same
+        # priority and avoids comparing the nodes themselves.
+        heapq.heappush(
+            ready_nodes, (-priority, next(self._node_counter), node)
+        )
 
-        First updates the node status to running.
-        Then calls self._run_node() in a new thread and returns the thread.
+    def _skip_downstream_nodes(self, node: str) -> None:
+        """Marks all (transitive) downstream nodes of a node as skipped.
 
         Args:
             node: The node.
-
-        Returns:
-            The thread in which the node was run.
         """
-        # Update node status to running.
-        assert self.node_states[node] == NodeStatus.WAITING
-        with self._lock:
-            self.node_states[node] = NodeStatus.RUNNING
-
-        # Run node in new thread.
-        thread = threading.Thread(target=self._run_node, args=(node,))
-        thread.start()
-        return thread
-
-    def _finish_node(self, node: str) -> None:
-        """Finish a node run.
-
-        First updates the node status to completed.
-        Then starts all other nodes that can now be run and waits for them.
-
-        Args:
-            node: The node.
-        """
-        # Update node status to completed.
-        assert self.node_states[node] == NodeStatus.RUNNING
-        with self._lock:
-            self.node_states[node] = NodeStatus.COMPLETED
-
-        # Run downstream nodes.
-        threads = []
-        for downstram_node in self.reversed_dag[node]:
-            if self._can_run(downstram_node):
-                thread = self._run_node_in_thread(downstram_node)
-                threads.append(thread)
-
-        # Wait for all downstream nodes to complete.
-        for thread in threads:
-            thread.join()
+        nodes_to_skip = list(self.reversed_dag[node])
+        while nodes_to_skip:
+            downstream_node = nodes_to_skip.pop()
+            if self.node_states[downstream_node] == NodeStatus.WAITING:
+                self.node_states[downstream_node] = NodeStatus.SKIPPED
+                logger.warning(
+                    f"Skipping node `{downstream_node}` because its upstream "
+                    f"node `{node}` failed."
+                )
+                nodes_to_skip.extend(self.reversed_dag[downstream_node])
 
     def run(self) -> None:
         """Call `self.run_fn` on all nodes in `self.dag`.
 
         The order of execution is determined using topological sort.
-        Each node is run in a separate thread to enable parallelism.
+        Independent nodes are run in a thread pool to enable parallelism.
         """
-        # Run all nodes that can be started immediately.
-        # These will, in turn, start other nodes once all of their respective
-        # upstream nodes have completed.
-        threads = []
+        ready_nodes: List[Any] = []
         for node in self.nodes:
             if self._can_run(node):
-                thread = self._run_node_in_thread(node)
-                threads.append(thread)
-
-        # Wait till all nodes have completed.
-        for thread in threads:
-            thread.join()
+                self._push_ready_node(ready_nodes, node)
+
+        stopped = False
+        running: Dict["Future[Any]", str] = {}
+        with ThreadPoolExecutor(max_workers=self.max_parallelism) as executor:
+            while True:
+                while (
+                    ready_nodes
+                    and not stopped
+                    and len(running) < self.max_parallelism
+                ):
+                    _, _, node = heapq.heappop(ready_nodes)
+                    if not self._can_run(node):
+                        continue
+                    self.node_states[node] = NodeStatus.RUNNING
+                    running[executor.submit(self.run_fn, node)] = node
+
+                if not running:
+                    break
+
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    node = running.pop(future)
+                    exception = future.exception()
+                    if exception:
+                        self.node_states[node] = NodeStatus.FAILED
+                        logger.error(f"Node `{node}` failed: {exception}")
+                        self._skip_downstream_nodes(node)
+                        stopped = stopped or self.fail_fast
+                        continue
+
+                    self.node_states[node] = NodeStatus.COMPLETED
+                    for downstream_node in self.reversed_dag[node]:
+                        if self._can_run(downstream_node):
+                            self._push_ready_node(ready_nodes, downstream_node)
+
+        if stopped:
+            for node in self.nodes:
+                if self.node_states[node] == NodeStatus.WAITING:
+                    self.node_states[node] = NodeStatus.SKIPPED
+                    logger.warning(
+                        f"Skipping node `{node}` because another node failed."
+                    )
 
         # Make sure all nodes were run, otherwise print a warning.
         for node in self.nodes:
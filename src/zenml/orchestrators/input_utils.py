@@ -13,21 +13,17 @@
 #  permissions and limitations under the License.
 """Utilities for inputs."""
 
-from typing import TYPE_CHECKING, Dict, List, Tuple
+from typing import Dict, List, Tuple
 from uuid import UUID
 
 from zenml.client import Client
 from zenml.config.step_configurations import Step
 from zenml.exceptions import InputResolutionError
-from zenml.models import StepRunFilterModel
-
-if TYPE_CHECKING:
-    from zenml.models.artifact_models import ArtifactResponseModel
 
 
 def resolve_step_inputs(
     step: "Step", run_id: UUID
-) -> Tuple[Dict[str, "ArtifactResponseModel"], List[UUID]]:
+) -> Tuple[Dict[str, UUID], List[UUID]]:
     """Resolves inputs for the current step.
 
     Args:
@@ -42,38 +38,43 @@ def resolve_step_inputs(
         The IDs of the input artifacts and the IDs of parent steps of the
         current step.
     """
-    current_run_steps = {
-        run_step.name: run_step
-        for run_step in Client()
-        .zen_store.list_run_steps(StepRunFilterModel(pipeline_run_id=run_id))
-        .items
-    }
+    step_names = {input_.step_name for input_ in step.spec.inputs.values()}
+    step_names.update(step.spec.upstream_steps)
+
+    step_outputs = Client().zen_store.get_run_step_output_artifact_ids(
+        run_id=run_id, step_names=sorted(step_names)
+    )
 
-    input_artifacts: Dict[str, "ArtifactResponseModel"] = {}
+    input_artifact_ids: Dict[str, UUID] = {}
     for name, input_ in step.spec.inputs.items():
         try:
-            step_run = current_run_steps[input_.step_name]
+            outputs = step_outputs[input_.step_name]
         except KeyError:
             raise InputResolutionError(
                 f"No step `{input_.step_name}` found in current run."
             )
 
         try:
-            artifact = step_run.output_artifacts[input_.output_name]
+            artifact_id = outputs.output_artifact_ids[input_.output_name]
         except KeyError:
             raise InputResolutionError(
                 f"No output `{input_.output_name}` found for step "
                 f"`{input_.step_name}`."
             )
 
-        input_artifacts[name] = artifact
+        input_artifact_ids[name] = artifact_id
 
     for name, artifact_id in step.config.external_input_artifacts.items():
-        input_artifacts[name] = Client().get_artifact(artifact_id=artifact_id)
+        input_artifact_ids[name] = artifact_id
 
-    parent_step_ids = [
-        current_run_steps[upstream_step].id
-        for upstream_step in step.spec.upstream_steps
-    ]
+    try:
+        parent_step_ids = [
+            step_outputs[upstream_step].step_run_id
+            for upstream_step in step.spec.upstream_steps
+        ]
+    except KeyError as e:
+        raise InputResolutionError(
+            f"No step `{e.args[0]}` found in current run."
+        )
 
-    return input_artifacts, parent_step_ids
+    return input_artifact_ids, parent_step_ids
@@ -13,11 +13,27 @@
 #  permissions and limitations under the License.
 """Implementation of the ZenML local orchestrator."""
 
+import multiprocessing
+import os
 import time
-from typing import TYPE_CHECKING, Any, Dict, Optional, Type
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Type,
+    cast,
+)
 from uuid import uuid4
 
+from pydantic import PositiveInt
+
 from zenml.client import Client
+from zenml.config.base_settings import BaseSettings
+from zenml.enums import LocalExecutionMode
 from zenml.logger import get_logger
 from zenml.orchestrators import BaseOrchestrator
 from zenml.orchestrators import utils as orchestrator_utils
@@ -25,10 +41,13 @@ from zenml.orchestrators.base_orchestrator import (
     BaseOrchestratorConfig,
     BaseOrchestratorFlavor,
 )
+from zenml.orchestrators.dag_runner import ThreadedDagRunner
+from zenml.orchestrators.step_launcher import StepLauncher
 from zenml.stack import Stack
-from zenml.utils import string_utils
+from zenml.utils import source_utils, string_utils
 
 if TYPE_CHECKING:
+    from zenml.config.step_configurations import Step
     from zenml.models.pipeline_deployment_models import (
         PipelineDeploymentResponseModel,
     )
@@ -36,22 +55,67 @@ if TYPE_CHECKING:
 logger = get_logger(__name__)
 
 
+def _launch_step_in_subprocess(
+    deployment: "PipelineDeploymentResponseModel",
+    step: "Step",
+    orchestrator_run_id: str,
+    source_root: str,
+) -> None:
+    """Launches a step inside a worker process of the local orchestrator.
+
+    Args:
+        deployment: The pipeline deployment.
+        step: The step to launch.
+        orchestrator_run_id: The orchestrator run id.
+        source_root: The source root of the orchestrating process, required to
+            load the step source.
+    """
+    source_utils.set_custom_source_root(source_root)
+    StepLauncher(
+        deployment=deployment,
+        step=step,
+        orchestrator_run_id=orchestrator_run_id,
+    ).launch()
+
+
 class LocalOrchestrator(BaseOrchestrator):
     """Orchestrator responsible for running pipelines locally.
 
-    This orchestrator does not allow for concurrent execution of steps and also
-    does not support running on a schedule.
+    By default, this orchestrator runs all steps sequentially. Independent
+    steps can be run concurrently in a thread or process pool by configuring
+    the `execution_mode` setting. Running on a schedule is not supported.
     """
 
     _orchestrator_run_id: Optional[str] = None
 
+    @property
+    def config(self) -> "LocalOrchestratorConfig":
+        """Returns the `LocalOrchestratorConfig` config.
+
+        Returns:
+            The configuration.
+        """
+        return cast(LocalOrchestratorConfig, self._config)
+
+    @property
+    def settings_class(self) -> Optional[Type["BaseSettings"]]:
+        """Settings class for the local orchestrator.
+
+        Returns:
+            The settings class.
+        """
+        return LocalOrchestratorSettings
+
     def prepare_or_run_pipeline(
         self,
         deployment: "PipelineDeploymentResponseModel",
         stack: "Stack",
         environment: Dict[str, str],
     ) -> Any:
-        """Iterates through all steps and executes them sequentially.
+        """Iterates through all steps and executes them.
+
+        Depending on the configured execution mode, the steps are either
+        executed sequentially or independent steps are executed concurrently.
 
         Args:
             deployment: The pipeline deployment to prepare or run.
@@ -69,7 +133,6 @@ class LocalOrchestrator(BaseOrchestrator):
         self._orchestrator_run_id = str(uuid4())
         start_time = time.time()
 
-        # Run each step
         for step_name, step in deployment.step_configurations.items():
             if self.requires_resources_in_orchestration_environment(step):
                 logger.warning(
@@ -79,8 +142,18 @@ class LocalOrchestrator(BaseOrchestrator):
                     step_name,
                 )
 
-            self.run_step(
-                step=step,
+        settings = cast(
+            LocalOrchestratorSettings, self.get_settings(deployment)
+        )
+        if settings.execution_mode == LocalExecutionMode.SEQUENTIAL:
+            # Run each step
+            for step in deployment.step_configurations.values():
+                self.run_step(
+                    step=step,
+                )
+        else:
+            self._run_steps_concurrently(
+                deployment=deployment, settings=settings
             )
 
         run_duration = time.time() - start_time
@@ -95,6 +168,79 @@ class LocalOrchestrator(BaseOrchestrator):
         )
         self._orchestrator_run_id = None
 
+    def _run_steps_concurrently(
+        self,
+        deployment: "PipelineDeploymentResponseModel",
+        settings: "LocalOrchestratorSettings",
+    ) -> None:
+        """Runs independent steps of the pipeline concurrently.
+
+        Once a step fails, no new steps will be started.
+
+        Args:
+            deployment: The pipeline deployment to run.
+            settings: The orchestrator settings.
+
+        Raises:
+            Exception: The exception of the first step that failed.
+        """
+        max_parallelism = settings.max_parallelism or os.cpu_count() or 1
+        logger.info(
+            "Running up to %d steps concurrently in %s mode.",
+            max_parallelism,
+            settings.execution_mode.value,
+        )
+
+        executor: Optional[Executor] = None
+        if settings.execution_mode == LocalExecutionMode.PROCESS:
+            process_pool = ProcessPoolExecutor(
+                max_workers=max_parallelism,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            executor = process_pool
+            source_root = source_utils.get_source_root()
+            orchestrator_run_id = self.get_orchestrator_run_id()
+
+            def _run_step(step: "Step") -> None:
+                process_pool.submit(
+                    _launch_step_in_subprocess,
+                    deployment=deployment,
+                    step=step,
+                    orchestrator_run_id=orchestrator_run_id,
+                    source_root=source_root,
+                ).result()
+
+            run_step: Callable[["Step"], None] = _run_step
+        else:
+            run_step = self.run_step
+
+        failures: List[BaseException] = []
+
+        def _run_node(step_name: str) -> None:
+            try:
+                run_step(deployment.step_configurations[step_name])
+            except BaseException as e:
+                failures.append(e)
+                raise
+
+        pipeline_dag = {
+            step_name: step.spec.upstream_steps
+            for step_name, step in deployment.step_configurations.items()
+        }
+        try:
+            ThreadedDagRunner(
+                dag=pipeline_dag,
+                run_fn=_run_node,
+                max_parallelism=max_parallelism,
+                fail_fast=True,
+            ).run()
+        finally:
+            if executor:
+                executor.shutdown()
+
+        if failures:
+            raise failures[0]
+
     def get_orchestrator_run_id(self) -> str:
         """Returns the active orchestrator run id.
 
@@ -111,7 +257,26 @@ class LocalOrchestrator(BaseOrchestrator):
         return self._orchestrator_run_id
 
 
-class LocalOrchestratorConfig(BaseOrchestratorConfig):
+class LocalOrchestratorSettings(BaseSettings):
+    """Local orchestrator settings.
+
+    Attributes:
+        execution_mode: How to execute the steps of a pipeline. In `thread`
+            and `process` mode, steps whose upstream steps have all finished
+            are run concurrently in a thread or process pool. When using the
+            `process` mode, the code that runs the pipeline must be guarded by
+            an `if __name__ == "__main__":` block.
+        max_parallelism: Maximum number of steps that are run at the same
+            time in `thread` or `process` mode. Defaults to the number of CPUs.
+    """
+
+    execution_mode: LocalExecutionMode = LocalExecutionMode.SEQUENTIAL
+    max_parallelism: Optional[PositiveInt] = None
+
+
+class LocalOrchestratorConfig(  # type: ignore[misc] # https://github.com/pydantic/pydantic/issues/4173
+    BaseOrchestratorConfig, LocalOrchestratorSettings
+):
     """Local orchestrator config."""
 
     @property
@@ -14,8 +14,7 @@
 """Utilities to publish pipeline and step runs."""
 
 from datetime import datetime
-from functools import partial
-from typing import TYPE_CHECKING, Dict, List
+from typing import TYPE_CHECKING, Dict
 
 from zenml.client import Client
 from zenml.enums import ExecutionStatus
@@ -27,7 +26,7 @@ from zenml.models.step_run_models import (
     StepRunResponseModel,
     StepRunUpdateModel,
 )
-from zenml.utils.pagination_utils import depaginate
+from zenml.orchestrators import cache_utils
 
 if TYPE_CHECKING:
     from uuid import UUID
@@ -59,18 +58,19 @@ def publish_output_artifact_metadata(
     output_artifact_ids: Dict[str, "UUID"],
     output_artifact_metadata: Dict[str, Dict[str, "MetadataType"]],
 ) -> None:
-    """Publishes the given output artifact metadata.
+    """Publishes the given output artifact metadata in a single request.
 
     Args:
         output_artifact_ids: The IDs of the output artifacts.
         output_artifact_metadata: A mapping from output names to metadata.
     """
-    client = Client()
-    for output_name, artifact_metadata in output_artifact_metadata.items():
-        artifact_id = output_artifact_ids[output_name]
-        client.create_run_metadata(
-            metadata=artifact_metadata, artifact_id=artifact_id
-        )
+    metadata = {
+        output_artifact_ids[output_name]: artifact_metadata
+        for output_name, artifact_metadata in output_artifact_metadata.items()
+        if artifact_metadata
+    }
+    if metadata:
+        Client().create_run_metadata_for_artifacts(metadata=metadata)
 
 
 def publish_successful_step_run(
@@ -85,7 +85,7 @@ def publish_successful_step_run(
     Returns:
         The updated step run.
     """
-    return Client().zen_store.update_run_step(
+    step_run = Client().zen_store.update_run_step(
         step_run_id=step_run_id,
         step_run_update=StepRunUpdateModel(
             status=ExecutionStatus.COMPLETED,
@@ -93,6 +93,10 @@ def publish_successful_step_run(
             output_artifacts=output_artifact_ids,
         ),
     )
+    if step_run.cache_key:
+        # Steps of the same run with this cache key can now use its outputs
+        cache_utils.invalidate_cached_step_run_lookup(step_run.cache_key)
+    return step_run
 
 
 def publish_failed_step_run(step_run_id: "UUID") -> "StepRunResponseModel":
@@ -133,56 +137,6 @@ def publish_failed_pipeline_run(
     )
 
 
-def get_pipeline_run_status(
-    step_statuses: List[ExecutionStatus], num_steps: int
-) -> ExecutionStatus:
-    """Gets the pipeline run status for the given step statuses.
-
-    Args:
-        step_statuses: The status of steps in this run.
-        num_steps: The total amount of steps in this run.
-
-    Returns:
-        The run status.
-    """
-    if ExecutionStatus.FAILED in step_statuses:
-        return ExecutionStatus.FAILED
-    if (
-        ExecutionStatus.RUNNING in step_statuses
-        or len(step_statuses) < num_steps
-    ):
-        return ExecutionStatus.RUNNING
-
-    return ExecutionStatus.COMPLETED
-
-
-def update_pipeline_run_status(pipeline_run: PipelineRunResponseModel) -> None:
-    """Updates the status of the current pipeline run.
-
-    Args:
-        pipeline_run: The model of the current pipeline run.
-    """
-    assert pipeline_run.num_steps is not None
-    client = Client()
-    steps_in_current_run = depaginate(
-        partial(client.list_run_steps, pipeline_run_id=pipeline_run.id)
-    )
-
-    new_status = get_pipeline_run_status(
-        step_statuses=[step_run.status for step_run in steps_in_current_run],
-        num_steps=pipeline_run.num_steps,
-    )
-
-    if new_status != pipeline_run.status:
-        run_update = PipelineRunUpdateModel(status=new_status)
-        if new_status in {ExecutionStatus.COMPLETED, ExecutionStatus.FAILED}:
-            run_update.end_time = datetime.utcnow()
-
-        Client().zen_store.update_run(
-            run_id=pipeline_run.id, run_update=run_update
-        )
-
-
 def publish_pipeline_run_metadata(
     pipeline_run_id: "UUID",
     pipeline_run_metadata: Dict["UUID", Dict[str, "MetadataType"]],
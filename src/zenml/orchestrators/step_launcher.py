@@ -181,8 +181,6 @@ class StepLauncher:
                     logger.error(f"Failed to run step `{self._step_name}`.")
                     publish_utils.publish_failed_step_run(step_run_response.id)
                     raise
-
-            publish_utils.update_pipeline_run_status(pipeline_run=pipeline_run)
         except:  # noqa: E722
             logger.error(f"Pipeline run `{pipeline_run.name}` failed.")
             publish_utils.publish_failed_pipeline_run(pipeline_run.id)
@@ -274,19 +272,26 @@ class StepLauncher:
             Tuple that specifies whether the step needs to be executed as
             well as the response model of the registered step run.
         """
-        input_artifacts, parent_step_ids = input_utils.resolve_step_inputs(
+        input_artifact_ids, parent_step_ids = input_utils.resolve_step_inputs(
             step=self._step, run_id=step_run.pipeline_run_id
         )
-        input_artifact_ids = {
-            input_name: artifact.id
-            for input_name, artifact in input_artifacts.items()
-        }
+
+        input_artifact_content_hashes = None
+        if (
+            self._deployment.pipeline_configuration.enable_content_addressed_caching
+        ):
+            input_artifact_content_hashes = (
+                cache_utils.get_input_artifact_content_hashes(
+                    input_artifact_ids
+                )
+            )
 
         cache_key = cache_utils.generate_cache_key(
             step=self._step,
             input_artifact_ids=input_artifact_ids,
             artifact_store=self._stack.artifact_store,
             workspace_id=Client().active_workspace.id,
+            input_artifact_content_hashes=input_artifact_content_hashes,
         )
 
         step_run.input_artifacts = input_artifact_ids
@@ -301,17 +306,15 @@ class StepLauncher:
         execution_needed = True
         if cache_enabled:
             cached_step_run = cache_utils.get_cached_step_run(
-                cache_key=cache_key
+                cache_key=cache_key, pipeline_run_id=step_run.pipeline_run_id
             )
             if cached_step_run:
                 logger.info(f"Using cached version of `{self._step_name}`.")
                 execution_needed = False
-                cached_outputs = cached_step_run.output_artifacts
-                step_run.original_step_run_id = cached_step_run.id
-                step_run.output_artifacts = {
-                    output_name: artifact.id
-                    for output_name, artifact in cached_outputs.items()
-                }
+                step_run.original_step_run_id = cached_step_run.step_run_id
+                step_run.output_artifacts = dict(
+                    cached_step_run.output_artifact_ids
+                )
                 step_run.status = ExecutionStatus.CACHED
                 step_run.end_time = step_run.start_time
 
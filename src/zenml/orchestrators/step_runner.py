@@ -14,13 +14,19 @@
 
 """Class to run steps."""
 
+import collections.abc
+import contextvars
 import inspect
+import itertools
+from concurrent.futures import ThreadPoolExecutor
 from typing import (
     TYPE_CHECKING,
     Any,
     Dict,
+    Iterator,
     List,
     Optional,
+    Set,
     Tuple,
     Type,
 )
@@ -30,15 +36,18 @@ from pydantic.typing import get_origin, is_union
 from zenml.client import Client
 from zenml.config.step_configurations import StepConfiguration
 from zenml.config.step_run_info import StepRunInfo
+from zenml.constants import OUTPUT_ARTIFACT_THREADS
 from zenml.enums import StackComponentType
 from zenml.exceptions import StepInterfaceError
 from zenml.logger import get_logger
 from zenml.materializers.base_materializer import BaseMaterializer
 from zenml.materializers.unmaterialized_artifact import UnmaterializedArtifact
 from zenml.models.artifact_models import (
+    ArtifactRequestModel,
     ArtifactResponseModel,
 )
 from zenml.orchestrators.publish_utils import (
+    publish_output_artifact_metadata,
     publish_step_run_metadata,
     publish_successful_step_run,
 )
@@ -46,6 +55,7 @@ from zenml.orchestrators.utils import is_setting_enabled
 from zenml.steps.step_context import StepContext
 from zenml.steps.step_environment import StepEnvironment
 from zenml.steps.utils import (
+    OutputSignature,
     parse_return_type_annotations,
     resolve_type_annotation,
 )
@@ -56,6 +66,7 @@ if TYPE_CHECKING:
 
     from zenml.config.source import Source
     from zenml.config.step_configurations import Step
+    from zenml.metadata.metadata_types import MetadataType
     from zenml.stack import Stack
     from zenml.steps import BaseStep
 
@@ -104,6 +115,13 @@ class StepRunner:
         step_instance = self._load_step()
         output_materializers = self._load_output_materializers()
         spec = inspect.getfullargspec(inspect.unwrap(step_instance.entrypoint))
+        output_signatures = parse_return_type_annotations(
+            spec.annotations.get("return")
+        )
+        self._validate_chunked_output_materializers(
+            output_signatures=output_signatures,
+            output_materializers=output_materializers,
+        )
 
         # Parse the inputs for the entrypoint function.
         function_params = self._parse_inputs(
@@ -132,6 +150,36 @@ class StepRunner:
                 return_values = step_instance.call_entrypoint(
                     **function_params
                 )
+
+                # Store and publish the output artifacts of the step function.
+                # The outputs are stored before running any hooks, as the body
+                # of generator steps only runs while their outputs are stored.
+                output_data = self._validate_outputs(
+                    return_values, output_signatures
+                )
+                artifact_metadata_enabled = is_setting_enabled(
+                    is_enabled_on_step=step_run_info.config.enable_artifact_metadata,
+                    is_enabled_on_pipeline=step_run_info.pipeline.enable_artifact_metadata,
+                )
+                artifact_visualization_enabled = is_setting_enabled(
+                    is_enabled_on_step=step_run_info.config.enable_artifact_visualization,
+                    is_enabled_on_pipeline=step_run_info.pipeline.enable_artifact_visualization,
+                )
+                output_artifact_ids = self._store_output_artifacts(
+                    output_data=output_data,
+                    chunked_outputs={
+                        output_name
+                        for output_name, signature in output_signatures.items()
+                        if signature.is_chunked
+                    },
+                    output_artifact_uris=output_artifact_uris,
+                    output_materializers=output_materializers,
+                    artifact_metadata_enabled=artifact_metadata_enabled,
+                    artifact_visualization_enabled=artifact_visualization_enabled,
+                    content_hashing_enabled=bool(
+                        step_run_info.pipeline.enable_content_addressed_caching
+                    ),
+                )
             except BaseException as step_exception:  # noqa: E722
                 step_failed = True
                 failure_hook_source = self.configuration.failure_hook_source
@@ -155,41 +203,16 @@ class StepRunner:
                 self._stack.cleanup_step_run(
                     info=step_run_info, step_failed=step_failed
                 )
-                if not step_failed:
-                    success_hook_source = (
-                        self.configuration.success_hook_source
-                    )
-                    if success_hook_source:
-                        logger.info("Detected success hook. Running...")
-                        self.load_and_run_hook(
-                            success_hook_source,
-                            step_exception=None,
-                            output_artifact_uris=output_artifact_uris,
-                            output_materializers=output_materializers,
-                        )
-
-            # Store and publish the output artifacts of the step function.
-            output_annotations = parse_return_type_annotations(
-                spec.annotations.get("return")
-            )
-            output_data = self._validate_outputs(
-                return_values, output_annotations
-            )
-            artifact_metadata_enabled = is_setting_enabled(
-                is_enabled_on_step=step_run_info.config.enable_artifact_metadata,
-                is_enabled_on_pipeline=step_run_info.pipeline.enable_artifact_metadata,
-            )
-            artifact_visualization_enabled = is_setting_enabled(
-                is_enabled_on_step=step_run_info.config.enable_artifact_visualization,
-                is_enabled_on_pipeline=step_run_info.pipeline.enable_artifact_visualization,
-            )
-            output_artifact_ids = self._store_output_artifacts(
-                output_data=output_data,
-                output_artifact_uris=output_artifact_uris,
-                output_materializers=output_materializers,
-                artifact_metadata_enabled=artifact_metadata_enabled,
-                artifact_visualization_enabled=artifact_visualization_enabled,
-            )
+
+            success_hook_source = self.configuration.success_hook_source
+            if success_hook_source:
+                logger.info("Detected success hook. Running...")
+                self.load_and_run_hook(
+                    success_hook_source,
+                    step_exception=None,
+                    output_artifact_uris=output_artifact_uris,
+                    output_materializers=output_materializers,
+                )
 
         # Update the status and output artifacts of the step run.
         publish_successful_step_run(
@@ -354,6 +377,8 @@ class StepRunner:
     ) -> Any:
         """Loads an input artifact.
 
+        Inputs annotated as `Iterator` are loaded chunk by chunk.
+
         Args:
             artifact: The artifact to load.
             data_type: The data type of the artifact value.
@@ -365,7 +390,11 @@ class StepRunner:
         if data_type == UnmaterializedArtifact:
             return UnmaterializedArtifact.parse_obj(artifact)
 
-        if data_type is Any or is_union(get_origin(data_type)):
+        load_chunks = data_type in (
+            collections.abc.Iterator,
+            collections.abc.Generator,
+        )
+        if load_chunks or data_type is Any or is_union(get_origin(data_type)):
             # Entrypoint function does not define a specific type for the input,
             # we use the datatype of the stored artifact
             data_type = source_utils.load(artifact.data_type)
@@ -375,20 +404,69 @@ class StepRunner:
         ] = source_utils.load_and_validate_class(
             artifact.materializer, expected_class=BaseMaterializer
         )
-        materializer: BaseMaterializer = materializer_class(artifact.uri)
-        materializer.validate_type_compatibility(data_type)
-        return materializer.load(data_type=data_type)
+
+        def _load(uri: str) -> Any:
+            materializer: BaseMaterializer = materializer_class(uri)
+            materializer.validate_type_compatibility(data_type)
+            if load_chunks:
+                return materializer.load_chunks(data_type=data_type)
+            return materializer.load(data_type=data_type)
+
+        return artifact_utils.load_with_local_cache(
+            artifact=artifact,
+            artifact_store=self._stack.artifact_store,
+            load=_load,
+        )
+
+    def _validate_chunked_output_materializers(
+        self,
+        output_signatures: Dict[str, OutputSignature],
+        output_materializers: Dict[str, Tuple[Type[BaseMaterializer], ...]],
+    ) -> None:
+        """Validates that all chunked outputs can be saved chunk by chunk.
+
+        This is checked before running the step, as the step function of
+        generator steps only runs while its outputs are saved.
+
+        Args:
+            output_signatures: The output signatures of the step function.
+            output_materializers: The output materializers of the step.
+
+        Raises:
+            StepInterfaceError: If a materializer of a chunked output does not
+                support saving artifacts in chunks.
+        """
+        step_name = self._step.spec.pipeline_parameter_name
+        for output_name, signature in output_signatures.items():
+            if not signature.is_chunked:
+                continue
+            for materializer_class in output_materializers.get(
+                output_name, ()
+            ):
+                if (
+                    materializer_class.save_chunks
+                    is BaseMaterializer.save_chunks
+                ):
+                    raise StepInterfaceError(
+                        f"Output '{output_name}' of step '{step_name}' is "
+                        "annotated as an iterator of chunks but its "
+                        f"materializer {materializer_class.__name__} does "
+                        "not support saving artifacts in chunks."
+                    )
 
     def _validate_outputs(
         self,
         return_values: Any,
-        output_annotations: Dict[str, Any],
+        output_signatures: Dict[str, OutputSignature],
     ) -> Dict[str, Any]:
         """Validates the step function outputs.
 
+        Outputs annotated as iterators of chunks are validated chunk by chunk
+        while they are saved.
+
         Args:
             return_values: The return values of the step function.
-            output_annotations: The output annotations of the step function.
+            output_signatures: The output signatures of the step function.
 
         Returns:
             The validated output, mapping output names to return values.
@@ -400,7 +478,7 @@ class StepRunner:
         step_name = self._step.spec.pipeline_parameter_name
 
         # if there are no outputs, the return value must be `None`.
-        if len(output_annotations) == 0:
+        if len(output_signatures) == 0:
             if return_values is not None:
                 raise StepInterfaceError(
                     f"Wrong step function output type for step '{step_name}': "
@@ -412,7 +490,7 @@ class StepRunner:
         # if there is only one output annotation (either directly specified
         # or contained in an `Output` tuple) we treat the step function
         # return value as the return for that output.
-        if len(output_annotations) == 1:
+        if len(output_signatures) == 1:
             return_values = [return_values]
 
         # if the user defined multiple outputs, the return value must be a list
@@ -420,17 +498,17 @@ class StepRunner:
         if not isinstance(return_values, (list, tuple)):
             raise StepInterfaceError(
                 f"Wrong step function output type for step '{step_name}': "
-                f"Expected multiple outputs ({output_annotations}) but "
+                f"Expected multiple outputs ({output_signatures}) but "
                 f"the function did not return a list or tuple "
                 f"(actual return value: {return_values})."
             )
 
         # The amount of actual outputs must be the same as the amount of
         # expected outputs.
-        if len(output_annotations) != len(return_values):
+        if len(output_signatures) != len(return_values):
             raise StepInterfaceError(
                 f"Wrong amount of step function outputs for step "
-                f"'{step_name}: Expected {len(output_annotations)} outputs "
+                f"'{step_name}: Expected {len(output_signatures)} outputs "
                 f"but the function returned {len(return_values)} outputs"
                 f"(return values: {return_values})."
             )
@@ -440,21 +518,34 @@ class StepRunner:
         from zenml.steps.utils import get_args
 
         validated_outputs: Dict[str, Any] = {}
-        for return_value, (output_name, output_annotation) in zip(
-            return_values, output_annotations.items()
+        for return_value, (output_name, signature) in zip(
+            return_values, output_signatures.items()
         ):
-            if output_annotation is Any:
-                pass
-            else:
-                if is_union(get_origin(output_annotation)):
-                    output_annotation = get_args(output_annotation)
+            output_annotation = signature.annotation
+            if is_union(get_origin(output_annotation)):
+                output_annotation = get_args(output_annotation)
 
-                if not isinstance(return_value, output_annotation):
+            if signature.is_chunked:
+                if not isinstance(return_value, collections.abc.Iterator):
                     raise StepInterfaceError(
                         f"Wrong type for output '{output_name}' of step "
-                        f"'{step_name}' (expected type: {output_annotation}, "
+                        f"'{step_name}' (expected an iterator of chunks, "
                         f"actual type: {type(return_value)})."
                     )
+                return_value = _validate_chunks(
+                    chunks=return_value,
+                    chunk_type=output_annotation,
+                    output_name=output_name,
+                    step_name=step_name,
+                )
+            elif output_annotation is not Any and not isinstance(
+                return_value, output_annotation
+            ):
+                raise StepInterfaceError(
+                    f"Wrong type for output '{output_name}' of step "
+                    f"'{step_name}' (expected type: {output_annotation}, "
+                    f"actual type: {type(return_value)})."
+                )
             validated_outputs[output_name] = return_value
         return validated_outputs
 
@@ -465,9 +556,15 @@ class StepRunner:
         output_artifact_uris: Dict[str, str],
         artifact_metadata_enabled: bool,
         artifact_visualization_enabled: bool,
+        content_hashing_enabled: bool = False,
+        chunked_outputs: Optional[Set[str]] = None,
     ) -> Dict[str, "UUID"]:
         """Stores the output artifacts of the step.
 
+        The outputs are saved concurrently on up to `OUTPUT_ARTIFACT_THREADS`
+        threads (configurable via the `ZENML_OUTPUT_ARTIFACT_THREADS`
+        environment variable) and then published in a single request.
+
         Args:
             output_data: The output data of the step function, mapping output
                 names to return values.
@@ -477,6 +574,10 @@ class StepRunner:
                 enabled.
             artifact_visualization_enabled: Whether artifact visualization is
                 enabled.
+            content_hashing_enabled: Whether the content hashes of the
+                artifacts should be computed.
+            chunked_outputs: Names of the outputs that were returned as
+                iterators of chunks.
 
         Returns:
             The IDs of the published output artifacts.
@@ -487,10 +588,18 @@ class StepRunner:
         )
         assert artifact_stores  # Every stack has an artifact store.
         artifact_store_id = artifact_stores[0].id
-        output_artifacts: Dict[str, "UUID"] = {}
+        chunked_outputs = chunked_outputs or set()
 
-        for output_name, return_value in output_data.items():
+        def _save_output_artifact(
+            output_name: str,
+        ) -> Tuple[ArtifactRequestModel, Dict[str, "MetadataType"]]:
+            return_value = output_data[output_name]
             data_type = type(return_value)
+            chunked = output_name in chunked_outputs
+            if chunked:
+                data_type, return_value = _peek_chunk_type(
+                    chunks=return_value, output_name=output_name
+                )
             materializer_classes = output_materializers[output_name]
             materializer_class = materializer_utils.select_materializer(
                 data_type=data_type, materializer_classes=materializer_classes
@@ -498,16 +607,58 @@ class StepRunner:
             uri = output_artifact_uris[output_name]
             materializer = materializer_class(uri)
 
-            artifact_id = artifact_utils.upload_artifact(
+            return artifact_utils.save_artifact(
                 name=output_name,
                 data=return_value,
                 materializer=materializer,
                 artifact_store_id=artifact_store_id,
                 extract_metadata=artifact_metadata_enabled,
                 include_visualizations=artifact_visualization_enabled,
+                compute_content_hash=content_hashing_enabled,
+                data_type=data_type,
+                chunked=chunked,
             )
-            output_artifacts[output_name] = artifact_id
 
+        # Outputs are saved concurrently as this is mostly waiting for the
+        # artifact store, but published in a single request afterwards. Each
+        # output is saved in a copy of the current context so materializers
+        # still have access to the step environment.
+        output_names = list(output_data)
+        max_workers = min(OUTPUT_ARTIFACT_THREADS, len(output_names))
+        if max_workers > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [
+                    executor.submit(
+                        contextvars.copy_context().run,
+                        _save_output_artifact,
+                        output_name,
+                    )
+                    for output_name in output_names
+                ]
+                saved_artifacts = [future.result() for future in futures]
+        else:
+            saved_artifacts = [
+                _save_output_artifact(output_name)
+                for output_name in output_names
+            ]
+
+        artifacts = client.zen_store.create_artifacts_batch(
+            [artifact for artifact, _ in saved_artifacts]
+        )
+
+        output_artifacts = {
+            output_name: artifact.id
+            for output_name, artifact in zip(output_names, artifacts)
+        }
+        publish_output_artifact_metadata(
+            output_artifact_ids=output_artifacts,
+            output_artifact_metadata={
+                output_name: artifact_metadata
+                for output_name, (_, artifact_metadata) in zip(
+                    output_names, saved_artifacts
+                )
+            },
+        )
         return output_artifacts
 
     def load_and_run_hook(
@@ -542,3 +693,58 @@ class StepRunner:
             logger.error(
                 f"Failed to load hook source with exception: '{hook_source}': {e}"
             )
+
+
+def _peek_chunk_type(
+    chunks: Iterator[Any], output_name: str
+) -> Tuple[Type[Any], Iterator[Any]]:
+    """Gets the type of the chunks of an output returned as an iterator.
+
+    Args:
+        chunks: The iterator returned by the step function.
+        output_name: The name of the output.
+
+    Returns:
+        The type of the first chunk and an iterator over all chunks.
+
+    Raises:
+        StepInterfaceError: If the iterator does not yield any chunks.
+    """
+    try:
+        first_chunk = next(chunks)
+    except StopIteration:
+        raise StepInterfaceError(
+            f"Output '{output_name}' was returned as an iterator but did not "
+            "yield any chunks."
+        )
+    return type(first_chunk), itertools.chain([first_chunk], chunks)
+
+
+def _validate_chunks(
+    chunks: Iterator[Any],
+    chunk_type: Any,
+    output_name: str,
+    step_name: str,
+) -> Iterator[Any]:
+    """Validates the types of the chunks of an output while they are saved.
+
+    Args:
+        chunks: The iterator returned by the step function.
+        chunk_type: The annotated type of the chunks.
+        output_name: The name of the output.
+        step_name: The name of the step.
+
+    Yields:
+        The validated chunks.
+
+    Raises:
+        StepInterfaceError: If a chunk has the wrong type.
+    """
+    for chunk in chunks:
+        if chunk_type is not Any and not isinstance(chunk, chunk_type):
+            raise StepInterfaceError(
+                f"Wrong type for a chunk of output '{output_name}' of step "
+                f"'{step_name}' (expected type: {chunk_type}, actual type: "
+                f"{type(chunk)})."
+            )
+        yield chunk
@@ -46,6 +46,7 @@ PARAM_PIPELINE_NAME = "name"
 PARAM_ENABLE_CACHE = "enable_cache"
 PARAM_ENABLE_ARTIFACT_METADATA = "enable_artifact_metadata"
 PARAM_ENABLE_ARTIFACT_VISUALIZATION = "enable_artifact_visualization"
+PARAM_ENABLE_CONTENT_ADDRESSED_CACHING = "enable_content_addressed_caching"
 PARAM_SETTINGS = "settings"
 PARAM_EXTRA_OPTIONS = "extra"
 PARAM_ON_FAILURE = "on_failure"
@@ -126,6 +127,7 @@ class BasePipeline(Pipeline, ABC):
         enable_cache: Optional[bool] = None,
         enable_artifact_metadata: Optional[bool] = None,
         enable_artifact_visualization: Optional[bool] = None,
+        enable_content_addressed_caching: Optional[bool] = None,
         schedule: Optional[Schedule] = None,
         build: Union[str, "UUID", "PipelineBuildBaseModel", None] = None,
         settings: Optional[Mapping[str, "SettingsOrDict"]] = None,
@@ -146,6 +148,9 @@ class BasePipeline(Pipeline, ABC):
                 for this pipeline run.
             enable_artifact_visualization: If artifact visualization should be
                 enabled for this pipeline run.
+            enable_content_addressed_caching: If content hashes should be
+                computed for the artifacts of this pipeline run and used to
+                generate the cache keys of its steps.
             schedule: Optional schedule to use for the run.
             build: Optional build to use for the run.
             settings: Settings for this pipeline run.
@@ -175,6 +180,7 @@ class BasePipeline(Pipeline, ABC):
                 "enable_cache": enable_cache,
                 "enable_artifact_metadata": enable_artifact_metadata,
                 "enable_artifact_visualization": enable_artifact_visualization,
+                "enable_content_addressed_caching": enable_content_addressed_caching,
                 "settings": settings,
                 "extra": extra,
             }
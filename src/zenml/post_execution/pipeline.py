@@ -221,16 +221,13 @@ class PipelineVersionView(BaseView):
             The number of runs of this pipeline.
         """
         active_workspace_id = Client().active_workspace.id
-        return (
-            Client()
-            .zen_store.list_runs(
-                PipelineRunFilterModel(
-                    workspace_id=active_workspace_id,
-                    pipeline_id=self._model.id,
-                )
+        runs = Client().zen_store.list_runs(
+            PipelineRunFilterModel(
+                workspace_id=active_workspace_id,
+                pipeline_id=self._model.id,
             )
-            .total
         )
+        return runs.total or 0
 
     @property
     def runs(self) -> List["PipelineRunView"]:
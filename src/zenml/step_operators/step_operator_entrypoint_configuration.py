@@ -22,7 +22,7 @@ from zenml.entrypoints.step_entrypoint_configuration import (
     STEP_NAME_OPTION,
     StepEntrypointConfiguration,
 )
-from zenml.orchestrators import input_utils, output_utils
+from zenml.orchestrators import output_utils
 from zenml.orchestrators.step_runner import StepRunner
 
 if TYPE_CHECKING:
@@ -91,9 +91,9 @@ class StepOperatorEntrypointConfiguration(StepEntrypointConfiguration):
         )
 
         stack = Client().active_stack
-        input_artifacts, _ = input_utils.resolve_step_inputs(
-            step=step, run_id=pipeline_run.id
-        )
+        # The step launcher already resolved the inputs when registering the
+        # step run, so there is no need to look them up again.
+        input_artifacts = step_run.input_artifacts
         output_artifact_uris = output_utils.prepare_output_artifact_uris(
             step_run=step_run, stack=stack, step=step
         )
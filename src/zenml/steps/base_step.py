@@ -541,11 +541,11 @@ class BaseStep(metaclass=BaseStepMeta):
         )
 
         outputs = []
-        for key, annotation in self.entrypoint_definition.outputs.items():
+        for key, signature in self.entrypoint_definition.outputs.items():
             output = StepArtifact(
                 invocation_id=invocation_id,
                 output_name=key,
-                annotation=annotation,
+                annotation=signature.annotation,
                 pipeline=Pipeline.ACTIVE_PIPELINE,
             )
             outputs.append(output)
@@ -955,8 +955,9 @@ class BaseStep(metaclass=BaseStepMeta):
 
         for (
             output_name,
-            output_annotation,
+            output_signature,
         ) in self.entrypoint_definition.outputs.items():
+            output_annotation = output_signature.annotation
             output = self._configuration.outputs.get(
                 output_name, PartialArtifactConfiguration()
             )
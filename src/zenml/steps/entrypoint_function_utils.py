@@ -31,7 +31,10 @@ from zenml.exceptions import StepInterfaceError
 from zenml.logger import get_logger
 from zenml.materializers.base_materializer import BaseMaterializer
 from zenml.steps.external_artifact import ExternalArtifact
-from zenml.steps.utils import parse_return_type_annotations
+from zenml.steps.utils import (
+    OutputSignature,
+    parse_return_type_annotations,
+)
 from zenml.utils import yaml_utils
 
 if TYPE_CHECKING:
@@ -139,14 +142,14 @@ class EntrypointFunctionDefinition(NamedTuple):
     Attributes:
         inputs: The entrypoint function inputs.
         outputs: The entrypoint function outputs. This dictionary maps output
-            names to output annotations.
+            names to output signatures.
         context: Optional parameter representing the `StepContext` input.
         legacy_params: Optional parameter representing the `BaseParameters`
             input.
     """
 
     inputs: Dict[str, inspect.Parameter]
-    outputs: Dict[str, Any]
+    outputs: Dict[str, OutputSignature]
     context: Optional[inspect.Parameter]
     legacy_params: Optional[inspect.Parameter]
 
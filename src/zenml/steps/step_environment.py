@@ -46,6 +46,8 @@ class StepEnvironment(BaseEnvironmentComponent):
     """
 
     NAME = STEP_ENVIRONMENT_NAME
+    # Steps might run concurrently in multiple threads of the same process
+    THREAD_LOCAL = True
 
     def __init__(
         self,
@@ -14,7 +14,8 @@
 
 """Utility functions and classes to run ZenML steps."""
 
-from typing import Any, Dict, Tuple
+import collections.abc
+from typing import Any, Dict, NamedTuple, Tuple
 
 import pydantic.typing as pydantic_typing
 
@@ -26,6 +27,20 @@ logger = get_logger(__name__)
 SINGLE_RETURN_OUT_NAME = "output"
 
 
+class OutputSignature(NamedTuple):
+    """Signature of a step output.
+
+    Attributes:
+        annotation: The resolved type annotation of the output. For chunked
+            outputs, this is the type of the chunks.
+        is_chunked: Whether the output is annotated as an iterator of chunks,
+            e.g. `Iterator[pd.DataFrame]`.
+    """
+
+    annotation: Any
+    is_chunked: bool = False
+
+
 def resolve_type_annotation(obj: Any) -> Any:
     """Returns the non-generic class for generic aliases of the typing module.
 
@@ -66,7 +81,9 @@ def get_args(obj: Any) -> Tuple[Any, ...]:
     )
 
 
-def parse_return_type_annotations(return_annotation: Any) -> Dict[str, Any]:
+def parse_return_type_annotations(
+    return_annotation: Any,
+) -> Dict[str, OutputSignature]:
     """Parse the returns of a step function into a dict of resolved types.
 
     Called within `BaseStepMeta.__new__()` to define `cls.OUTPUT_SIGNATURE`.
@@ -88,7 +105,32 @@ def parse_return_type_annotations(return_annotation: Any) -> Dict[str, Any]:
 
     # Resolve type annotations of all outputs and save in new dict.
     output_signature = {
-        output_name: resolve_type_annotation(output_type)
+        output_name: _parse_output_annotation(output_type)
         for output_name, output_type in return_annotation.items()
     }
     return output_signature
+
+
+def _parse_output_annotation(obj: Any) -> OutputSignature:
+    """Parses the annotation of a single step output.
+
+    Steps can produce an output in chunks by returning an iterator, in which
+    case the output is annotated as e.g. `Iterator[pd.DataFrame]`. The type of
+    the artifact is the type of its chunks.
+
+    Args:
+        obj: The output annotation.
+
+    Returns:
+        The signature of the output.
+    """
+    origin = pydantic_typing.get_origin(obj)
+    args = pydantic_typing.get_args(obj)
+    if (
+        origin in (collections.abc.Iterator, collections.abc.Generator)
+        and args
+    ):
+        return OutputSignature(
+            annotation=resolve_type_annotation(args[0]), is_chunked=True
+        )
+    return OutputSignature(annotation=resolve_type_annotation(obj))
@@ -14,9 +14,21 @@
 """Util functions for artifact handling."""
 
 import base64
+import contextlib
 import os
 import tempfile
-from typing import TYPE_CHECKING, Any, List, Optional, Union, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
 
 from zenml.client import Client
 from zenml.constants import MODEL_METADATA_YAML_FILE_NAME
@@ -39,6 +51,7 @@ if TYPE_CHECKING:
     from zenml.artifact_stores.base_artifact_store import BaseArtifactStore
     from zenml.config.source import Source
     from zenml.materializers.base_materializer import BaseMaterializer
+    from zenml.metadata.metadata_types import MetadataType
     from zenml.zen_stores.base_zen_store import BaseZenStore
 
 
@@ -127,7 +140,7 @@ def load_artifact(artifact: "ArtifactResponseModel") -> Any:
                 component_type=StackComponentType.ARTIFACT_STORE,
                 name_id_or_prefix=artifact.artifact_store_id,
             )
-            _ = StackComponent.from_model(artifact_store_model)
+            artifact_store = StackComponent.from_model(artifact_store_model)
             artifact_store_loaded = True
         except KeyError:
             pass
@@ -140,11 +153,75 @@ def load_artifact(artifact: "ArtifactResponseModel") -> Any:
             artifact.id,
         )
 
-    return _load_artifact(
-        materializer=artifact.materializer,
-        data_type=artifact.data_type,
-        uri=artifact.uri,
+    def _load(uri: str) -> Any:
+        return _load_artifact(
+            materializer=artifact.materializer,
+            data_type=artifact.data_type,
+            uri=uri,
+        )
+
+    if not artifact_store_loaded:
+        return _load(artifact.uri)
+
+    return load_with_local_cache(
+        artifact=artifact,
+        artifact_store=cast("BaseArtifactStore", artifact_store),
+        load=_load,
+    )
+
+
+def load_with_local_cache(
+    artifact: "ArtifactResponseModel",
+    artifact_store: "BaseArtifactStore",
+    load: Callable[[str], Any],
+) -> Any:
+    """Load an artifact from the local cache of its artifact store.
+
+    If the artifact store has a local artifact cache, the artifact is loaded
+    from a local copy which gets downloaded on the first load. The cache
+    entries are keyed by the content hash of the artifact if it has one, so
+    artifacts with identical content share a single entry. The entry is
+    pinned until the loaded object is garbage collected, as materializers
+    might return objects which read from it lazily.
+
+    Args:
+        artifact: The artifact to load.
+        artifact_store: The artifact store in which the artifact is stored.
+        load: Function which loads the artifact from a URI.
+
+    Returns:
+        The loaded artifact.
+    """
+    local_cache = (
+        artifact_store.local_cache
+        if artifact.artifact_store_id == artifact_store.id
+        else None
     )
+    if not local_cache:
+        return load(artifact.uri)
+
+    key = artifact.content_hash or str(artifact.id)
+    try:
+        local_uri = local_cache.acquire(key=key, uri=artifact.uri)
+    except Exception as e:
+        logger.warning(
+            "Failed to cache artifact `%s` locally, loading it from the "
+            "artifact store instead: %s",
+            artifact.id,
+            e,
+        )
+        return load(artifact.uri)
+
+    if not local_uri:
+        return load(artifact.uri)
+
+    try:
+        data = load(local_uri)
+    except BaseException:
+        local_cache.release(key)
+        raise
+    local_cache.release_when_collected(key, data)
+    return data
 
 
 def _load_artifact(
@@ -340,15 +417,22 @@ def _load_file_from_artifact_store(
         )
 
 
-def upload_artifact(
+def save_artifact(
     name: str,
     data: Any,
     materializer: "BaseMaterializer",
     artifact_store_id: "UUID",
     extract_metadata: bool,
     include_visualizations: bool,
-) -> "UUID":
-    """Upload and publish an artifact.
+    compute_content_hash: bool = False,
+    data_type: Optional[Type[Any]] = None,
+    chunked: bool = False,
+) -> Tuple[ArtifactRequestModel, Dict[str, "MetadataType"]]:
+    """Save an artifact without publishing it.
+
+    If `chunked` is set, `data` is an iterator over chunks of the artifact
+    which is saved chunk by chunk. As the chunks are consumed while saving, no
+    visualizations or custom metadata are generated for such artifacts.
 
     Args:
         name: The name of the artifact.
@@ -358,13 +442,48 @@ def upload_artifact(
             be stored.
         extract_metadata: If artifact metadata should be extracted and returned.
         include_visualizations: If artifact visualizations should be generated.
+        compute_content_hash: If a digest of the stored artifact content should
+            be computed and stored with the artifact.
+        data_type: The type of the artifact data. Required if the data is
+            passed as an iterator over chunks, defaults to the type of `data`
+            otherwise.
+        chunked: Whether the data is an iterator over chunks of the artifact.
 
     Returns:
-        The ID of the published artifact.
+        The request model to publish the artifact and the extracted artifact
+        metadata.
     """
-    data_type = type(data)
+    if data_type is None:
+        data_type = type(data)
     materializer.validate_type_compatibility(data_type)
-    materializer.save(data)
+
+    if chunked:
+        include_visualizations = False
+        extract_metadata = False
+
+    # Files are hashed while they are written, so computing the content hash
+    # doesn't require reading them back from the artifact store
+    with (
+        materializer.record_file_digests()
+        if compute_content_hash
+        else contextlib.nullcontext()
+    ):
+        if chunked:
+            materializer.save_chunks(data)
+        else:
+            materializer.save(data)
+
+    # Compute the digest before any visualizations are written into the
+    # artifact directory.
+    content_hash = None
+    if compute_content_hash:
+        try:
+            content_hash = materializer.compute_content_hash()
+        except Exception as e:
+            logger.warning(
+                f"Failed to compute content hash for output artifact "
+                f"'{name}': {e}"
+            )
 
     visualizations: List[VisualizationModel] = []
     if include_visualizations:
@@ -382,7 +501,7 @@ def upload_artifact(
                 f"{e}"
             )
 
-    artifact_metadata = {}
+    artifact_metadata: Dict[str, "MetadataType"] = {}
     if extract_metadata:
         try:
             artifact_metadata = materializer.extract_full_metadata(data)
@@ -401,6 +520,44 @@ def upload_artifact(
         workspace=Client().active_workspace.id,
         artifact_store_id=artifact_store_id,
         visualizations=visualizations,
+        content_hash=content_hash,
+    )
+    return artifact, artifact_metadata
+
+
+def upload_artifact(
+    name: str,
+    data: Any,
+    materializer: "BaseMaterializer",
+    artifact_store_id: "UUID",
+    extract_metadata: bool,
+    include_visualizations: bool,
+    compute_content_hash: bool = False,
+) -> "UUID":
+    """Upload and publish an artifact.
+
+    Args:
+        name: The name of the artifact.
+        data: The artifact data.
+        materializer: The materializer to store the artifact.
+        artifact_store_id: ID of the artifact store in which the artifact should
+            be stored.
+        extract_metadata: If artifact metadata should be extracted and returned.
+        include_visualizations: If artifact visualizations should be generated.
+        compute_content_hash: If a digest of the stored artifact content should
+            be computed and stored with the artifact.
+
+    Returns:
+        The ID of the published artifact.
+    """
+    artifact, artifact_metadata = save_artifact(
+        name=name,
+        data=data,
+        materializer=materializer,
+        artifact_store_id=artifact_store_id,
+        extract_metadata=extract_metadata,
+        include_visualizations=include_visualizations,
+        compute_content_hash=compute_content_hash,
     )
     response = Client().zen_store.create_artifact(artifact=artifact)
     if artifact_metadata:
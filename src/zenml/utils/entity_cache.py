@@ -0,0 +1,193 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""In-memory caches for entities fetched from a ZenML store."""
+
+import math
+import threading
+import time
+from collections import OrderedDict
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+T = TypeVar("T")
+
+
+class EntityCache:
+    """Thread-safe in-memory cache with time-based expiry.
+
+    Entries expire after a fixed number of seconds so that changes made by
+    other processes are picked up eventually. Changes made through the
+    process itself should invalidate the cache explicitly.
+    """
+
+    def __init__(self, ttl: float) -> None:
+        """Initializes the cache.
+
+        Args:
+            ttl: Number of seconds after which entries expire. A value of
+                zero or less disables the cache.
+        """
+        self.ttl = ttl
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+        # Incremented on every invalidation so that entities which were
+        # loaded concurrently with an invalidation are not cached
+        self._generation = 0
+
+    def get(self, key: Hashable, load: Callable[[], T]) -> T:
+        """Gets a cached entity or loads it if it's not cached.
+
+        Args:
+            key: The key of the entity.
+            load: Function which loads the entity if it's not cached.
+
+        Returns:
+            The entity.
+        """
+        if self.ttl <= 0:
+            return load()
+
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] > now:
+                return entry[1]  # type: ignore[no-any-return]
+            generation = self._generation
+
+        value = load()
+        with self._lock:
+            if generation != self._generation:
+                return value
+            # Drop expired entries so the cache doesn't grow indefinitely
+            self._entries = {
+                cached_key: cached_entry
+                for cached_key, cached_entry in self._entries.items()
+                if cached_entry[0] > now
+            }
+            self._entries[key] = (now + self.ttl, value)
+        return value
+
+    def invalidate(self) -> None:
+        """Removes all entries from the cache."""
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+
+
+class LRUCache(Generic[T]):
+    """Thread-safe in-memory cache which evicts the least recently used entry.
+
+    Entries can optionally expire so that changes made by other processes are
+    picked up eventually. Changes made through the process itself should
+    remove the affected entries explicitly.
+
+    Like for the `EntityCache`, entries which were loaded concurrently with an
+    invalidation are not cached. Callers get the current `generation` before
+    loading an entry and pass it to `put`.
+    """
+
+    def __init__(self, max_size: int, ttl: Optional[float] = None) -> None:
+        """Initializes the cache.
+
+        Args:
+            max_size: Maximum number of cached entries. A value of zero or less
+                disables the cache.
+            ttl: Number of seconds after which entries expire. Entries never
+                expire if this is not set.
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, Tuple[float, T]]" = OrderedDict()
+        self._lock = threading.Lock()
+        # Incremented whenever entries are removed
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        """The number of invalidations of the cache.
+
+        Returns:
+            The current generation of the cache.
+        """
+        with self._lock:
+            return self._generation
+
+    def get(self, key: Hashable) -> Optional[T]:
+        """Gets a cached entry.
+
+        Args:
+            key: The key of the entry.
+
+        Returns:
+            The cached entry or `None` if no entry is cached for the key.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def put(
+        self, key: Hashable, value: T, generation: Optional[int] = None
+    ) -> None:
+        """Caches an entry.
+
+        Args:
+            key: The key of the entry.
+            value: The entry to cache.
+            generation: The generation of the cache before the entry was
+                loaded. If the cache was invalidated since, the entry is not
+                cached.
+        """
+        if self.max_size <= 0 or (self.ttl is not None and self.ttl <= 0):
+            return
+
+        expires_at = (
+            time.monotonic() + self.ttl if self.ttl is not None else math.inf
+        )
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        """Removes an entry from the cache.
+
+        Args:
+            key: The key of the entry.
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+            self._generation += 1
+
+    def clear(self) -> None:
+        """Removes all entries from the cache."""
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
@@ -13,14 +13,21 @@
 #  permissions and limitations under the License.
 """Various utility functions for the io module."""
 
+import contextvars
 import fnmatch
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import TYPE_CHECKING, Iterable
+from typing import TYPE_CHECKING, Iterable, Iterator, Tuple
 
 import click
 
-from zenml.constants import APP_NAME, ENV_ZENML_CONFIG_PATH, REMOTE_FS_PREFIX
+from zenml.constants import (
+    APP_NAME,
+    ENV_ZENML_CONFIG_PATH,
+    FILE_COPY_THREADS,
+    REMOTE_FS_PREFIX,
+)
 from zenml.io.fileio import (
     convert_to_str,
     copy,
@@ -101,11 +108,53 @@ def copy_dir(
 ) -> None:
     """Copies dir from source to destination.
 
+    The files are copied concurrently on up to `FILE_COPY_THREADS` threads
+    (configurable via the `ZENML_FILE_COPY_THREADS` environment variable), as
+    copying files from or to remote filesystems is mostly waiting for the
+    network.
+
     Args:
         source_dir: Path to copy from.
         destination_dir: Path to copy to.
         overwrite: Boolean. If false, function throws an error before overwrite.
     """
+    files = list(_find_files_to_copy(source_dir, destination_dir))
+    for directory in sorted({os.path.dirname(dst) for _, dst in files}):
+        create_dir_recursive_if_not_exists(directory)
+
+    def _copy_file(paths: Tuple[str, str]) -> None:
+        copy(paths[0], paths[1], overwrite)
+
+    # Each file is copied in a copy of the current context, so files written
+    # by the worker threads are still passed to the active write observer.
+    max_workers = min(FILE_COPY_THREADS, len(files))
+    if max_workers > 1:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(
+                    contextvars.copy_context().run, _copy_file, paths
+                )
+                for paths in files
+            ]
+            for future in futures:
+                future.result()
+    else:
+        for paths in files:
+            _copy_file(paths)
+
+
+def _find_files_to_copy(
+    source_dir: str, destination_dir: str
+) -> Iterator[Tuple[str, str]]:
+    """Finds all files of a directory and their paths in a copy of it.
+
+    Args:
+        source_dir: Path of the directory to copy.
+        destination_dir: Path of the copy.
+
+    Yields:
+        Tuples of source and destination paths of all files.
+    """
     for source_file in listdir(source_dir):
         source_path = os.path.join(source_dir, convert_to_str(source_file))
         destination_path = os.path.join(
@@ -116,12 +165,9 @@ def copy_dir(
                 # if the destination is a subdirectory of the source, we skip
                 # copying it to avoid an infinite loop.
                 continue
-            copy_dir(source_path, destination_path, overwrite)
+            yield from _find_files_to_copy(source_path, destination_path)
         else:
-            create_dir_recursive_if_not_exists(
-                os.path.dirname(destination_path)
-            )
-            copy(str(source_path), str(destination_path), overwrite)
+            yield str(source_path), str(destination_path)
 
 
 def find_files(dir_path: "PathType", pattern: str) -> Iterable[str]:
@@ -28,16 +28,27 @@ def depaginate(
 ) -> List[AnyResponseModel]:
     """Depaginate the results from a client or store method that returns pages.
 
+    The pages are fetched without counting the items and each page continues
+    after the `next_cursor` of the previous one. Pages of methods which don't
+    support cursors are fetched by their index instead.
+
     Args:
-        list_method: The list method to wrap around.
+        list_method: The list method to wrap around. It needs to accept the
+            `page`, `cursor` and `count` fields of the filter model as keyword
+            arguments.
 
     Returns:
         A list of the corresponding Response Models.
     """
-    page = list_method()
+    page = list_method(count=False)
     items = list(page.items)
-    while page.index < page.total_pages:
-        page = list_method(page=page.index + 1)
+    while True:
+        if page.next_cursor is not None:
+            page = list_method(cursor=page.next_cursor, count=False)
+        elif page.total_pages is not None and page.index < page.total_pages:
+            page = list_method(page=page.index + 1, count=False)
+        else:
+            break
         items += list(page.items)
 
     return items
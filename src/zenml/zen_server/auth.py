@@ -15,24 +15,31 @@
 
 import os
 from contextvars import ContextVar
-from typing import Callable, List, Optional, Set, Union
+from typing import Callable, Iterator, List, Optional, Set, Union
 from uuid import UUID
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import (
     HTTPBasic,
     HTTPBasicCredentials,
     OAuth2PasswordBearer,
     SecurityScopes,
 )
-from pydantic import BaseModel
-
-from zenml.constants import API, ENV_ZENML_AUTH_TYPE, LOGIN, VERSION_1
+from pydantic import BaseModel, PrivateAttr
+
+from zenml.constants import (
+    API,
+    ENV_ZENML_AUTH_TYPE,
+    LOGIN,
+    SERVER_AUTH_CACHE_TTL,
+    VERSION_1,
+)
 from zenml.enums import PermissionType
 from zenml.exceptions import AuthorizationException
 from zenml.logger import get_logger
 from zenml.models import UserResponseModel
 from zenml.models.user_models import JWTToken, JWTTokenType, UserAuthModel
+from zenml.utils.entity_cache import EntityCache
 from zenml.utils.enum_utils import StrEnum
 from zenml.zen_server.utils import ROOT_URL_PATH, zen_store
 from zenml.zen_stores.base_zen_store import DEFAULT_USERNAME
@@ -44,6 +51,13 @@ _auth_context: ContextVar[Optional["AuthContext"]] = ContextVar(
     "auth_context", default=None
 )
 
+# Caches the authentication contexts of access tokens. The cache is invalidated
+# whenever users, teams or roles change on this server. Changes made through
+# other replicas of the server are picked up once the entries expire.
+_auth_context_cache = EntityCache(ttl=SERVER_AUTH_CACHE_TTL)
+# HTTP methods of requests which don't modify any entities
+READ_ONLY_METHODS = ("GET", "HEAD", "OPTIONS")
+
 
 def get_auth_context() -> Optional["AuthContext"]:
     """Returns the current authentication context.
@@ -80,24 +94,52 @@ class AuthContext(BaseModel):
     """The authentication context."""
 
     user: UserResponseModel
+    _permissions: Optional[Set[PermissionType]] = PrivateAttr(default=None)
 
     @property
     def permissions(self) -> Set[PermissionType]:
         """Returns the permissions of the user.
 
+        The permissions are only computed once per authentication context.
+
         Returns:
             The permissions of the user.
         """
-        if self.user.roles:
+        if self._permissions is None:
             # Merge permissions from all roles
             permissions: List[PermissionType] = []
-            for role in self.user.roles:
+            for role in self.user.roles or []:
                 permissions.extend(role.permissions)
 
             # Remove duplicates
-            return set(permissions)
+            self._permissions = set(permissions)
+
+        return self._permissions
+
+
+def invalidate_auth_context_cache() -> None:
+    """Invalidates all cached authentication contexts."""
+    _auth_context_cache.invalidate()
+
 
-        return set()
+def invalidate_auth_context_cache_on_change(
+    request: Request,
+) -> Iterator[None]:
+    """Invalidates the cached authentication contexts after modifications.
+
+    This is used as dependency of all routers which modify users, teams or
+    roles. The cache is invalidated after the request was handled, so that no
+    outdated authentication contexts can be cached in the meantime.
+
+    Args:
+        request: The request.
+
+    Yields:
+        Nothing.
+    """
+    yield
+    if request.method not in READ_ONLY_METHODS:
+        invalidate_auth_context_cache()
 
 
 def authentication_scheme() -> AuthScheme:
@@ -226,7 +268,6 @@ def oauth2_password_bearer_authentication(
         authenticate_value = f'Bearer scope="{security_scopes.scope_str}"'
     else:
         authenticate_value = "Bearer"
-    auth_context = authenticate_credentials(access_token=token)
 
     try:
         access_token = JWTToken.decode(
@@ -245,6 +286,12 @@ def oauth2_password_bearer_authentication(
                 detail="Not enough permissions",
                 headers={"WWW-Authenticate": authenticate_value},
             )
+
+    # The token itself is validated for every request, only the user lookup
+    # is cached
+    auth_context = _auth_context_cache.get(
+        token, lambda: authenticate_credentials(access_token=token)
+    )
     if auth_context is None:
         # We have to return an additional WWW-Authenticate header here with the
         # value Bearer to be compliant with the OAuth2 spec.
@@ -268,7 +315,10 @@ def no_authentication(security_scopes: SecurityScopes) -> AuthContext:
     Raises:
         HTTPException: If the default user is not available.
     """
-    auth_context = authenticate_credentials(user_name_or_id=DEFAULT_USERNAME)
+    auth_context = _auth_context_cache.get(
+        DEFAULT_USERNAME,
+        lambda: authenticate_credentials(user_name_or_id=DEFAULT_USERNAME),
+    )
 
     if auth_context is None:
         raise HTTPException(
@@ -13,13 +13,15 @@
 #  permissions and limitations under the License.
 """Endpoint definitions for steps (and artifacts) of pipeline runs."""
 
+from typing import List
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Security
+from fastapi import APIRouter, Depends, Query, Request, Response, Security
 
-from zenml.constants import API, ARTIFACTS, VERSION_1, VISUALIZE
+from zenml.constants import API, ARTIFACTS, BATCH, VERSION_1, VISUALIZE
 from zenml.enums import PermissionType
 from zenml.models import (
+    ArtifactBatchRequestModel,
     ArtifactFilterModel,
     ArtifactRequestModel,
     ArtifactResponseModel,
@@ -32,7 +34,9 @@ from zenml.utils.artifact_utils import load_artifact_visualization
 from zenml.zen_server.auth import AuthContext, authorize
 from zenml.zen_server.exceptions import error_response
 from zenml.zen_server.utils import (
+    cached_response,
     handle_exceptions,
+    invalidate_response_cache_on_change,
     make_dependable,
     zen_store,
 )
@@ -41,6 +45,7 @@ router = APIRouter(
     prefix=API + VERSION_1 + ARTIFACTS,
     tags=["artifacts"],
     responses={401: error_response},
+    dependencies=[Depends(invalidate_response_cache_on_change)],
 )
 
 
@@ -91,6 +96,48 @@ def create_artifact(
     return zen_store().create_artifact(artifact)
 
 
+@router.post(
+    BATCH,
+    response_model=List[ArtifactResponseModel],
+    responses={401: error_response, 409: error_response, 422: error_response},
+)
+@handle_exceptions
+def create_artifacts_batch(
+    batch: ArtifactBatchRequestModel,
+    _: AuthContext = Security(authorize, scopes=[PermissionType.WRITE]),
+) -> List[ArtifactResponseModel]:
+    """Create multiple artifacts in a single transaction.
+
+    Args:
+        batch: The artifacts to create.
+
+    Returns:
+        The created artifacts, in the same order as the requests.
+    """
+    return zen_store().create_artifacts_batch(batch.artifacts)
+
+
+@router.get(
+    BATCH,
+    response_model=List[ArtifactResponseModel],
+    responses={401: error_response, 404: error_response, 422: error_response},
+)
+@handle_exceptions
+def get_artifacts_batch(
+    artifact_ids: List[UUID] = Query([]),
+    _: AuthContext = Security(authorize, scopes=[PermissionType.READ]),
+) -> List[ArtifactResponseModel]:
+    """Get multiple artifacts in a single request.
+
+    Args:
+        artifact_ids: The IDs of the artifacts to get.
+
+    Returns:
+        All existing artifacts with one of the given IDs.
+    """
+    return list(zen_store().get_artifacts_batch(artifact_ids).values())
+
+
 @router.get(
     "/{artifact_id}",
     response_model=ArtifactResponseModel,
@@ -99,17 +146,23 @@ def create_artifact(
 @handle_exceptions
 def get_artifact(
     artifact_id: UUID,
+    request: Request,
     _: AuthContext = Security(authorize, scopes=[PermissionType.READ]),
-) -> ArtifactResponseModel:
+) -> Response:
     """Get an artifact by ID.
 
     Args:
         artifact_id: The ID of the artifact to get.
+        request: The request.
 
     Returns:
         The artifact with the given ID.
     """
-    return zen_store().get_artifact(artifact_id)
+    return cached_response(
+        request,
+        key=(ARTIFACTS, artifact_id),
+        load=lambda: zen_store().get_artifact(artifact_id),
+    )
 
 
 @router.delete(
@@ -28,6 +28,7 @@ from zenml.zen_server.auth import AuthContext, authorize
 from zenml.zen_server.exceptions import error_response
 from zenml.zen_server.utils import (
     handle_exceptions,
+    invalidate_response_cache_on_change,
     make_dependable,
     zen_store,
 )
@@ -36,6 +37,7 @@ router = APIRouter(
     prefix=API + VERSION_1 + CODE_REPOSITORIES,
     tags=["code_repositories"],
     responses={401: error_response},
+    dependencies=[Depends(invalidate_response_cache_on_change)],
 )
 
 
@@ -15,7 +15,7 @@
 
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Security
+from fastapi import APIRouter, Depends, Request, Response, Security
 
 from zenml.constants import API, FLAVORS, VERSION_1
 from zenml.enums import PermissionType
@@ -30,7 +30,9 @@ from zenml.models.page_model import Page
 from zenml.zen_server.auth import AuthContext, authorize
 from zenml.zen_server.exceptions import error_response
 from zenml.zen_server.utils import (
+    cached_response,
     handle_exceptions,
+    invalidate_response_cache_on_change,
     make_dependable,
     zen_store,
 )
@@ -39,6 +41,7 @@ router = APIRouter(
     prefix=API + VERSION_1 + FLAVORS,
     tags=["flavors"],
     responses={401: error_response},
+    dependencies=[Depends(invalidate_response_cache_on_change)],
 )
 
 
@@ -75,18 +78,23 @@ def list_flavors(
 @handle_exceptions
 def get_flavor(
     flavor_id: UUID,
+    request: Request,
     _: AuthContext = Security(authorize, scopes=[PermissionType.READ]),
-) -> FlavorResponseModel:
+) -> Response:
     """Returns the requested flavor.
 
     Args:
         flavor_id: ID of the flavor.
+        request: The request.
 
     Returns:
         The requested stack.
     """
-    flavor = zen_store().get_flavor(flavor_id)
-    return flavor
+    return cached_response(
+        request,
+        key=(FLAVORS, flavor_id),
+        load=lambda: zen_store().get_flavor(flavor_id),
+    )
 
 
 @router.post(
@@ -14,7 +14,7 @@
 """Endpoint definitions for builds."""
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Security
+from fastapi import APIRouter, Depends, Request, Response, Security
 
 from zenml.constants import API, PIPELINE_BUILDS, VERSION_1
 from zenml.enums import PermissionType
@@ -23,7 +23,9 @@ from zenml.models.page_model import Page
 from zenml.zen_server.auth import AuthContext, authorize
 from zenml.zen_server.exceptions import error_response
 from zenml.zen_server.utils import (
+    cached_response,
     handle_exceptions,
+    invalidate_response_cache_on_change,
     make_dependable,
     zen_store,
 )
@@ -32,6 +34,7 @@ router = APIRouter(
     prefix=API + VERSION_1 + PIPELINE_BUILDS,
     tags=["builds"],
     responses={401: error_response},
+    dependencies=[Depends(invalidate_response_cache_on_change)],
 )
 
 
@@ -67,17 +70,23 @@ def list_builds(
 @handle_exceptions
 def get_build(
     build_id: UUID,
+    request: Request,
     _: AuthContext = Security(authorize, scopes=[PermissionType.READ]),
-) -> PipelineBuildResponseModel:
+) -> Response:
     """Gets a specific build using its unique id.
 
     Args:
         build_id: ID of the build to get.
+        request: The request.
 
     Returns:
         A specific build object.
     """
-    return zen_store().get_build(build_id=build_id)
+    return cached_response(
+        request,
+        key=(PIPELINE_BUILDS, build_id),
+        load=lambda: zen_store().get_build(build_id=build_id),
+    )
 
 
 @router.delete(
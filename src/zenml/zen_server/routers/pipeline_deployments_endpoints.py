@@ -14,7 +14,7 @@
 """Endpoint definitions for deployments."""
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Security
+from fastapi import APIRouter, Depends, Request, Response, Security
 
 from zenml.constants import API, PIPELINE_DEPLOYMENTS, VERSION_1
 from zenml.enums import PermissionType
@@ -26,7 +26,9 @@ from zenml.models.page_model import Page
 from zenml.zen_server.auth import AuthContext, authorize
 from zenml.zen_server.exceptions import error_response
 from zenml.zen_server.utils import (
+    cached_response,
     handle_exceptions,
+    invalidate_cached_response,
     make_dependable,
     zen_store,
 )
@@ -72,17 +74,23 @@ def list_deployments(
 @handle_exceptions
 def get_deployment(
     deployment_id: UUID,
+    request: Request,
     _: AuthContext = Security(authorize, scopes=[PermissionType.READ]),
-) -> PipelineDeploymentResponseModel:
+) -> Response:
     """Gets a specific deployment using its unique id.
 
     Args:
         deployment_id: ID of the deployment to get.
+        request: The request.
 
     Returns:
         A specific deployment object.
     """
-    return zen_store().get_deployment(deployment_id=deployment_id)
+    return cached_response(
+        request,
+        key=(PIPELINE_DEPLOYMENTS, deployment_id),
+        load=lambda: zen_store().get_deployment(deployment_id=deployment_id),
+    )
 
 
 @router.delete(
@@ -100,3 +108,4 @@ def delete_deployment(
         deployment_id: ID of the deployment to delete.
     """
     zen_store().delete_deployment(deployment_id=deployment_id)
+    invalidate_cached_response((PIPELINE_DEPLOYMENTS, deployment_id))
@@ -24,7 +24,11 @@ from zenml.models import (
     UserRoleAssignmentResponseModel,
 )
 from zenml.models.page_model import Page
-from zenml.zen_server.auth import AuthContext, authorize
+from zenml.zen_server.auth import (
+    AuthContext,
+    authorize,
+    invalidate_auth_context_cache_on_change,
+)
 from zenml.zen_server.exceptions import error_response
 from zenml.zen_server.utils import (
     handle_exceptions,
@@ -36,6 +40,7 @@ router = APIRouter(
     prefix=API + VERSION_1 + USER_ROLE_ASSIGNMENTS,
     tags=["role_assignments"],
     responses={401: error_response},
+    dependencies=[Depends(invalidate_auth_context_cache_on_change)],
 )
 
 
@@ -12,14 +12,15 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 """Endpoint definitions for pipeline runs."""
-from typing import Any, Dict
+from typing import Any, Dict, List
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Security
+from fastapi import APIRouter, Depends, Query, Security
 
 from zenml.constants import (
     API,
     GRAPH,
+    OUTPUTS,
     PIPELINE_CONFIGURATION,
     RUNS,
     STATUS,
@@ -32,6 +33,7 @@ from zenml.models import (
     PipelineRunResponseModel,
     PipelineRunUpdateModel,
     StepRunFilterModel,
+    StepRunOutputArtifactsModel,
     StepRunResponseModel,
 )
 from zenml.models.page_model import Page
@@ -40,6 +42,7 @@ from zenml.zen_server.auth import AuthContext, authorize
 from zenml.zen_server.exceptions import error_response
 from zenml.zen_server.utils import (
     handle_exceptions,
+    invalidate_response_cache_on_change,
     make_dependable,
     zen_store,
 )
@@ -48,6 +51,7 @@ router = APIRouter(
     prefix=API + VERSION_1 + RUNS,
     tags=["runs"],
     responses={401: error_response},
+    dependencies=[Depends(invalidate_response_cache_on_change)],
 )
 
 
@@ -185,6 +189,31 @@ def get_run_steps(
     return zen_store().list_run_steps(step_run_filter_model)
 
 
+@router.get(
+    "/{run_id}" + STEPS + OUTPUTS,
+    response_model=Dict[str, StepRunOutputArtifactsModel],
+    responses={401: error_response, 404: error_response, 422: error_response},
+)
+@handle_exceptions
+def get_run_step_output_artifact_ids(
+    run_id: UUID,
+    step_names: List[str] = Query([]),
+    _: AuthContext = Security(authorize, scopes=[PermissionType.READ]),
+) -> Dict[str, StepRunOutputArtifactsModel]:
+    """Get the output artifact IDs of steps of a specific pipeline run.
+
+    Args:
+        run_id: ID of the pipeline run.
+        step_names: Names of the steps for which to get the outputs.
+
+    Returns:
+        The output artifact IDs of the requested steps, keyed by step name.
+    """
+    return zen_store().get_run_step_output_artifact_ids(
+        run_id=run_id, step_names=step_names
+    )
+
+
 @router.get(
     "/{run_id}" + PIPELINE_CONFIGURATION,
     response_model=Dict[str, Any],
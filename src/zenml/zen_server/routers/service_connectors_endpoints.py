@@ -39,6 +39,7 @@ from zenml.zen_server.auth import AuthContext, authorize
 from zenml.zen_server.exceptions import error_response
 from zenml.zen_server.utils import (
     handle_exceptions,
+    invalidate_response_cache_on_change,
     make_dependable,
     zen_store,
 )
@@ -47,12 +48,14 @@ router = APIRouter(
     prefix=API + VERSION_1 + SERVICE_CONNECTORS,
     tags=["service_connectors"],
     responses={401: error_response},
+    dependencies=[Depends(invalidate_response_cache_on_change)],
 )
 
 types_router = APIRouter(
     prefix=API + VERSION_1 + SERVICE_CONNECTOR_TYPES,
     tags=["service_connectors"],
     responses={401: error_response},
+    dependencies=[Depends(invalidate_response_cache_on_change)],
 )
 
 
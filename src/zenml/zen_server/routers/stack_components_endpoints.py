@@ -29,6 +29,7 @@ from zenml.zen_server.auth import AuthContext, authorize
 from zenml.zen_server.exceptions import error_response
 from zenml.zen_server.utils import (
     handle_exceptions,
+    invalidate_response_cache_on_change,
     make_dependable,
     zen_store,
 )
@@ -37,12 +38,14 @@ router = APIRouter(
     prefix=API + VERSION_1 + STACK_COMPONENTS,
     tags=["stack_components"],
     responses={401: error_response},
+    dependencies=[Depends(invalidate_response_cache_on_change)],
 )
 
 types_router = APIRouter(
     prefix=API + VERSION_1 + COMPONENT_TYPES,
     tags=["stack_components"],
     responses={401: error_response},
+    dependencies=[Depends(invalidate_response_cache_on_change)],
 )
 
 
@@ -13,15 +13,23 @@
 #  permissions and limitations under the License.
 """Endpoint definitions for steps (and artifacts) of pipeline runs."""
 
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Security
+from fastapi import APIRouter, Depends, Request, Response, Security
 
-from zenml.constants import API, STATUS, STEP_CONFIGURATION, STEPS, VERSION_1
+from zenml.constants import (
+    API,
+    CACHE,
+    STATUS,
+    STEP_CONFIGURATION,
+    STEPS,
+    VERSION_1,
+)
 from zenml.enums import ExecutionStatus, PermissionType
 from zenml.models import (
     StepRunFilterModel,
+    StepRunOutputArtifactsModel,
     StepRunRequestModel,
     StepRunResponseModel,
     StepRunUpdateModel,
@@ -30,7 +38,9 @@ from zenml.models.page_model import Page
 from zenml.zen_server.auth import AuthContext, authorize
 from zenml.zen_server.exceptions import error_response
 from zenml.zen_server.utils import (
+    cached_response,
     handle_exceptions,
+    invalidate_cached_response,
     make_dependable,
     zen_store,
 )
@@ -89,6 +99,32 @@ def create_run_step(
     return zen_store().create_run_step(step_run=step)
 
 
+@router.get(
+    CACHE + "/{cache_key}",
+    response_model=Optional[StepRunOutputArtifactsModel],  # type: ignore[arg-type]
+    responses={401: error_response, 404: error_response, 422: error_response},
+)
+@handle_exceptions
+def get_cached_run_step_outputs(
+    cache_key: str,
+    workspace_id: UUID,
+    _: AuthContext = Security(authorize, scopes=[PermissionType.READ]),
+) -> Optional[StepRunOutputArtifactsModel]:
+    """Get the outputs of the latest successful step run with a cache key.
+
+    Args:
+        cache_key: The cache key of the step run.
+        workspace_id: The ID of the workspace in which to look for step runs.
+
+    Returns:
+        The step run ID and output artifact IDs of the latest completed step
+        run with the given cache key, if one exists.
+    """
+    return zen_store().get_cached_run_step_outputs(
+        workspace_id=workspace_id, cache_key=cache_key
+    )
+
+
 @router.get(
     "/{step_id}",
     response_model=StepRunResponseModel,
@@ -97,17 +133,25 @@ def create_run_step(
 @handle_exceptions
 def get_step(
     step_id: UUID,
+    request: Request,
     _: AuthContext = Security(authorize, scopes=[PermissionType.READ]),
-) -> StepRunResponseModel:
+) -> Response:
     """Get one specific step.
 
     Args:
         step_id: ID of the step to get.
+        request: The request.
 
     Returns:
         The step.
     """
-    return zen_store().get_run_step(step_id)
+    return cached_response(
+        request,
+        key=(STEPS, step_id),
+        load=lambda: zen_store().get_run_step(step_id),
+        # Running steps can still be updated
+        cacheable=lambda step: step.status != ExecutionStatus.RUNNING,
+    )
 
 
 @router.put(
@@ -130,9 +174,11 @@ def update_step(
     Returns:
         The updated step model.
     """
-    return zen_store().update_run_step(
+    updated_step = zen_store().update_run_step(
         step_run_id=step_id, step_run_update=step_model
     )
+    invalidate_cached_response((STEPS, step_id))
+    return updated_step
 
 
 @router.get(
@@ -28,7 +28,11 @@ from zenml.models import (
     TeamUpdateModel,
 )
 from zenml.models.page_model import Page
-from zenml.zen_server.auth import AuthContext, authorize
+from zenml.zen_server.auth import (
+    AuthContext,
+    authorize,
+    invalidate_auth_context_cache_on_change,
+)
 from zenml.zen_server.exceptions import error_response
 from zenml.zen_server.utils import (
     handle_exceptions,
@@ -40,6 +44,7 @@ router = APIRouter(
     prefix=API + VERSION_1 + TEAMS,
     tags=["teams"],
     responses={401: error_response},
+    dependencies=[Depends(invalidate_auth_context_cache_on_change)],
 )
 
 
@@ -43,10 +43,12 @@ from zenml.zen_server.auth import (
     AuthContext,
     authenticate_credentials,
     authorize,
+    invalidate_auth_context_cache_on_change,
 )
 from zenml.zen_server.exceptions import error_response
 from zenml.zen_server.utils import (
     handle_exceptions,
+    invalidate_response_cache_on_change,
     make_dependable,
     zen_store,
 )
@@ -57,6 +59,10 @@ router = APIRouter(
     prefix=API + VERSION_1 + USERS,
     tags=["users"],
     responses={401: error_response},
+    dependencies=[
+        Depends(invalidate_response_cache_on_change),
+        Depends(invalidate_auth_context_cache_on_change),
+    ],
 )
 
 
@@ -64,6 +70,10 @@ activation_router = APIRouter(
     prefix=API + VERSION_1 + USERS,
     tags=["users"],
     responses={401: error_response},
+    dependencies=[
+        Depends(invalidate_response_cache_on_change),
+        Depends(invalidate_auth_context_cache_on_change),
+    ],
 )
 
 
@@ -71,6 +81,10 @@ current_user_router = APIRouter(
     prefix=API + VERSION_1,
     tags=["users"],
     responses={401: error_response},
+    dependencies=[
+        Depends(invalidate_response_cache_on_change),
+        Depends(invalidate_auth_context_cache_on_change),
+    ],
 )
 
 
@@ -19,6 +19,8 @@ from fastapi import APIRouter, Depends, Security
 
 from zenml.constants import (
     API,
+    ARTIFACTS,
+    BATCH,
     CODE_REPOSITORIES,
     GET_OR_CREATE,
     PIPELINE_BUILDS,
@@ -33,6 +35,7 @@ from zenml.constants import (
     STACK_COMPONENTS,
     STACKS,
     STATISTICS,
+    STEPS,
     TEAM_ROLE_ASSIGNMENTS,
     USER_ROLE_ASSIGNMENTS,
     VERSION_1,
@@ -59,6 +62,7 @@ from zenml.models import (
     PipelineRunFilterModel,
     PipelineRunRequestModel,
     PipelineRunResponseModel,
+    RunMetadataBatchRequestModel,
     RunMetadataRequestModel,
     RunMetadataResponseModel,
     ScheduleRequestModel,
@@ -86,6 +90,8 @@ from zenml.zen_server.auth import AuthContext, authorize
 from zenml.zen_server.exceptions import error_response
 from zenml.zen_server.utils import (
     handle_exceptions,
+    invalidate_cached_response,
+    invalidate_response_cache_on_change,
     make_dependable,
     zen_store,
 )
@@ -99,6 +105,7 @@ router = APIRouter(
     prefix=API + VERSION_1,
     tags=["workspaces"],
     responses={401: error_response},
+    dependencies=[Depends(invalidate_response_cache_on_change)],
 )
 
 
@@ -970,7 +977,77 @@ def create_run_metadata(
             "is not supported."
         )
 
-    return zen_store().create_run_metadata(run_metadata=run_metadata)
+    created_run_metadata = zen_store().create_run_metadata(
+        run_metadata=run_metadata
+    )
+    _invalidate_cached_responses_with_run_metadata(run_metadata)
+    return created_run_metadata
+
+
+@router.post(
+    WORKSPACES + "/{workspace_name_or_id}" + RUN_METADATA + BATCH,
+    response_model=List[RunMetadataResponseModel],
+    responses={401: error_response, 409: error_response, 422: error_response},
+)
+@handle_exceptions
+def create_run_metadata_batch(
+    workspace_name_or_id: Union[str, UUID],
+    batch: RunMetadataBatchRequestModel,
+    auth_context: AuthContext = Security(
+        authorize, scopes=[PermissionType.WRITE]
+    ),
+) -> List[RunMetadataResponseModel]:
+    """Creates multiple run metadata entries in a single transaction.
+
+    Args:
+        workspace_name_or_id: Name or ID of the workspace.
+        batch: The run metadata to create.
+        auth_context: Authentication context.
+
+    Returns:
+        The created run metadata, in the same order as the requests.
+
+    Raises:
+        IllegalOperationError: If the workspace or user specified in any of
+            the run metadata does not match the current workspace or
+            authenticated user.
+    """
+    workspace = zen_store().get_workspace(workspace_name_or_id)
+
+    for run_metadata in batch.run_metadata:
+        if run_metadata.workspace != workspace.id:
+            raise IllegalOperationError(
+                "Creating run metadata outside of the workspace scope "
+                f"of this endpoint `{workspace_name_or_id}` is "
+                f"not supported."
+            )
+
+        if run_metadata.user != auth_context.user.id:
+            raise IllegalOperationError(
+                "Creating run metadata for a user other than yourself "
+                "is not supported."
+            )
+
+    created_run_metadata = zen_store().create_run_metadata_batch(
+        run_metadata=batch.run_metadata
+    )
+    for run_metadata in batch.run_metadata:
+        _invalidate_cached_responses_with_run_metadata(run_metadata)
+    return created_run_metadata
+
+
+def _invalidate_cached_responses_with_run_metadata(
+    run_metadata: RunMetadataRequestModel,
+) -> None:
+    """Removes the cached responses of the resources of new run metadata.
+
+    Args:
+        run_metadata: The new run metadata.
+    """
+    if run_metadata.step_run_id:
+        invalidate_cached_response((STEPS, run_metadata.step_run_id))
+    if run_metadata.artifact_id:
+        invalidate_cached_response((ARTIFACTS, run_metadata.artifact_id))
 
 
 @router.post(
@@ -1118,21 +1195,23 @@ def get_workspace_statistics(
     """
     workspace = zen_store().get_workspace(workspace_name_or_id)
 
+    stacks = zen_store().list_stacks(
+        StackFilterModel(scope_workspace=workspace.id)
+    )
+    components = zen_store().list_stack_components(
+        ComponentFilterModel(scope_workspace=workspace.id)
+    )
+    pipelines = zen_store().list_pipelines(
+        PipelineFilterModel(scope_workspace=workspace.id)
+    )
+    runs = zen_store().list_runs(
+        PipelineRunFilterModel(scope_workspace=workspace.id)
+    )
     return {
-        "stacks": zen_store()
-        .list_stacks(StackFilterModel(scope_workspace=workspace.id))
-        .total,
-        "components": zen_store()
-        .list_stack_components(
-            ComponentFilterModel(scope_workspace=workspace.id)
-        )
-        .total,
-        "pipelines": zen_store()
-        .list_pipelines(PipelineFilterModel(scope_workspace=workspace.id))
-        .total,
-        "runs": zen_store()
-        .list_runs(PipelineRunFilterModel(scope_workspace=workspace.id))
-        .total,
+        "stacks": stacks.total or 0,
+        "components": components.total or 0,
+        "pipelines": pipelines.total or 0,
+        "runs": runs.total or 0,
     }
 
 
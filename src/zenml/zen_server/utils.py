@@ -13,22 +13,38 @@
 #  permissions and limitations under the License.
 """Util functions for the ZenML Server."""
 
+import hashlib
 import inspect
 import os
 from functools import wraps
-from typing import Any, Callable, Optional, Tuple, Type, TypeVar, cast
+from typing import (
+    Any,
+    Callable,
+    Hashable,
+    Iterator,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    cast,
+)
 from urllib.parse import urlparse
 
-from fastapi import HTTPException
+from fastapi import HTTPException, Request, Response, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel, ValidationError
 
 from zenml.config.global_config import GlobalConfiguration
 from zenml.constants import (
     ENV_ZENML_SERVER,
     ENV_ZENML_SERVER_ROOT_URL_PATH,
+    SERVER_RESPONSE_CACHE_SIZE,
+    SERVER_RESPONSE_CACHE_TTL,
 )
 from zenml.enums import ServerProviderType, StoreType
 from zenml.logger import get_logger
+from zenml.utils.entity_cache import LRUCache
 from zenml.zen_server.deploy.deployment import ServerDeployment
 from zenml.zen_server.deploy.local.local_zen_server import (
     LocalServerDeploymentConfig,
@@ -44,6 +60,11 @@ ROOT_URL_PATH = os.getenv(ENV_ZENML_SERVER_ROOT_URL_PATH, "")
 
 _zen_store: Optional[BaseZenStore] = None
 
+# ETags and serialized responses of immutable resources
+_response_cache: LRUCache[Tuple[str, bytes]] = LRUCache(
+    max_size=SERVER_RESPONSE_CACHE_SIZE, ttl=SERVER_RESPONSE_CACHE_TTL
+)
+
 
 def zen_store() -> BaseZenStore:
     """Initialize the ZenML Store.
@@ -239,3 +260,102 @@ def make_dependable(cls: Type[BaseModel]) -> Callable[..., Any]:
     init_cls_and_handle_errors.__signature__ = inspect.signature(cls)  # type: ignore[attr-defined]
 
     return init_cls_and_handle_errors
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """Checks whether a request has an `If-None-Match` header for an ETag.
+
+    Args:
+        request: The request.
+        etag: The ETag of the current response.
+
+    Returns:
+        If the client already has the current response.
+    """
+    if_none_match = request.headers.get("If-None-Match")
+    if not if_none_match:
+        return False
+
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or any(
+        (tag[2:] if tag.startswith("W/") else tag) == etag for tag in tags
+    )
+
+
+def cached_response(
+    request: Request,
+    key: Hashable,
+    load: Callable[[], Any],
+    cacheable: Callable[[Any], bool] = lambda _: True,
+) -> Response:
+    """Creates the response for an immutable resource.
+
+    Serialized responses are kept in memory, so they can be sent again
+    without querying the database. Each response has an ETag, and requests
+    with a matching `If-None-Match` header get an empty `304 Not Modified`
+    response.
+
+    Endpoints which delete or modify resources which are cached this way need
+    to call `invalidate_cached_response` for them once the change is
+    committed. Changes made through other server processes are picked up once
+    the cached responses expire.
+
+    Args:
+        request: The request.
+        key: The key of the resource, e.g. its route and ID.
+        load: Function which loads the resource if it's not cached.
+        cacheable: Function which checks whether a loaded resource won't
+            change anymore and can therefore be cached.
+
+    Returns:
+        The response.
+    """
+    entry = _response_cache.get(key)
+    if entry is None:
+        generation = _response_cache.generation
+        resource = load()
+        body = JSONResponse(content=jsonable_encoder(resource)).body
+        entry = '"' + hashlib.sha256(body).hexdigest() + '"', body
+        if cacheable(resource):
+            _response_cache.put(key, entry, generation=generation)
+
+    etag, body = entry
+    # Clients always need to revalidate their copy as the resource could
+    # have been deleted
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if _etag_matches(request, etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers=headers
+        )
+    return Response(
+        content=body, media_type="application/json", headers=headers
+    )
+
+
+def invalidate_cached_response(key: Hashable) -> None:
+    """Removes the cached response of a resource.
+
+    Args:
+        key: The key of the resource.
+    """
+    _response_cache.pop(key)
+
+
+def invalidate_response_cache_on_change(request: Request) -> Iterator[None]:
+    """Clears the cached responses after modifications.
+
+    Cached resources contain other resources, e.g. deployments contain their
+    stack and all resources contain their user and workspace. This is used
+    as dependency of all routers whose resources can be contained in cached
+    responses to clear all of them whenever such a resource is updated or
+    deleted.
+
+    Args:
+        request: The request.
+
+    Yields:
+        Nothing.
+    """
+    yield
+    if request.method in ("PUT", "PATCH", "DELETE"):
+        _response_cache.clear()
@@ -23,6 +23,7 @@ from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from genericpath import isfile
 from starlette.middleware.cors import CORSMiddleware
+from starlette.middleware.gzip import GZipMiddleware
 from starlette.responses import FileResponse
 
 import zenml
@@ -69,6 +70,9 @@ def relative_path(rel: str) -> str:
     return os.path.join(os.path.dirname(__file__), rel)
 
 
+# Responses smaller than this number of bytes are not compressed
+GZIP_MINIMUM_SIZE = 1000
+
 app = FastAPI(
     title="ZenML",
     version=zenml.__version__,
@@ -102,6 +106,9 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+# Compress responses for clients which accept gzip, e.g. large lists of
+# steps or pipeline deployments
+app.add_middleware(GZipMiddleware, minimum_size=GZIP_MINIMUM_SIZE)
 
 
 @app.on_event("startup")
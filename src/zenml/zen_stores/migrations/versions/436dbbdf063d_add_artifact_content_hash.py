@@ -0,0 +1,34 @@
+"""Add artifact content hash [436dbbdf063d].
+
+Revision ID: 436dbbdf063d
+Revises: d9d88b5bcb2a
+Create Date: 2023-06-14 10:27:31.604183
+
+"""
+import sqlalchemy as sa
+import sqlmodel
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "436dbbdf063d"
+down_revision = "d9d88b5bcb2a"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema and/or data, creating a new revision."""
+    with op.batch_alter_table("artifact", schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column(
+                "content_hash",
+                sqlmodel.sql.sqltypes.AutoString(),
+                nullable=True,
+            )
+        )
+
+
+def downgrade() -> None:
+    """Downgrade database schema and/or data back to the previous revision."""
+    with op.batch_alter_table("artifact", schema=None) as batch_op:
+        batch_op.drop_column("content_hash")
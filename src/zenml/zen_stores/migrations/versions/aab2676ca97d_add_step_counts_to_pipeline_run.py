@@ -0,0 +1,76 @@
+"""Add step counts to pipeline run [aab2676ca97d].
+
+Revision ID: aab2676ca97d
+Revises: 0.40.2
+Create Date: 2023-06-12 10:31:07.418112
+
+"""
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy import func, select
+
+# revision identifiers, used by Alembic.
+revision = "aab2676ca97d"
+down_revision = "0.40.2"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema and/or data, creating a new revision."""
+    with op.batch_alter_table("pipeline_run", schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column(
+                "num_created_steps",
+                sa.Integer(),
+                nullable=False,
+                server_default="0",
+            )
+        )
+        batch_op.add_column(
+            sa.Column(
+                "num_running_steps",
+                sa.Integer(),
+                nullable=False,
+                server_default="0",
+            )
+        )
+        batch_op.add_column(
+            sa.Column(
+                "num_failed_steps",
+                sa.Integer(),
+                nullable=False,
+                server_default="0",
+            )
+        )
+
+    # Compute the step counts of all existing runs
+    conn = op.get_bind()
+    meta = sa.MetaData(bind=op.get_bind())
+    meta.reflect(only=("pipeline_run", "step_run"))
+    pipeline_runs = sa.Table("pipeline_run", meta)
+    step_runs = sa.Table("step_run", meta)
+
+    def _count_steps(*conditions: sa.sql.ColumnElement) -> sa.sql.Select:
+        return (
+            select([func.count(step_runs.c.id)])
+            .where(step_runs.c.pipeline_run_id == pipeline_runs.c.id)
+            .where(*conditions)
+            .scalar_subquery()
+        )
+
+    conn.execute(
+        pipeline_runs.update().values(
+            num_created_steps=_count_steps(),
+            num_running_steps=_count_steps(step_runs.c.status == "running"),
+            num_failed_steps=_count_steps(step_runs.c.status == "failed"),
+        )
+    )
+
+
+def downgrade() -> None:
+    """Downgrade database schema and/or data back to the previous revision."""
+    with op.batch_alter_table("pipeline_run", schema=None) as batch_op:
+        batch_op.drop_column("num_failed_steps")
+        batch_op.drop_column("num_running_steps")
+        batch_op.drop_column("num_created_steps")
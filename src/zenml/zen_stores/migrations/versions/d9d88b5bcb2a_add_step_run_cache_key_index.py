@@ -0,0 +1,28 @@
+"""Add step run cache key index [d9d88b5bcb2a].
+
+Revision ID: d9d88b5bcb2a
+Revises: aab2676ca97d
+Create Date: 2023-06-13 09:12:44.872215
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "d9d88b5bcb2a"
+down_revision = "aab2676ca97d"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema and/or data, creating a new revision."""
+    with op.batch_alter_table("step_run", schema=None) as batch_op:
+        batch_op.create_index(
+            batch_op.f("ix_step_run_cache_key"), ["cache_key"], unique=False
+        )
+
+
+def downgrade() -> None:
+    """Downgrade database schema and/or data back to the previous revision."""
+    with op.batch_alter_table("step_run", schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f("ix_step_run_cache_key"))
@@ -12,8 +12,12 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 """REST Zen Store implementation."""
+import json
 import os
+import random
 import re
+import threading
+from collections import Counter
 from pathlib import Path, PurePath
 from typing import (
     TYPE_CHECKING,
@@ -27,12 +31,14 @@ from typing import (
     TypeVar,
     Union,
 )
-from urllib.parse import urlparse
+from urllib.parse import urlencode, urlparse
 from uuid import UUID
 
 import requests
 import urllib3
 from pydantic import BaseModel, root_validator, validator
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 import zenml
 from zenml.config.global_config import GlobalConfiguration
@@ -41,6 +47,9 @@ from zenml.config.store_config import StoreConfiguration
 from zenml.constants import (
     API,
     ARTIFACTS,
+    BATCH,
+    CACHE,
+    CLIENT_RESPONSE_CACHE_SIZE,
     CODE_REPOSITORIES,
     CURRENT_USER,
     DISABLE_CLIENT_SERVER_MISMATCH_WARNING,
@@ -49,6 +58,7 @@ from zenml.constants import (
     GET_OR_CREATE,
     INFO,
     LOGIN,
+    OUTPUTS,
     PIPELINE_BUILDS,
     PIPELINE_DEPLOYMENTS,
     PIPELINES,
@@ -78,6 +88,7 @@ from zenml.exceptions import (
 from zenml.io import fileio
 from zenml.logger import get_logger
 from zenml.models import (
+    ArtifactBatchRequestModel,
     ArtifactFilterModel,
     ArtifactRequestModel,
     ArtifactResponseModel,
@@ -112,6 +123,7 @@ from zenml.models import (
     RoleRequestModel,
     RoleResponseModel,
     RoleUpdateModel,
+    RunMetadataBatchRequestModel,
     RunMetadataRequestModel,
     RunMetadataResponseModel,
     ScheduleRequestModel,
@@ -128,6 +140,7 @@ from zenml.models import (
     StackResponseModel,
     StackUpdateModel,
     StepRunFilterModel,
+    StepRunOutputArtifactsModel,
     StepRunRequestModel,
     StepRunResponseModel,
     StepRunUpdateModel,
@@ -162,6 +175,7 @@ from zenml.service_connectors.service_connector_registry import (
     service_connector_registry,
 )
 from zenml.utils.analytics_utils import AnalyticsEvent, track
+from zenml.utils.entity_cache import LRUCache
 from zenml.utils.networking_utils import (
     replace_localhost_with_internal_hostname,
 )
@@ -184,6 +198,29 @@ AnyResponseModel = TypeVar("AnyResponseModel", bound=BaseResponseModel)
 
 
 DEFAULT_HTTP_TIMEOUT = 30
+DEFAULT_HTTP_POOL_SIZE = 10
+DEFAULT_HTTP_MAX_RETRIES = 3
+DEFAULT_HTTP_RETRY_BACKOFF_FACTOR = 0.5
+# Response status codes for which idempotent requests are retried
+HTTP_RETRY_STATUS_CODES = (429, 502, 503, 504)
+# Guards the creation of the sessions of all REST stores
+_SESSION_LOCK = threading.Lock()
+
+
+class _JitteredRetry(Retry):  # type: ignore[misc]
+    """Retry policy which randomizes the exponential backoff time.
+
+    Randomizing the backoff time prevents many clients which failed at the
+    same time (e.g. during a server restart) from retrying in lockstep.
+    """
+
+    def get_backoff_time(self) -> float:
+        """Gets a random backoff time up to the exponential backoff time.
+
+        Returns:
+            The number of seconds to wait before the next retry.
+        """
+        return random.uniform(0, super().get_backoff_time())
 
 
 class RestZenStoreConfiguration(StoreConfiguration):
@@ -200,6 +237,12 @@ class RestZenStoreConfiguration(StoreConfiguration):
             verify the server's TLS certificate, or a string, in which case it
             must be a path to a CA bundle to use or the CA bundle value itself.
         http_timeout: The timeout to use for all requests.
+        http_pool_size: The maximum number of connections to the server that
+            are kept open for reuse.
+        http_max_retries: The maximum number of times idempotent requests are
+            retried after connection errors or server errors.
+        http_retry_backoff_factor: The factor of the randomized exponential
+            backoff between retries.
 
     """
 
@@ -212,6 +255,9 @@ class RestZenStoreConfiguration(StoreConfiguration):
     api_token: Optional[str] = None
     verify_ssl: Union[bool, str] = True
     http_timeout: int = DEFAULT_HTTP_TIMEOUT
+    http_pool_size: int = DEFAULT_HTTP_POOL_SIZE
+    http_max_retries: int = DEFAULT_HTTP_MAX_RETRIES
+    http_retry_backoff_factor: float = DEFAULT_HTTP_RETRY_BACKOFF_FACTOR
 
     @validator("secrets_store")
     def validate_secrets_store(
@@ -401,6 +447,8 @@ class RestZenStore(BaseZenStore):
     CONFIG_TYPE: ClassVar[Type[StoreConfiguration]] = RestZenStoreConfiguration
     _api_token: Optional[str] = None
     _session: Optional[requests.Session] = None
+    _connection_stats: "Counter[str]" = Counter()
+    _response_cache: Optional[LRUCache[Tuple[str, bytes]]] = None
 
     def _initialize_database(self) -> None:
         """Initialize the database."""
@@ -1685,6 +1733,61 @@ class RestZenStore(BaseZenStore):
             filter_model=step_run_filter_model,
         )
 
+    def get_run_step_output_artifact_ids(
+        self, run_id: UUID, step_names: List[str]
+    ) -> Dict[str, StepRunOutputArtifactsModel]:
+        """Get the output artifact IDs of steps of a pipeline run.
+
+        Args:
+            run_id: The ID of the pipeline run.
+            step_names: The names of the steps for which to get the outputs.
+
+        Returns:
+            The output artifact IDs of all existing steps of the run with one
+            of the given names, keyed by step name.
+
+        Raises:
+            ValueError: If the server response is not a dict.
+        """
+        if not step_names:
+            return {}
+
+        body = self.get(
+            f"{RUNS}/{str(run_id)}{STEPS}{OUTPUTS}",
+            params={"step_names": list(step_names)},
+        )
+        if not isinstance(body, dict):
+            raise ValueError(
+                f"Bad API Response. Expected dict, got {type(body)}"
+            )
+        return {
+            step_name: StepRunOutputArtifactsModel.parse_obj(outputs)
+            for step_name, outputs in body.items()
+        }
+
+    def get_cached_run_step_outputs(
+        self, workspace_id: UUID, cache_key: str
+    ) -> Optional[StepRunOutputArtifactsModel]:
+        """Get the outputs of the latest successful step run with a cache key.
+
+        Args:
+            workspace_id: The ID of the workspace in which to look for step
+                runs.
+            cache_key: The cache key of the step run.
+
+        Returns:
+            The step run ID and output artifact IDs of the latest completed
+            step run with the given cache key, or `None` if no such step run
+            exists.
+        """
+        body = self.get(
+            f"{STEPS}{CACHE}/{cache_key}",
+            params={"workspace_id": workspace_id},
+        )
+        if body is None:
+            return None
+        return StepRunOutputArtifactsModel.parse_obj(body)
+
     def update_run_step(
         self,
         step_run_id: UUID,
@@ -1727,6 +1830,33 @@ class RestZenStore(BaseZenStore):
             route=ARTIFACTS,
         )
 
+    def create_artifacts_batch(
+        self, artifacts: List[ArtifactRequestModel]
+    ) -> List[ArtifactResponseModel]:
+        """Creates multiple artifacts in a single transaction.
+
+        Args:
+            artifacts: The artifacts to create.
+
+        Returns:
+            The created artifacts, in the same order as the requests.
+
+        Raises:
+            ValueError: If the server response is not a list.
+        """
+        if not artifacts:
+            return []
+
+        body = self.post(
+            f"{ARTIFACTS}{BATCH}",
+            body=ArtifactBatchRequestModel(artifacts=artifacts),
+        )
+        if not isinstance(body, list):
+            raise ValueError(
+                f"Bad API Response. Expected list, got {type(body)}"
+            )
+        return [ArtifactResponseModel.parse_obj(item) for item in body]
+
     def get_artifact(self, artifact_id: UUID) -> ArtifactResponseModel:
         """Gets an artifact.
 
@@ -1742,6 +1872,38 @@ class RestZenStore(BaseZenStore):
             response_model=ArtifactResponseModel,
         )
 
+    def get_artifacts_batch(
+        self, artifact_ids: List[UUID]
+    ) -> Dict[UUID, ArtifactResponseModel]:
+        """Gets multiple artifacts in a single request.
+
+        Args:
+            artifact_ids: The IDs of the artifacts to get.
+
+        Returns:
+            All existing artifacts with one of the given IDs, keyed by ID.
+
+        Raises:
+            ValueError: If the server response is not a list.
+        """
+        if not artifact_ids:
+            return {}
+
+        body = self.get(
+            f"{ARTIFACTS}{BATCH}",
+            params={
+                "artifact_ids": [
+                    str(artifact_id) for artifact_id in artifact_ids
+                ]
+            },
+        )
+        if not isinstance(body, list):
+            raise ValueError(
+                f"Bad API Response. Expected list, got {type(body)}"
+            )
+        artifacts = [ArtifactResponseModel.parse_obj(item) for item in body]
+        return {artifact.id: artifact for artifact in artifacts}
+
     def list_artifacts(
         self, artifact_filter_model: ArtifactFilterModel
     ) -> Page[ArtifactResponseModel]:
@@ -1789,6 +1951,41 @@ class RestZenStore(BaseZenStore):
             route=RUN_METADATA,
         )
 
+    def create_run_metadata_batch(
+        self, run_metadata: List[RunMetadataRequestModel]
+    ) -> List[RunMetadataResponseModel]:
+        """Creates multiple run metadata entries in a single transaction.
+
+        Args:
+            run_metadata: The run metadata to create.
+
+        Returns:
+            The created run metadata, in the same order as the requests.
+
+        Raises:
+            ValueError: If the run metadata belongs to multiple workspaces or
+                the server response is not a list.
+        """
+        if not run_metadata:
+            return []
+
+        workspace_ids = {request.workspace for request in run_metadata}
+        if len(workspace_ids) > 1:
+            raise ValueError(
+                "Creating run metadata for multiple workspaces in a single "
+                "batch is not supported."
+            )
+
+        body = self.post(
+            f"{WORKSPACES}/{str(workspace_ids.pop())}{RUN_METADATA}{BATCH}",
+            body=RunMetadataBatchRequestModel(run_metadata=run_metadata),
+        )
+        if not isinstance(body, list):
+            raise ValueError(
+                f"Bad API Response. Expected list, got {type(body)}"
+            )
+        return [RunMetadataResponseModel.parse_obj(item) for item in body]
+
     def list_run_metadata(
         self,
         run_metadata_filter_model: RunMetadataFilterModel,
@@ -2368,21 +2565,169 @@ class RestZenStore(BaseZenStore):
     def session(self) -> requests.Session:
         """Authenticate to the ZenML server.
 
+        The session is shared by all threads using the store, so that they
+        share its connection pool.
+
         Returns:
             A requests session with the authentication token.
         """
+        with _SESSION_LOCK:
+            if self._session is None:
+                self._session = self._create_session()
+                logger.debug("Authenticated to ZenML server.")
+            return self._session
+
+    def _create_session(self) -> requests.Session:
+        """Creates an authenticated session for the ZenML server.
+
+        Returns:
+            The session.
+        """
+        if self.config.verify_ssl is False:
+            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+        session = requests.Session()
+        session.verify = self.config.verify_ssl
+        retries = _JitteredRetry(
+            total=self.config.http_max_retries,
+            backoff_factor=self.config.http_retry_backoff_factor,
+            status_forcelist=HTTP_RETRY_STATUS_CODES,
+            allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=self.config.http_pool_size,
+            pool_maxsize=self.config.http_pool_size,
+            max_retries=retries,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        # Accept all compression algorithms that urllib3 can decode, which
+        # includes brotli if it is installed
+        session.headers.update(urllib3.util.make_headers(accept_encoding=True))
+        token = self._get_auth_token()
+        session.headers.update({"Authorization": "Bearer " + token})
+        return session
+
+    def _discard_session(self, session: requests.Session) -> None:
+        """Closes the session and keeps the statistics of its connections.
+
+        Other threads sharing the session may fail at the same time, so the
+        session is only discarded if it wasn't already replaced by one of
+        them.
+
+        Args:
+            session: The session which failed.
+        """
+        with _SESSION_LOCK:
+            if self._session is session:
+                self._connection_stats.update(self._get_pool_stats())
+                self._session.close()
+                self._session = None
+
+    def _get_pool_stats(self) -> "Counter[str]":
+        """Gets the statistics of the connection pools of the current session.
+
+        Returns:
+            The number of opened connections and sent requests.
+        """
+        stats: "Counter[str]" = Counter()
         if self._session is None:
-            if self.config.verify_ssl is False:
-                urllib3.disable_warnings(
-                    urllib3.exceptions.InsecureRequestWarning
-                )
+            return stats
+
+        for adapter in set(self._session.adapters.values()):
+            pools = adapter.poolmanager.pools
+            for key in pools.keys():
+                pool = pools.get(key)
+                if pool is not None:
+                    stats["connections"] += pool.num_connections
+                    stats["requests"] += pool.num_requests
+        return stats
+
+    def get_connection_stats(self) -> Dict[str, int]:
+        """Gets statistics about the HTTP connections to the ZenML server.
+
+        Returns:
+            The number of HTTP requests sent to the server including retries,
+            the number of connections opened to the server, the number of
+            requests which reused an open connection and the number of
+            retried requests.
+        """
+        stats = self._connection_stats + self._get_pool_stats()
+        return {
+            "requests": stats["requests"],
+            "connections": stats["connections"],
+            "reused_connections": max(
+                stats["requests"] - stats["connections"], 0
+            ),
+            "retries": stats["retries"],
+        }
+
+    def _send_request(
+        self,
+        session: requests.Session,
+        method: str,
+        url: str,
+        params: Dict[str, Any],
+        **kwargs: Any,
+    ) -> Json:
+        """Sends a request with the given session.
+
+        Args:
+            session: The session to send the request with.
+            method: The HTTP method to use.
+            url: The URL to request.
+            params: The query parameters to pass to the endpoint.
+            kwargs: Additional keyword arguments to pass to the request.
 
-            self._session = requests.Session()
-            self._session.verify = self.config.verify_ssl
-            token = self._get_auth_token()
-            self._session.headers.update({"Authorization": "Bearer " + token})
-            logger.debug("Authenticated to ZenML server.")
-        return self._session
+        Returns:
+            The parsed response.
+        """
+        # Responses to GET requests which have an ETag are kept, so they
+        # don't have to be sent again if they didn't change
+        cache_key = url + "?" + urlencode(sorted(params.items()), doseq=True)
+        cached_response = None
+        if method == "GET":
+            cached_response = self._get_response_cache().get(cache_key)
+        if cached_response:
+            kwargs["headers"] = {
+                **(kwargs.get("headers") or {}),
+                "If-None-Match": cached_response[0],
+            }
+
+        response = session.request(
+            method,
+            url,
+            params=params,
+            verify=self.config.verify_ssl,
+            timeout=self.config.http_timeout,
+            **kwargs,
+        )
+        retries = getattr(response.raw, "retries", None)
+        if retries is not None and retries.history:
+            with _SESSION_LOCK:
+                self._connection_stats["retries"] += len(retries.history)
+
+        if cached_response and response.status_code == 304:
+            payload: Json = json.loads(cached_response[1])
+            return payload
+        etag = response.headers.get("ETag")
+        if method == "GET" and etag and response.status_code == 200:
+            self._get_response_cache().put(cache_key, (etag, response.content))
+        return self._handle_response(response)
+
+    def _get_response_cache(self) -> LRUCache[Tuple[str, bytes]]:
+        """Gets the cache of responses for conditional requests.
+
+        Returns:
+            The response cache.
+        """
+        with _SESSION_LOCK:
+            if self._response_cache is None:
+                self._response_cache = LRUCache(
+                    max_size=CLIENT_RESPONSE_CACHE_SIZE
+                )
+            return self._response_cache
 
     @staticmethod
     def _handle_response(response: requests.Response) -> Json:
@@ -2443,31 +2788,25 @@ class RestZenStore(BaseZenStore):
         Returns:
             The parsed response.
         """
-        params = {k: str(v) for k, v in params.items()} if params else {}
+        params = (
+            {
+                k: [str(item) for item in v] if isinstance(v, list) else str(v)
+                for k, v in params.items()
+            }
+            if params
+            else {}
+        )
+        session = self.session
         try:
-            return self._handle_response(
-                self.session.request(
-                    method,
-                    url,
-                    params=params,
-                    verify=self.config.verify_ssl,
-                    timeout=self.config.http_timeout,
-                    **kwargs,
-                )
+            return self._send_request(
+                session, method, url, params=params, **kwargs
             )
         except AuthorizationException:
             # The authentication token could have expired; refresh it and try
             # again
-            self._session = None
-            return self._handle_response(
-                self.session.request(
-                    method,
-                    url,
-                    params=params,
-                    verify=self.config.verify_ssl,
-                    timeout=self.config.http_timeout,
-                    **kwargs,
-                )
+            self._discard_session(session)
+            return self._send_request(
+                self.session, method, url, params=params, **kwargs
             )
 
     def get(
@@ -77,6 +77,7 @@ class ArtifactSchema(NamedSchema, table=True):
     uri: str = Field(sa_column=Column(TEXT, nullable=False))
     materializer: str = Field(sa_column=Column(TEXT, nullable=False))
     data_type: str = Field(sa_column=Column(TEXT, nullable=False))
+    content_hash: Optional[str] = Field(nullable=True)
 
     run_metadata: List["RunMetadataSchema"] = Relationship(
         back_populates="artifact",
@@ -116,6 +117,7 @@ class ArtifactSchema(NamedSchema, table=True):
             uri=artifact_request.uri,
             materializer=artifact_request.materializer.json(),
             data_type=artifact_request.data_type.json(),
+            content_hash=artifact_request.content_hash,
         )
 
     def to_model(
@@ -162,6 +164,7 @@ class ArtifactSchema(NamedSchema, table=True):
             producer_step_run_id=producer_step_run_id,
             metadata=metadata,
             visualizations=[vis.to_model() for vis in self.visualizations],
+            content_hash=self.content_hash,
         )
 
 
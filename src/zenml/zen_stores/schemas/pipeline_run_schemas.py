@@ -133,6 +133,12 @@ class PipelineRunSchema(NamedSchema, table=True):
     status: ExecutionStatus
     pipeline_configuration: str = Field(sa_column=Column(TEXT, nullable=False))
     num_steps: Optional[int]
+    # Counts of the step runs of this run, which are maintained whenever a
+    # step run is created or updated so the run status can be derived
+    # without loading all step runs.
+    num_created_steps: int = 0
+    num_running_steps: int = 0
+    num_failed_steps: int = 0
     client_version: str
     server_version: Optional[str] = Field(nullable=True)
     client_environment: Optional[str] = Field(
@@ -290,3 +296,28 @@ class PipelineRunSchema(NamedSchema, table=True):
 
         self.updated = datetime.utcnow()
         return self
+
+    def update_status_from_step_counts(self) -> None:
+        """Derives the status of the run from the counts of its step runs.
+
+        The status is left untouched if the number of steps of the run is
+        unknown.
+        """
+        if self.num_steps is None:
+            return
+
+        if self.num_failed_steps > 0:
+            status = ExecutionStatus.FAILED
+        elif (
+            self.num_running_steps > 0
+            or self.num_created_steps < self.num_steps
+        ):
+            status = ExecutionStatus.RUNNING
+        else:
+            status = ExecutionStatus.COMPLETED
+
+        if status != self.status:
+            self.status = status
+            if status in {ExecutionStatus.COMPLETED, ExecutionStatus.FAILED}:
+                self.end_time = datetime.utcnow()
+            self.updated = datetime.utcnow()
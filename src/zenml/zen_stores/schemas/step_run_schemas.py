@@ -92,7 +92,7 @@ class StepRunSchema(NamedSchema, table=True):
     enable_cache: Optional[bool] = Field(nullable=True)
     enable_artifact_metadata: Optional[bool] = Field(nullable=True)
     code_hash: Optional[str] = Field(nullable=True)
-    cache_key: Optional[str] = Field(nullable=True)
+    cache_key: Optional[str] = Field(nullable=True, index=True)
     start_time: Optional[datetime] = Field(nullable=True)
     end_time: Optional[datetime] = Field(nullable=True)
     status: ExecutionStatus
@@ -14,7 +14,6 @@
 """Base Secrets Store implementation."""
 from abc import ABC
 from datetime import datetime
-from functools import partial
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -283,11 +282,8 @@ class BaseSecretsStore(
 
         # Delete all secrets associated with the workspace.
         secrets = depaginate(
-            partial(
-                self.list_secrets,
-                secret_filter_model=SecretFilterModel(
-                    workspace_id=workspace_id
-                ),
+            lambda **kwargs: self.list_secrets(
+                SecretFilterModel(workspace_id=workspace_id, **kwargs)
             )
         )
         for secret in secrets:
@@ -311,9 +307,8 @@ class BaseSecretsStore(
 
         # Delete all secrets associated with the user.
         secrets = depaginate(
-            partial(
-                self.list_secrets,
-                secret_filter_model=SecretFilterModel(user_id=user_id),
+            lambda **kwargs: self.list_secrets(
+                SecretFilterModel(user_id=user_id, **kwargs)
             )
         )
         for secret in secrets:
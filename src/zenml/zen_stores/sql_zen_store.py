@@ -19,6 +19,7 @@ import logging
 import math
 import os
 import re
+from collections import defaultdict
 from contextvars import ContextVar
 from pathlib import Path, PurePath
 from typing import (
@@ -37,8 +38,9 @@ from typing import (
 from uuid import UUID
 
 import pymysql
-from pydantic import SecretStr, root_validator, validator
-from sqlalchemy import asc, desc, func, text
+from pydantic import SecretStr, parse_obj_as, root_validator, validator
+from pydantic.json import pydantic_encoder
+from sqlalchemy import asc, desc, func, text, update
 from sqlalchemy.engine import URL, Engine, make_url
 from sqlalchemy.exc import (
     ArgumentError,
@@ -46,8 +48,8 @@ from sqlalchemy.exc import (
     NoResultFound,
     OperationalError,
 )
-from sqlalchemy.orm import noload
-from sqlmodel import Session, create_engine, or_, select
+from sqlalchemy.orm import noload, selectinload
+from sqlmodel import Session, and_, create_engine, or_, select
 from sqlmodel.sql.expression import Select, SelectOfScalar
 
 from zenml.config.global_config import GlobalConfiguration
@@ -128,6 +130,7 @@ from zenml.models import (
     StackResponseModel,
     StackUpdateModel,
     StepRunFilterModel,
+    StepRunOutputArtifactsModel,
     StepRunRequestModel,
     StepRunResponseModel,
     StepRunUpdateModel,
@@ -717,6 +720,9 @@ class SqlZenStore(BaseZenStore):
                 List[AnySchema],
             ]
         ] = None,
+        custom_bulk_schema_to_model_conversion: Optional[
+            Callable[[Session, List[AnySchema]], List[B]]
+        ] = None,
     ) -> Page[B]:
         """Given a query, return a Page instance with a list of filtered Models.
 
@@ -735,6 +741,13 @@ class SqlZenStore(BaseZenStore):
                 perform additional filtering). The callable should take a
                 `Session`, a `Select` query and a `BaseFilterModel` filter as
                 arguments and return a `List` of items.
+            custom_bulk_schema_to_model_conversion: Callable to convert all
+                schemas of a page into models at once. This is used if
+                additional data needs to be fetched for each item, which can
+                be done more efficiently for the entire page than for each
+                item separately. The callable should take a `Session` and a
+                `List` of schemas as arguments and return a `List` of models
+                in the same order.
 
         Returns:
             The Domain Model representation of the DB resource
@@ -746,70 +759,102 @@ class SqlZenStore(BaseZenStore):
         query = filter_model.apply_filter(query=query, table=table)
 
         # Get the total amount of items in the database for a given query
-        if custom_fetch:
-            total = len(custom_fetch(session, query, filter_model))
-        else:
-            total = session.scalar(
-                select([func.count("*")]).select_from(
-                    query.options(noload("*")).subquery()
+        total: Optional[int] = None
+        if filter_model.count:
+            if custom_fetch:
+                total = len(custom_fetch(session, query, filter_model))
+            else:
+                total = session.scalar(
+                    select([func.count("*")]).select_from(
+                        query.options(noload("*")).subquery()
+                    )
                 )
-            )
 
-        # Sorting
+        # Sorting. The ID is used as a tie-breaker so that the order is
+        # deterministic, which is required for cursor-based pagination.
         column, operand = filter_model.sorting_params
+        sort_column = getattr(table, column)
         if operand == SorterOps.DESCENDING:
-            query = query.order_by(desc(getattr(table, column)))
+            query = query.order_by(desc(sort_column), desc(table.id))
         else:
-            query = query.order_by(asc(getattr(table, column)))
+            query = query.order_by(asc(sort_column), asc(table.id))
 
         # Get the total amount of pages in the database for a given query
-        if total == 0:
-            total_pages = 1
-        else:
-            total_pages = math.ceil(total / filter_model.size)
+        total_pages: Optional[int] = None
+        if total is not None:
+            if total == 0:
+                total_pages = 1
+            else:
+                total_pages = math.ceil(total / filter_model.size)
 
-        if filter_model.page > total_pages:
-            raise ValueError(
-                f"Invalid page {filter_model.page}. The requested page size is "
-                f"{filter_model.size} and there are a total of {total} items "
-                f"for this query. The maximum page value therefore is "
-                f"{total_pages}."
+            if filter_model.cursor is None and filter_model.page > total_pages:
+                raise ValueError(
+                    f"Invalid page {filter_model.page}. The requested page "
+                    f"size is {filter_model.size} and there are a total of "
+                    f"{total} items for this query. The maximum page value "
+                    f"therefore is {total_pages}."
+                )
+
+        # Continue after the last item of the previous page if a cursor is
+        # given instead of skipping all previous pages with an offset.
+        offset = filter_model.offset
+        if filter_model.cursor is not None:
+            query = query.where(
+                cls._get_cursor_condition(
+                    table=table,
+                    column=column,
+                    operand=operand,
+                    cursor=filter_model.cursor,
+                )
             )
+            offset = 0
 
-        # Get a page of the actual data
+        # Get a page of the actual data. We fetch one additional item to
+        # find out whether there are more items after this page.
         item_schemas: List[AnySchema]
         if custom_fetch:
             item_schemas = custom_fetch(session, query, filter_model)
             # select the items in the current page
             item_schemas = item_schemas[
-                filter_model.offset : filter_model.offset + filter_model.size
+                offset : offset + filter_model.size + 1
             ]
         else:
             item_schemas = (
-                session.exec(
-                    query.limit(filter_model.size).offset(filter_model.offset)
-                )
+                session.exec(query.limit(filter_model.size + 1).offset(offset))
                 .unique()
                 .all()
             )
 
+        next_cursor: Optional[str] = None
+        if len(item_schemas) > filter_model.size:
+            item_schemas = item_schemas[: filter_model.size]
+            last_item = item_schemas[-1]
+            next_cursor = cls._encode_cursor(
+                value=getattr(last_item, column), id_=last_item.id
+            )
+
         # Convert this page of items from schemas to models.
         items: List[B] = []
-        for schema in item_schemas:
-            # If a custom conversion function is provided, use it.
-            if custom_schema_to_model_conversion:
-                items.append(custom_schema_to_model_conversion(schema))
-                continue
-            # Otherwise, try to use the `to_model` method of the schema.
-            to_model = getattr(schema, "to_model", None)
-            if callable(to_model):
-                items.append(to_model())
-                continue
-            # If neither of the above work, raise an error.
-            raise RuntimeError(
-                f"Cannot convert schema `{schema.__class__.__name__}` to model "
-                "since it does not have a `to_model` method."
+        if custom_bulk_schema_to_model_conversion:
+            items = custom_bulk_schema_to_model_conversion(
+                session, item_schemas
             )
+        else:
+            for schema in item_schemas:
+                # If a custom conversion function is provided, use it.
+                if custom_schema_to_model_conversion:
+                    items.append(custom_schema_to_model_conversion(schema))
+                    continue
+                # Otherwise, try to use the `to_model` method of the schema.
+                to_model = getattr(schema, "to_model", None)
+                if callable(to_model):
+                    items.append(to_model())
+                    continue
+                # If neither of the above work, raise an error.
+                raise RuntimeError(
+                    f"Cannot convert schema `{schema.__class__.__name__}` to model "
+                    "since it does not have a `to_model` method."
+                )
 
         return Page(
             total=total,
@@ -817,8 +862,81 @@ class SqlZenStore(BaseZenStore):
             items=items,
             index=filter_model.page,
             max_size=filter_model.size,
+            next_cursor=next_cursor,
         )
 
+    @staticmethod
+    def _encode_cursor(value: Any, id_: UUID) -> str:
+        """Encodes the position of an item in a sorted list as a cursor.
+
+        Args:
+            value: The value of the sort column of the item.
+            id_: The ID of the item.
+
+        Returns:
+            The opaque cursor string.
+        """
+        payload = json.dumps([value, id_], default=pydantic_encoder)
+        return base64.urlsafe_b64encode(payload.encode()).decode()
+
+    @staticmethod
+    def _get_cursor_condition(
+        table: Type[AnySchema],
+        column: str,
+        operand: SorterOps,
+        cursor: str,
+    ) -> Any:
+        """Builds the condition that selects all items after a cursor.
+
+        Args:
+            table: The table that is queried.
+            column: The name of the sort column.
+            operand: The sorting operand.
+            cursor: The cursor pointing to the last item of the previous page.
+
+        Returns:
+            The SQL condition selecting all items after the cursor.
+
+        Raises:
+            ValueError: If the cursor is invalid.
+        """
+        try:
+            raw_value, raw_id = json.loads(
+                base64.urlsafe_b64decode(cursor.encode())
+            )
+            value = (
+                None
+                if raw_value is None
+                else parse_obj_as(
+                    table.__fields__[column].outer_type_, raw_value
+                )
+            )
+            id_ = UUID(raw_id)
+        except Exception as e:
+            raise ValueError(f"Invalid pagination cursor `{cursor}`: {e}")
+
+        sort_column = getattr(table, column)
+        # Both SQLite and MySQL sort NULL values first in ascending and last
+        # in descending order.
+        if operand == SorterOps.DESCENDING:
+            if value is None:
+                return and_(sort_column.is_(None), table.id < id_)
+            return or_(
+                sort_column < value,
+                and_(sort_column == value, table.id < id_),
+                sort_column.is_(None),
+            )
+        else:
+            if value is None:
+                return or_(
+                    and_(sort_column.is_(None), table.id > id_),
+                    sort_column.isnot(None),
+                )
+            return or_(
+                sort_column > value,
+                and_(sort_column == value, table.id > id_),
+            )
+
     # ====================================
     # ZenML Store interface implementation
     # ====================================
@@ -3496,10 +3614,80 @@ class SqlZenStore(BaseZenStore):
                     session=session,
                 )
 
+            num_running, num_failed = self._get_step_status_counts(
+                step_run.status
+            )
+            self._update_pipeline_run_step_counts(
+                pipeline_run_id=step_run.pipeline_run_id,
+                session=session,
+                num_created_steps=1,
+                num_running_steps=num_running,
+                num_failed_steps=num_failed,
+            )
+
             session.commit()
 
             return self._run_step_schema_to_model(step_schema)
 
+    @staticmethod
+    def _get_step_status_counts(status: ExecutionStatus) -> Tuple[int, int]:
+        """Gets the contribution of a step status to the run step counts.
+
+        Args:
+            status: The status of the step run.
+
+        Returns:
+            The number of running and failed steps the status accounts for.
+        """
+        return (
+            int(status == ExecutionStatus.RUNNING),
+            int(status == ExecutionStatus.FAILED),
+        )
+
+    @staticmethod
+    def _update_pipeline_run_step_counts(
+        pipeline_run_id: UUID,
+        session: Session,
+        num_created_steps: int = 0,
+        num_running_steps: int = 0,
+        num_failed_steps: int = 0,
+    ) -> None:
+        """Updates the step counts of a pipeline run and derives its status.
+
+        The counts are incremented in a single `UPDATE` statement so that
+        concurrent updates of steps of the same run don't overwrite each
+        other.
+
+        Args:
+            pipeline_run_id: The ID of the pipeline run.
+            session: The database session to use.
+            num_created_steps: Change of the number of created steps.
+            num_running_steps: Change of the number of running steps.
+            num_failed_steps: Change of the number of failed steps.
+        """
+        if not (num_created_steps or num_running_steps or num_failed_steps):
+            return
+
+        session.execute(
+            update(PipelineRunSchema)
+            .where(PipelineRunSchema.id == pipeline_run_id)
+            .values(
+                num_created_steps=PipelineRunSchema.num_created_steps
+                + num_created_steps,
+                num_running_steps=PipelineRunSchema.num_running_steps
+                + num_running_steps,
+                num_failed_steps=PipelineRunSchema.num_failed_steps
+                + num_failed_steps,
+            )
+        )
+        run = session.exec(
+            select(PipelineRunSchema)
+            .where(PipelineRunSchema.id == pipeline_run_id)
+            .execution_options(populate_existing=True)
+        ).one()
+        run.update_status_from_step_counts()
+        session.add(run)
+
     def _set_run_step_parent_step(
         self, child_id: UUID, parent_id: UUID, session: Session
     ) -> None:
@@ -3689,53 +3877,114 @@ class SqlZenStore(BaseZenStore):
             The run step model.
         """
         with Session(self.engine) as session:
-            # Get parent steps.
-            parent_steps = session.exec(
-                select(StepRunSchema)
-                .where(StepRunParentsSchema.child_id == step_run.id)
-                .where(StepRunParentsSchema.parent_id == StepRunSchema.id)
-            ).all()
-            parent_step_ids = [parent_step.id for parent_step in parent_steps]
+            return self._run_step_schemas_to_models(
+                session=session, step_runs=[step_run]
+            )[0]
 
-            # Get input artifacts.
-            input_artifact_list = session.exec(
-                select(
-                    ArtifactSchema,
-                    StepRunInputArtifactSchema.name,
-                )
-                .where(
-                    ArtifactSchema.id == StepRunInputArtifactSchema.artifact_id
-                )
-                .where(StepRunInputArtifactSchema.step_id == step_run.id)
-            ).all()
-            input_artifacts = {
-                input_name: self._artifact_schema_to_model(artifact)
-                for (artifact, input_name) in input_artifact_list
-            }
+    def _run_step_schemas_to_models(
+        self, session: Session, step_runs: List[StepRunSchema]
+    ) -> List[StepRunResponseModel]:
+        """Converts multiple run step schemas to step models.
 
-            # Get output artifacts.
-            output_artifact_list = session.exec(
-                select(
-                    ArtifactSchema,
-                    StepRunOutputArtifactSchema.name,
+        The parent steps and input/output artifacts of all step runs are
+        fetched in a constant number of queries instead of separately for
+        each step run.
+
+        Args:
+            session: The database session to use.
+            step_runs: The run step schemas to convert.
+
+        Returns:
+            The run step models in the same order as the given schemas.
+        """
+        step_run_ids = [step_run.id for step_run in step_runs]
+        if not step_run_ids:
+            return []
+
+        # Get parent steps.
+        parent_step_ids: Dict[UUID, List[UUID]] = defaultdict(list)
+        parent_links = session.exec(
+            select(StepRunParentsSchema).where(
+                StepRunParentsSchema.child_id.in_(  # type: ignore[attr-defined]
+                    step_run_ids
                 )
-                .where(
-                    ArtifactSchema.id
-                    == StepRunOutputArtifactSchema.artifact_id
+            )
+        ).all()
+        for parent_link in parent_links:
+            parent_step_ids[parent_link.child_id].append(parent_link.parent_id)
+
+        # Get input artifacts.
+        input_artifact_list = session.exec(
+            select(
+                StepRunInputArtifactSchema.step_id,
+                StepRunInputArtifactSchema.name,
+                ArtifactSchema,
+            )
+            .where(ArtifactSchema.id == StepRunInputArtifactSchema.artifact_id)
+            .where(
+                StepRunInputArtifactSchema.step_id.in_(  # type: ignore[attr-defined]
+                    step_run_ids
                 )
-                .where(StepRunOutputArtifactSchema.step_id == step_run.id)
-            ).all()
-            output_artifacts = {
-                output_name: self._artifact_schema_to_model(artifact)
-                for (artifact, output_name) in output_artifact_list
-            }
+            )
+            .options(
+                selectinload(ArtifactSchema.run_metadata),
+                selectinload(ArtifactSchema.visualizations),
+            )
+        ).all()
+
+        # Get output artifacts.
+        output_artifact_list = session.exec(
+            select(
+                StepRunOutputArtifactSchema.step_id,
+                StepRunOutputArtifactSchema.name,
+                ArtifactSchema,
+            )
+            .where(
+                ArtifactSchema.id == StepRunOutputArtifactSchema.artifact_id
+            )
+            .where(
+                StepRunOutputArtifactSchema.step_id.in_(  # type: ignore[attr-defined]
+                    step_run_ids
+                )
+            )
+            .options(
+                selectinload(ArtifactSchema.run_metadata),
+                selectinload(ArtifactSchema.visualizations),
+            )
+        ).all()
 
-            # Convert to model.
-            return step_run.to_model(
-                parent_step_ids=parent_step_ids,
-                input_artifacts=input_artifacts,
-                output_artifacts=output_artifacts,
+        artifact_models = self._artifact_schemas_to_models(
+            session=session,
+            artifact_schemas=[
+                artifact
+                for _, _, artifact in input_artifact_list
+                + output_artifact_list
+            ],
+        )
+        input_artifacts: Dict[
+            UUID, Dict[str, ArtifactResponseModel]
+        ] = defaultdict(dict)
+        for step_run_id, input_name, artifact in input_artifact_list:
+            input_artifacts[step_run_id][input_name] = artifact_models[
+                artifact.id
+            ]
+        output_artifacts: Dict[
+            UUID, Dict[str, ArtifactResponseModel]
+        ] = defaultdict(dict)
+        for step_run_id, output_name, artifact in output_artifact_list:
+            output_artifacts[step_run_id][output_name] = artifact_models[
+                artifact.id
+            ]
+
+        # Convert to models.
+        return [
+            step_run.to_model(
+                parent_step_ids=parent_step_ids[step_run.id],
+                input_artifacts=input_artifacts[step_run.id],
+                output_artifacts=output_artifacts[step_run.id],
             )
+            for step_run in step_runs
+        ]
 
     def list_run_steps(
         self, step_run_filter_model: StepRunFilterModel
@@ -3750,14 +3999,103 @@ class SqlZenStore(BaseZenStore):
             A list of all step runs matching the filter criteria.
         """
         with Session(self.engine) as session:
-            query = select(StepRunSchema)
+            query = select(StepRunSchema).options(
+                selectinload(StepRunSchema.run_metadata)
+            )
             return self.filter_and_paginate(
                 session=session,
                 query=query,
                 table=StepRunSchema,
                 filter_model=step_run_filter_model,
-                custom_schema_to_model_conversion=self._run_step_schema_to_model,
+                custom_bulk_schema_to_model_conversion=self._run_step_schemas_to_models,
+            )
+
+    def get_run_step_output_artifact_ids(
+        self, run_id: UUID, step_names: List[str]
+    ) -> Dict[str, StepRunOutputArtifactsModel]:
+        """Get the output artifact IDs of steps of a pipeline run.
+
+        Args:
+            run_id: The ID of the pipeline run.
+            step_names: The names of the steps for which to get the outputs.
+
+        Returns:
+            The output artifact IDs of all existing steps of the run with one
+            of the given names, keyed by step name.
+        """
+        if not step_names:
+            return {}
+
+        with Session(self.engine) as session:
+            rows = session.exec(
+                select(
+                    StepRunSchema.id,
+                    StepRunSchema.name,
+                    StepRunOutputArtifactSchema.name,
+                    StepRunOutputArtifactSchema.artifact_id,
+                )
+                .select_from(StepRunSchema)
+                .outerjoin(
+                    StepRunOutputArtifactSchema,
+                    StepRunOutputArtifactSchema.step_id == StepRunSchema.id,
+                )
+                .where(StepRunSchema.pipeline_run_id == run_id)
+                .where(
+                    StepRunSchema.name.in_(  # type: ignore[attr-defined]
+                        set(step_names)
+                    )
+                )
+            ).all()
+
+        outputs: Dict[str, StepRunOutputArtifactsModel] = {}
+        for step_run_id, step_name, output_name, artifact_id in rows:
+            step_outputs = outputs.setdefault(
+                step_name,
+                StepRunOutputArtifactsModel(step_run_id=step_run_id),
             )
+            if output_name is not None:
+                step_outputs.output_artifact_ids[output_name] = artifact_id
+
+        return outputs
+
+    def get_cached_run_step_outputs(
+        self, workspace_id: UUID, cache_key: str
+    ) -> Optional[StepRunOutputArtifactsModel]:
+        """Get the outputs of the latest successful step run with a cache key.
+
+        Args:
+            workspace_id: The ID of the workspace in which to look for step
+                runs.
+            cache_key: The cache key of the step run.
+
+        Returns:
+            The step run ID and output artifact IDs of the latest completed
+            step run with the given cache key, or `None` if no such step run
+            exists.
+        """
+        with Session(self.engine) as session:
+            step_run_id = session.exec(
+                select(StepRunSchema.id)
+                .where(StepRunSchema.cache_key == cache_key)
+                .where(StepRunSchema.workspace_id == workspace_id)
+                .where(StepRunSchema.status == ExecutionStatus.COMPLETED)
+                .order_by(desc(StepRunSchema.created))
+                .limit(1)
+            ).first()
+            if step_run_id is None:
+                return None
+
+            output_artifacts = session.exec(
+                select(
+                    StepRunOutputArtifactSchema.name,
+                    StepRunOutputArtifactSchema.artifact_id,
+                ).where(StepRunOutputArtifactSchema.step_id == step_run_id)
+            ).all()
+
+        return StepRunOutputArtifactsModel(
+            step_run_id=step_run_id,
+            output_artifact_ids=dict(output_artifacts),
+        )
 
     def update_run_step(
         self,
@@ -3788,6 +4126,7 @@ class SqlZenStore(BaseZenStore):
                 )
 
             # Update the step
+            old_status = existing_step_run.status
             existing_step_run.update(step_run_update)
             session.add(existing_step_run)
 
@@ -3803,6 +4142,22 @@ class SqlZenStore(BaseZenStore):
             # Input artifacts and parent steps cannot be updated after the
             # step has been created.
 
+            # Update the status of the pipeline run in the same transaction
+            # if the step status changed, e.g. because the step finished.
+            if existing_step_run.status != old_status:
+                old_running, old_failed = self._get_step_status_counts(
+                    old_status
+                )
+                new_running, new_failed = self._get_step_status_counts(
+                    existing_step_run.status
+                )
+                self._update_pipeline_run_step_counts(
+                    pipeline_run_id=existing_step_run.pipeline_run_id,
+                    session=session,
+                    num_running_steps=new_running - old_running,
+                    num_failed_steps=new_failed - old_failed,
+                )
+
             session.commit()
             session.refresh(existing_step_run)
 
@@ -3839,6 +4194,43 @@ class SqlZenStore(BaseZenStore):
             session.commit()
             return self._artifact_schema_to_model(artifact_schema)
 
+    def create_artifacts_batch(
+        self, artifacts: List[ArtifactRequestModel]
+    ) -> List[ArtifactResponseModel]:
+        """Creates multiple artifacts in a single transaction.
+
+        Args:
+            artifacts: The artifacts to create.
+
+        Returns:
+            The created artifacts, in the same order as the requests.
+        """
+        if not artifacts:
+            return []
+
+        with Session(self.engine) as session:
+            artifact_schemas = []
+            for artifact in artifacts:
+                artifact_schema = ArtifactSchema.from_request(artifact)
+                session.add(artifact_schema)
+                artifact_schemas.append(artifact_schema)
+
+                for vis in artifact.visualizations or []:
+                    session.add(
+                        ArtifactVisualizationSchema.from_model(
+                            visualization=vis, artifact_id=artifact_schema.id
+                        )
+                    )
+
+            session.flush()
+            # Convert before committing, as the commit expires all schemas
+            # which would otherwise be refreshed one by one.
+            models = self._artifact_schemas_to_list_of_models(
+                session=session, artifact_schemas=artifact_schemas
+            )
+            session.commit()
+            return models
+
     def _artifact_schema_to_model(
         self, artifact_schema: ArtifactSchema
     ) -> ArtifactResponseModel:
@@ -3850,22 +4242,71 @@ class SqlZenStore(BaseZenStore):
         Returns:
             The converted artifact model.
         """
-        # Find the producer step run ID.
         with Session(self.engine) as session:
-            producer_step_run_id = session.exec(
-                select(StepRunOutputArtifactSchema.step_id)
-                .where(
-                    StepRunOutputArtifactSchema.artifact_id
-                    == artifact_schema.id
-                )
-                .where(StepRunOutputArtifactSchema.step_id == StepRunSchema.id)
-                .where(StepRunSchema.status != ExecutionStatus.CACHED)
-            ).first()
+            return self._artifact_schemas_to_models(
+                session=session, artifact_schemas=[artifact_schema]
+            )[artifact_schema.id]
+
+    def _artifact_schemas_to_models(
+        self, session: Session, artifact_schemas: List[ArtifactSchema]
+    ) -> Dict[UUID, ArtifactResponseModel]:
+        """Converts multiple artifact schemas to models.
+
+        The producer step runs of all artifacts are fetched in a single query.
+
+        Args:
+            session: The database session to use.
+            artifact_schemas: The artifact schemas to convert.
 
-            # Convert the artifact schema to a model.
-            return artifact_schema.to_model(
-                producer_step_run_id=producer_step_run_id
+        Returns:
+            A dictionary mapping the artifact IDs to the converted models.
+        """
+        artifact_ids = {artifact.id for artifact in artifact_schemas}
+        if not artifact_ids:
+            return {}
+
+        # Find the producer step run IDs.
+        producer_step_run_ids: Dict[UUID, UUID] = {}
+        producer_links = session.exec(
+            select(
+                StepRunOutputArtifactSchema.artifact_id,
+                StepRunOutputArtifactSchema.step_id,
+            )
+            .where(
+                StepRunOutputArtifactSchema.artifact_id.in_(  # type: ignore[attr-defined]
+                    artifact_ids
+                )
+            )
+            .where(StepRunOutputArtifactSchema.step_id == StepRunSchema.id)
+            .where(StepRunSchema.status != ExecutionStatus.CACHED)
+        ).all()
+        for artifact_id, step_run_id in producer_links:
+            producer_step_run_ids.setdefault(artifact_id, step_run_id)
+
+        # Convert the artifact schemas to models.
+        return {
+            artifact.id: artifact.to_model(
+                producer_step_run_id=producer_step_run_ids.get(artifact.id)
             )
+            for artifact in artifact_schemas
+        }
+
+    def _artifact_schemas_to_list_of_models(
+        self, session: Session, artifact_schemas: List[ArtifactSchema]
+    ) -> List[ArtifactResponseModel]:
+        """Converts multiple artifact schemas to a list of models.
+
+        Args:
+            session: The database session to use.
+            artifact_schemas: The artifact schemas to convert.
+
+        Returns:
+            The artifact models in the same order as the given schemas.
+        """
+        artifact_models = self._artifact_schemas_to_models(
+            session=session, artifact_schemas=artifact_schemas
+        )
+        return [artifact_models[artifact.id] for artifact in artifact_schemas]
 
     def get_artifact(self, artifact_id: UUID) -> ArtifactResponseModel:
         """Gets an artifact.
@@ -3890,6 +4331,34 @@ class SqlZenStore(BaseZenStore):
                 )
             return self._artifact_schema_to_model(artifact)
 
+    def get_artifacts_batch(
+        self, artifact_ids: List[UUID]
+    ) -> Dict[UUID, ArtifactResponseModel]:
+        """Gets multiple artifacts in a single request.
+
+        Args:
+            artifact_ids: The IDs of the artifacts to get.
+
+        Returns:
+            All existing artifacts with one of the given IDs, keyed by ID.
+        """
+        if not artifact_ids:
+            return {}
+
+        with Session(self.engine) as session:
+            artifact_schemas = session.exec(
+                select(ArtifactSchema).where(
+                    ArtifactSchema.id.in_(  # type: ignore[attr-defined]
+                        set(artifact_ids)
+                    )
+                )
+            ).all()
+            artifact_models = self._artifact_schemas_to_list_of_models(
+                session=session, artifact_schemas=list(artifact_schemas)
+            )
+
+        return {artifact.id: artifact for artifact in artifact_models}
+
     def list_artifacts(
         self, artifact_filter_model: ArtifactFilterModel
     ) -> Page[ArtifactResponseModel]:
@@ -3920,7 +4389,7 @@ class SqlZenStore(BaseZenStore):
                 query=query,
                 table=ArtifactSchema,
                 filter_model=artifact_filter_model,
-                custom_schema_to_model_conversion=self._artifact_schema_to_model,
+                custom_bulk_schema_to_model_conversion=self._artifact_schemas_to_list_of_models,
             )
 
     def delete_artifact(self, artifact_id: UUID) -> None:
@@ -3965,6 +4434,33 @@ class SqlZenStore(BaseZenStore):
             session.commit()
             return run_metadata_schema.to_model()
 
+    def create_run_metadata_batch(
+        self, run_metadata: List[RunMetadataRequestModel]
+    ) -> List[RunMetadataResponseModel]:
+        """Creates multiple run metadata entries in a single transaction.
+
+        Args:
+            run_metadata: The run metadata to create.
+
+        Returns:
+            The created run metadata, in the same order as the requests.
+        """
+        if not run_metadata:
+            return []
+
+        with Session(self.engine) as session:
+            run_metadata_schemas = [
+                RunMetadataSchema.from_request(request)
+                for request in run_metadata
+            ]
+            session.add_all(run_metadata_schemas)
+            session.flush()
+            # Convert before committing, as the commit expires all schemas
+            # which would otherwise be refreshed one by one.
+            models = [schema.to_model() for schema in run_metadata_schemas]
+            session.commit()
+            return models
+
     def list_run_metadata(
         self,
         run_metadata_filter_model: RunMetadataFilterModel,
@@ -13,7 +13,7 @@
 #  permissions and limitations under the License.
 """ZenML Store interface."""
 from abc import ABC, abstractmethod
-from typing import List, Optional, Tuple, Union
+from typing import Dict, List, Optional, Tuple, Union
 from uuid import UUID
 
 from zenml.models import (
@@ -65,6 +65,7 @@ from zenml.models import (
     StackResponseModel,
     StackUpdateModel,
     StepRunFilterModel,
+    StepRunOutputArtifactsModel,
     StepRunRequestModel,
     StepRunResponseModel,
     StepRunUpdateModel,
@@ -1265,6 +1266,42 @@ class ZenStoreInterface(ABC):
             A list of all step runs matching the filter criteria.
         """
 
+    @abstractmethod
+    def get_run_step_output_artifact_ids(
+        self, run_id: UUID, step_names: List[str]
+    ) -> Dict[str, StepRunOutputArtifactsModel]:
+        """Get the output artifact IDs of steps of a pipeline run.
+
+        Unlike `list_run_steps`, this only fetches the step run and output
+        artifact IDs, which makes it cheap to call for each step launch even
+        if the run contains many steps.
+
+        Args:
+            run_id: The ID of the pipeline run.
+            step_names: The names of the steps for which to get the outputs.
+
+        Returns:
+            The output artifact IDs of all existing steps of the run with one
+            of the given names, keyed by step name.
+        """
+
+    @abstractmethod
+    def get_cached_run_step_outputs(
+        self, workspace_id: UUID, cache_key: str
+    ) -> Optional[StepRunOutputArtifactsModel]:
+        """Get the outputs of the latest successful step run with a cache key.
+
+        Args:
+            workspace_id: The ID of the workspace in which to look for step
+                runs.
+            cache_key: The cache key of the step run.
+
+        Returns:
+            The step run ID and output artifact IDs of the latest completed
+            step run with the given cache key, or `None` if no such step run
+            exists.
+        """
+
     @abstractmethod
     def update_run_step(
         self,
@@ -1301,6 +1338,19 @@ class ZenStoreInterface(ABC):
             The created artifact.
         """
 
+    @abstractmethod
+    def create_artifacts_batch(
+        self, artifacts: List[ArtifactRequestModel]
+    ) -> List[ArtifactResponseModel]:
+        """Creates multiple artifacts in a single transaction.
+
+        Args:
+            artifacts: The artifacts to create.
+
+        Returns:
+            The created artifacts, in the same order as the requests.
+        """
+
     @abstractmethod
     def get_artifact(self, artifact_id: UUID) -> ArtifactResponseModel:
         """Gets an artifact.
@@ -1315,6 +1365,19 @@ class ZenStoreInterface(ABC):
             KeyError: if the artifact doesn't exist.
         """
 
+    @abstractmethod
+    def get_artifacts_batch(
+        self, artifact_ids: List[UUID]
+    ) -> Dict[UUID, ArtifactResponseModel]:
+        """Gets multiple artifacts in a single request.
+
+        Args:
+            artifact_ids: The IDs of the artifacts to get.
+
+        Returns:
+            All existing artifacts with one of the given IDs, keyed by ID.
+        """
+
     @abstractmethod
     def list_artifacts(
         self, artifact_filter_model: ArtifactFilterModel
@@ -1357,6 +1420,19 @@ class ZenStoreInterface(ABC):
             The created run metadata.
         """
 
+    @abstractmethod
+    def create_run_metadata_batch(
+        self, run_metadata: List[RunMetadataRequestModel]
+    ) -> List[RunMetadataResponseModel]:
+        """Creates multiple run metadata entries in a single transaction.
+
+        Args:
+            run_metadata: The run metadata to create.
+
+        Returns:
+            The created run metadata, in the same order as the requests.
+        """
+
     @abstractmethod
     def list_run_metadata(
         self,
@@ -41,6 +41,7 @@ from zenml.models import (
     PipelineBuildRequestModel,
     PipelineDeploymentRequestModel,
     PipelineRequestModel,
+    RunMetadataRequestModel,
     StackResponseModel,
 )
 from zenml.utils import io_utils
@@ -301,6 +302,33 @@ def test_updating_a_stack_with_new_component_succeeds(clean_client):
     assert active_artifact_store == old_artifact_store
 
 
+def test_active_stack_is_cached_until_it_is_updated(clean_client, mocker):
+    """Tests that the active stack model is only fetched once until it is
+    updated and that stack instances are not shared."""
+    stack = _create_local_stack(
+        client=clean_client, stack_name="some_new_stack_name"
+    )
+    clean_client.activate_stack(stack.id)
+    get_stack_spy = mocker.spy(type(clean_client.zen_store), "get_stack")
+
+    active_stack = clean_client.active_stack
+    other_active_stack = clean_client.active_stack
+    assert other_active_stack is not active_stack
+    assert other_active_stack.id == active_stack.id
+    assert get_stack_spy.call_count == 1
+
+    orchestrator = _create_local_orchestrator(
+        client=clean_client, orchestrator_name="different_orchestrator"
+    )
+    clean_client.update_stack(
+        name_id_or_prefix=stack.id,
+        component_updates={
+            StackComponentType.ORCHESTRATOR: [str(orchestrator.id)],
+        },
+    )
+    assert clean_client.active_stack.orchestrator.id == orchestrator.id
+
+
 def test_renaming_stack_with_update_method_succeeds(clean_client):
     """Tests that renaming a stack with the update method succeeds."""
     stack = _create_local_stack(
@@ -680,6 +708,51 @@ def test_create_run_metadata_for_artifact(clean_client_with_run):
     assert len(registered_metadata) == len(existing_metadata) + 1
 
 
+def test_create_run_metadata_batch(clean_client_with_run):
+    """Test creating metadata for multiple keys and entities at once."""
+    pipeline_run = clean_client_with_run.list_runs()[0]
+    step_run = clean_client_with_run.list_run_steps()[0]
+
+    new_metadata = clean_client_with_run.create_run_metadata(
+        metadata={"axel": "is awesome", "aria": "is also awesome"},
+        pipeline_run_id=pipeline_run.id,
+    )
+    assert set(new_metadata) == {"axel", "aria"}
+    assert new_metadata["aria"].value == "is also awesome"
+
+    requests = [
+        RunMetadataRequestModel(
+            workspace=clean_client_with_run.active_workspace.id,
+            user=clean_client_with_run.active_user.id,
+            key="batch_key",
+            value=str(i),
+            type=MetadataTypeEnum.STRING,
+            **entity,
+        )
+        for i, entity in enumerate(
+            [
+                {"pipeline_run_id": pipeline_run.id},
+                {"step_run_id": step_run.id},
+            ]
+        )
+    ]
+    created = clean_client_with_run.zen_store.create_run_metadata_batch(
+        requests
+    )
+    assert [metadata.value for metadata in created] == ["0", "1"]
+    assert created[0].pipeline_run_id == pipeline_run.id
+    assert created[1].step_run_id == step_run.id
+    assert (
+        len(
+            clean_client_with_run.list_run_metadata(
+                key="batch_key", step_run_id=step_run.id
+            )
+        )
+        == 1
+    )
+    assert clean_client_with_run.zen_store.create_run_metadata_batch([]) == []
+
+
 def test_create_run_metadata_fails_if_not_linked_to_any_entity(
     clean_client_with_run,
 ):
@@ -38,7 +38,14 @@ from tests.unit.pipelines.test_build_utils import (
     StubLocalRepositoryContext,
 )
 from zenml.client import Client
-from zenml.enums import SecretScope, StackComponentType, StoreType
+from zenml.enums import (
+    ArtifactType,
+    ExecutionStatus,
+    SecretScope,
+    StackComponentType,
+    StoreType,
+    VisualizationType,
+)
 from zenml.exceptions import (
     EntityExistsError,
     IllegalOperationError,
@@ -46,6 +53,7 @@ from zenml.exceptions import (
 )
 from zenml.models import (
     ArtifactFilterModel,
+    ArtifactRequestModel,
     ComponentFilterModel,
     ComponentUpdateModel,
     PipelineRunFilterModel,
@@ -58,6 +66,7 @@ from zenml.models import (
     StackRequestModel,
     StackUpdateModel,
     StepRunFilterModel,
+    StepRunUpdateModel,
     TeamRoleAssignmentRequestModel,
     TeamUpdateModel,
     UserRoleAssignmentRequestModel,
@@ -69,6 +78,7 @@ from zenml.models.base_models import (
     WorkspaceScopedRequestModel,
 )
 from zenml.models.flavor_models import FlavorBaseModel
+from zenml.models.visualization_models import VisualizationModel
 from zenml.utils import code_repository_utils, source_utils
 from zenml.zen_stores.base_zen_store import (
     DEFAULT_ADMIN_ROLE,
@@ -1060,6 +1070,41 @@ def test_deleting_run_deletes_steps():
         )
 
 
+def test_run_status_is_derived_from_step_runs():
+    """Tests that step run updates update the status of the pipeline run."""
+    client = Client()
+    store = client.zen_store
+
+    with PipelineRunContext(1) as runs:
+        run = store.get_run(runs[0].id)
+        assert run.status == ExecutionStatus.COMPLETED
+        assert run.end_time is not None
+
+        steps = store.list_run_steps(
+            StepRunFilterModel(pipeline_run_id=run.id)
+        ).items
+
+        store.update_run_step(
+            step_run_id=steps[0].id,
+            step_run_update=StepRunUpdateModel(status=ExecutionStatus.RUNNING),
+        )
+        assert store.get_run(run.id).status == ExecutionStatus.RUNNING
+
+        store.update_run_step(
+            step_run_id=steps[0].id,
+            step_run_update=StepRunUpdateModel(status=ExecutionStatus.FAILED),
+        )
+        assert store.get_run(run.id).status == ExecutionStatus.FAILED
+
+        store.update_run_step(
+            step_run_id=steps[0].id,
+            step_run_update=StepRunUpdateModel(
+                status=ExecutionStatus.COMPLETED
+            ),
+        )
+        assert store.get_run(run.id).status == ExecutionStatus.COMPLETED
+
+
 # .--------------------.
 # | Pipeline run steps |
 # '--------------------'
@@ -1090,6 +1135,61 @@ def test_get_run_step_inputs_succeeds():
             assert len(run_step_inputs) == 1
 
 
+def test_list_run_steps_hydrates_steps():
+    """Tests that listing run steps returns fully hydrated step runs."""
+    client = Client()
+    store = client.zen_store
+
+    with PipelineRunContext(2) as runs:
+        for run in runs:
+            steps = store.list_run_steps(
+                StepRunFilterModel(pipeline_run_id=run.id)
+            ).items
+            assert len(steps) == 2
+            for step in steps:
+                fetched_step = store.get_run_step(step.id)
+                assert step.parent_step_ids == fetched_step.parent_step_ids
+                assert step.input_artifacts == fetched_step.input_artifacts
+                assert step.output_artifacts == fetched_step.output_artifacts
+
+            step_2 = next(step for step in steps if step.name == "step_2")
+            step_1 = next(step for step in steps if step.name == "step_1")
+            assert step_2.parent_step_ids == [step_1.id]
+            assert len(step_2.input_artifacts) == 1
+
+
+def test_get_run_step_output_artifact_ids():
+    """Tests fetching the output artifact IDs of steps of a run."""
+    client = Client()
+    store = client.zen_store
+
+    with PipelineRunContext(1) as runs:
+        run = runs[0]
+        steps = {
+            step.name: step
+            for step in store.list_run_steps(
+                StepRunFilterModel(pipeline_run_id=run.id)
+            ).items
+        }
+
+        outputs = store.get_run_step_output_artifact_ids(
+            run_id=run.id, step_names=["step_1", "non_existent"]
+        )
+        assert set(outputs) == {"step_1"}
+        assert outputs["step_1"].step_run_id == steps["step_1"].id
+        assert outputs["step_1"].output_artifact_ids == {
+            name: artifact.id
+            for name, artifact in steps["step_1"].output_artifacts.items()
+        }
+
+        assert (
+            store.get_run_step_output_artifact_ids(
+                run_id=run.id, step_names=[]
+            )
+            == {}
+        )
+
+
 # .-----------.
 # | Artifacts |
 # '-----------'
@@ -1113,6 +1213,94 @@ def test_list_unused_artifacts():
         assert artifacts.total == num_unused_artifacts_before
 
 
+@pytest.mark.parametrize("sort_by", ["created", "desc:created", "desc:name"])
+def test_list_artifacts_with_cursor(sort_by):
+    """Tests that cursor pagination returns the same items as offset paging."""
+    client = Client()
+    store = client.zen_store
+
+    with PipelineRunContext(2):
+        expected = store.list_artifacts(
+            ArtifactFilterModel(sort_by=sort_by, size=1000)
+        ).items
+        assert len(expected) >= 2
+
+        page = store.list_artifacts(
+            ArtifactFilterModel(sort_by=sort_by, size=1, count=False)
+        )
+        assert page.total is None
+        assert page.total_pages is None
+        items = list(page.items)
+        while page.next_cursor:
+            page = store.list_artifacts(
+                ArtifactFilterModel(
+                    sort_by=sort_by,
+                    size=1,
+                    cursor=page.next_cursor,
+                    count=False,
+                )
+            )
+            items += page.items
+
+        assert [item.id for item in items] == [item.id for item in expected]
+
+        page = store.list_artifacts(
+            ArtifactFilterModel(sort_by=sort_by, size=len(expected))
+        )
+        assert page.total == len(expected)
+        assert page.next_cursor is None
+
+        with pytest.raises(ValueError):
+            store.list_artifacts(ArtifactFilterModel(cursor="invalid"))
+
+
+def test_create_artifacts_batch():
+    """Tests creating multiple artifacts in a single batch."""
+    client = Client()
+    store = client.zen_store
+
+    requests = [
+        ArtifactRequestModel(
+            name=f"batch_artifact_{i}",
+            data_type="module.class",
+            materializer="module.class",
+            type=ArtifactType.DATA,
+            uri=f"/tmp/batch_artifact_{i}",
+            user=client.active_user.id,
+            workspace=client.active_workspace.id,
+            visualizations=[
+                VisualizationModel(
+                    type=VisualizationType.HTML, uri=f"/tmp/vis_{i}"
+                )
+            ],
+        )
+        for i in range(3)
+    ]
+    artifacts = store.create_artifacts_batch(requests)
+    try:
+        assert [artifact.name for artifact in artifacts] == [
+            request.name for request in requests
+        ]
+        for artifact in artifacts:
+            fetched = store.get_artifact(artifact.id)
+            assert fetched.uri == artifact.uri
+            assert len(fetched.visualizations) == 1
+
+        artifact_ids = [artifact.id for artifact in artifacts]
+        fetched_artifacts = store.get_artifacts_batch(
+            artifact_ids + [uuid.uuid4()]
+        )
+        assert set(fetched_artifacts) == set(artifact_ids)
+        for artifact in artifacts:
+            assert fetched_artifacts[artifact.id].uri == artifact.uri
+    finally:
+        for artifact in artifacts:
+            store.delete_artifact(artifact.id)
+
+    assert store.create_artifacts_batch([]) == []
+    assert store.get_artifacts_batch([]) == {}
+
+
 def test_artifacts_are_not_deleted_with_run():
     """Tests listing with `unused=True` only returns unused artifacts."""
     client = Client()
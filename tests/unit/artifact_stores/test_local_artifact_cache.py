@@ -0,0 +1,172 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+import os
+import time
+
+from zenml.artifact_stores import local_artifact_cache
+from zenml.artifact_stores.local_artifact_cache import (
+    PINS_DIRECTORY,
+    LocalArtifactCache,
+)
+from zenml.utils import io_utils
+
+
+def _create_artifact(path, size):
+    """Creates an artifact directory containing a single file."""
+    path.mkdir(parents=True)
+    (path / "data.bin").write_bytes(b"x" * size)
+    return str(path)
+
+
+def test_cache_serves_local_copy(tmp_path, mocker):
+    """Tests that artifacts are only downloaded on the first access."""
+    uri = _create_artifact(tmp_path / "store" / "artifact", size=10)
+    cache = LocalArtifactCache(root=str(tmp_path / "cache"), max_size=100)
+    copy_spy = mocker.spy(io_utils, "copy_dir")
+
+    local_uri = cache.acquire(key="key", uri=uri)
+    assert local_uri == cache.get_entry_path("key")
+    with open(os.path.join(local_uri, "data.bin"), "rb") as f:
+        assert f.read() == b"x" * 10
+    cache.release("key")
+
+    assert cache.acquire(key="key", uri=uri) == local_uri
+    cache.release("key")
+    assert copy_spy.call_count == 1
+
+
+def test_cache_evicts_least_recently_used_entries(tmp_path):
+    """Tests that the least recently used entries are evicted when the cache
+    exceeds its maximum size."""
+    cache = LocalArtifactCache(root=str(tmp_path / "cache"), max_size=25)
+    uris = {
+        key: _create_artifact(tmp_path / "store" / key, size=10)
+        for key in ("a", "b", "c")
+    }
+
+    cache.acquire(key="a", uri=uris["a"])
+    cache.acquire(key="b", uri=uris["b"])
+    # Make sure `a` is more recently used than `b`
+    past = time.time() - 10
+    os.utime(cache.get_entry_path("b"), (past, past))
+    cache.release("a")
+    cache.release("b")
+
+    cache.acquire(key="c", uri=uris["c"])
+    cache.release("c")
+    assert os.path.isdir(cache.get_entry_path("a"))
+    assert not os.path.exists(cache.get_entry_path("b"))
+    assert os.path.isdir(cache.get_entry_path("c"))
+
+
+def test_cache_keeps_pinned_entries(tmp_path):
+    """Tests that entries are only evicted once they are released."""
+    cache = LocalArtifactCache(root=str(tmp_path / "cache"), max_size=15)
+    uris = {
+        key: _create_artifact(tmp_path / "store" / key, size=10)
+        for key in ("a", "b")
+    }
+
+    cache.acquire(key="a", uri=uris["a"])
+    cache.acquire(key="b", uri=uris["b"])
+    assert os.path.isdir(cache.get_entry_path("a"))
+    assert os.path.isdir(cache.get_entry_path("b"))
+
+    # Releasing evicts the least recently used entry which isn't pinned
+    cache.release("a")
+    assert not os.path.exists(cache.get_entry_path("a"))
+    assert os.path.isdir(cache.get_entry_path("b"))
+
+
+def test_cache_respects_pins_of_other_processes(tmp_path, mocker):
+    """Tests that entries pinned by other running processes are kept."""
+    cache = LocalArtifactCache(root=str(tmp_path / "cache"), max_size=15)
+    uris = {
+        key: _create_artifact(tmp_path / "store" / key, size=10)
+        for key in ("a", "b")
+    }
+    cache.acquire(key="a", uri=uris["a"])
+    cache.release("a")
+    pins_dir = tmp_path / "cache" / PINS_DIRECTORY / "a"
+    (pins_dir / "1234").touch()
+
+    mocker.patch.object(
+        local_artifact_cache, "process_exists", return_value=True
+    )
+    cache.acquire(key="b", uri=uris["b"])
+    cache.release("b")
+    assert os.path.isdir(cache.get_entry_path("a"))
+
+    # Pins of processes which exited are ignored
+    mocker.patch.object(
+        local_artifact_cache, "process_exists", return_value=False
+    )
+    cache.acquire(key="b", uri=uris["b"])
+    cache.release("b")
+    assert not os.path.exists(cache.get_entry_path("a"))
+    assert not (pins_dir / "1234").exists()
+
+
+def test_cache_releases_entries_of_collected_objects(tmp_path):
+    """Tests that entries stay pinned while objects loaded from them are
+    alive."""
+
+    class _Loaded:
+        pass
+
+    cache = LocalArtifactCache(root=str(tmp_path / "cache"), max_size=15)
+    uris = {
+        key: _create_artifact(tmp_path / "store" / key, size=10)
+        for key in ("a", "b")
+    }
+    loaded = _Loaded()
+    cache.acquire(key="a", uri=uris["a"])
+    cache.release_when_collected("a", loaded)
+
+    # `a` is still pinned, so the more recently used `b` gets evicted
+    cache.acquire(key="b", uri=uris["b"])
+    cache.release("b")
+    assert os.path.isdir(cache.get_entry_path("a"))
+    assert not os.path.exists(cache.get_entry_path("b"))
+
+    del loaded
+    cache.acquire(key="b", uri=uris["b"])
+    cache.release("b")
+    assert not os.path.exists(cache.get_entry_path("a"))
+    assert os.path.isdir(cache.get_entry_path("b"))
+
+
+def test_cache_skips_artifacts_larger_than_the_cache(tmp_path):
+    """Tests that artifacts larger than the cache are not cached."""
+    uri = _create_artifact(tmp_path / "store" / "artifact", size=100)
+    cache = LocalArtifactCache(root=str(tmp_path / "cache"), max_size=10)
+
+    assert cache.acquire(key="key", uri=uri) is None
+    assert not os.path.exists(cache.get_entry_path("key"))
+    assert os.listdir(os.path.join(cache.root, PINS_DIRECTORY, "key")) == []
+
+
+def test_cache_keeps_oversized_artifacts_while_pinned(tmp_path):
+    """Tests that oversized artifacts can be cached until they are
+    released."""
+    uri = _create_artifact(tmp_path / "store" / "artifact", size=100)
+    cache = LocalArtifactCache(root=str(tmp_path / "cache"), max_size=10)
+
+    local_uri = cache.acquire(key="key", uri=uri, keep_oversized=True)
+    assert local_uri == cache.get_entry_path("key")
+    assert os.path.isdir(local_uri)
+
+    cache.release("key")
+    assert not os.path.exists(local_uri)
@@ -12,6 +12,9 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 
+import gc
+import os
+
 import pandas as pd
 from datasets import Dataset
 
@@ -35,3 +38,55 @@ def test_huggingface_datasets_materializer(clean_client):
     data = dataset.data.to_pydict()
     assert "0" in data.keys()
     assert [1, 2, 3] in data.values()
+
+
+def test_huggingface_datasets_materializer_caches_remote_datasets(
+    clean_client, tmp_path, mocker
+):
+    """Tests that datasets of remote artifact stores are downloaded once."""
+    from zenml.utils import io_utils
+
+    dataset = Dataset.from_pandas(pd.DataFrame({"a": [1, 2, 3]}))
+    materializer = HFDatasetMaterializer(uri=str(tmp_path))
+    materializer.save(dataset)
+
+    mocker.patch.object(io_utils, "is_remote", return_value=True)
+    copy_spy = mocker.spy(io_utils, "copy_dir")
+    for _ in range(2):
+        loaded_dataset = materializer.load(Dataset)
+        assert loaded_dataset.data.to_pydict() == {"a": [1, 2, 3]}
+        assert not loaded_dataset.cache_files[0]["filename"].startswith(
+            str(tmp_path)
+        )
+
+    assert copy_spy.call_count == 1
+
+
+def test_huggingface_datasets_materializer_doesnt_modify_artifacts(tmp_path):
+    """Tests that cache files of transformed datasets are not written into
+    the artifact directory."""
+    dataset = Dataset.from_pandas(pd.DataFrame({"a": [1, 2, 3]}))
+    materializer = HFDatasetMaterializer(uri=str(tmp_path))
+    materializer.save(dataset)
+    files_before = sorted(p for p in tmp_path.rglob("*"))
+
+    loaded_dataset = materializer.load(Dataset)
+    mapped_dataset = loaded_dataset.map(lambda row: {"a": row["a"] * 2})
+    assert mapped_dataset["a"] == [2, 4, 6]
+    assert sorted(p for p in tmp_path.rglob("*")) == files_before
+
+
+def test_huggingface_datasets_materializer_removes_links(tmp_path):
+    """Tests that the links of loaded datasets are removed once the dataset
+    is garbage collected."""
+    dataset = Dataset.from_pandas(pd.DataFrame({"a": [1, 2, 3]}))
+    materializer = HFDatasetMaterializer(uri=str(tmp_path))
+    materializer.save(dataset)
+
+    loaded_dataset = materializer.load(Dataset)
+    links_dir = os.path.dirname(loaded_dataset.cache_files[0]["filename"])
+    assert os.path.isdir(links_dir)
+
+    del loaded_dataset
+    gc.collect()
+    assert not os.path.exists(links_dir)
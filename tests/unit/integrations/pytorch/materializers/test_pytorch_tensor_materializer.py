@@ -0,0 +1,93 @@
+#  Copyright (c) ZenML GmbH 2022. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+import os
+
+import torch
+from torch.nn import Linear, Sequential
+
+from tests.unit.test_general import _test_materializer
+from zenml.integrations.pytorch.materializers.pytorch_tensor_materializer import (
+    DATA_FILENAME,
+    PyTorchTensorMaterializer,
+)
+
+
+def test_pytorch_tensor_materializer_for_modules(clean_client):
+    """Tests that modules are stored without pickling their tensor data."""
+    first = Linear(20, 20)
+    second = Linear(20, 20)
+    second.weight = first.weight
+    second.bias.requires_grad_(False)
+    model = Sequential(first, second)
+
+    def _validate(artifact_uri):
+        data_path = os.path.join(artifact_uri, DATA_FILENAME)
+        # The tied weight is only stored once
+        assert os.path.getsize(data_path) < 2 * 20 * 20 * 4
+
+    loaded = _test_materializer(
+        step_output=model,
+        materializer_class=PyTorchTensorMaterializer,
+        validation_function=_validate,
+        expected_metadata_size=3,
+    )
+
+    assert isinstance(loaded, Sequential)
+    assert loaded[0].weight is loaded[1].weight
+    assert isinstance(loaded[0].weight, torch.nn.Parameter)
+    assert not loaded[1].bias.requires_grad
+    for original, restored in zip(model.parameters(), loaded.parameters()):
+        assert torch.equal(original, restored)
+
+    inputs = torch.rand(3, 20)
+    assert torch.allclose(model(inputs), loaded(inputs))
+
+
+def test_pytorch_tensor_materializer_for_tensors(clean_client):
+    """Tests that tensors of different dtypes and shapes are restored."""
+    tensors = {
+        "float": torch.rand(4, 5),
+        "half": torch.rand(3).half(),
+        "int": torch.arange(7),
+        "bool": torch.tensor([True, False, True]),
+        "scalar": torch.tensor(3.0),
+        "empty": torch.empty(0, 3),
+        "transposed": torch.rand(3, 4).t(),
+        "nested": [torch.ones(2), "not a tensor"],
+    }
+
+    loaded = _test_materializer(
+        step_output=tensors,
+        materializer_class=PyTorchTensorMaterializer,
+        expected_metadata_size=1,
+    )
+
+    for key in (
+        "float",
+        "half",
+        "int",
+        "bool",
+        "scalar",
+        "empty",
+        "transposed",
+    ):
+        assert loaded[key].dtype == tensors[key].dtype
+        assert torch.equal(loaded[key], tensors[key])
+    assert torch.equal(loaded["nested"][0], torch.ones(2))
+    assert loaded["nested"][1] == "not a tensor"
+
+    # Loaded tensors can be modified in place without touching the artifact
+    loaded["float"] += 1
+    assert torch.equal(loaded["float"], tensors["float"] + 1)
@@ -12,12 +12,14 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 
+import os
 from contextlib import ExitStack as does_not_raise
 
 import pytest
 
 from zenml.enums import ArtifactType
 from zenml.exceptions import MaterializerInterfaceError
+from zenml.io import fileio
 from zenml.materializers.base_materializer import BaseMaterializer
 
 
@@ -60,3 +62,103 @@ def test_validate_type_compatibility():
 
     with pytest.raises(TypeError):
         materializer.validate_type_compatibility(data_type=str)
+
+
+def test_content_hash_depends_on_stored_files(tmp_path):
+    """Tests that the content hash only changes with the stored files."""
+    uri_1 = tmp_path / "artifact_1"
+    uri_2 = tmp_path / "artifact_2"
+    for uri in (uri_1, uri_2):
+        (uri / "subdir").mkdir(parents=True)
+        (uri / "data.txt").write_text("data")
+        (uri / "subdir" / "more_data.txt").write_text("more data")
+
+    hash_1 = TestMaterializer(uri=str(uri_1)).compute_content_hash()
+    hash_2 = TestMaterializer(uri=str(uri_2)).compute_content_hash()
+    assert hash_1 is not None
+    assert hash_1 == hash_2
+
+    (uri_2 / "subdir" / "more_data.txt").write_text("other data")
+    assert TestMaterializer(uri=str(uri_2)).compute_content_hash() != hash_1
+
+    (uri_2 / "subdir" / "more_data.txt").write_text("more data")
+    (uri_2 / "subdir" / "more_data.txt").rename(uri_2 / "subdir" / "x.txt")
+    assert TestMaterializer(uri=str(uri_2)).compute_content_hash() != hash_1
+
+    assert (
+        TestMaterializer(uri=str(tmp_path / "missing")).compute_content_hash()
+        is None
+    )
+
+
+class _WritingMaterializer(BaseMaterializer):
+    ASSOCIATED_TYPES = (int,)
+
+    def save(self, data: int) -> None:
+        with fileio.open(os.path.join(self.uri, "data.bin"), "wb") as f:
+            f.write(b"x" * data)
+        os.mkdir(os.path.join(self.uri, "subdir"))
+        with fileio.open(os.path.join(self.uri, "subdir", "a.txt"), "w") as f:
+            f.write("text")
+        # Files which are not written sequentially need to be read back
+        with fileio.open(os.path.join(self.uri, "seek.bin"), "wb") as f:
+            f.write(b"12")
+            f.seek(0)
+            f.write(b"3")
+
+
+def test_content_hash_uses_digests_recorded_while_saving(tmp_path, mocker):
+    """Tests that files are hashed while they are written."""
+    materializer = _WritingMaterializer(uri=str(tmp_path))
+    with materializer.record_file_digests():
+        materializer.save(5)
+
+    open_spy = mocker.spy(fileio, "open")
+    content_hash = materializer.compute_content_hash()
+    # Text files and files which are not written sequentially are read back
+    assert [call.args[0] for call in open_spy.call_args_list] == [
+        os.path.join(str(tmp_path), "seek.bin"),
+        os.path.join(str(tmp_path), "subdir", "a.txt"),
+    ]
+
+    # The digest is the same as when reading all files back
+    assert (
+        content_hash
+        == TestMaterializer(uri=str(tmp_path)).compute_content_hash()
+    )
+
+
+def test_content_hash_ignores_digests_of_modified_files(tmp_path, mocker):
+    """Tests that files which are modified after they were written are read
+    back when computing the content hash."""
+
+    class _RenamingMaterializer(BaseMaterializer):
+        ASSOCIATED_TYPES = (int,)
+
+        def save(self, data: int) -> None:
+            for name in ["a.bin", "b.bin", "c.bin"]:
+                with fileio.open(os.path.join(self.uri, name), "wb") as f:
+                    f.write(b"x" * data)
+            fileio.rename(
+                os.path.join(self.uri, "a.bin"),
+                os.path.join(self.uri, "b.bin"),
+                overwrite=True,
+            )
+            # Modified without going through `fileio`
+            with open(os.path.join(self.uri, "c.bin"), "ab") as f:
+                f.write(b"y")
+
+    materializer = _RenamingMaterializer(uri=str(tmp_path))
+    with materializer.record_file_digests():
+        materializer.save(5)
+
+    open_spy = mocker.spy(fileio, "open")
+    content_hash = materializer.compute_content_hash()
+    assert [call.args[0] for call in open_spy.call_args_list] == [
+        os.path.join(str(tmp_path), "b.bin"),
+        os.path.join(str(tmp_path), "c.bin"),
+    ]
+    assert (
+        content_hash
+        == TestMaterializer(uri=str(tmp_path)).compute_content_hash()
+    )
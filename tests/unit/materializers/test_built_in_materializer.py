@@ -11,15 +11,20 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
+import gc
 import os
 from tempfile import TemporaryDirectory
 from typing import Optional, Type
 
+import pytest
+
 from tests.unit.test_general import _test_materializer
+from zenml.materializers import built_in_materializer
 from zenml.materializers.base_materializer import BaseMaterializer
 from zenml.materializers.built_in_materializer import (
     BuiltInContainerMaterializer,
 )
+from zenml.utils import yaml_utils
 
 
 def test_basic_type_materialization():
@@ -225,3 +230,99 @@ def test_container_materializer_for_custom_types(mocker):
         assert result[0].myname == "aria"
         assert result[1].myname == "axl"
         assert result == example
+
+
+def test_container_materializer_packs_elements(tmp_path):
+    """Test that non-serializable containers are stored as a single archive
+    with one metadata entry per distinct element type."""
+    example = [b"0", b"1", b"2", CustomType()]
+    materializer = BuiltInContainerMaterializer(uri=str(tmp_path))
+    materializer.save(example)
+
+    assert sorted(os.listdir(tmp_path)) == ["elements.json", "elements.tar"]
+    metadata = yaml_utils.read_json(str(tmp_path / "elements.json"))
+    assert len(metadata["types"]) == 2
+    assert metadata["elements"] == [0, 0, 0, 1]
+
+    result = materializer.load(list)
+    assert result[:3] == example[:3]
+    assert result[3].myname == "aria"
+
+    # The archive content does not depend on when it was written
+    with TemporaryDirectory() as other_uri:
+        other_materializer = BuiltInContainerMaterializer(uri=other_uri)
+        other_materializer.save(example)
+        assert (
+            other_materializer.compute_content_hash()
+            == materializer.compute_content_hash()
+        )
+
+
+def test_container_materializer_removes_extracted_elements(tmp_path, mocker):
+    """Test that packed elements are extracted into a directory which is only
+    removed once all loaded elements are garbage collected."""
+    materializer = BuiltInContainerMaterializer(uri=str(tmp_path / "artifact"))
+    os.mkdir(materializer.uri)
+    materializer.save([b"0", CustomType()])
+
+    mkdtemp_spy = mocker.spy(built_in_materializer.tempfile, "mkdtemp")
+    result = materializer.load(list)
+    extracted_dir = mkdtemp_spy.spy_return
+    assert os.path.isdir(extracted_dir)
+
+    element = result[1]
+    del result
+    gc.collect()
+    assert os.path.isdir(extracted_dir)
+
+    del element
+    gc.collect()
+    assert not os.path.exists(extracted_dir)
+
+    # Directories of elements which can't be tracked are removed immediately
+    materializer.save([b"0", b"1"])
+    assert materializer.load(list) == [b"0", b"1"]
+    assert not os.path.exists(mkdtemp_spy.spy_return)
+
+
+def test_container_materializer_loads_elements_in_subdirectories(tmp_path):
+    """Test loading containers stored with one subdirectory per element."""
+    from zenml.materializers.built_in_materializer import BytesMaterializer
+    from zenml.utils import source_utils
+
+    metadata = []
+    for i, element in enumerate([b"0", b"1"]):
+        element_path = tmp_path / str(i)
+        element_path.mkdir()
+        BytesMaterializer(uri=str(element_path)).save(element)
+        metadata.append(
+            {
+                "path": str(element_path),
+                "type": "builtins.bytes",
+                "materializer": source_utils.resolve(
+                    BytesMaterializer
+                ).import_path,
+            }
+        )
+    yaml_utils.write_json(str(tmp_path / "metadata.json"), metadata)
+
+    materializer = BuiltInContainerMaterializer(uri=str(tmp_path))
+    assert materializer.load(list) == [b"0", b"1"]
+
+
+def test_container_materializer_chunks(mocker):
+    """Test saving and loading built-in containers in chunks."""
+    mocker.patch("zenml.materializers.built_in_materializer.CHUNK_SIZE", 2)
+    with TemporaryDirectory() as artifact_uri:
+        materializer = BuiltInContainerMaterializer(uri=artifact_uri)
+        materializer.save_chunks(iter([[1, "a"], [{"b": [2]}], [None]]))
+
+        assert materializer.load(list) == [1, "a", {"b": [2]}, None]
+        assert materializer.load(tuple) == (1, "a", {"b": [2]}, None)
+        assert list(materializer.load_chunks(list)) == [
+            [1, "a"],
+            [{"b": [2]}, None],
+        ]
+
+        with pytest.raises(TypeError):
+            materializer.save_chunks(iter([[CustomType()]]))
@@ -13,6 +13,7 @@
 #  permissions and limitations under the License.
 
 import numpy as np
+import pytest
 
 from tests.unit.test_general import _test_materializer
 from zenml.materializers.numpy_materializer import NumpyMaterializer
@@ -84,3 +85,56 @@ def test_numpy_materializer():
     assert text_metadata["total_words"] == 7
     assert text_metadata["most_common_word"] == "world"
     assert text_metadata["most_common_count"] == 2
+
+
+def test_numpy_materializer_memory_maps_local_arrays(tmp_path, monkeypatch):
+    """Test that local arrays are memory-mapped if enabled."""
+    array = np.arange(12).reshape(3, 4)
+    materializer = NumpyMaterializer(uri=str(tmp_path))
+    materializer.save(array)
+
+    loaded = materializer.load(np.ndarray)
+    assert not isinstance(loaded, np.memmap)
+
+    monkeypatch.setenv("ZENML_NUMPY_MEMORY_MAP", "true")
+    loaded = materializer.load(np.ndarray)
+    assert isinstance(loaded, np.memmap)
+    assert np.array_equal(loaded, array)
+
+    # Memory-mapped arrays are copy-on-write
+    loaded[0, 0] = 42
+    assert materializer.load(np.ndarray)[0, 0] == 0
+
+    # Arrays of python objects can't be memory-mapped
+    object_array = np.array(["a", 1], dtype=object)
+    materializer.save(object_array)
+    loaded = materializer.load(np.ndarray)
+    assert not isinstance(loaded, np.memmap)
+    assert np.array_equal(loaded, object_array)
+
+
+def test_numpy_materializer_chunks(tmp_path, mocker):
+    """Test saving and loading numpy arrays in chunks."""
+    mocker.patch(
+        "zenml.materializers.numpy_materializer.CHUNK_SIZE", 3 * 4 * 8
+    )
+    array = np.arange(40, dtype=np.int64).reshape(10, 4)
+    materializer = NumpyMaterializer(uri=str(tmp_path))
+    materializer.save_chunks(iter([array[:4], array[4:9], array[9:]]))
+
+    assert np.array_equal(materializer.load(np.ndarray), array)
+    chunks = list(materializer.load_chunks(np.ndarray))
+    assert [chunk.shape for chunk in chunks] == [
+        (3, 4),
+        (3, 4),
+        (3, 4),
+        (1, 4),
+    ]
+    assert np.array_equal(np.concatenate(chunks), array)
+
+    with pytest.raises(ValueError):
+        materializer.save_chunks(iter([array, np.arange(3)]))
+    with pytest.raises(ValueError):
+        materializer.save_chunks(iter([array, array.astype(np.float32)]))
+    with pytest.raises(ValueError):
+        materializer.save_chunks(iter([np.arange(3), np.array(1)]))
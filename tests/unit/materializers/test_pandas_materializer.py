@@ -13,11 +13,22 @@
 #  permissions and limitations under the License.
 
 import datetime
+import os
 
 import pandas
+import pytest
 
 from tests.unit.test_general import _test_materializer
-from zenml.materializers.pandas_materializer import PandasMaterializer
+from zenml.constants import (
+    ENV_ZENML_PANDAS_PARQUET_COMPRESSION,
+    ENV_ZENML_PANDAS_PARQUET_ROW_GROUP_SIZE,
+    ENV_ZENML_PANDAS_STATISTICS_SAMPLE_SIZE,
+)
+from zenml.materializers.pandas_materializer import (
+    LEGACY_PARQUET_FILENAME,
+    LazyDataFrame,
+    PandasMaterializer,
+)
 
 
 def test_pandas_materializer():
@@ -100,3 +111,112 @@ def test_pandas_materializer_with_index():
         assert_visualization_exists=True,
     )
     assert df_datetime_indexed.equals(result)
+
+
+def test_pandas_materializer_lazy_loading(tmp_path, monkeypatch):
+    """Tests reading selected columns and row groups of a stored dataframe."""
+    pytest.importorskip("pyarrow")
+    monkeypatch.setenv(ENV_ZENML_PANDAS_PARQUET_COMPRESSION, "snappy")
+    monkeypatch.setenv(ENV_ZENML_PANDAS_PARQUET_ROW_GROUP_SIZE, "2")
+    df = pandas.DataFrame(
+        {"A": [1, 2, 3, 4, 5], "B": [6, 7, 8, 9, 10], "C": list("abcde")},
+        index=list("vwxyz"),
+    )
+    materializer = PandasMaterializer(str(tmp_path))
+    materializer.save(df)
+
+    lazy_df = materializer.load(LazyDataFrame)
+    assert isinstance(lazy_df, LazyDataFrame)
+    assert lazy_df.columns == ["A", "B", "C"]
+    assert lazy_df.num_rows == 5
+    assert lazy_df.num_row_groups == 3
+
+    assert lazy_df.read().equals(df)
+    assert lazy_df.read(columns=["B"]).equals(df[["B"]])
+    assert lazy_df.read(columns=["A"], row_groups=[1]).equals(
+        df[["A"]].iloc[2:4]
+    )
+    chunks = list(lazy_df.iter_row_groups(columns=["C"]))
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    assert pandas.concat(chunks).equals(df[["C"]])
+
+
+def test_pandas_materializer_loads_legacy_parquet_artifacts(tmp_path):
+    """Tests loading artifacts stored by previous materializer versions."""
+    pytest.importorskip("pyarrow")
+    df = pandas.DataFrame({"A": [1, 2, 3]})
+    df.to_parquet(
+        os.path.join(tmp_path, LEGACY_PARQUET_FILENAME), compression="gzip"
+    )
+
+    materializer = PandasMaterializer(str(tmp_path))
+    assert materializer.load(pandas.DataFrame).equals(df)
+    assert materializer.load(LazyDataFrame).read(columns=["A"]).equals(df)
+
+
+def test_pandas_materializer_computes_statistics_once(tmp_path, mocker):
+    """Tests that the metadata and visualization share one computation."""
+    df = pandas.DataFrame(
+        {"A": [1.0, 2.0, 4.0], "B": [True, False, True], "C": list("abc")}
+    )
+    materializer = PandasMaterializer(str(tmp_path))
+    describe_spy = mocker.spy(pandas.DataFrame, "describe")
+
+    materializer.save_visualizations(df)
+    metadata = materializer.extract_metadata(df)
+
+    assert describe_spy.call_count == 1
+    for stat_name in ("mean", "std", "min", "max"):
+        expected = getattr(df, stat_name)(numeric_only=True)
+        assert metadata[stat_name] == pytest.approx(expected.to_dict())
+
+    # Boolean columns are only included in the metadata statistics
+    with open(os.path.join(tmp_path, "describe.csv")) as f:
+        assert f.read() == df.describe().to_csv()
+
+
+def test_pandas_materializer_statistics_of_boolean_series(tmp_path):
+    """Tests that the summary of boolean series is left unchanged."""
+    series = pandas.Series([True, False, True])
+    materializer = PandasMaterializer(str(tmp_path))
+
+    materializer.save_visualizations(series)
+    metadata = materializer.extract_metadata(series)
+
+    assert metadata["mean"] == pytest.approx(2 / 3)
+    assert metadata["max"] == 1.0
+    with open(os.path.join(tmp_path, "describe.csv")) as f:
+        assert f.read() == series.describe().to_csv()
+
+
+def test_pandas_materializer_samples_statistics(tmp_path, monkeypatch):
+    """Tests that statistics of large dataframes are computed on a sample."""
+    monkeypatch.setenv(ENV_ZENML_PANDAS_STATISTICS_SAMPLE_SIZE, "10")
+    df = pandas.DataFrame({"A": range(100)})
+
+    materializer = PandasMaterializer(str(tmp_path))
+    materializer.save_visualizations(df)
+    metadata = materializer.extract_metadata(df)
+
+    assert metadata["shape"] == (100, 1)
+    with open(os.path.join(tmp_path, "describe.csv")) as f:
+        statistics = pandas.read_csv(f, index_col=0)
+    assert statistics.at["count", "A"] == 10
+
+
+def test_pandas_materializer_chunks(tmp_path, monkeypatch):
+    """Tests saving and loading dataframes in chunks."""
+    pytest.importorskip("pyarrow")
+    monkeypatch.setenv(ENV_ZENML_PANDAS_PARQUET_ROW_GROUP_SIZE, "2")
+    df = pandas.DataFrame({"A": range(5), "B": list("abcde")})
+    materializer = PandasMaterializer(str(tmp_path))
+    materializer.save_chunks(iter([df.iloc[:3], df.iloc[3:]]))
+
+    assert materializer.load(pandas.DataFrame).equals(df)
+    chunks = list(materializer.load_chunks(pandas.DataFrame))
+    assert [len(chunk) for chunk in chunks] == [2, 1, 2]
+    assert pandas.concat(chunks).equals(df)
+
+    series = pandas.Series([1.0, 2.0, 3.0])
+    materializer.save_chunks(iter([series.iloc[:1], series.iloc[1:]]))
+    assert materializer.load(pandas.Series).equals(series)
@@ -12,8 +12,16 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 
-from zenml.enums import StackComponentType
+import pytest
+
+from zenml import pipeline, step
+from zenml.enums import ExecutionStatus, StackComponentType
+from zenml.environment import Environment
 from zenml.orchestrators import LocalOrchestratorFlavor
+from zenml.orchestrators.local.local_orchestrator import (
+    LocalOrchestratorSettings,
+)
+from zenml.post_execution import StepView
 
 
 def test_local_orchestrator_flavor_attributes():
@@ -23,3 +31,112 @@ def test_local_orchestrator_flavor_attributes():
     flavor = LocalOrchestratorFlavor()
     assert flavor.type == StackComponentType.ORCHESTRATOR
     assert flavor.name == "local"
+
+
+@step
+def _producer_step() -> int:
+    """Step that produces an integer."""
+    return 1
+
+
+@step
+def _consumer_step(value: int) -> int:
+    """Step that consumes an integer."""
+    return value + 1
+
+
+@step
+def _failing_step(value: int) -> None:
+    """Step that always fails."""
+    raise RuntimeError("Step failed.")
+
+
+def test_local_orchestrator_runs_steps_concurrently(clean_client):
+    """Tests that the local orchestrator runs all steps of a pipeline when
+    using the thread execution mode."""
+
+    @pipeline(
+        settings={
+            "orchestrator.local": LocalOrchestratorSettings(
+                execution_mode="thread", max_parallelism=2
+            )
+        }
+    )
+    def fan_out_pipeline():
+        value = _producer_step()
+        _consumer_step(value, id="consumer_1")
+        _consumer_step(value, id="consumer_2")
+
+    fan_out_pipeline()
+
+    run = clean_client.get_pipeline("fan_out_pipeline").runs[0]
+    assert run.status == ExecutionStatus.COMPLETED
+    step_runs = clean_client.list_run_steps(pipeline_run_id=run.id).items
+    assert {step_run.name for step_run in step_runs} == {
+        "_producer_step",
+        "consumer_1",
+        "consumer_2",
+    }
+    for step_run in step_runs:
+        assert step_run.status == ExecutionStatus.COMPLETED
+
+
+def test_local_orchestrator_raises_step_failure_when_running_concurrently(
+    clean_client,
+):
+    """Tests that the local orchestrator raises the exception of a failed step
+    when using the thread execution mode."""
+
+    @pipeline(
+        settings={
+            "orchestrator.local": LocalOrchestratorSettings(
+                execution_mode="thread"
+            )
+        }
+    )
+    def failing_pipeline():
+        value = _producer_step()
+        _failing_step(value)
+        _consumer_step(value)
+
+    with pytest.raises(RuntimeError, match="Step failed."):
+        failing_pipeline()
+
+    run = clean_client.get_pipeline("failing_pipeline").runs[0]
+    assert run.status == ExecutionStatus.FAILED
+
+
+@step
+def _step_name_step() -> str:
+    """Step that returns the name of the step it is running in."""
+    return Environment().step_environment.step_name
+
+
+@pytest.mark.parametrize("execution_mode", ["thread", "process"])
+def test_local_orchestrator_steps_see_their_own_environment(
+    clean_client, execution_mode
+):
+    """Tests that concurrently running steps each see their own step
+    environment."""
+
+    @pipeline(
+        settings={
+            "orchestrator.local": LocalOrchestratorSettings(
+                execution_mode=execution_mode, max_parallelism=2
+            )
+        }
+    )
+    def step_name_pipeline():
+        _step_name_step(id="first")
+        _step_name_step(id="second")
+
+    step_name_pipeline()
+
+    run = clean_client.get_pipeline("step_name_pipeline").runs[0]
+    assert run.status == ExecutionStatus.COMPLETED
+    step_runs = clean_client.list_run_steps(pipeline_run_id=run.id).items
+    assert {
+        step_run.name: StepView(step_run).output.read()
+        for step_run in step_runs
+    } == {"first": "first", "second": "second"}
+    assert not Environment().step_is_running
@@ -21,8 +21,7 @@ import pytest
 from zenml.config.compiler import Compiler
 from zenml.config.source import Source
 from zenml.config.step_configurations import Step
-from zenml.enums import ExecutionStatus, SorterOps
-from zenml.models.page_model import Page
+from zenml.models import StepRunOutputArtifactsModel
 from zenml.new.pipelines.pipeline import Pipeline
 from zenml.orchestrators import cache_utils
 from zenml.steps import Output, step
@@ -141,6 +140,67 @@ def test_generate_cache_key_considers_input_artifacts(
     assert key_1 != key_2
 
 
+def test_content_addressed_cache_key_ignores_input_artifact_ids(
+    generate_cache_key_kwargs,
+):
+    """Check that content-addressed cache keys only depend on the content of
+    input artifacts with a content hash."""
+    generate_cache_key_kwargs["input_artifact_content_hashes"] = {
+        "input_1": "content_hash"
+    }
+    key_1 = cache_utils.generate_cache_key(**generate_cache_key_kwargs)
+    generate_cache_key_kwargs["input_artifact_ids"] = {"input_1": uuid4()}
+    key_2 = cache_utils.generate_cache_key(**generate_cache_key_kwargs)
+    assert key_1 == key_2
+
+    generate_cache_key_kwargs["input_artifact_content_hashes"] = {
+        "input_1": "other_content_hash"
+    }
+    key_3 = cache_utils.generate_cache_key(**generate_cache_key_kwargs)
+    assert key_1 != key_3
+
+    # Input artifacts without content hash are still identified by their ID
+    generate_cache_key_kwargs["input_artifact_content_hashes"] = {}
+    key_4 = cache_utils.generate_cache_key(**generate_cache_key_kwargs)
+    generate_cache_key_kwargs["input_artifact_ids"] = {"input_1": uuid4()}
+    key_5 = cache_utils.generate_cache_key(**generate_cache_key_kwargs)
+    assert key_4 != key_5
+
+
+def test_content_hashes_of_input_artifacts(mocker):
+    """Check that input artifacts without content hash are skipped and that
+    the content hash considers the data type and materializer."""
+    artifacts = {
+        "hashed": mocker.Mock(
+            content_hash="abc",
+            data_type=Source.from_import_path("builtins.int"),
+            materializer=Source.from_import_path("some.Materializer"),
+        ),
+        "other_data_type": mocker.Mock(
+            content_hash="abc",
+            data_type=Source.from_import_path("builtins.float"),
+            materializer=Source.from_import_path("some.Materializer"),
+        ),
+        "not_hashed": mocker.Mock(content_hash=None),
+    }
+    input_artifact_ids = {name: uuid4() for name in artifacts}
+    artifacts_by_id = {
+        input_artifact_ids[name]: artifact
+        for name, artifact in artifacts.items()
+    }
+    mock_get_artifacts_batch = mocker.patch(
+        "zenml.zen_stores.sql_zen_store.SqlZenStore.get_artifacts_batch",
+        return_value=artifacts_by_id,
+    )
+
+    content_hashes = cache_utils.get_input_artifact_content_hashes(
+        input_artifact_ids
+    )
+    mock_get_artifacts_batch.assert_called_once()
+    assert set(content_hashes) == {"hashed", "other_data_type"}
+    assert content_hashes["hashed"] != content_hashes["other_data_type"]
+
+
 def test_generate_cache_key_considers_output_artifacts(
     generate_cache_key_kwargs,
 ):
@@ -165,45 +225,84 @@ def test_generate_cache_key_considers_caching_parameters(
     assert key_1 != key_2
 
 
-def test_fetching_cached_step_run_queries_cache_candidates(
-    mocker, create_step_run
-):
+def test_fetching_cached_step_run_queries_cache_candidates(mocker):
     """Tests fetching a cached step run."""
-    mock_list_run_steps = mocker.patch(
-        "zenml.client.Client.list_run_steps",
-        return_value=Page(
-            index=1,
-            max_size=1,
-            total_pages=1,
-            total=0,
-            items=[],
-        ),
+    mock_get_cached_outputs = mocker.patch(
+        "zenml.zen_stores.sql_zen_store.SqlZenStore.get_cached_run_step_outputs",
+        return_value=None,
     )
 
     assert cache_utils.get_cached_step_run(cache_key="cache_key") is None
 
-    cache_candidate = create_step_run()
-
-    mock_list_run_steps = mocker.patch(
-        "zenml.client.Client.list_run_steps",
-        return_value=Page(
-            index=1,
-            max_size=1,
-            total_pages=1,
-            total=1,
-            items=[cache_candidate],
-        ),
+    cache_candidate = StepRunOutputArtifactsModel(
+        step_run_id=uuid4(), output_artifact_ids={"output": uuid4()}
     )
+    mock_get_cached_outputs.return_value = cache_candidate
 
     cached_step = cache_utils.get_cached_step_run(cache_key="cache_key")
     assert cached_step == cache_candidate
-    mock_list_run_steps.assert_called_with(
-        workspace_id=ANY,
-        cache_key="cache_key",
-        status=ExecutionStatus.COMPLETED,
-        sort_by=f"{SorterOps.DESCENDING}:created",
-        size=1,
+    mock_get_cached_outputs.assert_called_with(
+        workspace_id=ANY, cache_key="cache_key"
+    )
+
+
+def test_cached_step_run_lookups_are_memoized_per_run(mocker):
+    """Tests that cached step runs are memoized within a pipeline run."""
+    cached_step_run = StepRunOutputArtifactsModel(step_run_id=uuid4())
+    mock_get_cached_outputs = mocker.patch(
+        "zenml.zen_stores.sql_zen_store.SqlZenStore.get_cached_run_step_outputs",
+        return_value=cached_step_run,
+    )
+    run_id = uuid4()
+
+    for _ in range(3):
+        assert (
+            cache_utils.get_cached_step_run(
+                cache_key="cache_key", pipeline_run_id=run_id
+            )
+            == cached_step_run
+        )
+    assert mock_get_cached_outputs.call_count == 1
+
+    cache_utils.get_cached_step_run(
+        cache_key="other_cache_key", pipeline_run_id=run_id
+    )
+    assert mock_get_cached_outputs.call_count == 2
+
+    # Lookups of a different run don't use the memoized results
+    cache_utils.get_cached_step_run(
+        cache_key="cache_key", pipeline_run_id=uuid4()
+    )
+    assert mock_get_cached_outputs.call_count == 3
+
+
+def test_cached_step_run_misses_are_memoized_until_invalidated(mocker):
+    """Tests that lookups which found no cached step run are memoized until a
+    step with the same cache key is published."""
+    cached_step_run = StepRunOutputArtifactsModel(step_run_id=uuid4())
+    mock_get_cached_outputs = mocker.patch(
+        "zenml.zen_stores.sql_zen_store.SqlZenStore.get_cached_run_step_outputs",
+        side_effect=[None, cached_step_run],
+    )
+    run_id = uuid4()
+
+    for _ in range(2):
+        assert (
+            cache_utils.get_cached_step_run(
+                cache_key="cache_key", pipeline_run_id=run_id
+            )
+            is None
+        )
+    assert mock_get_cached_outputs.call_count == 1
+
+    cache_utils.invalidate_cached_step_run_lookup("cache_key")
+    assert (
+        cache_utils.get_cached_step_run(
+            cache_key="cache_key", pipeline_run_id=run_id
+        )
+        == cached_step_run
     )
+    assert mock_get_cached_outputs.call_count == 2
 
 
 def test_fetching_cached_step_run_uses_latest_candidate(
@@ -241,4 +340,4 @@ def test_fetching_cached_step_run_uses_latest_candidate(
     assert response_2.created > response_1.created
 
     cached_step = cache_utils.get_cached_step_run(cache_key="cache_key")
-    assert cached_step == response_2
+    assert cached_step.step_run_id == response_2.id
@@ -12,10 +12,17 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 
+import threading
+import time
 from contextlib import ExitStack as does_not_raise
 from typing import Dict, List
 
-from zenml.orchestrators.dag_runner import ThreadedDagRunner, reverse_dag
+from zenml.orchestrators.dag_runner import (
+    NodeStatus,
+    ThreadedDagRunner,
+    get_critical_path_lengths,
+    reverse_dag,
+)
 
 
 def test_reverse_dag():
@@ -68,3 +75,74 @@ def test_dag_runner_multi_path():  # 3->(2, 5)->1
 def test_dag_runner_cyclic():
     """Test that nothing happens for cyclic graphs, and no error is raised."""
     _test_runner({1: [2], 2: [1]}, correct_results=[0])
+
+
+def test_dag_runner_max_parallelism():
+    """Test that the DAG runner never runs more nodes than allowed at once."""
+    lock = threading.Lock()
+    running = 0
+    max_running = 0
+
+    def run_fn(node) -> None:
+        nonlocal running, max_running
+        with lock:
+            running += 1
+            max_running = max(max_running, running)
+        time.sleep(0.05)
+        with lock:
+            running -= 1
+
+    dag = {0: [], **{i: [0] for i in range(1, 9)}}
+    ThreadedDagRunner(dag, run_fn, max_parallelism=3).run()
+    assert 1 < max_running <= 3
+
+
+def test_get_critical_path_lengths():
+    """Test `dag_runner.get_critical_path_lengths()`."""
+    dag = {1: [], 2: [1], 3: [1], 4: [3], 5: [4]}
+    assert get_critical_path_lengths(dag) == {1: 4, 2: 1, 3: 3, 4: 2, 5: 1}
+
+
+def test_dag_runner_starts_longest_chain_first():
+    """Test that ready nodes with the longest downstream chain run first."""
+    order = []
+    dag = {"short": [], "long": [], "long_2": ["long"], "long_3": ["long_2"]}
+    ThreadedDagRunner(dag, order.append, max_parallelism=1).run()
+    assert order[:2] == ["long", "long_2"]
+    assert set(order) == set(dag)
+
+
+def test_dag_runner_skips_downstream_nodes_of_failed_node():
+    """Test that a failed node causes its downstream nodes to be skipped while
+    independent nodes still run."""
+
+    def run_fn(node) -> None:
+        if node == "fail":
+            raise RuntimeError()
+
+    dag = {"fail": [], "child": ["fail"], "grandchild": ["child"], "ok": []}
+    runner = ThreadedDagRunner(dag, run_fn)
+    runner.run()
+    assert runner.node_states == {
+        "fail": NodeStatus.FAILED,
+        "child": NodeStatus.SKIPPED,
+        "grandchild": NodeStatus.SKIPPED,
+        "ok": NodeStatus.COMPLETED,
+    }
+
+
+def test_dag_runner_fail_fast():
+    """Test that no new nodes are started after a failure in fail-fast mode."""
+
+    def run_fn(node) -> None:
+        if node == "fail":
+            raise RuntimeError()
+
+    dag = {"fail": [], "child": ["fail"], "independent": []}
+    runner = ThreadedDagRunner(dag, run_fn, max_parallelism=1, fail_fast=True)
+    runner.run()
+    assert runner.node_states == {
+        "fail": NodeStatus.FAILED,
+        "child": NodeStatus.SKIPPED,
+        "independent": NodeStatus.SKIPPED,
+    }
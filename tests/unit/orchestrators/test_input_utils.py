@@ -18,23 +18,24 @@ import pytest
 
 from zenml.config.step_configurations import Step
 from zenml.exceptions import InputResolutionError
-from zenml.models.page_model import Page
+from zenml.models import StepRunOutputArtifactsModel
 from zenml.orchestrators import input_utils
 
 
-def test_input_resolution(mocker, sample_artifact_model, create_step_run):
+def test_input_resolution(mocker):
     """Tests that input resolution works if the correct models exist in the
     zen store."""
-    step_run = create_step_run(
-        step_run_name="upstream_step",
-        output_artifacts={"output_name": sample_artifact_model},
-    )
+    step_run_id = uuid4()
+    artifact_id = uuid4()
 
-    mocker.patch(
-        "zenml.zen_stores.sql_zen_store.SqlZenStore.list_run_steps",
-        return_value=Page(
-            index=1, max_size=50, total_pages=1, total=1, items=[step_run]
-        ),
+    mock_get_outputs = mocker.patch(
+        "zenml.zen_stores.sql_zen_store.SqlZenStore.get_run_step_output_artifact_ids",
+        return_value={
+            "upstream_step": StepRunOutputArtifactsModel(
+                step_run_id=step_run_id,
+                output_artifact_ids={"output_name": artifact_id},
+            )
+        },
     )
     step = Step.parse_obj(
         {
@@ -52,20 +53,22 @@ def test_input_resolution(mocker, sample_artifact_model, create_step_run):
         }
     )
 
-    input_artifacts, parent_ids = input_utils.resolve_step_inputs(
-        step=step, run_id=uuid4()
+    run_id = uuid4()
+    input_artifact_ids, parent_ids = input_utils.resolve_step_inputs(
+        step=step, run_id=run_id
+    )
+    assert input_artifact_ids == {"input_name": artifact_id}
+    assert parent_ids == [step_run_id]
+    mock_get_outputs.assert_called_once_with(
+        run_id=run_id, step_names=["upstream_step"]
     )
-    assert input_artifacts == {"input_name": sample_artifact_model}
-    assert parent_ids == [step_run.id]
 
 
 def test_input_resolution_with_missing_step_run(mocker):
     """Tests that input resolution fails if the upstream step run is missing."""
     mocker.patch(
-        "zenml.zen_stores.sql_zen_store.SqlZenStore.list_run_steps",
-        return_value=Page(
-            index=1, max_size=50, total_pages=1, total=0, items=[]
-        ),
+        "zenml.zen_stores.sql_zen_store.SqlZenStore.get_run_step_output_artifact_ids",
+        return_value={},
     )
     step = Step.parse_obj(
         {
@@ -87,18 +90,14 @@ def test_input_resolution_with_missing_step_run(mocker):
         input_utils.resolve_step_inputs(step=step, run_id=uuid4())
 
 
-def test_input_resolution_with_missing_artifact(mocker, create_step_run):
+def test_input_resolution_with_missing_artifact(mocker):
     """Tests that input resolution fails if the upstream step run output
     artifact is missing."""
-    step_run = create_step_run(
-        step_name="upstream_step",
-    )
-
     mocker.patch(
-        "zenml.zen_stores.sql_zen_store.SqlZenStore.list_run_steps",
-        return_value=Page(
-            index=1, max_size=50, total_pages=1, total=1, items=[step_run]
-        ),
+        "zenml.zen_stores.sql_zen_store.SqlZenStore.get_run_step_output_artifact_ids",
+        return_value={
+            "upstream_step": StepRunOutputArtifactsModel(step_run_id=uuid4())
+        },
     )
     step = Step.parse_obj(
         {
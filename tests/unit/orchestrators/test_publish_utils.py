@@ -14,11 +14,8 @@
 
 from uuid import UUID, uuid4
 
-import pytest
-
 from zenml.enums import ArtifactType, ExecutionStatus
 from zenml.models.artifact_models import ArtifactRequestModel
-from zenml.models.page_model import Page
 from zenml.orchestrators import publish_utils
 
 
@@ -81,6 +78,10 @@ def test_publishing_a_successful_step_run(mocker):
     mock_update_run_step = mocker.patch(
         "zenml.zen_stores.sql_zen_store.SqlZenStore.update_run_step",
     )
+    mock_update_run_step.return_value.cache_key = "cache_key"
+    mock_invalidate_lookup = mocker.patch(
+        "zenml.orchestrators.cache_utils.invalidate_cached_step_run_lookup"
+    )
 
     step_run_id = uuid4()
     output_artifact_ids = {"output_name": uuid4()}
@@ -94,6 +95,7 @@ def test_publishing_a_successful_step_run(mocker):
         call_kwargs["step_run_update"].output_artifacts == output_artifact_ids
     )
     assert call_kwargs["step_run_update"].status == ExecutionStatus.COMPLETED
+    mock_invalidate_lookup.assert_called_once_with("cache_key")
 
 
 def test_publishing_a_failed_step_run(mocker):
@@ -124,82 +126,10 @@ def test_publishing_a_failed_pipeline_run(mocker):
     assert call_kwargs["run_update"].status == ExecutionStatus.FAILED
 
 
-@pytest.mark.parametrize(
-    "step_statuses, num_steps, expected_run_status",
-    [
-        (
-            [ExecutionStatus.COMPLETED, ExecutionStatus.FAILED],
-            2,
-            ExecutionStatus.FAILED,
-        ),
-        ([ExecutionStatus.COMPLETED], 2, ExecutionStatus.RUNNING),
-        (
-            [ExecutionStatus.COMPLETED, ExecutionStatus.RUNNING],
-            2,
-            ExecutionStatus.RUNNING,
-        ),
-        (
-            [ExecutionStatus.COMPLETED, ExecutionStatus.COMPLETED],
-            2,
-            ExecutionStatus.COMPLETED,
-        ),
-    ],
-)
-def test_pipeline_run_status_computation(
-    step_statuses, num_steps, expected_run_status
-):
-    """Tests computing a pipeline run status from step statuses."""
-    assert (
-        publish_utils.get_pipeline_run_status(
-            step_statuses=step_statuses, num_steps=num_steps
-        )
-        == expected_run_status
-    )
-
-
-@pytest.mark.parametrize(
-    "old_status, new_status",
-    [
-        (ExecutionStatus.RUNNING, ExecutionStatus.RUNNING),
-        (ExecutionStatus.RUNNING, ExecutionStatus.COMPLETED),
-        (ExecutionStatus.RUNNING, ExecutionStatus.FAILED),
-        (ExecutionStatus.RUNNING, ExecutionStatus.CACHED),
-    ],
-)
-def test_updating_the_pipeline_run_status(
-    mocker, sample_pipeline_run_model, old_status, new_status
-):
-    """Tests updating the status of a pipeline run."""
-    mocker.patch(
-        "zenml.zen_stores.sql_zen_store.SqlZenStore.list_run_steps",
-        return_value=Page(
-            index=1, max_size=50, total_pages=1, total=0, items=[]
-        ),
-    )
-    mocker.patch(
-        "zenml.orchestrators.publish_utils.get_pipeline_run_status",
-        return_value=new_status,
-    )
-
-    mock_update_run = mocker.patch(
-        "zenml.zen_stores.sql_zen_store.SqlZenStore.update_run",
-    )
-
-    sample_pipeline_run_model.status = old_status
-    publish_utils.update_pipeline_run_status(sample_pipeline_run_model)
-
-    if old_status == new_status:
-        mock_update_run.assert_not_called()
-    else:
-        _, call_kwargs = mock_update_run.call_args
-        call_kwargs["run_id"] == sample_pipeline_run_model.id
-        call_kwargs["run_update"].status == new_status
-
-
 def test_publish_output_artifact_metadata(mocker):
     """Unit test for `publish_output_artifact_metadata`."""
     mock_create_run = mocker.patch(
-        "zenml.zen_stores.sql_zen_store.SqlZenStore.create_run_metadata",
+        "zenml.zen_stores.sql_zen_store.SqlZenStore.create_run_metadata_batch",
     )
     output_artifact_ids = {
         "output_name": uuid4(),
@@ -216,13 +146,21 @@ def test_publish_output_artifact_metadata(mocker):
         output_artifact_ids=output_artifact_ids,
         output_artifact_metadata=output_artifact_metadata,
     )
-    assert mock_create_run.call_count == 3  # once per key-value pair
+    assert mock_create_run.call_count == 1  # once for all artifacts
+    (run_metadata,) = mock_create_run.call_args.args
+    assert {
+        (request.artifact_id, request.key) for request in run_metadata
+    } == {
+        (output_artifact_ids["output_name"], "key"),
+        (output_artifact_ids["output_name"], "key_2"),
+        (output_artifact_ids["output_name_2"], "pi"),
+    }
 
 
 def test_publish_pipeline_run_metadata(mocker):
     """Unit test for `publish_pipeline_run_metadata`."""
     mock_create_run = mocker.patch(
-        "zenml.zen_stores.sql_zen_store.SqlZenStore.create_run_metadata",
+        "zenml.zen_stores.sql_zen_store.SqlZenStore.create_run_metadata_batch",
     )
     pipeline_run_id = uuid4()
     pipeline_run_metadata = {
@@ -233,13 +171,13 @@ def test_publish_pipeline_run_metadata(mocker):
         pipeline_run_id=pipeline_run_id,
         pipeline_run_metadata=pipeline_run_metadata,
     )
-    assert mock_create_run.call_count == 3  # once per key-value pair
+    assert mock_create_run.call_count == 2  # once per entity
 
 
 def test_publish_step_run_metadata(mocker):
     """Unit test for `publish_step_run_metadata`."""
     mock_create_run = mocker.patch(
-        "zenml.zen_stores.sql_zen_store.SqlZenStore.create_run_metadata",
+        "zenml.zen_stores.sql_zen_store.SqlZenStore.create_run_metadata_batch",
     )
     step_run_id = uuid4()
     step_run_metadata = {
@@ -250,4 +188,4 @@ def test_publish_step_run_metadata(mocker):
         step_run_id=step_run_id,
         step_run_metadata=step_run_metadata,
     )
-    assert mock_create_run.call_count == 3  # once per key-value pair
+    assert mock_create_run.call_count == 2  # once per entity
@@ -23,6 +23,7 @@ from zenml.materializers import UnmaterializedArtifact
 from zenml.orchestrators.step_launcher import StepRunner
 from zenml.stack import Stack
 from zenml.steps import step
+from zenml.zen_stores.sql_zen_store import SqlZenStore
 
 
 @step
@@ -132,6 +133,56 @@ def test_running_a_failing_step(mocker, local_stack):
     mock_publish_successful_step_run.assert_not_called()
 
 
+def test_failing_to_store_outputs_runs_the_failure_hook(mocker, local_stack):
+    """Tests that the failure hook runs instead of the success hook if storing
+    the outputs fails, e.g. because a generator step raised an exception."""
+    mock_cleanup_step_run = mocker.patch.object(Stack, "cleanup_step_run")
+    mocker.patch.object(
+        StepRunner, "_store_output_artifacts", side_effect=RuntimeError()
+    )
+    mock_run_hook = mocker.patch.object(StepRunner, "load_and_run_hook")
+
+    step = Step.parse_obj(
+        {
+            "spec": {
+                "source": "tests.unit.orchestrators.test_step_runner.successful_step",
+                "upstream_steps": [],
+            },
+            "config": {
+                "name": "step_name",
+                "failure_hook_source": "module.failure_hook",
+                "success_hook_source": "module.success_hook",
+            },
+        }
+    )
+    pipeline_config = PipelineConfiguration(name="pipeline_name")
+    step_run_info = StepRunInfo(
+        step_run_id=uuid4(),
+        run_id=uuid4(),
+        run_name="run_name",
+        pipeline_step_name="step_name",
+        config=step.config,
+        pipeline=pipeline_config,
+    )
+
+    runner = StepRunner(step=step, stack=local_stack)
+    with pytest.raises(RuntimeError):
+        runner.run(
+            input_artifacts={},
+            output_artifact_uris={},
+            step_run_info=step_run_info,
+        )
+
+    mock_run_hook.assert_called_once()
+    assert mock_run_hook.call_args.args[0].import_path == "module.failure_hook"
+    assert isinstance(
+        mock_run_hook.call_args.kwargs["step_exception"], RuntimeError
+    )
+    mock_cleanup_step_run.assert_called_with(
+        info=step_run_info, step_failed=True
+    )
+
+
 def test_loading_unmaterialized_input_artifact(
     local_stack, sample_artifact_model
 ):
@@ -155,3 +206,148 @@ def test_loading_unmaterialized_input_artifact(
         artifact=artifact_response, data_type=UnmaterializedArtifact
     )
     assert artifact == artifact_response
+
+
+def test_storing_multiple_output_artifacts(
+    mocker, local_stack, clean_client, tmp_path
+):
+    """Tests that all outputs of a step are saved and published in a single
+    batch."""
+    from zenml.materializers import BuiltInMaterializer
+
+    mocker.patch("zenml.orchestrators.step_runner.OUTPUT_ARTIFACT_THREADS", 2)
+    create_batch_spy = mocker.spy(SqlZenStore, "create_artifacts_batch")
+    create_metadata_batch_spy = mocker.spy(
+        SqlZenStore, "create_run_metadata_batch"
+    )
+
+    step = Step.parse_obj(
+        {
+            "spec": {
+                "source": "module.step_class",
+                "upstream_steps": [],
+            },
+            "config": {
+                "name": "step_name",
+            },
+        }
+    )
+    runner = StepRunner(step=step, stack=local_stack)
+    output_data = {"output_1": 1, "output_2": "two", "output_3": 3.0}
+    output_artifact_uris = {}
+    for output_name in output_data:
+        uri = tmp_path / output_name
+        uri.mkdir()
+        output_artifact_uris[output_name] = str(uri)
+
+    output_artifact_ids = runner._store_output_artifacts(
+        output_data=output_data,
+        output_materializers={
+            output_name: (BuiltInMaterializer,) for output_name in output_data
+        },
+        output_artifact_uris=output_artifact_uris,
+        artifact_metadata_enabled=True,
+        artifact_visualization_enabled=False,
+    )
+
+    create_batch_spy.assert_called_once()
+    create_metadata_batch_spy.assert_called_once()
+    assert list(output_artifact_ids) == list(output_data)
+    for output_name, artifact_id in output_artifact_ids.items():
+        artifact = clean_client.get_artifact(artifact_id)
+        assert artifact.name == output_name
+        assert artifact.uri == output_artifact_uris[output_name]
+        assert "storage_size" in artifact.metadata
+
+
+def test_storing_and_loading_chunked_artifacts(
+    local_stack, clean_client, tmp_path
+):
+    """Tests that outputs returned as iterators are saved chunk by chunk and
+    that inputs annotated as iterators are loaded chunk by chunk."""
+    from collections.abc import Iterator
+
+    from zenml.materializers import BuiltInContainerMaterializer
+
+    step = Step.parse_obj(
+        {
+            "spec": {
+                "source": "module.step_class",
+                "upstream_steps": [],
+            },
+            "config": {
+                "name": "step_name",
+            },
+        }
+    )
+    runner = StepRunner(step=step, stack=local_stack)
+
+    def _generate_chunks():
+        yield [1, 2]
+        yield [3]
+
+    output_artifact_ids = runner._store_output_artifacts(
+        output_data={"output": _generate_chunks()},
+        chunked_outputs={"output"},
+        output_materializers={"output": (BuiltInContainerMaterializer,)},
+        output_artifact_uris={"output": str(tmp_path)},
+        artifact_metadata_enabled=True,
+        artifact_visualization_enabled=True,
+    )
+    artifact = clean_client.get_artifact(output_artifact_ids["output"])
+    assert artifact.data_type.import_path == "builtins.list"
+
+    assert runner._load_input_artifact(artifact, data_type=list) == [1, 2, 3]
+    chunks = runner._load_input_artifact(artifact, data_type=Iterator)
+    assert isinstance(chunks, Iterator)
+    assert list(chunks) == [[1, 2, 3]]
+
+
+def test_validating_chunked_and_regular_outputs(local_stack):
+    """Tests that only outputs annotated as iterators of chunks are validated
+    chunk by chunk and that all other outputs are validated as before."""
+    from zenml.exceptions import StepInterfaceError
+    from zenml.materializers import BuiltInMaterializer
+    from zenml.steps.utils import OutputSignature
+
+    step = Step.parse_obj(
+        {
+            "spec": {
+                "source": "module.step_class",
+                "upstream_steps": [],
+            },
+            "config": {
+                "name": "step_name",
+            },
+        }
+    )
+    runner = StepRunner(step=step, stack=local_stack)
+
+    with pytest.raises(StepInterfaceError):
+        runner._validate_outputs(
+            iter([1, 2]), {"output": OutputSignature(annotation=int)}
+        )
+    with pytest.raises(StepInterfaceError):
+        runner._validate_outputs(
+            [1, 2], {"output": OutputSignature(int, is_chunked=True)}
+        )
+
+    output_data = runner._validate_outputs(
+        iter([1, "2"]), {"output": OutputSignature(int, is_chunked=True)}
+    )
+    chunks = output_data["output"]
+    assert next(chunks) == 1
+    with pytest.raises(StepInterfaceError):
+        next(chunks)
+
+    with pytest.raises(StepInterfaceError):
+        runner._validate_chunked_output_materializers(
+            output_signatures={
+                "output": OutputSignature(int, is_chunked=True)
+            },
+            output_materializers={"output": (BuiltInMaterializer,)},
+        )
+    runner._validate_chunked_output_materializers(
+        output_signatures={"output": OutputSignature(int)},
+        output_materializers={"output": (BuiltInMaterializer,)},
+    )
@@ -0,0 +1,67 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from zenml.async_client import AsyncClient
+
+
+def test_async_client_returns_client_models(clean_client):
+    """Tests that the async client returns the same models as the client."""
+
+    async def _fetch():
+        async with AsyncClient(clean_client) as client:
+            return await asyncio.gather(
+                client.get_stack("default"), client.list_stacks()
+            )
+
+    stack, stacks = asyncio.run(_fetch())
+    assert stack == clean_client.get_stack("default")
+    assert stacks.items == clean_client.list_stacks().items
+
+
+def test_async_client_limits_concurrency(clean_client, mocker):
+    """Tests that the async client never exceeds its maximum concurrency."""
+    lock = threading.Lock()
+    running = []
+    max_running = []
+
+    def _get_stack(*args, **kwargs):
+        with lock:
+            running.append(None)
+            max_running.append(len(running))
+        time.sleep(0.05)
+        with lock:
+            running.pop()
+
+    mocker.patch.object(clean_client, "get_stack", side_effect=_get_stack)
+
+    async def _fetch():
+        async with AsyncClient(clean_client, max_concurrency=2) as client:
+            await asyncio.gather(*(client.get_stack() for _ in range(8)))
+
+    asyncio.run(_fetch())
+    assert max(max_running) == 2
+
+
+def test_async_client_only_exposes_read_methods(clean_client):
+    """Tests that only `get_*` and `list_*` methods are coroutines."""
+    client = AsyncClient(clean_client)
+    with pytest.raises(AttributeError):
+        client.delete_stack
+    client.close()
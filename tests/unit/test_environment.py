@@ -12,7 +12,9 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 
+import contextvars
 import platform
+import threading
 from uuid import uuid4
 
 import pytest
@@ -114,6 +116,48 @@ def test_environment_component_activation():
         Environment()["foo"]
 
 
+def test_thread_local_environment_component_activation():
+    """Tests that thread-local environment components can be active in
+    multiple threads at the same time."""
+
+    class Bar(BaseEnvironmentComponent):
+        NAME = "bar"
+        THREAD_LOCAL = True
+
+    main_component = Bar()
+    thread_component = Bar()
+    thread_results = {}
+
+    def _activate_in_thread() -> None:
+        thread_results["before"] = Environment().get_component("bar")
+        with thread_component:
+            thread_results["component"] = Environment()["bar"]
+        thread_results["after"] = Environment().get_component("bar")
+
+    def _get_in_thread() -> None:
+        thread_results["propagated"] = Environment().get_component("bar")
+
+    with main_component:
+        thread = threading.Thread(target=_activate_in_thread)
+        thread.start()
+        thread.join()
+        assert Environment()["bar"] is main_component
+
+        # Components are available to code which runs in a copy of the
+        # context that activated them
+        thread = threading.Thread(
+            target=contextvars.copy_context().run, args=(_get_in_thread,)
+        )
+        thread.start()
+        thread.join()
+
+    assert thread_results["before"] is None
+    assert thread_results["component"] is thread_component
+    assert thread_results["after"] is None
+    assert thread_results["propagated"] is main_component
+    assert not Environment().has_component("bar")
+
+
 def test_ipython_terminal_detection_when_not_installed():
     """Tests that we detect if the Python process is running in an IPython terminal when not installed."""
     try:
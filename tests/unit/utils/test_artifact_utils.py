@@ -19,6 +19,8 @@ from uuid import uuid4
 import numpy as np
 import pytest
 
+from zenml.artifact_stores import LocalArtifactStore
+from zenml.artifact_stores.local_artifact_cache import LocalArtifactCache
 from zenml.constants import MODEL_METADATA_YAML_FILE_NAME
 from zenml.materializers.numpy_materializer import NUMPY_FILENAME
 from zenml.models import ArtifactResponseModel
@@ -28,6 +30,7 @@ from zenml.utils.artifact_utils import (
     _load_artifact,
     load_artifact,
     load_model_from_metadata,
+    load_with_local_cache,
     save_model_metadata,
 )
 
@@ -170,3 +173,56 @@ def test__load_artifact(numpy_file_uri):
     artifact = _load_artifact(materializer, data_type, numpy_file_uri)
     assert artifact is not None
     assert isinstance(artifact, np.ndarray)
+
+
+def test_load_with_local_cache(
+    mocker, tmp_path, local_artifact_store, sample_artifact_model
+):
+    """Tests that artifacts are only loaded from the local cache of the
+    artifact store in which they are stored, and that the cache entry stays
+    pinned while the loaded object is alive."""
+    artifact_dir = tmp_path / "artifact"
+    artifact_dir.mkdir()
+    (artifact_dir / "data.txt").write_text("data")
+    artifact = sample_artifact_model.copy(
+        update={
+            "uri": str(artifact_dir),
+            "artifact_store_id": local_artifact_store.id,
+            "content_hash": "content_hash",
+        }
+    )
+
+    class _Loaded:
+        def __init__(self, uri):
+            self.uri = uri
+
+    # Local artifact stores don't use a cache
+    loaded = load_with_local_cache(
+        artifact=artifact, artifact_store=local_artifact_store, load=_Loaded
+    )
+    assert loaded.uri == artifact.uri
+
+    cache = LocalArtifactCache(root=str(tmp_path / "cache"), max_size=1000)
+    mocker.patch.object(
+        LocalArtifactStore,
+        "local_cache",
+        new_callable=mocker.PropertyMock,
+        return_value=cache,
+    )
+    release = mocker.spy(cache, "release")
+    loaded = load_with_local_cache(
+        artifact=artifact, artifact_store=local_artifact_store, load=_Loaded
+    )
+    assert loaded.uri == cache.get_entry_path("content_hash")
+    assert os.path.isfile(os.path.join(loaded.uri, "data.txt"))
+    assert release.call_count == 0
+    del loaded
+    release.assert_called_once_with("content_hash")
+
+    other_store_artifact = artifact.copy(update={"artifact_store_id": uuid4()})
+    loaded = load_with_local_cache(
+        artifact=other_store_artifact,
+        artifact_store=local_artifact_store,
+        load=_Loaded,
+    )
+    assert loaded.uri == artifact.uri
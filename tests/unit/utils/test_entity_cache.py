@@ -0,0 +1,105 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+from zenml.utils.entity_cache import EntityCache, LRUCache
+
+
+def test_entity_cache_loads_entities_once(mocker):
+    """Tests that cached entities are only loaded once until they expire."""
+    time = mocker.patch("zenml.utils.entity_cache.time.monotonic")
+    time.return_value = 0
+    load = mocker.Mock(side_effect=["first", "second"])
+    cache = EntityCache(ttl=10)
+
+    assert cache.get("key", load) == "first"
+    time.return_value = 9
+    assert cache.get("key", load) == "first"
+    assert load.call_count == 1
+
+    time.return_value = 10
+    assert cache.get("key", load) == "second"
+    assert load.call_count == 2
+
+
+def test_entity_cache_invalidation():
+    """Tests that invalidating the cache removes all entries."""
+    cache = EntityCache(ttl=10)
+    cache.get("key", lambda: "first")
+
+    cache.invalidate()
+    assert cache.get("key", lambda: "second") == "second"
+
+
+def test_entity_cache_ignores_entities_loaded_during_invalidation():
+    """Tests that entities which were loaded while the cache was invalidated
+    are not cached."""
+    cache = EntityCache(ttl=10)
+
+    def _load():
+        cache.invalidate()
+        return "stale"
+
+    assert cache.get("key", _load) == "stale"
+    assert cache.get("key", lambda: "fresh") == "fresh"
+
+
+def test_disabled_entity_cache_always_loads_entities():
+    """Tests that a cache without TTL doesn't cache anything."""
+    cache = EntityCache(ttl=0)
+    cache.get("key", lambda: "first")
+
+    assert cache.get("key", lambda: "second") == "second"
+
+
+def test_lru_cache_evicts_least_recently_used_entries():
+    """Tests that the LRU cache evicts the least recently used entries."""
+    cache = LRUCache(max_size=2)
+    cache.put("first", 1)
+    cache.put("second", 2)
+    assert cache.get("first") == 1
+
+    cache.put("third", 3)
+    assert cache.get("second") is None
+    assert cache.get("first") == 1
+    assert cache.get("third") == 3
+
+    cache.pop("first")
+    assert cache.get("first") is None
+
+
+def test_lru_cache_entries_expire(mocker):
+    """Tests that entries of an LRU cache with TTL expire."""
+    time = mocker.patch("zenml.utils.entity_cache.time.monotonic")
+    time.return_value = 0
+    cache = LRUCache(max_size=2, ttl=10)
+    cache.put("key", 1)
+
+    time.return_value = 9
+    assert cache.get("key") == 1
+    time.return_value = 10
+    assert cache.get("key") is None
+
+
+def test_lru_cache_ignores_entries_loaded_during_invalidation():
+    """Tests that entries which were loaded while the LRU cache was
+    invalidated are not cached."""
+    cache = LRUCache(max_size=2)
+
+    generation = cache.generation
+    cache.pop("key")
+    cache.put("key", "stale", generation=generation)
+    assert cache.get("key") is None
+
+    cache.put("key", "fresh", generation=cache.generation)
+    assert cache.get("key") == "fresh"
@@ -23,6 +23,7 @@ from hypothesis import given
 from hypothesis.strategies import text
 
 from zenml.constants import ENV_ZENML_CONFIG_PATH, REMOTE_FS_PREFIX
+from zenml.io import fileio
 from zenml.utils import io_utils
 
 TEMPORARY_FILE_NAME = "a_file.txt"
@@ -125,6 +126,29 @@ def test_copy_dir_overwriting_works(tmp_path):
         assert f.read() == "some_content_about_aria"
 
 
+def test_copy_dir_copies_nested_files_concurrently(tmp_path, mocker):
+    """Tests copying a nested directory on multiple threads."""
+    mocker.patch("zenml.utils.io_utils.FILE_COPY_THREADS", 4)
+    executor_spy = mocker.spy(io_utils, "ThreadPoolExecutor")
+    source_dir = tmp_path / "source"
+    files = {
+        "a.txt": "a",
+        os.path.join("sub", "b.txt"): "b",
+        os.path.join("sub", "nested", "c.txt"): "c",
+    }
+    for relative_path, contents in files.items():
+        path = source_dir / relative_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(contents)
+
+    destination_dir = tmp_path / "destination"
+    io_utils.copy_dir(str(source_dir), str(destination_dir))
+
+    executor_spy.assert_called_once_with(max_workers=3)
+    for relative_path, contents in files.items():
+        assert (destination_dir / relative_path).read_text() == contents
+
+
 def test_copy_dir_throws_error_if_overwriting(tmp_path):
     """Tests copying directory throwing error if overwriting."""
     dir_path = os.path.join(tmp_path, "test")
@@ -304,3 +328,28 @@ def test_get_parent_gets_the_parent_directory(tmp_path) -> None:
     )
     parent = io_utils.get_parent(os.path.join(tmp_path, "new_dir/new_dir2"))
     assert parent == "new_dir"
+
+
+def test_copy_dir_passes_write_observer_to_threads(tmp_path, mocker):
+    """Tests that files copied concurrently are copied in the context of the
+    caller, so they are passed to the active write observer."""
+    mocker.patch("zenml.utils.io_utils.FILE_COPY_THREADS", 4)
+    source_dir = tmp_path / "source"
+    source_dir.mkdir()
+    for name in ["a.txt", "b.txt", "c.txt"]:
+        (source_dir / name).write_text(name)
+
+    observers = []
+
+    def _copy(src, dst, overwrite=False):
+        observers.append(fileio._write_observer.get())
+
+    mocker.patch("zenml.utils.io_utils.copy", side_effect=_copy)
+
+    def _observer(path, mode, file):
+        return file
+
+    with fileio.observe_writes(_observer):
+        io_utils.copy_dir(str(source_dir), str(tmp_path / "destination"))
+
+    assert observers == [_observer] * 3
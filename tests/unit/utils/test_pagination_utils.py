@@ -0,0 +1,62 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+from zenml.models import Page
+from zenml.utils.pagination_utils import depaginate
+
+
+def test_depaginate_follows_cursors_without_counting():
+    """Tests that depaginate continues after the cursor of each page and
+    doesn't request item counts."""
+    pages = {
+        None: Page.construct(
+            index=1,
+            max_size=2,
+            total_pages=None,
+            total=None,
+            items=[1, 2],
+            next_cursor="2",
+        ),
+        "2": Page.construct(
+            index=1,
+            max_size=2,
+            total_pages=None,
+            total=None,
+            items=[3],
+            next_cursor=None,
+        ),
+    }
+    calls = []
+
+    def list_method(**kwargs):
+        calls.append(kwargs)
+        return pages[kwargs.get("cursor")]
+
+    assert depaginate(list_method) == [1, 2, 3]
+    assert calls == [{"count": False}, {"cursor": "2", "count": False}]
+
+
+def test_depaginate_falls_back_to_page_indices():
+    """Tests that depaginate fetches pages by index if the list method doesn't
+    return cursors."""
+    calls = []
+
+    def list_method(page=1, **kwargs):
+        calls.append(page)
+        return Page.construct(
+            index=page, max_size=1, total_pages=3, total=3, items=[page]
+        )
+
+    assert depaginate(list_method) == [1, 2, 3]
+    assert calls == [1, 2, 3]
@@ -0,0 +1,60 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+from types import SimpleNamespace
+
+import pytest
+from fastapi.security import SecurityScopes
+
+from zenml.zen_server import auth
+
+
+@pytest.fixture
+def auth_context_cache():
+    """Clears the auth context cache before and after the test."""
+    auth.invalidate_auth_context_cache()
+    yield
+    auth.invalidate_auth_context_cache()
+
+
+def test_auth_contexts_are_cached_until_invalidated(
+    auth_context_cache, mocker
+):
+    """Tests that auth contexts are cached until users/teams/roles change."""
+    authenticate = mocker.patch.object(
+        auth, "authenticate_credentials", return_value=mocker.Mock()
+    )
+
+    first = auth.no_authentication(SecurityScopes())
+    assert auth.no_authentication(SecurityScopes()) is first
+    assert authenticate.call_count == 1
+
+    # Read-only requests don't invalidate the cache
+    dependency = auth.invalidate_auth_context_cache_on_change(
+        SimpleNamespace(method="GET")
+    )
+    next(dependency)
+    with pytest.raises(StopIteration):
+        next(dependency)
+    auth.no_authentication(SecurityScopes())
+    assert authenticate.call_count == 1
+
+    dependency = auth.invalidate_auth_context_cache_on_change(
+        SimpleNamespace(method="PUT")
+    )
+    next(dependency)
+    with pytest.raises(StopIteration):
+        next(dependency)
+    auth.no_authentication(SecurityScopes())
+    assert authenticate.call_count == 2
@@ -0,0 +1,60 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+from uuid import uuid4
+
+from fastapi import Depends, FastAPI, Request
+from fastapi.testclient import TestClient
+
+from zenml.zen_server.utils import (
+    cached_response,
+    invalidate_cached_response,
+    invalidate_response_cache_on_change,
+)
+
+
+def test_cached_responses_support_conditional_requests(mocker):
+    """Tests that immutable resources are cached and sent with an ETag."""
+    resource_id = uuid4()
+    load = mocker.Mock(return_value={"id": str(resource_id), "name": "aria"})
+    app = FastAPI(dependencies=[Depends(invalidate_response_cache_on_change)])
+
+    @app.get("/resource")
+    def get_resource(request: Request):
+        return cached_response(
+            request, key=("resource", resource_id), load=load
+        )
+
+    @app.delete("/resource")
+    def delete_resource():
+        pass
+
+    client = TestClient(app)
+    try:
+        response = client.get("/resource")
+        assert response.status_code == 200
+        assert response.json() == load.return_value
+        etag = response.headers["ETag"]
+
+        response = client.get("/resource", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.headers["ETag"] == etag
+        assert load.call_count == 1
+
+        # Modifications clear the cache
+        client.delete("/resource")
+        client.get("/resource")
+        assert load.call_count == 2
+    finally:
+        invalidate_cached_response(("resource", resource_id))
@@ -0,0 +1,159 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+import gzip
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from zenml.zen_stores.rest_zen_store import (
+    RestZenStore,
+    RestZenStoreConfiguration,
+)
+
+
+class _FlakyHandler(BaseHTTPRequestHandler):
+    """Request handler which fails every first request to a path."""
+
+    protocol_version = "HTTP/1.1"
+    requested_paths = set()
+    accept_encodings = []
+
+    def do_GET(self):
+        self.accept_encodings.append(self.headers.get("Accept-Encoding"))
+        if self.path not in self.requested_paths:
+            self.requested_paths.add(self.path)
+            self.send_response(503)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        body = gzip.compress(json.dumps({"path": self.path}).encode())
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def flaky_server():
+    """Runs a local HTTP server with the flaky request handler."""
+    _FlakyHandler.requested_paths = set()
+    _FlakyHandler.accept_encodings = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FlakyHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_rest_store_retries_and_reuses_connections(flaky_server):
+    """Tests that failed idempotent requests are retried and that
+    compressed responses are sent over a single kept-alive connection."""
+    store = RestZenStore.construct(
+        config=RestZenStoreConfiguration(
+            url=flaky_server,
+            api_token="token",
+            http_retry_backoff_factor=0,
+        )
+    )
+
+    assert store.get("/first") == {"path": "/api/v1/first"}
+    assert store.get("/second") == {"path": "/api/v1/second"}
+
+    assert "gzip" in _FlakyHandler.accept_encodings[0]
+    assert store.get_connection_stats() == {
+        "requests": 4,
+        "connections": 1,
+        "reused_connections": 3,
+        "retries": 2,
+    }
+
+
+class _ETagHandler(BaseHTTPRequestHandler):
+    """Request handler which sends an ETag and supports conditional
+    requests."""
+
+    protocol_version = "HTTP/1.1"
+    etag = '"v1"'
+    if_none_match = []
+
+    def do_GET(self):
+        self.if_none_match.append(self.headers.get("If-None-Match"))
+        if self.headers.get("If-None-Match") == self.etag:
+            self.send_response(304)
+            self.send_header("ETag", self.etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        body = json.dumps({"etag": self.etag}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("ETag", self.etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_rest_store_sends_conditional_requests():
+    """Tests that the store revalidates responses which have an ETag."""
+    _ETagHandler.if_none_match = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _ETagHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        store = RestZenStore.construct(
+            config=RestZenStoreConfiguration(
+                url=f"http://127.0.0.1:{server.server_address[1]}",
+                api_token="token",
+            )
+        )
+
+        assert store.get("/resource") == {"etag": '"v1"'}
+        assert store.get("/resource") == {"etag": '"v1"'}
+        _ETagHandler.etag = '"v2"'
+        assert store.get("/resource") == {"etag": '"v2"'}
+        assert _ETagHandler.if_none_match == [None, '"v1"', '"v1"']
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_rest_store_only_discards_the_failed_session():
+    """Tests that a session replaced by another thread isn't discarded."""
+    store = RestZenStore.construct(
+        config=RestZenStoreConfiguration(
+            url="http://127.0.0.1:1", api_token="token"
+        )
+    )
+    failed_session = store.session
+    store._discard_session(failed_session)
+    new_session = store.session
+    assert new_session is not failed_session
+
+    # Another thread failing with the old session keeps the new one
+    store._discard_session(failed_session)
+    assert store.session is new_session